@@ -20,6 +20,7 @@ from dataall.core.tasks.service_handlers import Worker
 from dataall.base.aws.sqs import SqsQueue
 from dataall.base.context import set_context, dispose_context, RequestContext
 from dataall.base.db import get_engine
+from dataall.base.db.instrumentation import SqlInstrumentation
 from dataall.base.loader import load_modules, ImportMode
 
 
@@ -58,7 +59,7 @@ def resolver_adapter(resolver):
 
 executable_schema = get_executable_schema()
 end = perf_counter()
-print(f'Lambda Context ' f'Initialization took: {end - start:.3f} sec')
+print(f'Lambda Context Initialization took: {end - start:.3f} sec')
 
 
 def handler(event, context):
@@ -135,7 +136,10 @@ def handler(event, context):
     else:
         raise Exception(f'Could not initialize user context from event {event}')
 
-    success, response = graphql_sync(schema=executable_schema, data=query, context_value=app_context)
+    with SqlInstrumentation.record_operation(query.get('operationName')) as recorded_statements:
+        success, response = graphql_sync(schema=executable_schema, data=query, context_value=app_context)
+    if extensions := SqlInstrumentation.graphql_extensions(recorded_statements):
+        response['extensions'] = extensions
 
     dispose_context()
     response = json.dumps(response)
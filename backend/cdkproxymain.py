@@ -154,7 +154,7 @@ async def create_stack(stackid: str, background_tasks: BackgroundTasks, response
                 }
             stack.status = 'RUNNING'
         logger.info('Adding bg task')
-        background_tasks.add_task(wrapper.deploy_cdk_stack, engine, stackid)
+        background_tasks.add_task(wrapper.deploy_cdk_stack, engine, stackid, synth_in_process=True)
         results.append(
             {
                 'DH_DOCKER_VERSION': os.environ.get('DH_DOCKER_VERSION'),
@@ -13,6 +13,7 @@ from ariadne import (
 from dataall.base.api import gql
 from dataall.base.api.constants import GraphQLEnumMapper
 from dataall.base.api.queries import enumsQuery
+from dataall.base.db.instrumentation import SqlInstrumentation
 
 
 def bootstrap():
@@ -53,16 +54,17 @@ def bootstrap():
 
 def resolver_adapter(resolver):
     def adapted(obj, info, **kwargs):
-        response = resolver(
-            context=Namespace(
-                engine=info.context['engine'],
-                username=info.context['username'],
-                groups=info.context['groups'],
-                schema=info.context['schema'],
-            ),
-            source=obj or None,
-            **kwargs,
-        )
+        with SqlInstrumentation.resolving(f'{info.parent_type.name}.{info.field_name}'):
+            response = resolver(
+                context=Namespace(
+                    engine=info.context['engine'],
+                    username=info.context['username'],
+                    groups=info.context['groups'],
+                    schema=info.context['schema'],
+                ),
+                source=obj or None,
+                **kwargs,
+            )
         return response
 
     return adapted
@@ -8,15 +8,24 @@ log = logging.getLogger(__name__)
 
 
 class Cognito(ServiceProvider):
+    # The user pool of a deployment does not change, it is read from SSM once per container
+    _user_pool_ids = {}
+
     def __init__(self):
         self.client = boto3.client('cognito-idp', region_name=os.getenv('AWS_REGION', 'eu-west-1'))
 
+    @classmethod
+    def get_user_pool_id(cls, envname: str, region: str):
+        if (envname, region) not in cls._user_pool_ids:
+            parameter_path = f'/dataall/{envname}/cognito/userpool'
+            ssm = boto3.client('ssm', region_name=region)
+            cls._user_pool_ids[(envname, region)] = ssm.get_parameter(Name=parameter_path)['Parameter']['Value']
+        return cls._user_pool_ids[(envname, region)]
+
     def get_user_emailids_from_group(self, groupName):
         try:
             envname = os.getenv('envname', 'local')
-            parameter_path = f'/dataall/{envname}/cognito/userpool'
-            ssm = boto3.client('ssm', region_name=os.getenv('AWS_REGION', 'eu-west-1'))
-            user_pool_id = ssm.get_parameter(Name=parameter_path)['Parameter']['Value']
+            user_pool_id = self.get_user_pool_id(envname, os.getenv('AWS_REGION', 'eu-west-1'))
             paginator = self.client.get_paginator('list_users_in_group')
             pages = paginator.paginate(UserPoolId=user_pool_id, GroupName=groupName)
             cognito_user_list = []
@@ -43,9 +52,7 @@ class Cognito(ServiceProvider):
         user_pool_id = None
         groups = []
         try:
-            parameter_path = f'/dataall/{envname}/cognito/userpool'
-            ssm = boto3.client('ssm', region_name=region)
-            user_pool_id = ssm.get_parameter(Name=parameter_path)['Parameter']['Value']
+            user_pool_id = self.get_user_pool_id(envname, region)
             cognito = boto3.client('cognito-idp', region_name=region)
             paginator = cognito.get_paginator('list_groups')
             pages = paginator.paginate(UserPoolId=user_pool_id)
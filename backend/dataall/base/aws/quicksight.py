@@ -2,6 +2,7 @@ import logging
 import re
 
 from .sts import SessionHelper
+from dataall.base.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger('QuicksightHandler')
 logger.setLevel(logging.DEBUG)
@@ -27,6 +28,10 @@ class QuicksightClient:
         {'name': 'Asia Pacific (Mumbai)', 'code': 'ap-south-1'},
     ]
 
+    # identity regions and groups rarely change, they are kept while the Lambda/ECS container is warm
+    _identity_regions = TTLCache(ttl_seconds=3600)
+    _groups = TTLCache(ttl_seconds=3600)
+
     def __init__(self):
         pass
 
@@ -44,6 +49,18 @@ class QuicksightClient:
 
     @staticmethod
     def get_identity_region(AwsAccountId, region):
+        """Returns the Quicksight identity region of the account, it is discovered once per account and cached"""
+        return QuicksightClient._identity_regions.get_or_set(
+            AwsAccountId, lambda: QuicksightClient._discover_identity_region(AwsAccountId, region)
+        )
+
+    @staticmethod
+    def remember_identity_region(AwsAccountId, identity_region):
+        """Caches an identity region known from elsewhere (e.g. persisted) to skip the discovery"""
+        QuicksightClient._identity_regions.set(AwsAccountId, identity_region)
+
+    @staticmethod
+    def _discover_identity_region(AwsAccountId, region):
         """Quicksight manages identities in one region, and there is no API to retrieve it
         However, when using Quicksight user/group apis in the wrong region,
         the client will throw and exception showing the region Quicksight's using as its
@@ -109,31 +126,45 @@ class QuicksightClient:
         Returns: bool
             True if Quicksight Enterprise Edition is enabled in the AWS Account
         """
+        account_info = QuicksightClient.get_account_subscription(AwsAccountId, region)
+        return QuicksightClient.check_enterprise_subscription(
+            AwsAccountId, account_info['Edition'], account_info['AccountSubscriptionStatus']
+        )
+
+    @staticmethod
+    def get_account_subscription(AwsAccountId, region=None):
+        """Returns the AccountInfo of the Quicksight subscription of the account
+        Args:
+            AwsAccountId(str) : aws account id
+            region(str): aws region
+        Returns: dict
+        """
         logger.info(f'Checking Quicksight subscription in AWS account = {AwsAccountId}')
         client = QuicksightClient.get_quicksight_client(AwsAccountId=AwsAccountId, region=region, session_region=region)
         try:
             response = client.describe_account_subscription(AwsAccountId=AwsAccountId)
-            if not response['AccountInfo']:
-                raise Exception(f'Quicksight Enterprise Subscription not found in Account: {AwsAccountId}')
-            else:
-                if response['AccountInfo']['Edition'] not in ['ENTERPRISE', 'ENTERPRISE_AND_Q']:
-                    raise Exception(
-                        f"Quicksight Subscription found in Account: {AwsAccountId} of incorrect type: {response['AccountInfo']['Edition']}"
-                    )
-                else:
-                    if response['AccountInfo']['AccountSubscriptionStatus'] == 'ACCOUNT_CREATED':
-                        return True
-                    else:
-                        raise Exception(
-                            f"Quicksight Subscription found in Account: {AwsAccountId} not active. Status = {response['AccountInfo']['AccountSubscriptionStatus']}"
-                        )
-
         except client.exceptions.ResourceNotFoundException:
             raise Exception('Quicksight Enterprise Subscription not found')
 
         except client.exceptions.AccessDeniedException:
             raise Exception('Access denied to Quicksight for selected role')
 
+        if not response['AccountInfo']:
+            raise Exception(f'Quicksight Enterprise Subscription not found in Account: {AwsAccountId}')
+        return response['AccountInfo']
+
+    @staticmethod
+    def check_enterprise_subscription(AwsAccountId, edition, status):
+        """Checks the edition and status of a subscription returned by get_account_subscription
+        Returns: bool
+            True if Quicksight Enterprise Edition is active, raises otherwise
+        """
+        if edition not in ['ENTERPRISE', 'ENTERPRISE_AND_Q']:
+            raise Exception(f'Quicksight Subscription found in Account: {AwsAccountId} of incorrect type: {edition}')
+        if status != 'ACCOUNT_CREATED':
+            raise Exception(f'Quicksight Subscription found in Account: {AwsAccountId} not active. Status = {status}')
+        return True
+
     @staticmethod
     def create_quicksight_group(AwsAccountId, region, GroupName=DEFAULT_GROUP_NAME):
         """Creates a Quicksight group called GroupName
@@ -145,6 +176,9 @@ class QuicksightClient:
         Returns:dict
             quicksight.describe_group response
         """
+        group = QuicksightClient._groups.get((AwsAccountId, GroupName))
+        if group:
+            return group
         client = QuicksightClient.get_quicksight_client_in_identity_region(AwsAccountId, region)
         group = QuicksightClient.describe_group(client, AwsAccountId, region, GroupName)
         if not group:
@@ -160,8 +194,8 @@ class QuicksightClient:
                 Namespace='default',
             )
             logger.info(f'Quicksight group {GroupName} created {response}')
-            response = client.describe_group(AwsAccountId=AwsAccountId, GroupName=GroupName, Namespace='default')
-            return response
+            group = client.describe_group(AwsAccountId=AwsAccountId, GroupName=GroupName, Namespace='default')
+        QuicksightClient._groups.set((AwsAccountId, GroupName), group)
         return group
 
     @staticmethod
@@ -1,13 +1,47 @@
+import json
 import logging
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import boto3
 
 log = logging.getLogger(__name__)
 
+# SendBulkEmail accepts up to 50 destinations per request
+MAX_BULK_DESTINATIONS = 50
+MAX_BULK_WORKERS = 4
+DEFAULT_MAX_SEND_RATE = 1.0
+# Result of the destinations whose batch could not be sent within the time budget of the caller
+NOT_SENT_RESULT = {'Status': 'ACCOUNT_THROTTLED', 'Error': 'Not sent within the time budget'}
+
+
+class _SendRateLimiter:
+    """Spaces the requests so that no more than max_send_rate emails per second are sent, as SES quotas allow"""
+
+    def __init__(self, max_send_rate: float):
+        self._interval = 1.0 / (max_send_rate or DEFAULT_MAX_SEND_RATE)
+        self._next_send = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, emails: int, deadline: float = None) -> bool:
+        """Waits for the emails to be allowed, returns False without waiting if they are not allowed before the deadline"""
+        with self._lock:
+            now = time.monotonic()
+            send_at = max(now, self._next_send)
+            if deadline is not None and send_at > deadline:
+                return False
+            self._next_send = send_at + emails * self._interval
+        if send_at > now:
+            time.sleep(send_at - now)
+        return True
+
 
 class Ses:
-    def __init__(self, fromEmailId: str = None):
+    def __init__(self, fromEmailId: str = None, templateName: str = None):
         self.fromEmailId = fromEmailId
+        self.templateName = templateName
         self.client = boto3.client('sesv2', region_name=os.getenv('AWS_REGION', 'eu-west-1'))
 
     @staticmethod
@@ -15,7 +49,7 @@ class Ses:
         # Create SES client
         fromEmailId = os.getenv('email_sender_id', 'none')
         if fromEmailId != 'none':
-            return Ses(fromEmailId)
+            return Ses(fromEmailId, os.getenv('email_template_name'))
         else:
             raise Exception('email_sender_id environment variable is not set')
 
@@ -41,3 +75,48 @@ class Ses:
                 return True
             log.error(f'Error while sending email {e})')
             raise e
+
+    def send_bulk_email(self, toList, message, subject, max_wait_seconds: float = None):
+        """
+        Sends the templated message to every address as an individual email, 50 destinations per request.
+        Requests run concurrently within the SES maximum send rate.
+        Batches that cannot be sent within max_wait_seconds are not sent, their emails get the NOT_SENT_RESULT.
+        Returns the (email, BulkEmailEntryResult) pairs, every delivered email has its own MessageId
+        """
+        batches = [toList[i : i + MAX_BULK_DESTINATIONS] for i in range(0, len(toList), MAX_BULK_DESTINATIONS)]
+        if not batches:
+            return []
+        template_data = json.dumps({'subject': subject, 'message': message})
+        rate_limiter = _SendRateLimiter(self.get_max_send_rate())
+        deadline = time.monotonic() + max_wait_seconds if max_wait_seconds is not None else None
+
+        def send_batch(batch):
+            if not rate_limiter.acquire(len(batch), deadline):
+                return [(email, NOT_SENT_RESULT) for email in batch]
+            return zip(batch, self._send_bulk_email_batch(batch, template_data))
+
+        with ThreadPoolExecutor(max_workers=min(MAX_BULK_WORKERS, len(batches))) as executor:
+            return [result for batch_results in executor.map(send_batch, batches) for result in batch_results]
+
+    def _send_bulk_email_batch(self, batch, template_data):
+        try:
+            response = self.client.send_bulk_email(
+                FromEmailAddress=self.fromEmailId,
+                DefaultContent={'Template': {'TemplateName': self.templateName, 'TemplateData': template_data}},
+                BulkEmailEntries=[{'Destination': {'ToAddresses': [email]}} for email in batch],
+            )
+            return response['BulkEmailEntryResults']
+        except Exception as e:
+            envname = os.getenv('envname', 'local')
+            if envname in ['local', 'dkrcompose']:
+                log.error('Local development environment does not support SES notifications')
+                return []
+            log.error(f'Error while sending bulk email {e})')
+            raise e
+
+    def get_max_send_rate(self) -> float:
+        try:
+            return self.client.get_account()['SendQuota']['MaxSendRate']
+        except Exception as e:
+            log.warning(f'Failed to read the SES send quota, using {DEFAULT_MAX_SEND_RATE} emails per second: {e}')
+            return DEFAULT_MAX_SEND_RATE
@@ -4,10 +4,14 @@
 # see : https://github.com/aws-samples/cdk-assume-role-credential-plugin
 
 import ast
+import glob
+import hashlib
+import json
 import logging
 import os
 import subprocess
 import sys
+import tempfile
 from abc import abstractmethod
 from typing import Dict
 
@@ -15,6 +19,7 @@ import boto3
 from botocore.exceptions import ClientError
 
 from dataall.core.stacks.db.stack_models import Stack
+from dataall.base.cdkproxy.synth_worker import CdkSynthWorker
 from dataall.base.aws.sts import SessionHelper
 from dataall.base.db import Engine
 from dataall.base.utils.alarm_service import AlarmService
@@ -24,6 +29,11 @@ logger = logging.getLogger('cdksass')
 
 ENVNAME = os.getenv('envname', 'local')
 
+# CloudFormation statuses in which the deployed template is the last successfully deployed one
+STABLE_STACK_STATUSES = ('CREATE_COMPLETE', 'UPDATE_COMPLETE', 'IMPORT_COMPLETE')
+# files of the cloud assembly that define what is deployed
+FINGERPRINTED_ASSEMBLY_FILES = ('manifest.json', '*.template.json', '*.assets.json')
+
 
 class CDKCliWrapperExtension:
     def __init__(self):
@@ -72,7 +82,9 @@ def update_stack_output(session, stack):
         stack.outputs = outputs
 
 
-def deploy_cdk_stack(engine: Engine, stackid: str, app_path: str = None, path: str = None):
+def deploy_cdk_stack(
+    engine: Engine, stackid: str, app_path: str = None, path: str = None, synth_in_process: bool = False
+):
     from dataall.base.loader import load_modules, ImportMode
 
     load_modules(modes={ImportMode.CDK_CLI_EXTENSION})
@@ -134,53 +146,36 @@ def deploy_cdk_stack(engine: Engine, stackid: str, app_path: str = None, path: s
 
             CommandSanitizer(input_args)
 
-            cmd = [
-                '' '. ~/.nvm/nvm.sh &&',
-                'cdk',
-                'deploy --all',
-                '--require-approval',
-                ' never',
-                '-c',
-                f"appid='{stack.name}'",
-                # the target accountid
-                '-c',
-                f"account='{stack.accountid}'",
-                # the target region
-                '-c',
-                f"region='{stack.region}'",
-                # the predefined stack
-                '-c',
-                f"stack='{stack.stack}'",
-                # the payload for the stack with additional parameters
-                '-c',
-                f"target_uri='{stack.targetUri}'",
-                '-c',
-                "data='{}'",
-                # skips synth step when no changes apply
-                '--app',
-                f'"{sys.executable} {app_path}"',
-                '--verbose',
-            ]
-            logger.info(f"Running command : \n {' '.join(cmd)}")
-
-            # This command is too complex to be executed as a list of commands. We need to run it with shell=True
-            # However, the input arguments have to be sanitized with the CommandSanitizer
-
-            process = subprocess.run(  # nosemgrep
-                ' '.join(cmd),  # nosemgrep
-                text=True,  # nosemgrep
-                shell=True,  # nosec  # nosemgrep
-                encoding='utf-8',  # nosemgrep
-                env=env,  # nosemgrep
-                cwd=cwd,  # nosemgrep
-            )
-
+            app = f'"{sys.executable} {app_path}"'
             if extension:
+                process = run_cdk_command(
+                    ['deploy --all', *DEPLOY_ARGS, *cdk_context_args(stack), '--app', app], env, cwd
+                )
                 _CDK_CLI_WRAPPER_EXTENSIONS[stack.stack].post_deployment()
             else:
-                logger.info(
-                    f'There is no CDK deployment extension for {stack.stack}. Proceeding further with the post-deployment'
-                )
+                with tempfile.TemporaryDirectory() as assembly_dir:
+                    synthesized = synth_in_process and CdkSynthWorker.synth(stack, assembly_dir)
+                    if not synthesized:
+                        process = run_cdk_command(
+                            ['synth --all', '--quiet', *cdk_context_args(stack), '--app', app, '--output', assembly_dir],
+                            env,
+                            cwd,
+                        )
+                        synthesized = process.returncode == 0
+                    if synthesized:
+                        fingerprint = cloud_assembly_fingerprint(assembly_dir)
+                        meta = describe_unchanged_stack(stack, fingerprint)
+                        if meta:
+                            logger.info(f'Stack {stack.name} is up to date, skipping the deployment')
+                            stack.stackid = meta['StackId']
+                            stack.status = meta['StackStatus']
+                            update_stack_output(session, stack)
+                            return
+
+                        # deploys the synthesized cloud assembly instead of synthesizing the app again
+                        process = run_cdk_command(['deploy --all', *DEPLOY_ARGS, '--app', assembly_dir], env, cwd)
+                        if process.returncode == 0:
+                            stack.templateFingerprint = fingerprint
 
             if process.returncode == 0:
                 meta = describe_stack(stack)
@@ -198,6 +193,76 @@ def deploy_cdk_stack(engine: Engine, stackid: str, app_path: str = None, path: s
             raise e
 
 
+DEPLOY_ARGS = ['--require-approval', ' never', '--verbose']
+
+
+def cdk_context_args(stack):
+    return [
+        '-c',
+        f"appid='{stack.name}'",
+        # the target accountid
+        '-c',
+        f"account='{stack.accountid}'",
+        # the target region
+        '-c',
+        f"region='{stack.region}'",
+        # the predefined stack
+        '-c',
+        f"stack='{stack.stack}'",
+        # the payload for the stack with additional parameters
+        '-c',
+        f"target_uri='{stack.targetUri}'",
+        '-c',
+        "data='{}'",
+    ]
+
+
+def run_cdk_command(args, env, cwd):
+    cmd = ['. ~/.nvm/nvm.sh &&', 'cdk', *args]
+    logger.info(f"Running command : \n {' '.join(cmd)}")
+
+    # This command is too complex to be executed as a list of commands. We need to run it with shell=True
+    # However, the input arguments have to be sanitized with the CommandSanitizer
+
+    return subprocess.run(  # nosemgrep
+        ' '.join(cmd),  # nosemgrep
+        text=True,  # nosemgrep
+        shell=True,  # nosec  # nosemgrep
+        encoding='utf-8',  # nosemgrep
+        env=env,  # nosemgrep
+        cwd=cwd,  # nosemgrep
+    )
+
+
+def cloud_assembly_fingerprint(assembly_dir: str) -> str:
+    """
+    Hash of the templates, asset manifests (which contain the asset hashes) and stack manifest of a cloud assembly.
+    The JSON files are normalized, so that the fingerprint only changes when the deployed resources change
+    """
+    fingerprint = hashlib.sha256()
+    paths = {
+        path for pattern in FINGERPRINTED_ASSEMBLY_FILES for path in glob.glob(os.path.join(assembly_dir, pattern))
+    }
+    for path in sorted(paths):
+        with open(path) as f:
+            content = json.load(f)
+        fingerprint.update(os.path.basename(path).encode())
+        fingerprint.update(json.dumps(content, sort_keys=True, separators=(',', ':')).encode())
+    return fingerprint.hexdigest()
+
+
+def describe_unchanged_stack(stack, fingerprint: str):
+    """Returns the CloudFormation status of the stack if it is already deployed with the same cloud assembly"""
+    if not stack.templateFingerprint or stack.templateFingerprint != fingerprint:
+        return None
+    try:
+        meta = describe_stack(stack)
+    except Exception as e:
+        logger.warning(f'Failed to describe stack {stack.name}, deploying it: {e}')
+        return None
+    return meta if meta['StackStatus'] in STABLE_STACK_STATUSES else None
+
+
 def describe_stack(stack, engine: Engine = None, stackid: str = None):
     if not stack:
         with engine.scoped_session() as session:
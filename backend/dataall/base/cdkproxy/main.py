@@ -146,7 +146,7 @@ async def create_stack(stackid: str, background_tasks: BackgroundTasks, response
             }  # yaml.safe_load(response.stdout)
         stack.status = 'RUNNING'
     logger.info('Adding bg task')
-    background_tasks.add_task(wrapper.deploy_cdk_stack, engine, stackid)
+    background_tasks.add_task(wrapper.deploy_cdk_stack, engine, stackid, synth_in_process=True)
     return {
         '_ts': datetime.now().isoformat(),
         'message': f'Starting creation of StackId {stack.stackUri} on Account {stack.accountid} / Region {stack.region}',
@@ -0,0 +1,68 @@
+"""
+Synthesizes data.all stacks in the process of the cdkproxy instead of spawning `cdk synth` with a fresh `python app.py`.
+The CDK libraries and the data.all CDK modules are imported once and stay warm for the next stacks,
+the cloud assembly written by the worker is then deployed with `cdk deploy --app <assembly dir>`.
+"""
+
+import json
+import logging
+import os
+from threading import Lock
+
+logger = logging.getLogger('cdksass')
+
+CDK_JSON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cdk.json')
+
+
+class CdkSynthWorker:
+    # the CDK app and the jsii runtime are not thread safe, the stacks are synthesized one at a time
+    _lock = Lock()
+    _feature_flags = None
+
+    @classmethod
+    def synth(cls, stack, assembly_dir: str) -> bool:
+        """Synthesizes the stack into the assembly directory, returns False if the stack could not be synthesized"""
+        with cls._lock:
+            try:
+                cls._synth(stack, assembly_dir)
+                return True
+            except Exception as e:
+                logger.exception(f'Failed to synthesize stack {stack.name} in process: {e}')
+                return False
+
+    @classmethod
+    def _synth(cls, stack, assembly_dir):
+        from aws_cdk import App, Environment
+        from dataall.base.cdkproxy.stacks import instanciate_stack
+
+        cls._load()
+        # the same context as the one the CLI passes to app.py
+        context = {
+            **cls._feature_flags,
+            'appid': stack.name,
+            'account': stack.accountid,
+            'region': stack.region,
+            'stack': stack.stack,
+            'target_uri': stack.targetUri,
+            'data': '{}',
+        }
+        app = App(outdir=assembly_dir, context=context)
+        instanciate_stack(
+            stack.stack,
+            app,
+            stack.name,
+            env=Environment(account=stack.accountid, region=stack.region),
+            target_uri=stack.targetUri,
+        )
+        app.synth()
+
+    @classmethod
+    def _load(cls):
+        if cls._feature_flags is not None:
+            return
+        from dataall.base.loader import load_modules, ImportMode
+
+        logger.info('Loading the CDK modules of the synth worker')
+        load_modules(modes={ImportMode.CDK})
+        with open(CDK_JSON_PATH) as f:
+            cls._feature_flags = json.load(f).get('context', {})
@@ -11,3 +11,4 @@ from .connection import (
 )
 from .dbconfig import DbConfig
 from .paginator import paginate
+from .filters import term_filter
@@ -10,6 +10,7 @@ from sqlalchemy.orm import sessionmaker
 from dataall.base.aws.secrets_manager import SecretsManager
 from dataall.base.db import Base
 from dataall.base.db.dbconfig import DbConfig
+from dataall.base.db.instrumentation import SqlInstrumentation
 from dataall.base.utils import Parameter
 from dataall.base.aws.sts import SessionHelper
 
@@ -31,6 +32,7 @@ class Engine:
             pool_size=1,
             connect_args={'options': f'-csearch_path={dbconfig.schema}'},
         )
+        SqlInstrumentation.instrument(self.engine)
         try:
             if not self.engine.dialect.has_schema(self.engine, dbconfig.schema):
                 log.info(f'Schema not found - init the schema {dbconfig.schema}')
@@ -0,0 +1,19 @@
+from sqlalchemy import or_
+
+_LIKE_ESCAPE = '\\'
+
+
+def _escape_like(term: str) -> str:
+    return (
+        term.replace(_LIKE_ESCAPE, _LIKE_ESCAPE * 2).replace('%', _LIKE_ESCAPE + '%').replace('_', _LIKE_ESCAPE + '_')
+    )
+
+
+def term_filter(term: str, *columns):
+    """
+    Case-insensitive substring match of the search term on any of the columns.
+    The term is matched literally (% and _ are escaped) and the '%term%' pattern can use
+    the pg_trgm GIN indexes of the searched columns
+    """
+    pattern = f'%{_escape_like(term)}%'
+    return or_(*[column.ilike(pattern, escape=_LIKE_ESCAPE) for column in columns])
@@ -0,0 +1,205 @@
+"""
+Opt-in instrumentation of the SQL statements executed by the GraphQL operations.
+
+The statements are counted and timed with the cursor events of the engine while an operation is recorded,
+they are attributed to the GraphQL field being resolved and to the data.all function that issued them
+(the repository function usually). At the end of the operation the totals are printed as a CloudWatch
+embedded metric format document and a warning is logged when the operation exceeds its budgets.
+
+Configured in config.json with core.features.sql_instrumentation, e.g.
+    "sql_instrumentation": {"enabled": true, "statements_budget": 50, "db_time_budget_ms": 1000}
+
+With "graphql_extensions": true the recorded statements are also returned in the extensions of the GraphQL
+responses. They hold SQL text and code locations, so they are only returned in the local development
+environments and the setting is ignored in the deployed ones.
+"""
+
+import json
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from threading import local
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+
+from dataall.base.config import config
+
+log = logging.getLogger(__name__)
+
+_DEFAULT_SETTINGS = {
+    'enabled': False,
+    'statements_budget': 50,
+    'db_time_budget_ms': 1000,
+    'slowest_statements': 5,
+    'graphql_extensions': False,
+}
+_METRICS_NAMESPACE = 'dataall'
+_GRAPHQL_EXTENSIONS_ENVS = ['local', 'dkrcompose']
+_STATEMENT_MAX_LENGTH = 500
+
+
+def _caller() -> str:
+    """The first data.all function in the stack that is not part of the db layer, the repositories usually"""
+    frame = sys._getframe(2)
+    fallback = None
+    while frame:
+        module = frame.f_globals.get('__name__', '')
+        if module.startswith('dataall.') and not module.startswith('dataall.base.db'):
+            name = f'{module}.{frame.f_code.co_name}'
+            if '.db.' in module:
+                return name
+            fallback = fallback or name
+        frame = frame.f_back
+    return fallback or 'unknown'
+
+
+@dataclass
+class ResolverStatements:
+    statements: int = 0
+    db_time: float = 0.0
+
+
+@dataclass
+class OperationStatements:
+    """SQL statements executed by one GraphQL operation"""
+
+    operation: str
+    slowest_kept: int = _DEFAULT_SETTINGS['slowest_statements']
+    statements: int = 0
+    db_time: float = 0.0
+    resolver: str = None
+    resolvers: Dict[str, ResolverStatements] = field(default_factory=dict)
+    slowest: List[Tuple[float, str, str]] = field(default_factory=list)
+
+    def add(self, duration: float, caller: str, statement: str):
+        self.statements += 1
+        self.db_time += duration
+        resolver = self.resolvers.setdefault(self.resolver or self.operation, ResolverStatements())
+        resolver.statements += 1
+        resolver.db_time += duration
+        if len(self.slowest) < self.slowest_kept or duration > self.slowest[-1][0]:
+            self.slowest.append((duration, caller, ' '.join(statement.split())[:_STATEMENT_MAX_LENGTH]))
+            self.slowest.sort(key=lambda slow: slow[0], reverse=True)
+            del self.slowest[self.slowest_kept :]
+
+    def to_dict(self) -> dict:
+        return {
+            'operation': self.operation,
+            'statements': self.statements,
+            'dbTimeMs': round(self.db_time * 1000, 3),
+            'resolvers': {
+                name: {'statements': stats.statements, 'dbTimeMs': round(stats.db_time * 1000, 3)}
+                for name, stats in self.resolvers.items()
+            },
+            'slowest': [
+                {'dbTimeMs': round(duration * 1000, 3), 'caller': caller, 'statement': statement}
+                for duration, caller, statement in self.slowest
+            ],
+        }
+
+
+class SqlInstrumentation:
+    _current = local()
+
+    @staticmethod
+    def settings() -> dict:
+        return {**_DEFAULT_SETTINGS, **config.get_property('core.features.sql_instrumentation', {})}
+
+    @classmethod
+    def instrument(cls, engine) -> None:
+        """Listens to the cursor events of the SQLAlchemy engine if the instrumentation is enabled"""
+        if not cls.settings()['enabled'] or event.contains(engine, 'before_cursor_execute', cls._before_execute):
+            return
+        event.listen(engine, 'before_cursor_execute', cls._before_execute)
+        event.listen(engine, 'after_cursor_execute', cls._after_execute)
+
+    @classmethod
+    def current(cls) -> Optional[OperationStatements]:
+        return getattr(cls._current, 'operation', None)
+
+    @classmethod
+    @contextmanager
+    def record_operation(cls, operation: str):
+        """Records the statements executed in the context, yields None if the instrumentation is disabled"""
+        settings = cls.settings()
+        if not settings['enabled']:
+            yield None
+            return
+        recorded = OperationStatements(operation=operation or 'anonymous', slowest_kept=settings['slowest_statements'])
+        cls._current.operation = recorded
+        try:
+            yield recorded
+        finally:
+            cls._current.operation = None
+            cls._report(recorded, settings)
+
+    @classmethod
+    @contextmanager
+    def resolving(cls, resolver: str):
+        """Attributes the statements executed in the context to the resolver"""
+        recorded = cls.current()
+        if recorded is None:
+            yield
+            return
+        parent, recorded.resolver = recorded.resolver, resolver
+        try:
+            yield
+        finally:
+            recorded.resolver = parent
+
+    @classmethod
+    def graphql_extensions(cls, recorded: Optional[OperationStatements]) -> Optional[dict]:
+        if recorded is None or not cls.settings()['graphql_extensions']:
+            return None
+        if os.getenv('envname', 'local') not in _GRAPHQL_EXTENSIONS_ENVS:
+            return None
+        return {'sqlStatements': recorded.to_dict()}
+
+    @classmethod
+    def _before_execute(cls, conn, cursor, statement, parameters, context, executemany):
+        if cls.current() is not None:
+            conn.info.setdefault('instrumentation_started', []).append(time.perf_counter())
+
+    @classmethod
+    def _after_execute(cls, conn, cursor, statement, parameters, context, executemany):
+        recorded = cls.current()
+        started = conn.info.get('instrumentation_started')
+        if recorded is None or not started:
+            return
+        recorded.add(time.perf_counter() - started.pop(), _caller(), statement)
+
+    @staticmethod
+    def _report(recorded: OperationStatements, settings: dict):
+        db_time_ms = round(recorded.db_time * 1000, 3)
+        # printed as is, the embedded metric format requires the log line to be the JSON document only
+        print(
+            json.dumps(
+                {
+                    '_aws': {
+                        'Timestamp': int(time.time() * 1000),
+                        'CloudWatchMetrics': [
+                            {
+                                'Namespace': _METRICS_NAMESPACE,
+                                'Dimensions': [['Operation']],
+                                'Metrics': [
+                                    {'Name': 'SqlStatements', 'Unit': 'Count'},
+                                    {'Name': 'SqlDbTime', 'Unit': 'Milliseconds'},
+                                ],
+                            }
+                        ],
+                    },
+                    'Operation': recorded.operation,
+                    'SqlStatements': recorded.statements,
+                    'SqlDbTime': db_time_ms,
+                }
+            )
+        )
+        if recorded.statements > settings['statements_budget'] or db_time_ms > settings['db_time_budget_ms']:
+            log.warning(
+                f'Operation {recorded.operation} exceeded its SQL budget of {settings["statements_budget"]} statements '
+                f'and {settings["db_time_budget_ms"]} ms: {json.dumps(recorded.to_dict())}'
+            )
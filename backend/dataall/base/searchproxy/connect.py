@@ -3,14 +3,19 @@ from urllib.parse import urlparse
 
 import boto3
 import opensearchpy
+from requests.adapters import HTTPAdapter
 from requests_aws4auth import AWS4Auth
 
 from dataall.base import utils
 
+# Groups allowed to find the document in the catalog
+ALLOWED_GROUPS_FIELD = 'allowedGroups'
+
 CREATE_INDEX_REQUEST_BODY = {
     'mappings': {
         'properties': {
             '_indexed': {'type': 'date'},
+            ALLOWED_GROUPS_FIELD: {'type': 'keyword'},
             'admins': {
                 'type': 'text',
                 'fields': {'keyword': {'type': 'keyword', 'ignore_above': 256}},
@@ -45,6 +50,19 @@ CREATE_INDEX_REQUEST_BODY = {
 }
 
 
+class PooledRequestsHttpConnection(opensearchpy.RequestsHttpConnection):
+    """
+    Requests connection that keeps its connections alive in a pool, the warm Lambda/ECS containers
+    reuse them instead of opening a new TLS connection for every request
+    """
+
+    def __init__(self, *args, pool_maxsize=10, **kwargs):
+        super().__init__(*args, **kwargs)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+
 def connect(envname='local'):
     if envname in ['local', 'pytest', 'dkrcompose']:
         return connect_dev_environment(envname)
@@ -71,7 +89,12 @@ def connect(envname='local'):
             http_auth=awsauth,
             use_ssl=True,
             verify_certs=True,
-            connection_class=opensearchpy.RequestsHttpConnection,
+            connection_class=PooledRequestsHttpConnection,
+            http_compress=True,
+            timeout=10,
+            # pooled connections closed by the domain while the container was idle are retried once
+            max_retries=1,
+            retry_on_timeout=True,
         )
 
         # Avoid calling GET /info endpoint because it is not available in OpenSearch Serverless
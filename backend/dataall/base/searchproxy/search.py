@@ -1,15 +1,98 @@
 import os
 
 import json
-from .connect import connect
+from .connect import ALLOWED_GROUPS_FIELD, connect
 
+# Fields of the indexed documents that the catalog renders or searches on, the rest of the documents is not returned
+RESULT_SOURCE_FIELDS = [
+    'admins',
+    'created',
+    'datasetUri',
+    'description',
+    'environmentName',
+    'label',
+    'name',
+    'owner',
+    'region',
+    'resourceKind',
+    'tags',
+    'topics',
+    'upvotes',
+]
+# Parts of the search responses that the catalog reads
+RESULT_FILTER_PATH = [
+    'took',
+    'timed_out',
+    'hits.total',
+    'hits.max_score',
+    'hits.hits._id',
+    'hits.hits._index',
+    'hits.hits._score',
+    'hits.hits._source',
+    'hits.hits.highlight',
+    'aggregations',
+]
+MSEARCH_FILTER_PATH = ['responses.status', 'responses.error'] + [f'responses.{path}' for path in RESULT_FILTER_PATH]
 
-def run_query(es, index, body):
+
+def _with_source_filter(search_object):
+    source = search_object.get('_source')
+    if source is None or (isinstance(source, dict) and source.get('includes', ['*']) == ['*']):
+        search_object['_source'] = {
+            'includes': RESULT_SOURCE_FIELDS,
+            'excludes': source.get('excludes', []) if source else [],
+        }
+    return search_object
+
+
+def _check_no_global_aggregation(aggregations):
+    """Global aggregations ignore the query, they would reach documents outside of the groups filter"""
+    for aggregation in (aggregations or {}).values():
+        if not isinstance(aggregation, dict):
+            continue
+        if 'global' in aggregation:
+            raise ValueError('Global aggregations are not allowed in catalog searches')
+        _check_no_global_aggregation(aggregation.get('aggs'))
+        _check_no_global_aggregation(aggregation.get('aggregations'))
+
+
+def _with_groups_filter(search_object, groups):
+    """Restricts the hits and the aggregations to the documents that the groups are allowed to find"""
+    _check_no_global_aggregation(search_object.get('aggs'))
+    _check_no_global_aggregation(search_object.get('aggregations'))
+    allowed = {
+        'bool': {
+            'should': [
+                {'terms': {ALLOWED_GROUPS_FIELD: groups}},
+                # documents indexed before the allowed groups existed stay visible until they are reindexed
+                {'bool': {'must_not': {'exists': {'field': ALLOWED_GROUPS_FIELD}}}},
+            ],
+            'minimum_should_match': 1,
+        }
+    }
+    search_object['query'] = {'bool': {'must': [search_object.get('query', {'match_all': {}})], 'filter': [allowed]}}
+    return search_object
+
+
+def run_query(es, index, body, groups=None):
+    """
+    Runs the NDJSON multi search body of the catalog against the index.
+    A single search is answered with a search response, several searches with a multi search response.
+    If groups are given only the documents they are allowed to find are searched
+    """
     if not es:
         print('ES connection is null creating it...')
         es = connect(envname=os.getenv('envname', 'local'))
         if not es:
             raise Exception('Failed to create ES connection')
-    search_object = json.loads(body.split('\n')[1])
-    res = es.search(index=index, body=search_object)
-    return res
+    lines = [line for line in body.split('\n') if line.strip()]
+    # Every other line is a header naming the index, the searches are always run against the given index
+    searches = [_with_source_filter(json.loads(line)) for line in lines[1::2]]
+    if groups is not None:
+        searches = [_with_groups_filter(search_object, groups) for search_object in searches]
+    if len(searches) == 1:
+        return es.search(index=index, body=searches[0], filter_path=RESULT_FILTER_PATH)
+    msearch_body = []
+    for search_object in searches:
+        msearch_body.extend([{'index': index}, search_object])
+    return es.msearch(index=index, body=msearch_body, filter_path=MSEARCH_FILTER_PATH)
@@ -0,0 +1,61 @@
+import time
+from threading import Lock
+
+
+class TTLCache:
+    """
+    Small in-process cache whose entries expire after a fixed time to live.
+    It lives as long as the Lambda/ECS container is warm, so it only fits data where bounded staleness is acceptable
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int = 1024):
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max_size
+        self._entries = {}
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            return value
+
+    def set(self, key, value) -> None:
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self._max_size:
+                self._evict()
+            self._entries[key] = (value, time.monotonic() + self._ttl_seconds)
+
+    def get_or_set(self, key, factory):
+        """Returns the cached value of the key or computes it with factory() and caches it"""
+        marker = object()
+        value = self.get(key, marker)
+        if value is marker:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key=None) -> None:
+        """Drops the key or the whole cache if no key is given"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _evict(self):
+        now = time.monotonic()
+        expired = [key for key, (_, expires_at) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        if len(self._entries) >= self._max_size:
+            # dicts keep insertion order, the first entry is the oldest one
+            del self._entries[next(iter(self._entries))]
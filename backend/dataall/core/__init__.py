@@ -1,3 +1,3 @@
 """The package contains the core functionality that is required by data.all to work correctly"""
 
-from dataall.core import permissions, stacks, groups, environment, organizations, tasks, vpc, resource_lock
+from dataall.core import permissions, stacks, groups, environment, organizations, tasks, vpc, resource_lock, quicksight
@@ -2,7 +2,7 @@
 
 import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, String, ForeignKey
+from sqlalchemy import Boolean, Column, DateTime, String, ForeignKey, Index
 from sqlalchemy.orm import query_expression
 from dataall.base.db import Resource, Base, utils
 
@@ -57,6 +57,9 @@ class EnvironmentGroup(Base):
     # environmentRole is the role of the entity (group or user) in the Environment
     groupRoleInEnvironment = Column(String, nullable=False, default=EnvironmentPermission.Invited.value)
 
+    # the primary key (groupUri, environmentUri) already serves the lookups by group
+    __table_args__ = (Index('ix_environment_group_permission_environmentUri', 'environmentUri'),)
+
 
 class EnvironmentParameter(Base):
     """Represent the parameter of the environment"""
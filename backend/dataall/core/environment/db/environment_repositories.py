@@ -4,10 +4,13 @@ from dataall.core.environment.db.environment_models import (
     ConsumptionRole,
     EnvironmentGroup,
 )
+from dataall.core.environment.api.enums import EnvironmentPermission
+from dataall.core.stacks.db.stack_models import Stack
+from sqlalchemy import case, exists, literal
 from sqlalchemy.sql import and_, or_
-from sqlalchemy.orm import Query
+from sqlalchemy.orm import Query, aliased, with_expression
 
-from dataall.base.db import exceptions
+from dataall.base.db import exceptions, term_filter
 from typing import List
 
 
@@ -130,11 +133,7 @@ class EnvironmentRepository:
         query = session.query(ConsumptionRole).filter(ConsumptionRole.environmentUri == uri)
         if filter and filter.get('term'):
             term = filter['term']
-            query = query.filter(
-                or_(
-                    ConsumptionRole.consumptionRoleName.ilike('%' + term + '%'),
-                )
-            )
+            query = query.filter(term_filter(term, ConsumptionRole.consumptionRoleName))
         if filter and filter.get('groupUri'):
             group = filter['groupUri']
             query = query.filter(
@@ -153,11 +152,7 @@ class EnvironmentRepository:
         )
         if filter and filter.get('term'):
             term = filter['term']
-            query = query.filter(
-                or_(
-                    ConsumptionRole.consumptionRoleName.ilike('%' + term + '%'),
-                )
-            )
+            query = query.filter(term_filter(term, ConsumptionRole.consumptionRoleName))
         if filter and filter.get('groupUri'):
             print('filter group')
             group = filter['groupUri']
@@ -185,11 +180,7 @@ class EnvironmentRepository:
         )
         if filter and filter.get('term'):
             term = filter['term']
-            query = query.filter(
-                or_(
-                    EnvironmentGroup.groupUri.ilike('%' + term + '%'),
-                )
-            )
+            query = query.filter(term_filter(term, EnvironmentGroup.groupUri))
         return query.order_by(EnvironmentGroup.groupUri)
 
     @staticmethod
@@ -201,11 +192,7 @@ class EnvironmentRepository:
         )
         if filter and filter.get('term'):
             term = filter['term']
-            query = query.filter(
-                or_(
-                    EnvironmentGroup.groupUri.ilike('%' + term + '%'),
-                )
-            )
+            query = query.filter(term_filter(term, EnvironmentGroup.groupUri))
         return query.order_by(EnvironmentGroup.groupUri)
 
     @staticmethod
@@ -213,11 +200,7 @@ class EnvironmentRepository:
         query = session.query(EnvironmentGroup).filter(EnvironmentGroup.environmentUri == uri)
         if filter and filter.get('term'):
             term = filter['term']
-            query = query.filter(
-                or_(
-                    EnvironmentGroup.groupUri.ilike('%' + term + '%'),
-                )
-            )
+            query = query.filter(term_filter(term, EnvironmentGroup.groupUri))
         return query.order_by(EnvironmentGroup.groupUri)
 
     @staticmethod
@@ -229,11 +212,7 @@ class EnvironmentRepository:
         )
         if filter and filter.get('term'):
             term = filter['term']
-            query = query.filter(
-                or_(
-                    ConsumptionRole.consumptionRoleName.ilike('%' + term + '%'),
-                )
-            )
+            query = query.filter(term_filter(term, ConsumptionRole.consumptionRoleName))
         if filter and filter.get('groupUri'):
             print('filter group')
             group = filter['groupUri']
@@ -253,11 +232,7 @@ class EnvironmentRepository:
         )
         if filter and filter.get('term'):
             term = filter['term']
-            query = query.filter(
-                or_(
-                    EnvironmentGroup.groupUri.ilike('%' + term + '%'),
-                )
-            )
+            query = query.filter(term_filter(term, EnvironmentGroup.groupUri))
         return query.order_by(EnvironmentGroup.groupUri)
 
     @staticmethod
@@ -279,16 +254,56 @@ class EnvironmentRepository:
             term = filter['term']
             query = query.filter(
                 or_(
-                    Environment.label.ilike('%' + term + '%'),
-                    Environment.description.ilike('%' + term + '%'),
+                    term_filter(term, Environment.label, Environment.description, Environment.region),
                     Environment.tags.contains(f'{{{term}}}'),
-                    Environment.region.ilike('%' + term + '%'),
                 )
             )
         if filter and filter.get('SamlGroupName') and filter.get('SamlGroupName') in groups:
             query = query.filter(EnvironmentGroup.groupUri == filter.get('SamlGroupName'))
+        query = query.options(
+            with_expression(
+                Environment.userRoleInEnvironment, EnvironmentRepository.user_role_in_environment(username, groups)
+            )
+        )
         return query.order_by(Environment.label).distinct()
 
+    @staticmethod
+    def query_user_environments_with_stack_status(session, username, groups, filter, statuses) -> Query:
+        return EnvironmentRepository.query_user_environments(session, username, groups, filter).join(
+            Stack,
+            and_(
+                Stack.targetUri == Environment.environmentUri,
+                Stack.status.in_(statuses),
+            ),
+        )
+
+    @staticmethod
+    def user_role_in_environment(username, groups):
+        """
+        SQL expression of the EnvironmentPermission of the user, it resolves the role of all the listed environments
+        in the list query itself instead of running is_user_invited_to_environment for every environment
+        """
+        if not groups:
+            return case(
+                [(Environment.owner == username, EnvironmentPermission.Owner.value)],
+                else_=literal(EnvironmentPermission.NotInvited.value),
+            )
+        invited_group = aliased(EnvironmentGroup)
+        is_invited = exists().where(
+            and_(
+                invited_group.environmentUri == Environment.environmentUri,
+                invited_group.groupUri.in_(groups),
+            )
+        )
+        return case(
+            [
+                (Environment.owner == username, EnvironmentPermission.Owner.value),
+                (Environment.SamlGroupName.in_(groups), EnvironmentPermission.Admin.value),
+                (is_invited, EnvironmentPermission.Invited.value),
+            ],
+            else_=literal(EnvironmentPermission.NotInvited.value),
+        )
+
     @staticmethod
     def is_user_invited_to_environment(session, groups, uri):
         env_group = (
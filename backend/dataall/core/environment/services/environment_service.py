@@ -674,16 +674,14 @@ class EnvironmentService:
         context = get_context()
         data = data if data is not None else {}
         with context.db_engine.scoped_session() as session:
-            query = EnvironmentRepository.query_user_environments(session, context.username, context.groups, data)
-            valid_environments = []
             valid_statuses = [
                 StackStatus.CREATE_COMPLETE.value,
                 StackStatus.UPDATE_COMPLETE.value,
                 StackStatus.UPDATE_ROLLBACK_COMPLETE.value,
             ]
-            for env in query:
-                if StackRepository.find_stack_by_target_uri(session, env.environmentUri, valid_statuses):
-                    valid_environments.append(env)
+            valid_environments = EnvironmentRepository.query_user_environments_with_stack_status(
+                session, context.username, context.groups, data, valid_statuses
+            ).all()
 
             return {
                 'count': len(valid_environments),
@@ -918,6 +916,9 @@ class EnvironmentService:
 
     @staticmethod
     def resolve_user_role(environment: Environment):
+        if environment.userRoleInEnvironment:
+            # resolved by the list query already
+            return environment.userRoleInEnvironment
         if environment.owner == get_context().username:
             return EnvironmentPermission.Owner.value
         elif environment.SamlGroupName in get_context().groups:
@@ -10,7 +10,6 @@ from dataall.core.environment.tasks.env_stack_finder import StackFinder
 from dataall.core.stacks.aws.ecs import Ecs
 from dataall.core.stacks.db.stack_repositories import StackRepository
 from dataall.base.db import get_engine
-from dataall.base.utils import Parameter
 
 root = logging.getLogger()
 root.setLevel(logging.INFO)
@@ -42,12 +41,13 @@ def update_stacks(engine, envname):
 
 def update_stack(session, envname, target_uri, wait=False):
     stack = StackRepository.get_stack_by_target_uri(session, target_uri=target_uri)
-    cluster_name = Parameter().get_parameter(env=envname, path='ecs/cluster/name')
-    if not Ecs.is_task_running(cluster_name=cluster_name, started_by=f'awsworker-{stack.stackUri}'):
+    # one listing of the cluster tasks answers for all the stacks polled within the same interval
+    tracker = Ecs.task_tracker()
+    if not tracker.is_running(started_by=f'awsworker-{stack.stackUri}'):
         stack.EcsTaskArn = Ecs.run_cdkproxy_task(stack_uri=stack.stackUri)
         if wait:
             retries = 1
-            while Ecs.is_task_running(cluster_name=cluster_name, started_by=f'awsworker-{stack.stackUri}'):
+            while tracker.is_running(started_by=f'awsworker-{stack.stackUri}'):
                 log.info(
                     f'Update for {stack.name}//{stack.stackUri} is not complete, waiting for {SLEEP_TIME} seconds...'
                 )
@@ -1,11 +1,13 @@
 import logging
+from typing import List
 
 from sqlalchemy import or_, and_
-from sqlalchemy.orm import Query
+from sqlalchemy.orm import Query, with_expression
 
-from dataall.base.db import exceptions, paginate
+from dataall.base.db import exceptions, paginate, term_filter
 from dataall.core.organizations.db import organization_models as models
 from dataall.core.environment.db.environment_models import Environment
+from dataall.core.environment.db.environment_repositories import EnvironmentRepository
 from dataall.base.context import get_context
 
 logger = logging.getLogger(__name__)
@@ -43,8 +45,7 @@ class OrganizationRepository:
         if filter and filter.get('term'):
             query = query.filter(
                 or_(
-                    models.Organization.label.ilike('%' + filter.get('term') + '%'),
-                    models.Organization.description.ilike('%' + filter.get('term') + '%'),
+                    term_filter(filter.get('term'), models.Organization.label, models.Organization.description),
                     models.Organization.tags.contains(f"{{{filter.get('term')}}}"),
                 )
             )
@@ -61,14 +62,19 @@ class OrganizationRepository:
 
     @staticmethod
     def query_organization_environments(session, uri, filter) -> Query:
-        query = session.query(Environment).filter(Environment.organizationUri == uri)
-        if filter and filter.get('term'):
-            query = query.filter(
-                or_(
-                    Environment.label.ilike('%' + filter.get('term') + '%'),
-                    Environment.description.ilike('%' + filter.get('term') + '%'),
+        context = get_context()
+        query = (
+            session.query(Environment)
+            .filter(Environment.organizationUri == uri)
+            .options(
+                with_expression(
+                    Environment.userRoleInEnvironment,
+                    EnvironmentRepository.user_role_in_environment(context.username, context.groups),
                 )
             )
+        )
+        if filter and filter.get('term'):
+            query = query.filter(term_filter(filter.get('term'), Environment.label, Environment.description))
         return query.order_by(Environment.label)
 
     @staticmethod
@@ -83,13 +89,18 @@ class OrganizationRepository:
     def query_organization_groups(session, uri, filter) -> Query:
         query = session.query(models.OrganizationGroup).filter(models.OrganizationGroup.organizationUri == uri)
         if filter and filter.get('term'):
-            query = query.filter(
-                or_(
-                    models.OrganizationGroup.groupUri.ilike('%' + filter.get('term') + '%'),
-                )
-            )
+            query = query.filter(term_filter(filter.get('term'), models.OrganizationGroup.groupUri))
         return query.order_by(models.OrganizationGroup.groupUri)
 
+    @staticmethod
+    def get_organization_group_uris(session, uri) -> List[str]:
+        return [
+            group_uri
+            for (group_uri,) in session.query(models.OrganizationGroup.groupUri).filter(
+                models.OrganizationGroup.organizationUri == uri
+            )
+        ]
+
     @staticmethod
     def paginated_organization_groups(session, uri, data=None) -> dict:
         return paginate(
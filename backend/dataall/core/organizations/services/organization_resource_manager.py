@@ -0,0 +1,26 @@
+from abc import ABC
+from typing import List
+
+
+class OrganizationResource(ABC):
+    @staticmethod
+    def update_org_groups(session, organization):
+        pass
+
+
+class OrganizationResourceManager:
+    """
+    API for managing the resources of an organization.
+    Contains callbacks that are invoked when the teams of the organization change.
+    """
+
+    _resources: List[OrganizationResource] = []
+
+    @classmethod
+    def register(cls, resource: OrganizationResource):
+        cls._resources.append(resource)
+
+    @classmethod
+    def update_org_groups(cls, session, organization):
+        for resource in cls._resources:
+            resource.update_org_groups(session, organization)
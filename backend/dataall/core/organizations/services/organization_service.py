@@ -4,6 +4,7 @@ from dataall.core.activity.db.activity_models import Activity
 from dataall.core.environment.db.environment_repositories import EnvironmentRepository
 from dataall.core.organizations.db.organization_repositories import OrganizationRepository
 from dataall.core.organizations.services.organizations_enums import OrganisationUserRole
+from dataall.core.organizations.services.organization_resource_manager import OrganizationResourceManager
 from dataall.core.organizations.db.organization_models import OrganizationGroup
 from dataall.core.organizations.db import organization_models as models
 from dataall.core.permissions.api.enums import PermissionType
@@ -213,6 +214,7 @@ class OrganizationService:
                 permissions=permissions,
                 resource_type=models.Organization.__name__,
             )
+            OrganizationResourceManager.update_org_groups(session, organization)
 
             return organization
 
@@ -286,6 +288,7 @@ class OrganizationService:
                 resource_uri=organization.organizationUri,
                 resource_type=models.Organization.__name__,
             )
+            OrganizationResourceManager.update_org_groups(session, organization)
             return organization
 
     @staticmethod
@@ -2,7 +2,7 @@ import logging
 
 from sqlalchemy.sql import and_
 
-from dataall.base.db import paginate
+from dataall.base.db import paginate, term_filter
 from dataall.core.permissions.db.permission.permission_models import Permission
 from dataall.core.permissions.db.tenant.tenant_models import TenantPolicy, Tenant, TenantPolicyPermission
 
@@ -37,6 +37,30 @@ class TenantPolicyRepository:
         )
         return tenant_policy
 
+    @staticmethod
+    def list_groups_tenant_permission_names(session, groups: [str], tenant_name: str):
+        """Returns the (group, permission name) pairs of the tenant policies of the groups"""
+        return (
+            session.query(TenantPolicy.principalId, Permission.name)
+            .join(
+                TenantPolicyPermission,
+                TenantPolicy.sid == TenantPolicyPermission.sid,
+            )
+            .join(
+                Tenant,
+                Tenant.tenantUri == TenantPolicy.tenantUri,
+            )
+            .join(
+                Permission,
+                Permission.permissionUri == TenantPolicyPermission.permissionUri,
+            )
+            .filter(
+                TenantPolicy.principalId.in_(groups),
+                Tenant.name == tenant_name,
+            )
+            .all()
+        )
+
     @staticmethod
     def has_group_tenant_permission(session, group_uri: str, tenant_name: str, permission_name: str):
         tenant_policy: TenantPolicy = (
@@ -96,7 +120,7 @@ class TenantPolicyRepository:
         )
 
         if data and data.get('term'):
-            query = query.filter(TenantPolicy.principalId.ilike('%' + data.get('term') + '%'))
+            query = query.filter(term_filter(data.get('term'), TenantPolicy.principalId))
 
         return paginate(
             query=query.order_by(TenantPolicy.principalId),
@@ -1,3 +1,4 @@
+import datetime
 import logging
 
 from dataall.core.permissions.db.tenant.tenant_models import Tenant
@@ -10,3 +11,14 @@ class TenantRepository:
     def find_tenant_by_name(session, tenant_name: str) -> Tenant:
         tenant = session.query(Tenant).filter(Tenant.name == tenant_name).first()
         return tenant
+
+    @staticmethod
+    def get_permissions_version(session, tenant_name: str):
+        """The last update of the tenant row is the version of the tenant permissions"""
+        return session.query(Tenant.updated).filter(Tenant.name == tenant_name).scalar()
+
+    @staticmethod
+    def bump_permissions_version(session, tenant_name: str):
+        session.query(Tenant).filter(Tenant.name == tenant_name).update(
+            {Tenant.updated: datetime.datetime.now()}, synchronize_session=False
+        )
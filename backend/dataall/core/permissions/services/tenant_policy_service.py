@@ -8,6 +8,7 @@ from dataall.base.context import get_context
 from dataall.core.permissions.db.tenant.tenant_repositories import TenantRepository
 from dataall.core.permissions.services.permission_service import PermissionService
 from dataall.core.permissions.db.tenant.tenant_models import Tenant
+from dataall.base.utils.ttl_cache import TTLCache
 import logging
 from functools import wraps
 
@@ -116,6 +117,11 @@ class TenantPolicyValidationService:
 class TenantPolicyService:
     TENANT_NAME = 'dataall'
 
+    # The permissions of the groups are cached per version of the tenant permissions.
+    # Re-reading the version every 30 seconds bounds how long other containers keep using outdated permissions
+    _tenant_versions = TTLCache(ttl_seconds=30)
+    _group_permissions = TTLCache(ttl_seconds=15 * 60)
+
     @staticmethod
     def update_group_permissions(data, check_perm=None):
         RequestValidationService.validate_update_group_permission_params(data)
@@ -188,22 +194,46 @@ class TenantPolicyService:
         if not username or not permission_name:
             return False
 
-        tenant_policy = TenantPolicyRepository.has_user_tenant_permission(
-            session=session,
-            groups=groups,
-            permission_name=permission_name,
-            tenant_name=tenant_name,
-        )
-
-        if not tenant_policy:
+        if permission_name not in TenantPolicyService.get_groups_tenant_permissions(session, groups, tenant_name):
             raise exceptions.TenantUnauthorized(
                 username=username,
                 action=permission_name,
                 tenant_name=tenant_name,
             )
 
-        else:
-            return tenant_policy
+        return True
+
+    @staticmethod
+    def get_groups_tenant_permissions(session, groups: [str], tenant_name: str) -> set:
+        """Returns the names of the tenant permissions of all the groups, the database is queried on cache misses only"""
+        version = TenantPolicyService._tenant_versions.get_or_set(
+            tenant_name, lambda: TenantRepository.get_permissions_version(session, tenant_name)
+        )
+        permissions = set()
+        missing_groups = []
+        for group in groups or []:
+            group_permissions = TenantPolicyService._group_permissions.get((tenant_name, version, group))
+            if group_permissions is None:
+                missing_groups.append(group)
+            else:
+                permissions.update(group_permissions)
+
+        if missing_groups:
+            loaded = {group: set() for group in missing_groups}
+            for group, permission_name in TenantPolicyRepository.list_groups_tenant_permission_names(
+                session, missing_groups, tenant_name
+            ):
+                loaded[group].add(permission_name)
+            for group, group_permissions in loaded.items():
+                TenantPolicyService._group_permissions.set((tenant_name, version, group), frozenset(group_permissions))
+                permissions.update(group_permissions)
+        return permissions
+
+    @staticmethod
+    def bump_permissions_version(session, tenant_name: str):
+        """Makes every container reload the tenant permissions of the groups"""
+        TenantRepository.bump_permissions_version(session, tenant_name)
+        TenantPolicyService._tenant_versions.invalidate(tenant_name)
 
     @staticmethod
     def attach_group_tenant_policy(
@@ -217,6 +247,7 @@ class TenantPolicyService:
         policy = TenantPolicyService.save_group_tenant_policy(session, group, tenant_name)
 
         TenantPolicyService.add_permission_to_group_tenant_policy(session, group, permissions, tenant_name, policy)
+        TenantPolicyService.bump_permissions_version(session, tenant_name)
 
         return policy
 
@@ -308,6 +339,7 @@ class TenantPolicyService:
             for permission in policy.permissions:
                 session.delete(permission)
             session.delete(policy)
+            TenantPolicyService.bump_permissions_version(session, tenant_name)
             session.commit()
 
         return True
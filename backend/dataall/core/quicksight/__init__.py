@@ -0,0 +1 @@
+from dataall.core.quicksight import db
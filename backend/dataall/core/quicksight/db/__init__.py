@@ -0,0 +1 @@
+from dataall.core.quicksight.db import quicksight_models
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, DateTime, String
+
+from dataall.base.db import Base
+
+
+class QuicksightAccountMetadata(Base):
+    """Quicksight settings of an AWS account that are expensive to discover, see QuicksightMetadataService"""
+
+    __tablename__ = 'quicksight_account_metadata'
+    AwsAccountId = Column(String, primary_key=True)
+    identityRegion = Column(String, nullable=False)
+    edition = Column(String, nullable=True)
+    subscriptionStatus = Column(String, nullable=True)
+    defaultGroupArn = Column(String, nullable=True)
+    lastSynced = Column(DateTime, nullable=False)
@@ -0,0 +1,21 @@
+from sqlalchemy.dialects.postgresql import insert
+
+from dataall.core.quicksight.db.quicksight_models import QuicksightAccountMetadata
+
+
+class QuicksightAccountMetadataRepository:
+    @staticmethod
+    def find_account_metadata(session, account_id) -> QuicksightAccountMetadata:
+        return session.query(QuicksightAccountMetadata).get(account_id)
+
+    @staticmethod
+    def save_account_metadata(session, metadata: dict) -> QuicksightAccountMetadata:
+        """Inserts or replaces the metadata of the account, concurrent refreshes of a new account do not conflict"""
+        statement = insert(QuicksightAccountMetadata).values(**metadata)
+        session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[QuicksightAccountMetadata.AwsAccountId],
+                set_={column: statement.excluded[column] for column in metadata if column != 'AwsAccountId'},
+            )
+        )
+        return session.query(QuicksightAccountMetadata).populate_existing().get(metadata['AwsAccountId'])
@@ -0,0 +1,79 @@
+"""
+Keeps the Quicksight identity region, subscription and default group of the AWS accounts in the data.all database.
+Finding the identity region probes the Quicksight regions one by one, and the subscription and the default group are
+checked on every share and dashboard session. The persisted values are refreshed when older than the configured time
+to live and they prime the in-process caches of QuicksightClient
+"""
+
+import logging
+from datetime import datetime, timedelta
+
+from dataall.base.aws.quicksight import QuicksightClient
+from dataall.base.config import config
+from dataall.core.quicksight.db.quicksight_models import QuicksightAccountMetadata
+from dataall.core.quicksight.db.quicksight_repositories import QuicksightAccountMetadataRepository
+
+log = logging.getLogger(__name__)
+
+
+class QuicksightMetadataService:
+    _DEFAULT_TTL_MINUTES = 24 * 60
+
+    @staticmethod
+    def get_identity_region(session, account_id, region) -> str:
+        return QuicksightMetadataService._get_account_metadata(session, account_id, region).identityRegion
+
+    @staticmethod
+    def check_enterprise_subscription(session, account_id, region) -> bool:
+        """Same as QuicksightClient.check_quicksight_enterprise_subscription, only an active subscription is reused"""
+        metadata = QuicksightMetadataService._get_account_metadata(session, account_id, region)
+        if not QuicksightMetadataService._is_subscription_active(metadata):
+            account_info = QuicksightClient.get_account_subscription(account_id, region)
+            metadata.edition = account_info['Edition']
+            metadata.subscriptionStatus = account_info['AccountSubscriptionStatus']
+        return QuicksightClient.check_enterprise_subscription(account_id, metadata.edition, metadata.subscriptionStatus)
+
+    @staticmethod
+    def get_default_group_arn(session, account_id, region) -> str:
+        """Returns the ARN of the data.all default Quicksight group, the group is created when missing"""
+        metadata = QuicksightMetadataService._get_account_metadata(session, account_id, region)
+        if not metadata.defaultGroupArn:
+            group = QuicksightClient.create_quicksight_group(AwsAccountId=account_id, region=region)
+            metadata.defaultGroupArn = group.get('Group', {}).get('Arn') if group else None
+        return metadata.defaultGroupArn
+
+    @staticmethod
+    def _get_account_metadata(session, account_id, region) -> QuicksightAccountMetadata:
+        metadata = QuicksightAccountMetadataRepository.find_account_metadata(session, account_id)
+        if metadata is None or QuicksightMetadataService._is_stale(metadata.lastSynced):
+            log.info(f'Refreshing Quicksight metadata of account {account_id}')
+            metadata = QuicksightAccountMetadataRepository.save_account_metadata(
+                session,
+                {
+                    'AwsAccountId': account_id,
+                    'identityRegion': QuicksightClient.get_identity_region(account_id, region),
+                    'edition': None,
+                    'subscriptionStatus': None,
+                    'defaultGroupArn': None,
+                    'lastSynced': datetime.now(),
+                },
+            )
+        else:
+            QuicksightClient.remember_identity_region(account_id, metadata.identityRegion)
+        return metadata
+
+    @staticmethod
+    def _is_subscription_active(metadata: QuicksightAccountMetadata) -> bool:
+        try:
+            return QuicksightClient.check_enterprise_subscription(
+                metadata.AwsAccountId, metadata.edition, metadata.subscriptionStatus
+            )
+        except Exception:
+            return False
+
+    @staticmethod
+    def _is_stale(last_synced) -> bool:
+        ttl_minutes = config.get_property(
+            'core.features.quicksight_metadata_cache_ttl_minutes', QuicksightMetadataService._DEFAULT_TTL_MINUTES
+        )
+        return last_synced < datetime.now() - timedelta(minutes=ttl_minutes)
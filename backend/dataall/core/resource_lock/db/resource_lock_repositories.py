@@ -1,68 +1,120 @@
+import hashlib
 import logging
+import time
 
 from dataall.core.resource_lock.db.resource_lock_models import ResourceLock
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
-from time import sleep
 from typing import List, Tuple
 from contextlib import contextmanager
 from dataall.base.db.exceptions import ResourceLockTimeout
 
 log = logging.getLogger(__name__)
 
-MAX_RETRIES = 10
-RETRY_INTERVAL = 60
+LOCK_TIMEOUT = 600
+
+
+def _autocommit(statement):
+    # the advisory locks are session level locks, the connection must not stay idle in a transaction while holding them
+    return text(statement).execution_options(autocommit=True)
 
 
 class ResourceLockRepository:
     @staticmethod
-    def _acquire_locks(resources, session, acquired_by_uri, acquired_by_type):
+    def _lock_key(resource) -> int:
+        """The 64 bits key of the Postgres advisory lock of a (resourceUri, resourceType) resource"""
+        digest = hashlib.sha256(f'{resource[1]}/{resource[0]}'.encode()).digest()
+        return int.from_bytes(digest[:8], 'big', signed=True)
+
+    @staticmethod
+    def _acquire_advisory_locks(connection, resources, timeout):
         """
-        Attempts to acquire/create one or more locks on the resources identified by resourceUri and resourceType.
+        Waits for the session level advisory locks of the resources on the dedicated connection.
+        Postgres grants the locks to the waiters in the order they asked for them and releases them as soon as
+        the holder unlocks them or its connection is closed, e.g. when the ECS task holding them crashes.
 
         Args:
+            connection: The dedicated connection that holds the locks, it must not be used by the SQLAlchemy session.
             resources: List of resource tuples (resourceUri, resourceType) to acquire locks for.
-            session (sqlalchemy.orm.Session): The SQLAlchemy session object used for interacting with the database.
-            acquired_by_uri: The ID of the resource that is attempting to acquire the lock.
-            acquired_by_type: The resource type that is attempting to acquire the lock.qu
+            timeout: Maximum number of seconds to wait for all the locks.
 
         Returns:
-            bool: True if the lock is successfully acquired, False otherwise.
+            list: The acquired lock keys, they are acquired in a sorted order to prevent deadlocks.
         """
+        keys = sorted({ResourceLockRepository._lock_key(resource) for resource in resources})
+        acquired = []
+        deadline = time.monotonic() + timeout
         try:
-            # Execute the query to get the ResourceLock object
-            filter_conditions = [
-                and_(
-                    ResourceLock.resourceUri == resource[0],
-                    ResourceLock.resourceType == resource[1],
-                )
-                for resource in resources
-            ]
+            for key in keys:
+                remaining_ms = max(int((deadline - time.monotonic()) * 1000), 1)
+                connection.execute(_autocommit(f'SET lock_timeout = {remaining_ms}'))
+                connection.execute(_autocommit('SELECT pg_advisory_lock(:key)'), key=key)
+                acquired.append(key)
+            return acquired
+        except OperationalError as e:
+            ResourceLockRepository._release_advisory_locks(connection, acquired)
+            raise ResourceLockTimeout(
+                'process shares',
+                f'Failed to acquire lock for one or more of {resources=}: {e.orig}',
+            )
 
-            if not session.query(ResourceLock).filter(or_(*filter_conditions)).first():
-                records = []
-                for resource in resources:
-                    records.append(
-                        ResourceLock(
-                            resourceUri=resource[0],
-                            resourceType=resource[1],
-                            acquiredByUri=acquired_by_uri,
-                            acquiredByType=acquired_by_type,
-                        )
-                    )
-                session.add_all(records)
-                session.commit()
-                return True
-            else:
-                log.info(
-                    'Not all ResourceLocks were found. One or more ResourceLocks may be acquired by another resource...'
-                )
-                return False
+    @staticmethod
+    def _release_advisory_locks(connection, keys):
+        """
+        Releases the advisory locks held by the dedicated connection. If they cannot be released one by one,
+        the connection is discarded instead of going back to the pool with locks that would block the next acquirers
+        """
+        try:
+            for key in keys:
+                connection.execute(_autocommit('SELECT pg_advisory_unlock(:key)'), key=key)
+            connection.execute(_autocommit('RESET lock_timeout'))
         except Exception as e:
-            session.expunge_all()
-            session.rollback()
-            log.error('Error occurred while acquiring lock:', e)
-            return False
+            log.error(f'Failed to release the advisory locks {keys}, discarding the connection: {e}')
+            try:
+                connection.execute(_autocommit('SELECT pg_advisory_unlock_all()'))
+            except Exception as unlock_error:
+                log.error(f'Failed to release all the advisory locks of the connection: {unlock_error}')
+            # closes the database connection, which releases any lock it still holds
+            connection.invalidate()
+
+    @staticmethod
+    def _acquire_locks(resources, session, acquired_by_uri, acquired_by_type):
+        """
+        Records the locks on the resources identified by resourceUri and resourceType, the advisory locks
+        of the resources must be held. Remaining records are stale locks of processes that did not release them.
+
+        Args:
+            resources: List of resource tuples (resourceUri, resourceType) to acquire locks for.
+            session (sqlalchemy.orm.Session): The SQLAlchemy session object used for interacting with the database.
+            acquired_by_uri: The ID of the resource that is attempting to acquire the lock.
+            acquired_by_type: The resource type that is attempting to acquire the lock.
+        """
+        filter_conditions = [
+            and_(
+                ResourceLock.resourceUri == resource[0],
+                ResourceLock.resourceType == resource[1],
+            )
+            for resource in resources
+        ]
+        for stale_lock in session.query(ResourceLock).filter(or_(*filter_conditions)):
+            log.warning(
+                f'Removing stale lock of resource {stale_lock.resourceUri} acquired by {stale_lock.acquiredByUri}'
+            )
+            session.delete(stale_lock)
+        session.flush()
+        session.add_all(
+            [
+                ResourceLock(
+                    resourceUri=resource[0],
+                    resourceType=resource[1],
+                    acquiredByUri=acquired_by_uri,
+                    acquiredByType=acquired_by_type,
+                )
+                for resource in set(resources)
+            ]
+        )
+        session.commit()
 
     @staticmethod
     def _release_lock(session, resource_uri, resource_type, share_uri):
@@ -111,27 +163,35 @@ class ResourceLockRepository:
     @staticmethod
     @contextmanager
     def acquire_lock_with_retry(
-        resources: List[Tuple[str, str]], session: Session, acquired_by_uri: str, acquired_by_type: str
+        resources: List[Tuple[str, str]],
+        session: Session,
+        acquired_by_uri: str,
+        acquired_by_type: str,
+        timeout: float = LOCK_TIMEOUT,
     ):
-        retries_remaining = MAX_RETRIES
+        """
+        Locks the resources while the context is active.
+        Waiting processes acquire the locks in turn as soon as the holder releases them,
+        ResourceLockTimeout is raised if the locks can not be acquired within the timeout.
+        """
         log.info(f'Attempting to acquire lock for resources {resources} by share {acquired_by_uri}...')
-        while not (
-            lock_acquired := ResourceLockRepository._acquire_locks(
-                resources, session, acquired_by_uri, acquired_by_type
-            )
-        ):
-            log.info(
-                f'Lock for one or more resources {resources} already acquired. Retrying in {RETRY_INTERVAL} seconds...'
-            )
-            sleep(RETRY_INTERVAL)
-            retries_remaining -= 1
-            if retries_remaining <= 0:
-                raise ResourceLockTimeout(
-                    'process shares',
-                    f'Failed to acquire lock for one or more of {resources=}',
-                )
+        # the advisory locks outlive the commits of the session, they are held by a dedicated connection
+        connection = session.get_bind().connect()
         try:
-            yield lock_acquired
+            started = time.monotonic()
+            keys = ResourceLockRepository._acquire_advisory_locks(connection, resources, timeout)
+            try:
+                log.info(
+                    f'Acquired lock for resources {resources} by share {acquired_by_uri} '
+                    f'after waiting {time.monotonic() - started:.3f} seconds'
+                )
+                ResourceLockRepository._acquire_locks(resources, session, acquired_by_uri, acquired_by_type)
+                try:
+                    yield True
+                finally:
+                    for resource in resources:
+                        ResourceLockRepository._release_lock(session, resource[0], resource[1], acquired_by_uri)
+            finally:
+                ResourceLockRepository._release_advisory_locks(connection, keys)
         finally:
-            for resource in resources:
-                ResourceLockRepository._release_lock(session, resource[0], resource[1], acquired_by_uri)
+            connection.close()
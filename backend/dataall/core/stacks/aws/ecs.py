@@ -1,5 +1,6 @@
 import logging
 import os
+import time
 
 import boto3
 from botocore.exceptions import ClientError
@@ -8,11 +9,84 @@ from dataall.base.utils import Parameter
 
 log = logging.getLogger('aws:ecs')
 
+# the polling loops sleep for 30 seconds, so every poll sees a new snapshot of the running tasks
+TASK_SNAPSHOT_MAX_AGE = 20
+DESCRIBE_TASKS_BATCH_SIZE = 100
+
+
+class EcsTaskTracker:
+    """
+    Answers whether tasks are running from a snapshot of all the running tasks of the cluster.
+    The snapshot is listed at most once every max_age seconds however many stack tasks are polled
+    """
+
+    def __init__(self, cluster_name, max_age=TASK_SNAPSHOT_MAX_AGE):
+        self._cluster_name = cluster_name
+        self._max_age = max_age
+        self._started_by = set()
+        self._listed_at = None
+
+    def is_running(self, started_by=None) -> bool:
+        running = self._running_started_by()
+        if started_by is None:
+            return bool(running)
+        return started_by in running
+
+    def add(self, started_by):
+        """Tracks a task started by this process until the next snapshot lists it"""
+        self._started_by.add(started_by)
+
+    def _running_started_by(self) -> set:
+        if self._listed_at is None or time.monotonic() - self._listed_at >= self._max_age:
+            self._started_by = self._list_running_started_by()
+            self._listed_at = time.monotonic()
+        return self._started_by
+
+    def _list_running_started_by(self) -> set:
+        try:
+            client = boto3.client('ecs')
+            task_arns = []
+            for page in client.get_paginator('list_tasks').paginate(
+                cluster=self._cluster_name, desiredStatus='RUNNING'
+            ):
+                task_arns.extend(page['taskArns'])
+
+            started_by = set()
+            for i in range(0, len(task_arns), DESCRIBE_TASKS_BATCH_SIZE):
+                response = client.describe_tasks(
+                    cluster=self._cluster_name, tasks=task_arns[i : i + DESCRIBE_TASKS_BATCH_SIZE]
+                )
+                # tasks without startedBy are still running tasks of the cluster
+                started_by.update(task.get('startedBy', task['taskArn']) for task in response['tasks'])
+            log.info(f'Found {len(started_by)} running tasks in the cluster {self._cluster_name}')
+            return started_by
+        except ClientError as e:
+            log.error(e)
+            raise e
+
 
 class Ecs:
+    _cluster_names = {}
+    _task_trackers = {}
+
     def __init__(self):
         pass
 
+    @classmethod
+    def get_cluster_name(cls):
+        envname = os.environ.get('envname', 'local')
+        if envname not in cls._cluster_names:
+            cls._cluster_names[envname] = Parameter().get_parameter(env=envname, path='ecs/cluster/name')
+        return cls._cluster_names[envname]
+
+    @classmethod
+    def task_tracker(cls, cluster_name=None) -> EcsTaskTracker:
+        """The tracker of the running tasks of the cluster shared by all the polling loops of the process"""
+        cluster_name = cluster_name or cls.get_cluster_name()
+        if cluster_name not in cls._task_trackers:
+            cls._task_trackers[cluster_name] = EcsTaskTracker(cluster_name)
+        return cls._task_trackers[cluster_name]
+
     @staticmethod
     def run_cdkproxy_task(stack_uri):
         task_arn = Ecs.run_ecs_task(
@@ -21,6 +95,7 @@ class Ecs:
             context=[{'name': 'stackUri', 'value': stack_uri}],
             started_by=f'awsworker-{stack_uri}',
         )
+        Ecs.task_tracker().add(f'awsworker-{stack_uri}')
         log.info(f'ECS Task {task_arn} running')
         return task_arn
 
@@ -33,7 +108,7 @@ class Ecs:
     ):
         try:
             envname = os.environ.get('envname', 'local')
-            cluster_name = Parameter().get_parameter(env=envname, path='ecs/cluster/name')
+            cluster_name = Ecs.get_cluster_name()
             subnets = Parameter().get_parameter(env=envname, path='ecs/private_subnets')
             security_groups = Parameter().get_parameter(env=envname, path='ecs/security_groups')
 
@@ -87,6 +162,7 @@ class Ecs:
 
     @staticmethod
     def is_task_running(cluster_name, started_by=None):
+        """Checks the current state of the tasks, use task_tracker() to poll the tasks in a loop"""
         try:
             client = boto3.client('ecs')
             if started_by is None:
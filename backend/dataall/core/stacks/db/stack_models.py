@@ -1,6 +1,6 @@
 import datetime
 
-from sqlalchemy import Column, DateTime, String, Boolean
+from sqlalchemy import Column, DateTime, String, Boolean, Index
 from sqlalchemy.dialects import postgresql
 
 from dataall.base.db import Base
@@ -9,6 +9,7 @@ from dataall.base.db import utils
 
 class Stack(Base):
     __tablename__ = 'stack'
+    __table_args__ = (Index('ix_stack_targetUri', 'targetUri'),)
     stackUri = Column(String, nullable=False, default=utils.uuid('stack'), primary_key=True)
     name = Column(String, nullable=True)
     targetUri = Column(String, nullable=False)
@@ -27,6 +28,8 @@ class Stack(Base):
     events = Column(postgresql.JSON)
     lastSeen = Column(DateTime, default=lambda: datetime.datetime(year=1900, month=1, day=1))
     EcsTaskArn = Column(String, nullable=True)
+    # fingerprint of the last deployed cloud assembly, used to skip deployments without changes
+    templateFingerprint = Column(String, nullable=True)
 
 
 class KeyValueTag(Base):
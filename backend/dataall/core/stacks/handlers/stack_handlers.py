@@ -1,5 +1,4 @@
 import logging
-import os
 import time
 
 from botocore.exceptions import ClientError
@@ -10,7 +9,6 @@ from dataall.core.stacks.aws.ecs import Ecs
 from dataall.core.stacks.db import stack_models as models
 from dataall.core.stacks.db.stack_repositories import StackRepository
 from dataall.core.tasks.db.task_models import Task
-from dataall.base.utils import Parameter
 
 log = logging.getLogger(__name__)
 
@@ -41,10 +39,9 @@ class StackHandlers:
     def deploy_stack(engine, task: Task):
         with engine.scoped_session() as session:
             stack: models.Stack = StackRepository.get_stack_by_uri(session, stack_uri=task.targetUri)
-            envname = os.environ.get('envname', 'local')
-            cluster_name = Parameter().get_parameter(env=envname, path='ecs/cluster/name')
+            tracker = Ecs.task_tracker()
 
-            while Ecs.is_task_running(cluster_name=cluster_name, started_by=f'awsworker-{task.targetUri}'):
+            while tracker.is_running(started_by=f'awsworker-{task.targetUri}'):
                 log.info(
                     f'ECS task for stack stack-{task.targetUri} is running waiting for 30 seconds before retrying...'
                 )
@@ -13,7 +13,6 @@ from dataall.core.stacks.aws.ecs import Ecs
 from dataall.core.stacks.db.stack_repositories import StackRepository
 from dataall.core.stacks.db.stack_models import Stack
 from dataall.core.tasks.db.task_models import Task
-from dataall.base.utils import Parameter
 from dataall.base.db.exceptions import AWSResourceNotFound
 from dataall.base.db.exceptions import RequiredParameter
 from dataall.core.stacks.db.target_type_repositories import TargetType
@@ -107,8 +106,7 @@ class StackService:
                 requests.post(f'{config.get_property("cdk_proxy_url")}/stack/{stack.stackUri}')
 
             else:
-                cluster_name = Parameter().get_parameter(env=envname, path='ecs/cluster/name')
-                if not Ecs.is_task_running(cluster_name, f'awsworker-{stack.stackUri}'):
+                if not Ecs.is_task_running(Ecs.get_cluster_name(), f'awsworker-{stack.stackUri}'):
                     stack.EcsTaskArn = Ecs.run_cdkproxy_task(stack.stackUri)
                 else:
                     task: Task = Task(action='ecs.cdkproxy.deploy', targetUri=stack.stackUri)
@@ -1,6 +1,6 @@
 import datetime
 
-from sqlalchemy import Column, DateTime, String
+from sqlalchemy import Column, DateTime, Index, String
 from sqlalchemy.dialects import postgresql
 
 from dataall.base.db import Base
@@ -20,3 +20,5 @@ class Task(Base):
     response = Column(postgresql.JSON)
     error = Column(postgresql.JSON)
     lastSeen = Column(DateTime, default=lambda: datetime.datetime(year=1900, month=1, day=1))
+
+    __table_args__ = (Index('ix_task_status_action', 'status', 'action'),)
@@ -1,8 +1,8 @@
 import logging
 
-from sqlalchemy import and_, or_
+from sqlalchemy import and_
 
-from dataall.base.db import exceptions
+from dataall.base.db import exceptions, term_filter
 from dataall.core.vpc.db.vpc_models import Vpc
 
 log = logging.getLogger(__name__)
@@ -44,10 +44,5 @@ class VpcRepository:
         )
         if filter.get('term'):
             term = filter.get('term')
-            query = query.filter(
-                or_(
-                    Vpc.label.ilike('%' + term + '%'),
-                    Vpc.VpcId.ilike('%' + term + '%'),
-                )
-            )
+            query = query.filter(term_filter(term, Vpc.label, Vpc.VpcId))
         return query.order_by(Vpc.label)
@@ -89,7 +89,7 @@ def resolve_link(context, source, targetUri: str = None):
 
 def resolve_stats(context, source: GlossaryNode, **kwargs):
     _required_path(source.path)
-    return GlossariesService.get_glossary_categories_terms_and_associations(path=source.path)
+    return GlossariesService.get_glossary_categories_terms_and_associations(node=source)
 
 
 def resolve_node_tree(context: Context, source: GlossaryNode, filter: dict = None):
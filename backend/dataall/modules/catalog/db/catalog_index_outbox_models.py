@@ -0,0 +1,15 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, String
+
+from dataall.base.db import Base
+
+
+class CatalogIndexOutbox(Base):
+    """Catalog documents waiting to be reindexed, at most one row per indexer and target"""
+
+    __tablename__ = 'catalog_index_outbox'
+    __table_args__ = (Index('ix_catalog_index_outbox_queued', 'queued'),)
+    indexer = Column(String, primary_key=True)
+    targetUri = Column(String, primary_key=True)
+    queued = Column(DateTime, nullable=False, default=datetime.now)
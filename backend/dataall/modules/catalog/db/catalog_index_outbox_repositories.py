@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import tuple_
+from sqlalchemy.dialects.postgresql import insert
+
+from dataall.modules.catalog.db.catalog_index_outbox_models import CatalogIndexOutbox
+
+
+class CatalogIndexOutboxRepository:
+    @staticmethod
+    def add(session, indexer: str, target_uri: str):
+        """Queues the target, a target that is already queued only gets its queued time refreshed"""
+        statement = insert(CatalogIndexOutbox).values(indexer=indexer, targetUri=target_uri, queued=datetime.now())
+        session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[CatalogIndexOutbox.indexer, CatalogIndexOutbox.targetUri],
+                set_={'queued': statement.excluded.queued},
+            )
+        )
+
+    @staticmethod
+    def list_pending(session, limit: int) -> List[CatalogIndexOutbox]:
+        return session.query(CatalogIndexOutbox).order_by(CatalogIndexOutbox.queued).limit(limit).all()
+
+    @staticmethod
+    def remove(session, entries: List[CatalogIndexOutbox]):
+        """
+        Removes the processed entries.
+        Entries queued again while they were processed keep their row and are processed once more
+        """
+        if not entries:
+            return
+        session.query(CatalogIndexOutbox).filter(
+            tuple_(CatalogIndexOutbox.indexer, CatalogIndexOutbox.targetUri, CatalogIndexOutbox.queued).in_(
+                [(entry.indexer, entry.targetUri, entry.queued) for entry in entries]
+            )
+        ).delete(synchronize_session=False)
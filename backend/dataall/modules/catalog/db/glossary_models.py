@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, String, DateTime, Enum
+from sqlalchemy import Boolean, Column, String, DateTime, Enum, Index, Integer
 from sqlalchemy.orm import query_expression
 
 from dataall.base.db import Base
@@ -30,9 +30,19 @@ class GlossaryNode(Base):
     deleted = Column(DateTime, nullable=True)
     owner = Column(String, nullable=False)
     admin = Column(String, nullable=True)
+    # counters of the live subtree including the node itself, maintained by GlossaryRepository
+    categoriesCount = Column(Integer, nullable=False, default=0)
+    termsCount = Column(Integer, nullable=False, default=0)
+    associationsCount = Column(Integer, nullable=False, default=0)
     isLinked = query_expression()
     isMatch = query_expression()
 
+    __table_args__ = (
+        # text_pattern_ops lets the path LIKE 'prefix%' subtree filters use the index
+        Index('ix_glossary_node_path', 'path', postgresql_ops={'path': 'text_pattern_ops'}),
+        Index('ix_glossary_node_parentUri', 'parentUri'),
+    )
+
 
 class TermLink(Base):
     __tablename__ = 'term_link'
@@ -49,3 +59,8 @@ class TermLink(Base):
     path = query_expression()
     label = query_expression()
     readme = query_expression()
+
+    __table_args__ = (
+        Index('ix_term_link_nodeUri', 'nodeUri'),
+        Index('ix_term_link_targetUri_targetType', 'targetUri', 'targetType'),
+    )
@@ -1,10 +1,10 @@
 import logging
 from datetime import datetime
 
-from sqlalchemy import asc, or_, and_, literal
+from sqlalchemy import asc, and_, literal, func
 from sqlalchemy.orm import with_expression
 
-from dataall.base.db import exceptions, paginate
+from dataall.base.db import exceptions, paginate, term_filter
 from dataall.modules.catalog.db.glossary_models import GlossaryNodeStatus, TermLink, GlossaryNode
 from dataall.modules.catalog.indexers.registry import GlossaryRegistry
 from dataall.base.db.paginator import Page
@@ -44,10 +44,12 @@ class GlossaryRepository:
             label=data.get('label'),
             owner=get_context().username,
             readme=data.get('readme'),
+            categoriesCount=1,
         )
         session.add(cat)
         session.commit()
         cat.path = parent.path + '/' + cat.nodeUri
+        GlossaryRepository._update_path_counts(session, parent.path, categories=1)
         return cat
 
     @staticmethod
@@ -65,10 +67,12 @@ class GlossaryRepository:
             label=data.get('label'),
             readme=data.get('readme'),
             owner=get_context().username,
+            termsCount=1,
         )
         session.add(term)
         session.commit()
         term.path = parent.path + '/' + term.nodeUri
+        GlossaryRepository._update_path_counts(session, parent.path, terms=1)
         return term
 
     @staticmethod
@@ -76,12 +80,7 @@ class GlossaryRepository:
         q = session.query(GlossaryNode).filter(GlossaryNode.nodeType == 'G', GlossaryNode.deleted.is_(None))
         term = data.get('term')
         if term:
-            q = q.filter(
-                or_(
-                    GlossaryNode.label.ilike('%' + term + '%'),
-                    GlossaryNode.readme.ilike('%' + term + '%'),
-                )
-            )
+            q = q.filter(term_filter(term, GlossaryNode.label, GlossaryNode.readme))
         return paginate(
             q.order_by(GlossaryNode.label), page_size=data.get('pageSize', 10), page=data.get('page', 1)
         ).to_dict()
@@ -96,15 +95,12 @@ class GlossaryRepository:
         term = filter.get('term')
         nodeType = filter.get('nodeType')
         if term:
-            q = q.filter(
-                or_(
-                    GlossaryNode.label.ilike(term),
-                    GlossaryNode.readme.ilike(term),
-                )
-            )
+            q = q.filter(term_filter(term, GlossaryNode.label, GlossaryNode.readme))
         if nodeType:
             q = q.filter(GlossaryNode.nodeType == nodeType)
-        return paginate(q, page_size=filter.get('pageSize', 10), page=filter.get('page', 1)).to_dict()
+        return GlossaryRepository._paginate_nodes(
+            q, page_size=filter.get('pageSize', 10), page=filter.get('page', 1)
+        ).to_dict()
 
     @staticmethod
     def get_node_tree(session, path, filter):
@@ -117,16 +113,32 @@ class GlossaryRepository:
         term = filter.get('term')
         nodeType = filter.get('nodeType')
         if term:
-            q = q.filter(
-                or_(
-                    GlossaryNode.label.ilike(term),
-                    GlossaryNode.readme.ilike(term),
-                )
-            )
+            q = q.filter(term_filter(term, GlossaryNode.label, GlossaryNode.readme))
         if nodeType:
             q = q.filter(GlossaryNode.nodeType == nodeType)
 
-        return paginate(q, page_size=filter.get('pageSize', 10), page=filter.get('page', 1)).to_dict()
+        return GlossaryRepository._paginate_nodes(
+            q, page_size=filter.get('pageSize', 10), page=filter.get('page', 1)
+        ).to_dict()
+
+    @staticmethod
+    def _paginate_nodes(query, page, page_size) -> Page:
+        """
+        Same as paginate, but the total is computed with a window function in the query of the page,
+        so large subtrees are not loaded entirely just to count them
+        """
+        if page <= 0:
+            raise AttributeError('page needs to be >= 1')
+        if page_size <= 0:
+            raise AttributeError('page_size needs to be >= 1')
+        rows = (
+            query.add_columns(func.count().over().label('total')).limit(page_size).offset((page - 1) * page_size).all()
+        )
+        if rows:
+            total = rows[0].total
+        else:
+            total = query.order_by(None).count() if page > 1 else 0
+        return Page([row[0] for row in rows], page, page_size, total)
 
     @staticmethod
     def get_node_link_to_target(session, username, uri, targetUri):
@@ -152,43 +164,6 @@ class GlossaryRepository:
 
         return link
 
-    @staticmethod
-    def get_glossary_categories_terms_and_associations(session, path):
-        categories = (
-            session.query(GlossaryNode)
-            .filter(
-                and_(
-                    GlossaryNode.path.startswith(path),
-                    GlossaryNode.nodeType == 'C',
-                    GlossaryNode.deleted.is_(None),
-                )
-            )
-            .count()
-        )
-        terms = (
-            session.query(GlossaryNode)
-            .filter(
-                and_(
-                    GlossaryNode.path.startswith(path),
-                    GlossaryNode.nodeType == 'T',
-                    GlossaryNode.deleted.is_(None),
-                )
-            )
-            .count()
-        )
-
-        associations = (
-            session.query(TermLink)
-            .join(
-                GlossaryNode,
-                GlossaryNode.nodeType == TermLink.nodeUri,
-            )
-            .filter(GlossaryNode.path.startswith(path))
-            .count()
-        )
-
-        return {'categories': categories, 'terms': terms, 'associations': associations}
-
     @staticmethod
     def list_term_associations(session, target_model_definitions, node, filter=None):
         query = None
@@ -233,11 +208,7 @@ class GlossaryRepository:
         term = filter.get('term')
         if term:
             q = q.filter(
-                or_(
-                    linked_objects.c.label.ilike('%' + term + '%'),
-                    linked_objects.c.description.ilike(f'%{term}'),
-                    linked_objects.c.targetType.ilike(f'%{term}'),
-                )
+                term_filter(term, linked_objects.c.label, linked_objects.c.description, linked_objects.c.targetType)
             )
         q = q.order_by(asc(path))
 
@@ -255,12 +226,7 @@ class GlossaryRepository:
 
         term = data.get('term')
         if term:
-            q = q.filter(
-                or_(
-                    GlossaryNode.label.ilike(term),
-                    GlossaryNode.readme.ilike(term),
-                )
-            )
+            q = q.filter(term_filter(term, GlossaryNode.label, GlossaryNode.readme))
         return paginate(
             q.order_by(GlossaryNode.label), page=data.get('page', 1), page_size=data.get('pageSize', 10)
         ).to_dict()
@@ -276,12 +242,7 @@ class GlossaryRepository:
         )
         term = data.get('term')
         if term:
-            q = q.filter(
-                or_(
-                    GlossaryNode.label.ilike(term),
-                    GlossaryNode.readme.ilike(term),
-                )
-            )
+            q = q.filter(term_filter(term, GlossaryNode.label, GlossaryNode.readme))
         return paginate(
             q.order_by(GlossaryNode.label), page=data.get('page', 1), page_size=data.get('pageSize', 10)
         ).to_dict()
@@ -308,6 +269,14 @@ class GlossaryRepository:
         node: GlossaryNode = session.query(GlossaryNode).get(uri)
         if not node:
             raise exceptions.ObjectNotFound('Node', uri)
+        if node.deleted is None:
+            GlossaryRepository._update_path_counts(
+                session,
+                node.path.rsplit('/', 1)[0],
+                categories=-node.categoriesCount,
+                terms=-node.termsCount,
+                associations=-node.associationsCount,
+            )
         node.deleted = datetime.now()
         if node.nodeType in ['G', 'C']:
             children = session.query(GlossaryNode).filter(
@@ -369,8 +338,8 @@ class GlossaryRepository:
         """Used in dependent modules to assign glossary terms to resources"""
         current_links = session.query(TermLink).filter(TermLink.targetUri == target_uri)
         for current_link in current_links:
-            if current_link not in glossary_terms:
-                session.delete(current_link)
+            if current_link.nodeUri not in glossary_terms:
+                GlossaryRepository._delete_term_link(session, current_link)
         for nodeUri in glossary_terms:
             term = session.query(GlossaryNode).get(nodeUri)
             if term:
@@ -392,6 +361,8 @@ class GlossaryRepository:
                     )
                     session.add(new_link)
                     session.commit()
+                    if term.deleted is None:
+                        GlossaryRepository._update_path_counts(session, term.path, associations=1)
 
     @staticmethod
     def get_glossary_terms_links(session, target_uri, target_type):
@@ -423,18 +394,35 @@ class GlossaryRepository:
             .all()
         )
         for link in term_links:
-            session.delete(link)
+            GlossaryRepository._delete_term_link(session, link)
+
+    @staticmethod
+    def _delete_term_link(session, link):
+        term = session.query(GlossaryNode).get(link.nodeUri)
+        if term and term.deleted is None:
+            GlossaryRepository._update_path_counts(session, term.path, associations=-1)
+        session.delete(link)
+
+    @staticmethod
+    def _update_path_counts(session, path, categories=0, terms=0, associations=0):
+        """Adds the deltas to the subtree counters of every node of the path, i.e. a node and all its ancestors"""
+        node_uris = [uri for uri in path.split('/') if uri]
+        if not node_uris:
+            return
+        session.query(GlossaryNode).filter(GlossaryNode.nodeUri.in_(node_uris)).update(
+            {
+                GlossaryNode.categoriesCount: GlossaryNode.categoriesCount + categories,
+                GlossaryNode.termsCount: GlossaryNode.termsCount + terms,
+                GlossaryNode.associationsCount: GlossaryNode.associationsCount + associations,
+            },
+            synchronize_session=False,
+        )
 
     @staticmethod
     def search_glossary_terms(session, data=None):
         q = session.query(GlossaryNode).filter(GlossaryNode.deleted.is_(None))
         term = data.get('term')
         if term:
-            q = q.filter(
-                or_(
-                    GlossaryNode.label.ilike(term),
-                    GlossaryNode.readme.ilike(term),
-                )
-            )
+            q = q.filter(term_filter(term, GlossaryNode.label, GlossaryNode.readme))
         q = q.order_by(asc(GlossaryNode.path))
         return paginate(q, page=data.get('page', 1), page_size=data.get('pageSize', 10)).to_dict()
@@ -1,3 +1,3 @@
-from dataall.modules.catalog.handlers import ecs_catalog_handlers
+from dataall.modules.catalog.handlers import catalog_index_outbox_handlers, ecs_catalog_handlers
 
-__all__ = ['ecs_catalog_handlers']
+__all__ = ['catalog_index_outbox_handlers', 'ecs_catalog_handlers']
@@ -0,0 +1,14 @@
+import logging
+
+from dataall.core.tasks.service_handlers import Worker
+from dataall.core.tasks.db.task_models import Task
+from dataall.modules.catalog.indexers.base_indexer import BaseIndexer, OUTBOX_TASK_ACTION
+
+log = logging.getLogger(__name__)
+
+
+class CatalogIndexOutboxHandler:
+    @staticmethod
+    @Worker.handler(path=OUTBOX_TASK_ACTION)
+    def drain_catalog_index_outbox(engine, task: Task):
+        return {'indexed': BaseIndexer.drain_outbox(engine)}
@@ -1,22 +1,37 @@
+import importlib
 import logging
 import os
 from abc import ABC, abstractmethod
 from datetime import datetime
 from operator import and_
 
+from opensearchpy import helpers
+from sqlalchemy import event
 from sqlalchemy.orm import with_expression
 
+from dataall.base.context import get_context
+from dataall.core.organizations.db.organization_repositories import OrganizationRepository
+from dataall.core.tasks.db.task_models import Task
+from dataall.core.tasks.service_handlers import Worker
+from dataall.modules.catalog.db.catalog_index_outbox_repositories import CatalogIndexOutboxRepository
 from dataall.modules.catalog.db.glossary_models import GlossaryNode, TermLink
 from dataall.base.searchproxy import connect
+from dataall.base.searchproxy.connect import ALLOWED_GROUPS_FIELD, add_keyword_mapping, get_mappings_properties_indice
 
 log = logging.getLogger(__name__)
 
+OUTBOX_TASK_ACTION = 'catalog.index.outbox'
+OUTBOX_BATCH_SIZE = 200
+_OUTBOX_DRAIN_TASK = 'catalog_index_outbox_drain_task'
+
 
 class BaseIndexer(ABC):
     """API to work with OpenSearch"""
 
     _INDEX = 'dataall-index'
     _es = None
+    # documents collected while the outbox is drained, they are sent in one bulk request per batch
+    _bulk_docs = None
 
     @classmethod
     def es(cls):
@@ -25,6 +40,9 @@ class BaseIndexer(ABC):
             es = connect(envname=os.getenv('envname', 'local'))
             if not es:
                 raise Exception('Failed to create ES connection')
+            # indices created before the allowed groups were indexed would map them as text
+            if ALLOWED_GROUPS_FIELD not in get_mappings_properties_indice(es, cls._INDEX):
+                add_keyword_mapping(es, ALLOWED_GROUPS_FIELD, cls._INDEX)
             cls._es = es
 
         return cls._es
@@ -34,6 +52,78 @@ class BaseIndexer(ABC):
     def upsert(session, target_id):
         raise NotImplementedError('Method upsert is not implemented')
 
+    @classmethod
+    def queue_upsert(cls, session, target_uri: str):
+        """
+        Queues the reindexing of the target in the transaction of the session.
+        The outbox is drained asynchronously once the transaction is committed
+        """
+        CatalogIndexOutboxRepository.add(session, f'{cls.__module__}.{cls.__name__}', target_uri)
+        if _OUTBOX_DRAIN_TASK not in session.info:
+            task = Task(action=OUTBOX_TASK_ACTION, targetUri='catalog', payload={})
+            session.add(task)
+            session.flush()
+            session.info[_OUTBOX_DRAIN_TASK] = task.taskUri
+            event.listen(session, 'after_commit', BaseIndexer._queue_outbox_drain, once=True)
+            event.listen(session, 'after_rollback', BaseIndexer._forget_outbox_drain, once=True)
+
+    @staticmethod
+    def _queue_outbox_drain(session):
+        task_uri = session.info.pop(_OUTBOX_DRAIN_TASK, None)
+        if task_uri is None:
+            return
+        try:
+            # no SQL can be run in the committed transaction, only the message is sent
+            Worker.queue(engine=get_context().db_engine, task_ids=[task_uri])
+        except Exception as e:
+            # the outbox is drained by the next drain or by the catalog indexer task
+            log.error(f'Failed to queue the catalog index outbox drain: {e}')
+
+    @staticmethod
+    def _forget_outbox_drain(session):
+        session.info.pop(_OUTBOX_DRAIN_TASK, None)
+
+    @classmethod
+    def drain_outbox(cls, engine, batch_size=OUTBOX_BATCH_SIZE) -> int:
+        """Reindexes the queued targets in batches, every target once however often it was queued"""
+        indexed = 0
+        while True:
+            with engine.scoped_session() as session:
+                entries = CatalogIndexOutboxRepository.list_pending(session, batch_size)
+                BaseIndexer._bulk_docs = []
+                try:
+                    for entry in entries:
+                        try:
+                            module_name, class_name = entry.indexer.rsplit('.', 1)
+                            indexer = getattr(importlib.import_module(module_name), class_name)
+                            # a failed SQL statement only rolls back the savepoint, the batch goes on
+                            with session.begin_nested():
+                                indexer.upsert(session, entry.targetUri)
+                        except Exception as e:
+                            # e.g. the target was deleted in the meantime, retrying would fail again
+                            log.exception(f'Failed to reindex {entry.targetUri} with {entry.indexer}: {e}')
+                    failed_doc_ids = cls._bulk_index(BaseIndexer._bulk_docs)
+                finally:
+                    BaseIndexer._bulk_docs = None
+                # documents that OpenSearch did not accept stay queued for the next drain
+                indexed_entries = [entry for entry in entries if entry.targetUri not in failed_doc_ids]
+                CatalogIndexOutboxRepository.remove(session, indexed_entries)
+            indexed += len(indexed_entries)
+            if len(entries) < batch_size or not indexed_entries:
+                log.info(f'Reindexed {indexed} queued catalog documents')
+                return indexed
+
+    @classmethod
+    def _bulk_index(cls, docs) -> set:
+        """Indexes the (doc_id, doc) pairs and returns the ids of the documents that were not indexed"""
+        if not docs:
+            return set()
+        actions = [{'_index': cls._INDEX, '_id': doc_id, '_source': doc} for doc_id, doc in docs]
+        _, errors = helpers.bulk(cls.es(), actions, raise_on_error=False)
+        for error in errors:
+            log.error(f'Failed to index catalog document: {error}')
+        return {next(iter(error.values())).get('_id') for error in errors}
+
     @classmethod
     def delete_doc(cls, doc_id):
         es = cls.es()
@@ -42,8 +132,11 @@ class BaseIndexer(ABC):
 
     @classmethod
     def _index(cls, doc_id, doc):
-        es = cls.es()
         doc['_indexed'] = datetime.now()
+        if BaseIndexer._bulk_docs is not None:
+            BaseIndexer._bulk_docs.append((doc_id, doc))
+            return True
+        es = cls.es()
         if es:
             res = es.index(index=cls._INDEX, id=doc_id, body=doc)
             log.info(f'doc {doc} for id {doc_id} indexed with response {res}')
@@ -63,6 +156,12 @@ class BaseIndexer(ABC):
             log.error(f'ES config is missing, search query {query} failed')
             return {}
 
+    @staticmethod
+    def _get_allowed_groups(session, organization_uri, *groups):
+        """The teams of the organization and the given groups of the resource can find it in the catalog"""
+        organization_groups = OrganizationRepository.get_organization_group_uris(session, organization_uri)
+        return sorted(set(organization_groups) | {group for group in groups if group})
+
     @staticmethod
     def _get_target_glossary_terms(session, target_uri):
         q = (
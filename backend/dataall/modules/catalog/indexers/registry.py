@@ -58,4 +58,4 @@ class GlossaryRegistry(UnionTypeRegistry):
     def reindex(cls, session, target_type: str, target_uri: str):
         definition = cls._DEFINITIONS[target_type]
         if definition.reindexer:
-            definition.reindexer.upsert(session, target_uri)
+            definition.reindexer.queue_upsert(session, target_uri)
@@ -70,9 +70,13 @@ class GlossariesService:
             )
 
     @staticmethod
-    def get_glossary_categories_terms_and_associations(path: str):
-        with _session() as session:
-            return GlossaryRepository.get_glossary_categories_terms_and_associations(session=session, path=path)
+    def get_glossary_categories_terms_and_associations(node: GlossaryNode):
+        """The counters are kept up to date on the node itself, so reading them does not query the subtree"""
+        return {
+            'categories': node.categoriesCount,
+            'terms': node.termsCount,
+            'associations': node.associationsCount,
+        }
 
     @staticmethod
     def list_term_associations(node: GlossaryNode, filter: dict = None):
@@ -23,6 +23,11 @@ class CatalogIndexerTask:
 
     @classmethod
     def index_objects(cls, engine, with_deletes='False'):
+        try:
+            # the full reindex covers the queued targets too, but the outbox stays small when drains were missed
+            BaseIndexer.drain_outbox(engine)
+        except Exception as e:
+            log.exception(f'Failed to drain the catalog index outbox: {e}')
         try:
             indexed_object_uris = []
             with engine.scoped_session() as session:
@@ -26,6 +26,8 @@ class DashboardApiModuleInterface(ModuleInterface):
 
     def __init__(self):
         from dataall.core.environment.services.environment_resource_manager import EnvironmentResourceManager
+        from dataall.core.organizations.services.organization_resource_manager import OrganizationResourceManager
+        from dataall.modules.dashboards.indexers.organization_resource import DashboardOrganizationResource
         from dataall.modules.dashboards.db.dashboard_repositories import DashboardRepository
         from dataall.modules.dashboards.db.dashboard_models import Dashboard
         import dataall.modules.dashboards.api
@@ -45,6 +47,7 @@ class DashboardApiModuleInterface(ModuleInterface):
         add_vote_type('dashboard', DashboardIndexer)
 
         EnvironmentResourceManager.register(DashboardRepository())
+        OrganizationResourceManager.register(DashboardOrganizationResource())
         log.info('Dashboard API has been loaded')
 
 
@@ -5,7 +5,7 @@ from sqlalchemy.orm import Query
 
 from dataall.core.environment.services.environment_resource_manager import EnvironmentResource
 from dataall.core.environment.services.environment_service import EnvironmentService
-from dataall.base.db import exceptions, paginate
+from dataall.base.db import exceptions, paginate, term_filter
 from dataall.modules.dashboards.db.dashboard_models import DashboardShare, DashboardShareStatus, Dashboard
 
 logger = logging.getLogger(__name__)
@@ -24,6 +24,10 @@ class DashboardRepository(EnvironmentResource):
     def update_env(session, environment, **kwargs):
         return EnvironmentService.get_boolean_env_param(session, environment, 'dashboardsEnabled')
 
+    @staticmethod
+    def list_organization_dashboards(session, organization_uri):
+        return session.query(Dashboard).filter(Dashboard.organizationUri == organization_uri).all()
+
     @staticmethod
     def create_dashboard(session, env, username: str, data: dict = None) -> Dashboard:
         dashboard: Dashboard = Dashboard(
@@ -69,12 +73,7 @@ class DashboardRepository(EnvironmentResource):
             )
         )
         if filter and filter.get('term'):
-            query = query.filter(
-                or_(
-                    Dashboard.description.ilike(filter.get('term') + '%%'),
-                    Dashboard.label.ilike(filter.get('term') + '%%'),
-                )
-            )
+            query = query.filter(term_filter(filter.get('term'), Dashboard.description, Dashboard.label))
         return query.order_by(Dashboard.label).distinct()
 
     @staticmethod
@@ -104,12 +103,7 @@ class DashboardRepository(EnvironmentResource):
             )
         )
         if filter and filter.get('term'):
-            query = query.filter(
-                or_(
-                    DashboardShare.SamlGroupName.ilike(filter.get('term') + '%%'),
-                    Dashboard.label.ilike(filter.get('term') + '%%'),
-                )
-            )
+            query = query.filter(term_filter(filter.get('term'), DashboardShare.SamlGroupName, Dashboard.label))
         return query.order_by(DashboardShare.shareUri)
 
     @staticmethod
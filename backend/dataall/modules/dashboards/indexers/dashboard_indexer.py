@@ -26,6 +26,9 @@ class DashboardIndexer(BaseIndexer):
                 doc={
                     'name': dashboard.name,
                     'admins': dashboard.SamlGroupName,
+                    'allowedGroups': BaseIndexer._get_allowed_groups(
+                        session, org.organizationUri, dashboard.SamlGroupName
+                    ),
                     'owner': dashboard.owner,
                     'label': dashboard.label,
                     'resourceKind': 'dashboard',
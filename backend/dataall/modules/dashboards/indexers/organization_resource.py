@@ -0,0 +1,12 @@
+from dataall.core.organizations.services.organization_resource_manager import OrganizationResource
+from dataall.modules.dashboards.db.dashboard_repositories import DashboardRepository
+from dataall.modules.dashboards.indexers.dashboard_indexer import DashboardIndexer
+
+
+class DashboardOrganizationResource(OrganizationResource):
+    """Reindexes the dashboards of the organization, their documents hold the organization teams"""
+
+    @staticmethod
+    def update_org_groups(session, organization):
+        for dashboard in DashboardRepository.list_organization_dashboards(session, organization.organizationUri):
+            DashboardIndexer.queue_upsert(session, dashboard.dashboardUri)
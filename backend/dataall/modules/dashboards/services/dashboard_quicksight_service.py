@@ -4,6 +4,7 @@ from dataall.base.aws.parameter_store import ParameterStoreManager
 from dataall.base.aws.sts import SessionHelper
 from dataall.base.context import get_context
 from dataall.core.environment.services.environment_service import EnvironmentService
+from dataall.core.quicksight.services.quicksight_metadata_service import QuicksightMetadataService
 from dataall.core.permissions.db.tenant.tenant_policy_repositories import TenantPolicyRepository
 from dataall.base.db.exceptions import UnauthorizedOperation, TenantUnauthorized, AWSResourceNotFound
 from dataall.core.permissions.services.tenant_permissions import TENANT_ALL
@@ -27,6 +28,8 @@ class DashboardQuicksightService:
             dash: Dashboard = DashboardRepository.get_dashboard_by_uri(session, uri)
             env = EnvironmentService.get_environment_by_uri(session, dash.environmentUri)
             cls._check_dashboards_enabled(session, env, GET_DASHBOARD)
+            # loads the persisted identity region into QuicksightClient, the reader sessions need it
+            QuicksightMetadataService.get_identity_region(session, env.AwsAccountId, env.region)
             client = cls._client(env.AwsAccountId, env.region)
 
             if dash.SamlGroupName in context.groups:
@@ -73,7 +73,7 @@ class DashboardService:
             DashboardService._set_dashboard_resource_policy(session, env, dashboard, data['SamlGroupName'])
 
             DashboardService._update_glossary(session, dashboard, data)
-            DashboardIndexer.upsert(session, dashboard_uri=dashboard.dashboardUri)
+            DashboardIndexer.queue_upsert(session, dashboard.dashboardUri)
             return dashboard
 
     @staticmethod
@@ -89,7 +89,7 @@ class DashboardService:
             environment = EnvironmentService.get_environment_by_uri(session, dashboard.environmentUri)
             DashboardService._set_dashboard_resource_policy(session, environment, dashboard, dashboard.SamlGroupName)
 
-            DashboardIndexer.upsert(session, dashboard_uri=dashboard.dashboardUri)
+            DashboardIndexer.queue_upsert(session, dashboard.dashboardUri)
             return dashboard
 
     @staticmethod
@@ -6,7 +6,7 @@ from dataall.core.environment.services.environment_service import EnvironmentSer
 from dataall.core.environment.services.environment_resource_manager import EnvironmentResource
 from dataall.core.stacks.db.stack_models import Stack
 from dataall.core.activity.db.activity_models import Activity
-from dataall.base.db import exceptions, paginate
+from dataall.base.db import exceptions, paginate, term_filter
 from dataall.modules.datapipelines.db.datapipelines_models import DataPipeline, DataPipelineEnvironment
 from dataall.base.utils.naming_convention import (
     NamingConventionService,
@@ -120,12 +120,7 @@ class DatapipelinesRepository(EnvironmentResource):
             )
         )
         if filter and filter.get('term'):
-            query = query.filter(
-                or_(
-                    DataPipeline.description.ilike(filter.get('term') + '%%'),
-                    DataPipeline.label.ilike(filter.get('term') + '%%'),
-                )
-            )
+            query = query.filter(term_filter(filter.get('term'), DataPipeline.description, DataPipeline.label))
         if filter and filter.get('region'):
             if len(filter.get('region')) > 0:
                 query = query.filter(DataPipeline.region.in_(filter.get('region')))
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, String, Enum, ForeignKey
+from sqlalchemy import Boolean, Column, String, Enum, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import JSON, ARRAY
 from sqlalchemy.orm import query_expression
 from dataall.base.db import Base, Resource, utils
@@ -40,3 +40,16 @@ class DatasetBase(Resource, Base):
 
 
 DatasetBase.__name__ = 'Dataset'
+
+
+class ShareableItem(Base):
+    """Projection of the items of all shareable types, maintained by ShareableItemRepository on every flush"""
+
+    __tablename__ = 'shareable_item'
+    itemUri = Column(String, primary_key=True)
+    itemType = Column(String, nullable=False)
+    datasetUri = Column(String, nullable=False)
+    itemName = Column(String, nullable=True)
+    description = Column(String, nullable=True)
+
+    __table_args__ = (Index('ix_shareable_item_datasetUri_itemName', 'datasetUri', 'itemName'),)
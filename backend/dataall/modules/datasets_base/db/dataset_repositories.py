@@ -2,7 +2,7 @@ import logging
 from typing import List
 from sqlalchemy import and_, or_
 from sqlalchemy.orm import Query
-from dataall.base.db import paginate
+from dataall.base.db import paginate, term_filter
 from dataall.base.db.exceptions import ObjectNotFound
 from dataall.core.activity.db.activity_models import Activity
 from dataall.modules.datasets_base.db.dataset_models import DatasetBase
@@ -65,8 +65,7 @@ class DatasetListRepository:
             term = filter['term']
             query = query.filter(
                 or_(
-                    DatasetBase.description.ilike(term + '%%'),
-                    DatasetBase.label.ilike(term + '%%'),
+                    term_filter(term, DatasetBase.description, DatasetBase.label),
                     DatasetBase.tags.contains(f'{{{term}}}'),
                 )
             )
@@ -90,12 +89,7 @@ class DatasetListRepository:
             )
         )
         if filter and filter.get('term'):
-            query = query.filter(
-                or_(
-                    DatasetBase.description.ilike(filter.get('term') + '%%'),
-                    DatasetBase.label.ilike(filter.get('term') + '%%'),
-                )
-            )
+            query = query.filter(term_filter(filter.get('term'), DatasetBase.description, DatasetBase.label))
         return query.order_by(DatasetBase.label).distinct(DatasetBase.datasetUri, DatasetBase.label)
 
     @staticmethod
@@ -122,10 +116,8 @@ class DatasetListRepository:
             term = filter['term']
             query = query.filter(
                 or_(
-                    DatasetBase.label.ilike('%' + term + '%'),
-                    DatasetBase.description.ilike('%' + term + '%'),
+                    term_filter(term, DatasetBase.label, DatasetBase.description, DatasetBase.region),
                     DatasetBase.tags.contains(f'{{{term}}}'),
-                    DatasetBase.region.ilike('%' + term + '%'),
                 )
             )
         return query.order_by(DatasetBase.label)
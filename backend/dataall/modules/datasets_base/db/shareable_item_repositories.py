@@ -0,0 +1,73 @@
+import logging
+from typing import Dict, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from dataall.modules.datasets_base.db.dataset_models import ShareableItem
+
+logger = logging.getLogger(__name__)
+
+
+class ShareableItemRepository:
+    """
+    Keeps the shareable_item projection in sync with the models of the registered shareable types.
+    The rows are written in the same transaction as the items, when the session flushes them.
+    The dataset modules register their item models when they are imported, so that every process
+    writing them (API, async handlers, scheduled tasks) keeps the projection up to date.
+    """
+
+    # shareable model -> (item type, name of the uri attribute)
+    _tracked: Dict[type, Tuple[str, str]] = {}
+
+    @classmethod
+    def track(cls, item_type: str, model, uri_column) -> None:
+        if not cls._tracked:
+            event.listen(Session, 'after_flush', cls._sync_flushed_items)
+        cls._tracked[model] = (item_type, uri_column.key)
+
+    @classmethod
+    def _sync_flushed_items(cls, session, flush_context):
+        # new, dirty and deleted still hold the flushed objects in after_flush
+        upserts = {}
+        deleted = set()
+        for obj in list(session.new) + list(session.dirty):
+            tracked = cls._tracked.get(type(obj))
+            if tracked and (obj in session.new or session.is_modified(obj)):
+                item_type, uri_key = tracked
+                upserts[getattr(obj, uri_key)] = {
+                    'itemUri': getattr(obj, uri_key),
+                    'itemType': item_type,
+                    'datasetUri': obj.datasetUri,
+                    'itemName': obj.name,
+                    'description': obj.description,
+                }
+        for obj in session.deleted:
+            tracked = cls._tracked.get(type(obj))
+            if tracked:
+                deleted.add(getattr(obj, tracked[1]))
+
+        if upserts:
+            cls.upsert_items(session, list(upserts.values()))
+        if deleted:
+            cls.delete_items(session, deleted)
+
+    @staticmethod
+    def upsert_items(session, items: list):
+        statement = insert(ShareableItem.__table__).values(items)
+        session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[ShareableItem.itemUri],
+                set_={
+                    'itemType': statement.excluded.itemType,
+                    'datasetUri': statement.excluded.datasetUri,
+                    'itemName': statement.excluded.itemName,
+                    'description': statement.excluded.description,
+                },
+            )
+        )
+
+    @staticmethod
+    def delete_items(session, item_uris):
+        session.execute(ShareableItem.__table__.delete().where(ShareableItem.itemUri.in_(list(item_uris))))
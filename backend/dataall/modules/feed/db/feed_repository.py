@@ -3,9 +3,7 @@ DAO layer that encapsulates the logic and interaction with the database for Feed
 Provides the API to retrieve / update / delete FeedS
 """
 
-from sqlalchemy import or_
-
-from dataall.base.db import paginate
+from dataall.base.db import paginate, term_filter
 from dataall.modules.feed.db.feed_models import FeedMessage
 
 
@@ -17,12 +15,7 @@ class FeedRepository:
         q = self._session.query(FeedMessage).filter(FeedMessage.targetUri == uri)
         term = filter.get('term')
         if term:
-            q = q.filter(
-                or_(
-                    FeedMessage.content.ilike('%' + term + '%'),
-                    FeedMessage.creator.ilike('%' + term + '%'),
-                )
-            )
+            q = q.filter(term_filter(term, FeedMessage.content, FeedMessage.creator))
         q = q.order_by(FeedMessage.created.desc())
 
         return paginate(q, page=filter.get('page', 1), page_size=filter.get('pageSize', 10)).to_dict()
@@ -30,6 +30,19 @@ def get_sagemaker_studio_domain(AwsAccountId, region, domain_name):
         return dict()
 
 
+def list_sagemaker_studio_user_statuses(AwsAccountId, region):
+    """
+    Lists the status of all the Studio user profiles of the account/region with one paginated call
+    RETURN: a dict of statuses by (DomainId, UserProfileName)
+    """
+    client = get_client(AwsAccountId=AwsAccountId, region=region)
+    statuses = {}
+    for page in client.get_paginator('list_user_profiles').paginate():
+        for profile in page.get('UserProfiles', []):
+            statuses[(profile['DomainId'], profile['UserProfileName'])] = profile['Status']
+    return statuses
+
+
 class SagemakerStudioClient:
     """A Sagemaker studio proxy client that is used to send requests to AWS"""
 
@@ -29,7 +29,7 @@ class MLStudioPivotRole(PivotRoleStatementSet):
             iam.PolicyStatement(
                 sid='SageMakerDomainsAppsList',
                 effect=iam.Effect.ALLOW,
-                actions=['sagemaker:ListDomains', 'sagemaker:ListApps'],
+                actions=['sagemaker:ListDomains', 'sagemaker:ListApps', 'sagemaker:ListUserProfiles'],
                 resources=['*'],
             ),
             iam.PolicyStatement(
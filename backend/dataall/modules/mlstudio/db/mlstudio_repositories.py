@@ -9,7 +9,7 @@ from sqlalchemy.sql import and_
 from sqlalchemy.orm import Query
 
 from dataall.base.utils import slugify
-from dataall.base.db import paginate
+from dataall.base.db import paginate, term_filter
 from dataall.modules.mlstudio.db.mlstudio_models import SagemakerStudioDomain, SagemakerStudioUser
 from dataall.base.utils.naming_convention import (
     NamingConventionService,
@@ -39,10 +39,7 @@ class SageMakerStudioRepository:
         )
         if filter and filter.get('term'):
             query = query.filter(
-                or_(
-                    SagemakerStudioUser.description.ilike(filter.get('term') + '%%'),
-                    SagemakerStudioUser.label.ilike(filter.get('term') + '%%'),
-                )
+                term_filter(filter.get('term'), SagemakerStudioUser.description, SagemakerStudioUser.label)
             )
         return query.order_by(SagemakerStudioUser.label)
 
@@ -8,6 +8,8 @@ import logging
 from dataclasses import dataclass, field
 from typing import List, Dict
 
+from botocore.exceptions import ClientError
+
 from dataall.base.context import get_context
 from dataall.core.permissions.services.group_policy_service import GroupPolicyService
 from dataall.core.environment.services.environment_service import EnvironmentService
@@ -16,7 +18,11 @@ from dataall.core.permissions.services.tenant_policy_service import TenantPolicy
 from dataall.core.stacks.db.stack_repositories import StackRepository
 from dataall.base.db import exceptions
 from dataall.core.stacks.services.stack_service import StackService
-from dataall.modules.mlstudio.aws.sagemaker_studio_client import sagemaker_studio_client, get_sagemaker_studio_domain
+from dataall.modules.mlstudio.aws.sagemaker_studio_client import (
+    sagemaker_studio_client,
+    get_sagemaker_studio_domain,
+    list_sagemaker_studio_user_statuses,
+)
 from dataall.modules.mlstudio.db.mlstudio_repositories import SageMakerStudioRepository
 from dataall.core.environment.services.environment_resource_manager import EnvironmentResource
 from dataall.modules.mlstudio.db.mlstudio_models import SagemakerStudioUser
@@ -32,6 +38,7 @@ from dataall.modules.mlstudio.services.mlstudio_permissions import (
     DELETE_SGMSTUDIO_USER,
 )
 from dataall.base.utils import slugify
+from dataall.base.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -98,6 +105,9 @@ class SagemakerStudioService:
     Encapsulate the logic of interactions with sagemaker ml studio.
     """
 
+    # statuses of all the Studio user profiles of an account/region, a list page is resolved with one AWS call
+    _status_snapshots = TTLCache(ttl_seconds=30)
+
     @staticmethod
     @TenantPolicyService.has_tenant_permission(MANAGE_SGMSTUDIO_USERS)
     @ResourcePolicyService.has_resource_permission(CREATE_SGMSTUDIO_USER)
@@ -241,10 +251,28 @@ class SagemakerStudioService:
     def get_sagemaker_studio_user_status(*, uri: str):
         with _session() as session:
             user = SagemakerStudioService._get_sagemaker_studio_user(session, uri)
-            status = sagemaker_studio_client(user).get_sagemaker_studio_user_status()
+            statuses = SagemakerStudioService._get_status_snapshot(user.AWSAccountId, user.region)
+            key = (user.sagemakerStudioDomainID, user.sagemakerStudioUserNameSlugify)
+            if statuses is None or key not in statuses:
+                status = sagemaker_studio_client(user).get_sagemaker_studio_user_status()
+            else:
+                status = statuses[key]
             user.sagemakerStudioUserStatus = status
             return status
 
+    @staticmethod
+    def _get_status_snapshot(account_id, region):
+        key = (account_id, region)
+        statuses = SagemakerStudioService._status_snapshots.get(key)
+        if statuses is None:
+            try:
+                statuses = list_sagemaker_studio_user_statuses(account_id, region)
+            except ClientError as e:
+                logger.error(f'Could not list the Studio user profiles of {account_id}/{region} due to: {e}')
+                return None
+            SagemakerStudioService._status_snapshots.set(key, statuses)
+        return statuses
+
     @staticmethod
     @ResourcePolicyService.has_resource_permission(SGMSTUDIO_USER_URL)
     def get_sagemaker_studio_user_presigned_url(*, uri: str):
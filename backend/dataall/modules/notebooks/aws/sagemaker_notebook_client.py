@@ -51,6 +51,17 @@ class SagemakerClient:
             raise e
 
 
+def list_notebook_instance_statuses(account_id: str, region: str) -> dict:
+    """Remote call to AWS listing the status of all the notebook instances of the account and region by name"""
+    session = SessionHelper.remote_session(account_id, region)
+    paginator = session.client('sagemaker', region_name=region).get_paginator('list_notebook_instances')
+    statuses = {}
+    for page in paginator.paginate():
+        for instance in page.get('NotebookInstances', []):
+            statuses[instance['NotebookInstanceName']] = instance['NotebookInstanceStatus']
+    return statuses
+
+
 def client(notebook: SagemakerNotebook) -> SagemakerClient:
     """Factory method to retrieve the client to send request to AWS"""
     return SagemakerClient(notebook)
@@ -7,7 +7,7 @@ from sqlalchemy import or_
 from sqlalchemy.sql import and_
 from sqlalchemy.orm import Query
 
-from dataall.base.db import paginate
+from dataall.base.db import paginate, term_filter
 from dataall.modules.notebooks.db.notebook_models import SagemakerNotebook
 from dataall.core.environment.services.environment_resource_manager import EnvironmentResource
 
@@ -49,8 +49,7 @@ class NotebookRepository(EnvironmentResource):
             term = filter['term']
             query = query.filter(
                 or_(
-                    SagemakerNotebook.description.ilike(term + '%%'),
-                    SagemakerNotebook.label.ilike(term + '%%'),
+                    term_filter(term, SagemakerNotebook.description, SagemakerNotebook.label),
                     SagemakerNotebook.tags.contains(f'{{{term}}}'),
                 )
             )
@@ -8,6 +8,8 @@ import logging
 from dataclasses import dataclass, field
 from typing import List, Dict
 
+from botocore.exceptions import ClientError
+
 from dataall.base.context import get_context as context
 from dataall.core.environment.db.environment_models import Environment
 from dataall.core.permissions.services.group_policy_service import GroupPolicyService
@@ -18,7 +20,7 @@ from dataall.core.stacks.db.keyvaluetag_repositories import KeyValueTagRepositor
 from dataall.core.stacks.db.stack_repositories import StackRepository
 from dataall.base.db import exceptions
 from dataall.core.stacks.services.stack_service import StackService
-from dataall.modules.notebooks.aws.sagemaker_notebook_client import client
+from dataall.modules.notebooks.aws.sagemaker_notebook_client import client, list_notebook_instance_statuses
 from dataall.modules.notebooks.db.notebook_models import SagemakerNotebook
 from dataall.modules.notebooks.db.notebook_repository import NotebookRepository
 from dataall.modules.notebooks.services.notebook_permissions import (
@@ -34,6 +36,7 @@ from dataall.base.utils.naming_convention import (
     NamingConventionPattern,
 )
 from dataall.base.utils import slugify
+from dataall.base.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +68,8 @@ class NotebookService:
     """
 
     _NOTEBOOK_RESOURCE_TYPE = 'notebook'
+    # statuses of all the notebook instances of an account/region, a list page is resolved with one AWS call
+    _status_snapshots = TTLCache(ttl_seconds=30)
 
     @staticmethod
     @TenantPolicyService.has_tenant_permission(MANAGE_NOTEBOOKS)
@@ -170,6 +175,7 @@ class NotebookService:
         """Starts notebooks instance"""
         notebook = NotebookService.get_notebook(uri=uri)
         client(notebook).start_instance()
+        NotebookService._status_snapshots.invalidate((notebook.AWSAccountId, notebook.region))
 
     @staticmethod
     @ResourcePolicyService.has_resource_permission(UPDATE_NOTEBOOK)
@@ -177,6 +183,7 @@ class NotebookService:
         """Stop notebook instance"""
         notebook = NotebookService.get_notebook(uri=uri)
         client(notebook).stop_instance()
+        NotebookService._status_snapshots.invalidate((notebook.AWSAccountId, notebook.region))
 
     @staticmethod
     @ResourcePolicyService.has_resource_permission(GET_NOTEBOOK)
@@ -188,9 +195,25 @@ class NotebookService:
     @staticmethod
     @ResourcePolicyService.has_resource_permission(GET_NOTEBOOK)
     def get_notebook_status(*, uri) -> str:
-        """Retrieves notebook status"""
+        """Retrieves notebook status from the snapshot of all the notebook statuses of its account and region"""
         notebook = NotebookService.get_notebook(uri=uri)
-        return client(notebook).get_notebook_instance_status()
+        statuses = NotebookService._get_status_snapshot(notebook.AWSAccountId, notebook.region)
+        if statuses is None or notebook.NotebookInstanceName not in statuses:
+            return client(notebook).get_notebook_instance_status()
+        return statuses[notebook.NotebookInstanceName]
+
+    @staticmethod
+    def _get_status_snapshot(account_id, region):
+        key = (account_id, region)
+        statuses = NotebookService._status_snapshots.get(key)
+        if statuses is None:
+            try:
+                statuses = list_notebook_instance_statuses(account_id, region)
+            except ClientError as e:
+                logger.error(f'Could not list the notebook instances of {account_id}/{region} due to: {e}')
+                return None
+            NotebookService._status_snapshots.set(key, statuses)
+        return statuses
 
     @staticmethod
     @ResourcePolicyService.has_resource_permission(DELETE_NOTEBOOK)
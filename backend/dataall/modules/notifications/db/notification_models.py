@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, String, Boolean, DateTime
+from sqlalchemy import Column, String, Boolean, DateTime, Index
 
 from dataall.base.db import Base
 from dataall.base.db import utils
@@ -14,6 +14,34 @@ class Notification(Base):
     recipient = Column(String, nullable=False)  # recipients can be groups or individual users
     is_read = Column(Boolean, nullable=False, default=False)
     target_uri = Column(String)
+    target_type = Column(String, nullable=True)
+    share_uri = Column(String, nullable=True)
+    dataset_uri = Column(String, nullable=True)
     created = Column(DateTime, default=datetime.now)
     updated = Column(DateTime, onupdate=datetime.now)
     deleted = Column(DateTime)
+
+    __table_args__ = (
+        Index('ix_notification_recipient_created', 'recipient', 'created'),
+        Index('ix_notification_share_uri_type', 'share_uri', 'type'),
+        Index('ix_notification_dataset_uri', 'dataset_uri'),
+    )
+
+
+class NotificationArchive(Base):
+    """Read notifications moved out of the notification table once they are older than the retention period"""
+
+    __tablename__ = 'notification_archive'
+    notificationUri = Column(String, primary_key=True)
+    type = Column(String, nullable=True)
+    message = Column(String, nullable=False)
+    recipient = Column(String, nullable=False)
+    is_read = Column(Boolean, nullable=False, default=True)
+    target_uri = Column(String)
+    target_type = Column(String, nullable=True)
+    share_uri = Column(String, nullable=True)
+    dataset_uri = Column(String, nullable=True)
+    created = Column(DateTime)
+    updated = Column(DateTime)
+    deleted = Column(DateTime)
+    archived = Column(DateTime, default=datetime.now)
@@ -1,6 +1,6 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from sqlalchemy import func, and_, or_
+from sqlalchemy import func, and_, select
 
 from dataall.modules.notifications.db import notification_models as models
 from dataall.base.db import paginate
@@ -17,22 +17,50 @@ class NotificationRepository:
         notification_type,
         target_uri,
         message,
+        target_type=None,
+        share_uri=None,
+        dataset_uri=None,
     ) -> models.Notification:
+        notification = NotificationRepository.add_notification(
+            session,
+            recipient=recipient,
+            notification_type=notification_type,
+            target_uri=target_uri,
+            message=message,
+            target_type=target_type,
+            share_uri=share_uri,
+            dataset_uri=dataset_uri,
+        )
+        session.commit()
+        return notification
+
+    @staticmethod
+    def add_notification(
+        session,
+        recipient,
+        notification_type,
+        target_uri,
+        message,
+        target_type=None,
+        share_uri=None,
+        dataset_uri=None,
+    ) -> models.Notification:
+        """Adds the notification to the session, it is committed with the rest of the transaction"""
         notification = models.Notification(
             type=notification_type,
             message=message,
             recipient=recipient,
             target_uri=target_uri,
+            target_type=target_type,
+            share_uri=share_uri,
+            dataset_uri=dataset_uri,
         )
         session.add(notification)
-        session.commit()
         return notification
 
     @staticmethod
     def paginated_notifications(session, username, groups, filter=None):
-        q = session.query(models.Notification).filter(
-            or_(models.Notification.recipient == username, models.Notification.recipient.in_(groups))
-        )
+        q = session.query(models.Notification).filter(models.Notification.recipient.in_([username, *groups]))
         if filter.get('read'):
             q = q.filter(
                 and_(
@@ -59,7 +87,7 @@ class NotificationRepository:
     def count_unread_notifications(session, username, groups):
         count = (
             session.query(func.count(models.Notification.notificationUri))
-            .filter(or_(models.Notification.recipient == username, models.Notification.recipient.in_(groups)))
+            .filter(models.Notification.recipient.in_([username, *groups]))
             .filter(models.Notification.is_read == False)
             .filter(models.Notification.deleted.is_(None))
             .scalar()
@@ -70,7 +98,7 @@ class NotificationRepository:
     def count_read_notifications(session, username, groups):
         count = (
             session.query(func.count(models.Notification.notificationUri))
-            .filter(or_(models.Notification.recipient == username, models.Notification.recipient.in_(groups)))
+            .filter(models.Notification.recipient.in_([username, *groups]))
             .filter(models.Notification.is_read == True)
             .filter(models.Notification.deleted.is_(None))
             .scalar()
@@ -81,7 +109,7 @@ class NotificationRepository:
     def count_deleted_notifications(session, username, groups):
         count = (
             session.query(func.count(models.Notification.notificationUri))
-            .filter(or_(models.Notification.recipient == username, models.Notification.recipient.in_(groups)))
+            .filter(models.Notification.recipient.in_([username, *groups]))
             .filter(models.Notification.deleted.isnot(None))
             .scalar()
         )
@@ -101,3 +129,28 @@ class NotificationRepository:
             notification.deleted = datetime.now()
             session.commit()
         return True
+
+    @staticmethod
+    def archive_read_notifications(session, older_than_days) -> int:
+        """
+        Moves the read notifications created more than older_than_days ago to the notification_archive table
+        in one statement, so that they are not scanned anymore when listing and counting the notifications
+        """
+        notification = models.Notification.__table__
+        columns = [column.name for column in notification.columns]
+        moved = (
+            notification.delete()
+            .where(
+                and_(
+                    notification.c.is_read == True,
+                    notification.c.created < datetime.now() - timedelta(days=older_than_days),
+                )
+            )
+            .returning(*notification.columns)
+            .cte('moved')
+        )
+        result = session.execute(
+            models.NotificationArchive.__table__.insert().from_select(columns, select([moved.c[c] for c in columns]))
+        )
+        session.commit()
+        return result.rowcount
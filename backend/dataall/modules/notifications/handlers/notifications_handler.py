@@ -7,25 +7,44 @@ from dataall.modules.notifications.services.ses_email_notification_service impor
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
+# Time the worker waits for the SES send rate, the emails that cannot be sent by then are queued in a new task
+EMAIL_SEND_MAX_WAIT_SECONDS = 300
+
 
 class NotificationHandler:
     @staticmethod
     @Worker.handler(path='notification.service')
     def notification_service(engine, task: Task):
         if task.payload.get('notificationType') == 'email':
-            return NotificationHandler.send_email_notification(task)
+            return NotificationHandler.send_email_notification(engine, task)
 
     @staticmethod
-    def send_email_notification(task: Task):
+    def send_email_notification(engine, task: Task):
         try:
             log.info(f'Notification Service for Email Initiated .. for {task.payload.get("subject")}')
             subject = task.payload.get('subject')
             message = task.payload.get('message')
             recipient_groups_list = task.payload.get('recipientGroupsList', [])
             recipient_email_list = task.payload.get('recipientEmailList', [])
-            return SESEmailNotificationService.send_email_task(
-                subject, message, recipient_groups_list, recipient_email_list
+            not_sent = SESEmailNotificationService.send_email_task(
+                subject, message, recipient_groups_list, recipient_email_list, EMAIL_SEND_MAX_WAIT_SECONDS
             )
+            if not_sent:
+                NotificationHandler._queue_remaining_emails(engine, task, not_sent)
+            return True
         except Exception as e:
             log.error(f'Error while sending email in the notification service -  {e})')
             raise e
+
+    @staticmethod
+    def _queue_remaining_emails(engine, task: Task, emails):
+        log.info(f'Queuing the email notification of {task.targetUri} to the {len(emails)} remaining recipients')
+        with engine.scoped_session() as session:
+            remaining_task = Task(
+                action=task.action,
+                targetUri=task.targetUri,
+                payload={**task.payload, 'recipientGroupsList': [], 'recipientEmailList': emails},
+            )
+            session.add(remaining_task)
+            session.commit()
+            Worker.queue(engine=engine, task_ids=[remaining_task.taskUri])
@@ -2,14 +2,18 @@
 import logging
 
 from dataall.base.aws.cognito import Cognito
-from dataall.base.aws.ses import Ses
+from dataall.base.aws.ses import NOT_SENT_RESULT, Ses
 from dataall.base.services.service_provider_factory import ServiceProviderFactory
+from dataall.base.utils.ttl_cache import TTLCache
 from dataall.modules.notifications.services.base_email_notification_service import BaseEmailNotificationService
 
 log = logging.getLogger(__name__)
 
 
 class SESEmailNotificationService(BaseEmailNotificationService):
+    # Share notifications go to the same few groups, their members are resolved once every 10 minutes
+    _group_email_ids = TTLCache(ttl_seconds=600)
+
     def __init__(self, email_client, recipient_group_list, recipient_email_list) -> None:
         super().__init__()
         self.email_client = email_client
@@ -24,7 +28,11 @@ class SESEmailNotificationService(BaseEmailNotificationService):
     def get_email_ids_from_groupList(group_list, identity_provider):
         email_list = set()
         for group in group_list:
-            email_list.update(identity_provider.get_user_emailids_from_group(group))
+            email_list.update(
+                SESEmailNotificationService._group_email_ids.get_or_set(
+                    group, lambda: identity_provider.get_user_emailids_from_group(group)
+                )
+            )
         return email_list
 
     @staticmethod
@@ -32,7 +40,8 @@ class SESEmailNotificationService(BaseEmailNotificationService):
         return SESEmailNotificationService(Ses.get_ses_client(), recipient_groups, recipient_email_ids)
 
     @staticmethod
-    def send_email_task(subject, message, recipient_groups_list, recipient_email_list):
+    def send_email_task(subject, message, recipient_groups_list, recipient_email_list, max_wait_seconds=None):
+        """Sends the email to the recipients, returns the emails that could not be sent within max_wait_seconds"""
         # Get instance of the email provider
         email_provider = SESEmailNotificationService.get_email_provider_instance(
             recipient_groups_list, recipient_email_list
@@ -47,16 +56,34 @@ class SESEmailNotificationService(BaseEmailNotificationService):
             if len(recipient_email_list) > 0:
                 email_ids_to_send_emails.update(recipient_email_list)
 
-            SESEmailNotificationService.send_email_to_users(email_ids_to_send_emails, email_provider, message, subject)
+            return SESEmailNotificationService.send_email_to_users(
+                email_ids_to_send_emails, email_provider, message, subject, max_wait_seconds
+            )
 
         except Exception as e:
             raise e
-        else:
-            return True
 
     @staticmethod
-    def send_email_to_users(email_list, email_provider, message, subject):
+    def send_email_to_users(email_list, email_provider, message, subject, max_wait_seconds=None):
         # Send individual emails to all the email ids. Sending individual emails helps in tracking individual emails via message-ids
         # https://aws.amazon.com/blogs/messaging-and-targeting/how-to-send-messages-to-multiple-recipients-with-amazon-simple-email-service-ses/
-        for emailId in email_list:
-            email_provider.send_email([emailId], message, subject)
+        # With an email template the individual emails are sent in bulk, 50 recipients per SES request
+        email_list = sorted(email_list)
+        if not email_list:
+            return []
+        if not email_provider.email_client.templateName:
+            for emailId in email_list:
+                email_provider.send_email([emailId], message, subject)
+            return []
+
+        not_sent = []
+        for emailId, result in email_provider.email_client.send_bulk_email(
+            email_list, message, subject, max_wait_seconds
+        ):
+            if result.get('Status') == 'SUCCESS':
+                log.info(f'Email to {emailId} sent with message id {result.get("MessageId")}')
+            elif result is NOT_SENT_RESULT:
+                not_sent.append(emailId)
+            else:
+                log.error(f'Failed to send email to {emailId}: {result.get("Status")} {result.get("Error")}')
+        return not_sent
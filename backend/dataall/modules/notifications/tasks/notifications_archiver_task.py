@@ -0,0 +1,33 @@
+import logging
+import os
+import sys
+from dataall.base.db import get_engine
+from dataall.modules.notifications.db.notification_repositories import NotificationRepository
+
+
+root = logging.getLogger()
+root.setLevel(logging.INFO)
+if not root.hasHandlers():
+    root.addHandler(logging.StreamHandler(sys.stdout))
+log = logging.getLogger(__name__)
+
+ARCHIVE_READ_NOTIFICATIONS_AFTER_DAYS = 90
+
+
+def archive_read_notifications(engine, older_than_days=ARCHIVE_READ_NOTIFICATIONS_AFTER_DAYS):
+    """
+    A method used by the scheduled ECS Task to move the read notifications older than older_than_days
+    to the notification_archive table
+    """
+    with engine.scoped_session() as session:
+        log.info(f'Archiving read notifications older than {older_than_days} days')
+        archived = NotificationRepository.archive_read_notifications(session, older_than_days)
+        log.info(f'Archived {archived} notifications')
+        return archived
+
+
+if __name__ == '__main__':
+    # Only the notification tables are used, no module is loaded so the task does not depend on the enabled modules
+    ENVNAME = os.environ.get('envname', 'local')
+    ENGINE = get_engine(envname=ENVNAME)
+    archive_read_notifications(engine=ENGINE)
@@ -7,7 +7,7 @@ from sqlalchemy import or_
 from sqlalchemy.sql import and_
 from sqlalchemy.orm import Query
 
-from dataall.base.db import paginate, exceptions
+from dataall.base.db import paginate, exceptions, term_filter
 from dataall.core.environment.db.environment_models import Environment, EnvironmentParameter
 from dataall.modules.omics.db.omics_models import OmicsWorkflow, OmicsRun
 
@@ -46,12 +46,7 @@ class OmicsRepository:
     def _query_workflows(self, filter) -> Query:
         query = self._session.query(OmicsWorkflow)
         if filter and filter.get('term'):
-            query = query.filter(
-                or_(
-                    OmicsWorkflow.id.ilike(filter.get('term') + '%%'),
-                    OmicsWorkflow.name.ilike('%%' + filter.get('term') + '%%'),
-                )
-            )
+            query = query.filter(term_filter(filter.get('term'), OmicsWorkflow.id, OmicsWorkflow.name))
         return query.order_by(OmicsWorkflow.label)
 
     def paginated_omics_workflows(self, filter=None) -> dict:
@@ -69,12 +64,7 @@ class OmicsRepository:
             )
         )
         if filter and filter.get('term'):
-            query = query.filter(
-                or_(
-                    OmicsRun.description.ilike(filter.get('term') + '%%'),
-                    OmicsRun.label.ilike(filter.get('term') + '%%'),
-                )
-            )
+            query = query.filter(term_filter(filter.get('term'), OmicsRun.description, OmicsRun.label))
         return query.order_by(OmicsRun.label)
 
     def paginated_user_runs(self, username, groups, filter=None) -> dict:
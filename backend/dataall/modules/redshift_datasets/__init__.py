@@ -34,6 +34,8 @@ class RedshiftDatasetApiModuleInterface(ModuleInterface):
         from dataall.modules.feed.api.registry import FeedRegistry, FeedDefinition
         from dataall.modules.catalog.indexers.registry import GlossaryRegistry, GlossaryDefinition
         from dataall.core.environment.services.environment_resource_manager import EnvironmentResourceManager
+        from dataall.core.organizations.services.organization_resource_manager import OrganizationResourceManager
+        from dataall.modules.redshift_datasets.indexers.organization_resource import RedshiftDatasetOrganizationResource
 
         from dataall.modules.redshift_datasets.indexers.dataset_indexer import DatasetIndexer
         from dataall.modules.redshift_datasets.indexers.table_indexer import DatasetTableIndexer
@@ -79,6 +81,7 @@ class RedshiftDatasetApiModuleInterface(ModuleInterface):
 
         EnvironmentResourceManager.register(RedshiftDatasetEnvironmentResource())
         EnvironmentResourceManager.register(RedshiftConnectionEnvironmentResource())
+        OrganizationResourceManager.register(RedshiftDatasetOrganizationResource())
 
         log.info('API of Redshift datasets has been imported')
 
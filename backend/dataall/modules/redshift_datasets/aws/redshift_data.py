@@ -1,13 +1,21 @@
 import logging
 import time
+
 from botocore.exceptions import ClientError
 from dataall.base.aws.sts import SessionHelper
+from dataall.base.utils.ttl_cache import TTLCache
 from dataall.modules.redshift_datasets.db.redshift_models import RedshiftConnection
 
 log = logging.getLogger(__name__)
 
+# the clients use pivot role credentials, which are valid for 1 hour
+_redshift_data_clients = TTLCache(ttl_seconds=30 * 60)
+
 
 class RedshiftDataClient:
+    POLL_INITIAL_DELAY_SECONDS = 0.1
+    POLL_MAX_DELAY_SECONDS = 5
+
     def __init__(self, account_id: str, region: str, connection: RedshiftConnection) -> None:
         session = SessionHelper.remote_session(accountid=account_id, region=region)
         self.client = session.client(service_name='redshift-data', region_name=region)
@@ -29,16 +37,18 @@ class RedshiftDataClient:
 
     def _execute_statement(self, sql: str):
         log.info(f'Executing {sql=} with connection {self.execute_connection_params}...')
-        execute_dict = self.execute_connection_params
-        execute_dict['Sql'] = sql
-        execute_statement_response = self.client.execute_statement(**execute_dict)
-
-        execution_finished = False
-        describe_statement_response = None
-        while not execution_finished:
-            describe_statement_response = self.client.describe_statement(Id=execute_statement_response['Id'])
-            time.sleep(1)
-            execution_finished = describe_statement_response['Status'] not in ['PICKED', 'STARTED', 'SUBMITTED']
+        execute_statement_response = self.client.execute_statement(**self.execute_connection_params, Sql=sql)
+        return self._wait_for_statement(execute_statement_response['Id'])
+
+    def _wait_for_statement(self, statement_id: str):
+        """Polls the statement with exponential backoff, most grants finish well before the first second"""
+        delay = self.POLL_INITIAL_DELAY_SECONDS
+        while True:
+            describe_statement_response = self.client.describe_statement(Id=statement_id)
+            if describe_statement_response['Status'] not in ['PICKED', 'STARTED', 'SUBMITTED']:
+                break
+            time.sleep(delay)
+            delay = min(delay * 2, self.POLL_MAX_DELAY_SECONDS)
 
         if describe_statement_response['Status'] == 'FAILED':
             raise Exception(describe_statement_response['Error'])
@@ -146,5 +156,16 @@ class RedshiftDataClient:
 
 
 def redshift_data_client(account_id: str, region: str, connection: RedshiftConnection) -> RedshiftDataClient:
-    "Factory of Client"
-    return RedshiftDataClient(account_id=account_id, region=region, connection=connection)
+    "Factory of Client, reuses the client of the same account, region and connection parameters while it is warm"
+    key = (
+        account_id,
+        region,
+        connection.database,
+        connection.workgroup,
+        connection.clusterId,
+        connection.secretArn,
+        connection.redshiftUser,
+    )
+    return _redshift_data_clients.get_or_set(
+        key, lambda: RedshiftDataClient(account_id=account_id, region=region, connection=connection)
+    )
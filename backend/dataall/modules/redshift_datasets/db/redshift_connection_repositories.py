@@ -2,7 +2,7 @@ import logging
 
 from sqlalchemy import or_
 from sqlalchemy.orm import Query
-from dataall.base.db import exceptions
+from dataall.base.db import exceptions, term_filter
 from dataall.core.environment.services.environment_resource_manager import EnvironmentResource
 from dataall.base.db import paginate
 from dataall.modules.redshift_datasets.db.redshift_models import RedshiftConnection
@@ -54,10 +54,7 @@ class RedshiftConnectionRepository:
             query = query.filter(RedshiftConnection.connectionType == filter.get('connectionType'))
         if filter and filter.get('term'):
             query = query.filter(
-                or_(
-                    RedshiftConnection.description.ilike(filter.get('term') + '%%'),
-                    RedshiftConnection.label.ilike(filter.get('term') + '%%'),
-                )
+                term_filter(filter.get('term'), RedshiftConnection.description, RedshiftConnection.label)
             )
         return query.order_by(RedshiftConnection.label)
 
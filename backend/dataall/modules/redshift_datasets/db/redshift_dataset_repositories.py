@@ -1,10 +1,10 @@
 import logging
 
-from sqlalchemy import or_, and_
+from sqlalchemy import and_
 from dataall.core.activity.db.activity_models import Activity
 from dataall.core.environment.db.environment_models import Environment
 from dataall.core.organizations.db.organization_repositories import OrganizationRepository
-from dataall.base.db import paginate
+from dataall.base.db import paginate, term_filter
 from dataall.base.db.exceptions import ObjectNotFound
 from dataall.modules.datasets_base.services.datasets_enums import ConfidentialityClassification, Language
 from dataall.core.environment.services.environment_resource_manager import EnvironmentResource
@@ -99,14 +99,7 @@ class RedshiftDatasetRepository:
     def _query_redshift_dataset_tables(session, dataset_uri, filter: dict = None):
         query = session.query(RedshiftTable).filter(RedshiftTable.datasetUri == dataset_uri)
         if filter and filter.get('term'):
-            query = query.filter(
-                or_(
-                    *[
-                        RedshiftTable.name.ilike('%' + filter.get('term') + '%'),
-                        RedshiftTable.label.ilike('%' + filter.get('term') + '%'),
-                    ]
-                )
-            )
+            query = query.filter(term_filter(filter.get('term'), RedshiftTable.name, RedshiftTable.label))
         return query
 
     @staticmethod
@@ -127,6 +120,14 @@ class RedshiftDatasetRepository:
     def count_dataset_tables(session, dataset_uri) -> int:
         return RedshiftDatasetRepository._query_redshift_dataset_tables(session, dataset_uri).count()
 
+    @staticmethod
+    def list_organization_datasets(session, organization_uri) -> [RedshiftDataset]:
+        return (
+            session.query(RedshiftDataset)
+            .filter(RedshiftDataset.organizationUri == organization_uri, RedshiftDataset.deleted.is_(None))
+            .all()
+        )
+
     @staticmethod
     def count_environment_group_datasets(session, environment, group_uri) -> int:
         return (
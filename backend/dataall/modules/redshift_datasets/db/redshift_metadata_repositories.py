@@ -0,0 +1,156 @@
+import logging
+from datetime import datetime
+
+from sqlalchemy.dialects.postgresql import insert
+
+from dataall.base.db import paginate
+from dataall.modules.redshift_datasets.db.redshift_models import (
+    RedshiftDataset,
+    RedshiftMetadataColumn,
+    RedshiftMetadataSync,
+    RedshiftMetadataTable,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RedshiftMetadataRepository:
+    """DAO layer for the cached metadata of Redshift schemas"""
+
+    _DEFAULT_PAGE = 1
+    _DEFAULT_PAGE_SIZE = 10
+
+    @staticmethod
+    def list_schemas_in_use(session):
+        """Distinct (connectionUri, schema) pairs referenced by Redshift datasets"""
+        return (
+            session.query(RedshiftDataset.connectionUri, RedshiftDataset.schema)
+            .filter(RedshiftDataset.deleted.is_(None))
+            .distinct()
+            .all()
+        )
+
+    @staticmethod
+    def list_tables(session, connection_uri, schema):
+        return (
+            session.query(RedshiftMetadataTable)
+            .filter(
+                RedshiftMetadataTable.connectionUri == connection_uri,
+                RedshiftMetadataTable.schema == schema,
+            )
+            .order_by(RedshiftMetadataTable.name)
+            .all()
+        )
+
+    @staticmethod
+    def _get_last_synced(session, connection_uri, schema, table_name=''):
+        return (
+            session.query(RedshiftMetadataSync.lastSynced)
+            .filter(
+                RedshiftMetadataSync.connectionUri == connection_uri,
+                RedshiftMetadataSync.schema == schema,
+                RedshiftMetadataSync.tableName == table_name,
+            )
+            .scalar()
+        )
+
+    @staticmethod
+    def _set_last_synced(session, connection_uri, schema, synced: datetime, table_name=''):
+        statement = insert(RedshiftMetadataSync.__table__).values(
+            connectionUri=connection_uri, schema=schema, tableName=table_name, lastSynced=synced
+        )
+        session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[
+                    RedshiftMetadataSync.connectionUri,
+                    RedshiftMetadataSync.schema,
+                    RedshiftMetadataSync.tableName,
+                ],
+                set_={'lastSynced': statement.excluded.lastSynced},
+            )
+        )
+
+    @staticmethod
+    def get_tables_last_synced(session, connection_uri, schema):
+        return RedshiftMetadataRepository._get_last_synced(session, connection_uri, schema)
+
+    @staticmethod
+    def replace_tables(session, connection_uri, schema, tables: list, synced: datetime):
+        session.query(RedshiftMetadataTable).filter(
+            RedshiftMetadataTable.connectionUri == connection_uri,
+            RedshiftMetadataTable.schema == schema,
+        ).delete(synchronize_session=False)
+        session.bulk_insert_mappings(
+            RedshiftMetadataTable,
+            [
+                {
+                    'connectionUri': connection_uri,
+                    'schema': schema,
+                    'name': table['name'],
+                    'type': table['type'],
+                }
+                for table in tables
+            ],
+        )
+        RedshiftMetadataRepository._set_last_synced(session, connection_uri, schema, synced)
+
+    @staticmethod
+    def _query_columns(session, connection_uri, schema, table_name):
+        return (
+            session.query(RedshiftMetadataColumn)
+            .filter(
+                RedshiftMetadataColumn.connectionUri == connection_uri,
+                RedshiftMetadataColumn.schema == schema,
+                RedshiftMetadataColumn.tableName == table_name,
+            )
+            .order_by(RedshiftMetadataColumn.position)
+        )
+
+    @staticmethod
+    def list_columns(session, connection_uri, schema, table_name):
+        return RedshiftMetadataRepository._query_columns(session, connection_uri, schema, table_name).all()
+
+    @staticmethod
+    def paginated_columns(session, connection_uri, schema, table_name, filter=None) -> dict:
+        filter = filter or {}
+        return paginate(
+            query=RedshiftMetadataRepository._query_columns(session, connection_uri, schema, table_name),
+            page=filter.get('page', RedshiftMetadataRepository._DEFAULT_PAGE),
+            page_size=filter.get('pageSize', RedshiftMetadataRepository._DEFAULT_PAGE_SIZE),
+        ).to_dict()
+
+    @staticmethod
+    def get_columns_last_synced(session, connection_uri, schema, table_name):
+        return RedshiftMetadataRepository._get_last_synced(session, connection_uri, schema, table_name)
+
+    @staticmethod
+    def replace_columns(session, connection_uri, schema, table_name, columns: list, synced: datetime):
+        session.query(RedshiftMetadataColumn).filter(
+            RedshiftMetadataColumn.connectionUri == connection_uri,
+            RedshiftMetadataColumn.schema == schema,
+            RedshiftMetadataColumn.tableName == table_name,
+        ).delete(synchronize_session=False)
+        session.bulk_insert_mappings(
+            RedshiftMetadataColumn,
+            [
+                {
+                    'connectionUri': connection_uri,
+                    'schema': schema,
+                    'tableName': table_name,
+                    'name': column['name'],
+                    'position': position,
+                    'typeName': column.get('typeName'),
+                    'nullable': column.get('nullable'),
+                    'length': column.get('length'),
+                    'precision': column.get('precision'),
+                    'scale': column.get('scale'),
+                    'columnDefault': column.get('columnDefault'),
+                    'isCaseSensitive': column.get('isCaseSensitive'),
+                    'isCurrency': column.get('isCurrency'),
+                    'isSigned': column.get('isSigned'),
+                    'label': column.get('label'),
+                }
+                for position, column in enumerate(columns)
+            ],
+        )
+        RedshiftMetadataRepository._set_last_synced(session, connection_uri, schema, synced, table_name)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import ARRAY
 from dataall.modules.datasets_base.db.dataset_models import DatasetBase
 from dataall.modules.datasets_base.services.datasets_enums import DatasetTypes
@@ -41,3 +41,57 @@ class RedshiftTable(Base, Resource):
     @classmethod
     def uri(cls):
         return cls.rsTableUri
+
+
+class RedshiftMetadataTable(Base):
+    """Tables and views of a Redshift schema as last read through the Redshift Data API"""
+
+    __tablename__ = 'redshift_metadata_table'
+    connectionUri = Column(
+        String, ForeignKey('redshift_connection.connectionUri', ondelete='CASCADE'), primary_key=True
+    )
+    schema = Column(String, primary_key=True)
+    name = Column(String, primary_key=True)
+    type = Column(String, nullable=False)
+
+
+class RedshiftMetadataColumn(Base):
+    """Columns of a Redshift table as last read through the Redshift Data API"""
+
+    __tablename__ = 'redshift_metadata_column'
+    connectionUri = Column(
+        String, ForeignKey('redshift_connection.connectionUri', ondelete='CASCADE'), primary_key=True
+    )
+    schema = Column(String, primary_key=True)
+    tableName = Column(String, primary_key=True)
+    name = Column(String, primary_key=True)
+    position = Column(Integer, nullable=False)
+    typeName = Column(String, nullable=True)
+    nullable = Column(Boolean, nullable=True)
+    length = Column(Integer, nullable=True)
+    precision = Column(Integer, nullable=True)
+    scale = Column(Integer, nullable=True)
+    columnDefault = Column(String, nullable=True)
+    isCaseSensitive = Column(Boolean, nullable=True)
+    isCurrency = Column(Boolean, nullable=True)
+    isSigned = Column(Boolean, nullable=True)
+    label = Column(String, nullable=True)
+
+    __table_args__ = (
+        Index('ix_redshift_metadata_column_position', 'connectionUri', 'schema', 'tableName', 'position'),
+    )
+
+
+class RedshiftMetadataSync(Base):
+    """
+    Last sync of the tables of a Redshift schema (empty tableName) or of the columns of one of its tables.
+    Kept apart from the cached rows so that a schema without tables or a table without columns is cached too
+    """
+
+    __tablename__ = 'redshift_metadata_sync'
+    connectionUri = Column(
+        String, ForeignKey('redshift_connection.connectionUri', ondelete='CASCADE'), primary_key=True
+    )
+    schema = Column(String, primary_key=True)
+    tableName = Column(String, primary_key=True, default='')
+    lastSynced = Column(DateTime, nullable=False)
@@ -36,6 +36,9 @@ class DatasetIndexer(BaseIndexer):
                     'owner': dataset.owner,
                     'label': dataset.label,
                     'admins': dataset.SamlAdminGroupName,
+                    'allowedGroups': BaseIndexer._get_allowed_groups(
+                        session, org.organizationUri, dataset.SamlAdminGroupName, dataset.stewards
+                    ),
                     'database': connection.database,
                     'schema': dataset.schema,
                     'source': connection.clusterId
@@ -0,0 +1,15 @@
+from dataall.core.organizations.services.organization_resource_manager import OrganizationResource
+from dataall.modules.redshift_datasets.db.redshift_dataset_repositories import RedshiftDatasetRepository
+from dataall.modules.redshift_datasets.indexers.dataset_indexer import DatasetIndexer
+from dataall.modules.redshift_datasets.indexers.table_indexer import DatasetTableIndexer
+
+
+class RedshiftDatasetOrganizationResource(OrganizationResource):
+    """Reindexes the Redshift datasets and tables of the organization, their documents hold the organization teams"""
+
+    @staticmethod
+    def update_org_groups(session, organization):
+        for dataset in RedshiftDatasetRepository.list_organization_datasets(session, organization.organizationUri):
+            DatasetIndexer.queue_upsert(session, dataset.datasetUri)
+            for table in RedshiftDatasetRepository.list_redshift_dataset_tables(session, dataset.datasetUri):
+                DatasetTableIndexer.queue_upsert(session, table.rsTableUri)
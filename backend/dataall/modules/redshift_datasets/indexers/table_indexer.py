@@ -6,6 +6,7 @@ from dataall.core.environment.services.environment_service import EnvironmentSer
 from dataall.core.organizations.db.organization_repositories import OrganizationRepository
 from dataall.modules.redshift_datasets.db.redshift_dataset_repositories import RedshiftDatasetRepository
 from dataall.modules.redshift_datasets.db.redshift_connection_repositories import RedshiftConnectionRepository
+from dataall.modules.redshift_datasets.db.redshift_metadata_repositories import RedshiftMetadataRepository
 from dataall.modules.redshift_datasets.services.redshift_enums import RedshiftType
 from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
 
@@ -25,6 +26,10 @@ class DatasetTableIndexer(BaseIndexer):
             env = EnvironmentService.get_environment_by_uri(session, dataset.environmentUri) if not env else env
             org = OrganizationRepository.get_organization_by_uri(session, dataset.organizationUri) if not org else org
             glossary = BaseIndexer._get_target_glossary_terms(session, table_uri)
+            # columns come from the metadata cache, indexing never calls Redshift
+            columns = RedshiftMetadataRepository.list_columns(
+                session, dataset.connectionUri, dataset.schema, table.name
+            )
 
             tags = table.tags if table.tags else []
             BaseIndexer._index(
@@ -32,6 +37,9 @@ class DatasetTableIndexer(BaseIndexer):
                 doc={
                     'name': table.name,
                     'admins': dataset.SamlAdminGroupName,
+                    'allowedGroups': BaseIndexer._get_allowed_groups(
+                        session, org.organizationUri, dataset.SamlAdminGroupName, dataset.stewards
+                    ),
                     'owner': table.owner,
                     'label': table.label,
                     'resourceKind': 'redshifttable',
@@ -54,6 +62,7 @@ class DatasetTableIndexer(BaseIndexer):
                     'updated': table.updated,
                     'deleted': table.deleted,
                     'glossary': glossary,
+                    'columns': [column.name for column in columns],
                 },
             )
         return table
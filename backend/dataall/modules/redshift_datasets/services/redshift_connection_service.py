@@ -18,6 +18,7 @@ from dataall.modules.redshift_datasets.services.redshift_connection_permissions
 )
 from dataall.modules.redshift_datasets.db.redshift_models import RedshiftConnection
 from dataall.modules.redshift_datasets.aws.redshift_data import redshift_data_client
+from dataall.modules.redshift_datasets.services.redshift_metadata_service import RedshiftMetadataService
 from dataall.modules.redshift_datasets.aws.redshift_serverless import redshift_serverless_client
 from dataall.modules.redshift_datasets.aws.redshift import redshift_client
 from dataall.modules.redshift_datasets.aws.kms_redshift import kms_redshift_client
@@ -129,10 +130,10 @@ class RedshiftConnectionService:
         with context.db_engine.scoped_session() as session:
             connection = RedshiftConnectionService.get_redshift_connection_by_uri(uri=uri)
             environment = EnvironmentService.get_environment_by_uri(session, connection.environmentUri)
-            response = redshift_data_client(
-                account_id=environment.AwsAccountId, region=environment.region, connection=connection
-            ).list_redshift_tables(schema)
-            return response
+            tables = RedshiftMetadataService.list_schema_tables(
+                session, environment.AwsAccountId, environment.region, connection, schema
+            )
+            return [{'name': table.name, 'type': table.type} for table in tables]
 
     @staticmethod
     def _check_redshift_connection(account_id: str, region: str, connection: RedshiftConnection):
@@ -1,7 +1,6 @@
 import logging
 
 from dataall.base.context import get_context
-from dataall.base.db.paginator import paginate_list
 from dataall.core.permissions.services.resource_policy_service import ResourcePolicyService
 from dataall.core.permissions.services.tenant_policy_service import TenantPolicyService
 from dataall.core.permissions.services.group_policy_service import GroupPolicyService
@@ -31,7 +30,7 @@ from dataall.modules.redshift_datasets.services.redshift_dataset_permissions imp
 from dataall.modules.redshift_datasets.db.redshift_dataset_repositories import RedshiftDatasetRepository
 from dataall.modules.redshift_datasets.db.redshift_connection_repositories import RedshiftConnectionRepository
 from dataall.modules.redshift_datasets.db.redshift_models import RedshiftDataset, RedshiftTable
-from dataall.modules.redshift_datasets.aws.redshift_data import redshift_data_client
+from dataall.modules.redshift_datasets.services.redshift_metadata_service import RedshiftMetadataService
 from dataall.modules.redshift_datasets.indexers.dataset_indexer import DatasetIndexer
 from dataall.modules.redshift_datasets.indexers.table_indexer import DatasetTableIndexer
 from dataall.modules.redshift_datasets.services.redshift_constants import (
@@ -61,7 +60,7 @@ class RedshiftDatasetService:
 
             RedshiftDatasetService._attach_dataset_permissions(session, dataset, environment)
 
-            DatasetIndexer.upsert(session=session, dataset_uri=dataset.datasetUri)
+            DatasetIndexer.queue_upsert(session, dataset.datasetUri)
 
             for table in data.get('tables', []):
                 rs_table = RedshiftDatasetRepository.create_redshift_table(
@@ -71,7 +70,7 @@ class RedshiftDatasetService:
                     data={'name': table},
                 )
                 RedshiftDatasetService._attach_table_permissions(session, dataset, environment, rs_table)
-                DatasetTableIndexer.upsert(session=session, table_uri=rs_table.rsTableUri)
+                DatasetTableIndexer.queue_upsert(session, rs_table.rsTableUri)
 
         return dataset
 
@@ -109,7 +108,7 @@ class RedshiftDatasetService:
                     )
                 DatasetBaseRepository.update_dataset_activity(session, dataset, username)
 
-            DatasetIndexer.upsert(session, dataset_uri=uri)
+            DatasetIndexer.queue_upsert(session, uri)
             return dataset
 
     @staticmethod
@@ -168,7 +167,7 @@ class RedshiftDatasetService:
                     resource_uri=rs_table.rsTableUri,
                     resource_type=RedshiftTable.__name__,
                 )
-                DatasetTableIndexer.upsert(session=session, table_uri=rs_table.rsTableUri)
+                DatasetTableIndexer.queue_upsert(session, rs_table.rsTableUri)
         return True
 
     @staticmethod
@@ -199,7 +198,7 @@ class RedshiftDatasetService:
                     GlossaryRepository.set_glossary_terms_links(
                         session, username, table.rsTableUri, GLOSSARY_REDSHIFT_DATASET_TABLE_NAME, data.get('terms')
                     )
-            DatasetTableIndexer.upsert(session, table_uri=uri)
+            DatasetTableIndexer.queue_upsert(session, uri)
             return table
 
     @staticmethod
@@ -235,15 +234,13 @@ class RedshiftDatasetService:
             ]
             connection = RedshiftConnectionRepository.get_redshift_connection(session, dataset.connectionUri)
             environment = EnvironmentService.get_environment_by_uri(session, connection.environmentUri)
-            tables = redshift_data_client(
-                account_id=environment.AwsAccountId, region=environment.region, connection=connection
-            ).list_redshift_tables(dataset.schema)
-            for table in tables:
-                if table['name'] in dataset_tables_names:
-                    table.update({'alreadyAdded': True})
-                else:
-                    table.update({'alreadyAdded': False})
-            return tables
+            tables = RedshiftMetadataService.list_schema_tables(
+                session, environment.AwsAccountId, environment.region, connection, dataset.schema
+            )
+            return [
+                {'name': table.name, 'type': table.type, 'alreadyAdded': table.name in dataset_tables_names}
+                for table in tables
+            ]
 
     @staticmethod
     @TenantPolicyService.has_tenant_permission(MANAGE_REDSHIFT_DATASETS)
@@ -274,12 +271,9 @@ class RedshiftDatasetService:
             connection = RedshiftConnectionRepository.get_redshift_connection(
                 session=session, uri=dataset.connectionUri
             )
-            columns = redshift_data_client(
-                account_id=dataset.AwsAccountId, region=dataset.region, connection=connection
-            ).list_redshift_table_columns(dataset.schema, table.name)
-            return paginate_list(
-                items=columns, page_size=filter.get('pageSize', 10), page=filter.get('page', 1)
-            ).to_dict()
+            return RedshiftMetadataService.paginated_table_columns(
+                session, dataset.AwsAccountId, dataset.region, connection, dataset.schema, table.name, filter
+            )
 
     @staticmethod
     def _delete_dataset_term_links(session, dataset_uri):
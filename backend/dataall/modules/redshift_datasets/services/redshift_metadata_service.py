@@ -0,0 +1,76 @@
+"""
+Keeps a copy of the Redshift tables and columns in the data.all database.
+Browsing Redshift metadata reads the local copy, which is refreshed from the Redshift Data API when it is older
+than the configured time to live or by the scheduled redshift_metadata_syncer task
+"""
+
+import logging
+from datetime import datetime, timedelta
+
+from dataall.base.config import config
+from dataall.modules.redshift_datasets.aws.redshift_data import redshift_data_client
+from dataall.modules.redshift_datasets.db.redshift_metadata_repositories import RedshiftMetadataRepository
+from dataall.modules.redshift_datasets.db.redshift_models import RedshiftConnection
+
+log = logging.getLogger(__name__)
+
+
+class RedshiftMetadataService:
+    _DEFAULT_TTL_MINUTES = 60
+
+    @staticmethod
+    def list_schema_tables(session, account_id, region, connection: RedshiftConnection, schema: str):
+        if RedshiftMetadataService._is_stale(
+            RedshiftMetadataRepository.get_tables_last_synced(session, connection.connectionUri, schema)
+        ):
+            RedshiftMetadataService.sync_schema_tables(session, account_id, region, connection, schema)
+        return RedshiftMetadataRepository.list_tables(session, connection.connectionUri, schema)
+
+    @staticmethod
+    def list_table_columns(session, account_id, region, connection: RedshiftConnection, schema: str, table: str):
+        RedshiftMetadataService._refresh_table_columns_if_stale(session, account_id, region, connection, schema, table)
+        return RedshiftMetadataRepository.list_columns(session, connection.connectionUri, schema, table)
+
+    @staticmethod
+    def paginated_table_columns(
+        session, account_id, region, connection: RedshiftConnection, schema: str, table: str, filter: dict
+    ) -> dict:
+        RedshiftMetadataService._refresh_table_columns_if_stale(session, account_id, region, connection, schema, table)
+        return RedshiftMetadataRepository.paginated_columns(session, connection.connectionUri, schema, table, filter)
+
+    @staticmethod
+    def sync_schema_tables(session, account_id, region, connection: RedshiftConnection, schema: str):
+        tables = redshift_data_client(account_id=account_id, region=region, connection=connection).list_redshift_tables(
+            schema
+        )
+        RedshiftMetadataRepository.replace_tables(session, connection.connectionUri, schema, tables, datetime.now())
+        session.commit()
+        return tables
+
+    @staticmethod
+    def sync_table_columns(session, account_id, region, connection: RedshiftConnection, schema: str, table: str):
+        columns = redshift_data_client(
+            account_id=account_id, region=region, connection=connection
+        ).list_redshift_table_columns(schema, table)
+        RedshiftMetadataRepository.replace_columns(
+            session, connection.connectionUri, schema, table, columns, datetime.now()
+        )
+        session.commit()
+        return columns
+
+    @staticmethod
+    def _refresh_table_columns_if_stale(session, account_id, region, connection, schema, table):
+        if RedshiftMetadataService._is_stale(
+            RedshiftMetadataRepository.get_columns_last_synced(session, connection.connectionUri, schema, table)
+        ):
+            RedshiftMetadataService.sync_table_columns(session, account_id, region, connection, schema, table)
+
+    @staticmethod
+    def _is_stale(last_synced) -> bool:
+        if last_synced is None:
+            return True
+        ttl_minutes = config.get_property(
+            'modules.redshift_datasets.features.metadata_cache_ttl_minutes',
+            RedshiftMetadataService._DEFAULT_TTL_MINUTES,
+        )
+        return last_synced < datetime.now() - timedelta(minutes=ttl_minutes)
@@ -0,0 +1 @@
+"""Code of the long-running tasks that run in ECS"""
@@ -0,0 +1,61 @@
+import logging
+import os
+import sys
+
+from dataall.base.db import get_engine
+from dataall.core.environment.services.environment_service import EnvironmentService
+from dataall.modules.redshift_datasets.db.redshift_connection_repositories import RedshiftConnectionRepository
+from dataall.modules.redshift_datasets.db.redshift_dataset_repositories import RedshiftDatasetRepository
+from dataall.modules.redshift_datasets.db.redshift_metadata_repositories import RedshiftMetadataRepository
+from dataall.modules.redshift_datasets.db.redshift_models import RedshiftDataset
+from dataall.modules.redshift_datasets.indexers.table_indexer import DatasetTableIndexer
+from dataall.modules.redshift_datasets.services.redshift_metadata_service import RedshiftMetadataService
+
+root = logging.getLogger()
+root.setLevel(logging.INFO)
+if not root.hasHandlers():
+    root.addHandler(logging.StreamHandler(sys.stdout))
+log = logging.getLogger(__name__)
+
+
+def sync_redshift_metadata(engine):
+    """Refreshes the cached tables of every schema used by a Redshift dataset and the columns of the imported tables"""
+    synced_schemas = []
+    with engine.scoped_session() as session:
+        schemas = RedshiftMetadataRepository.list_schemas_in_use(session)
+        log.info(f'Found {len(schemas)} Redshift schemas for metadata sync')
+        for connection_uri, schema in schemas:
+            try:
+                connection = RedshiftConnectionRepository.get_redshift_connection(session, connection_uri)
+                environment = EnvironmentService.get_environment_by_uri(session, connection.environmentUri)
+                RedshiftMetadataService.sync_schema_tables(
+                    session, environment.AwsAccountId, environment.region, connection, schema
+                )
+                datasets = (
+                    session.query(RedshiftDataset)
+                    .filter(
+                        RedshiftDataset.connectionUri == connection_uri,
+                        RedshiftDataset.schema == schema,
+                        RedshiftDataset.deleted.is_(None),
+                    )
+                    .all()
+                )
+                for dataset in datasets:
+                    for table in RedshiftDatasetRepository.list_redshift_dataset_tables(session, dataset.datasetUri):
+                        RedshiftMetadataService.sync_table_columns(
+                            session, environment.AwsAccountId, environment.region, connection, schema, table.name
+                        )
+                        DatasetTableIndexer.upsert(
+                            session, table_uri=table.rsTableUri, dataset=dataset, env=environment
+                        )
+                synced_schemas.append((connection_uri, schema))
+            except Exception as e:
+                session.rollback()
+                log.error(f'Failed to sync metadata of Redshift schema {connection_uri}/{schema} due to: {e}')
+    return synced_schemas
+
+
+if __name__ == '__main__':
+    ENVNAME = os.environ.get('envname', 'local')
+    ENGINE = get_engine(envname=ENVNAME)
+    sync_redshift_metadata(engine=ENGINE)
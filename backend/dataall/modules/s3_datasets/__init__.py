@@ -36,6 +36,8 @@ class DatasetApiModuleInterface(ModuleInterface):
         from dataall.modules.feed.api.registry import FeedRegistry, FeedDefinition
         from dataall.modules.catalog.indexers.registry import GlossaryRegistry, GlossaryDefinition
         from dataall.core.environment.services.environment_resource_manager import EnvironmentResourceManager
+        from dataall.core.organizations.services.organization_resource_manager import OrganizationResourceManager
+        from dataall.modules.s3_datasets.indexers.organization_resource import DatasetOrganizationResource
         from dataall.modules.s3_datasets.indexers.dataset_indexer import DatasetIndexer
         from dataall.modules.s3_datasets.indexers.location_indexer import DatasetLocationIndexer
         from dataall.modules.s3_datasets.indexers.table_indexer import DatasetTableIndexer
@@ -76,6 +78,7 @@ class DatasetApiModuleInterface(ModuleInterface):
         TargetType('dataset', GET_DATASET, UPDATE_DATASET)
 
         EnvironmentResourceManager.register(DatasetRepository())
+        OrganizationResourceManager.register(DatasetOrganizationResource())
 
         log.info('API of S3 datasets has been imported')
 
@@ -1,6 +1,6 @@
 from operator import or_
 
-from dataall.base.db import paginate
+from dataall.base.db import paginate, term_filter
 from dataall.base.db.exceptions import ObjectNotFound
 from dataall.modules.s3_datasets.db.dataset_models import DatasetTableColumn
 
@@ -31,11 +31,8 @@ class DatasetColumnRepository:
 
         if 'term' in filter:
             term = filter['term']
-            q = q.filter(
-                or_(
-                    DatasetTableColumn.label.ilike('%' + term + '%'),
-                    DatasetTableColumn.description.ilike('%' + term + '%'),
-                )
-            ).order_by(DatasetTableColumn.columnType.asc())
+            q = q.filter(term_filter(term, DatasetTableColumn.label, DatasetTableColumn.description)).order_by(
+                DatasetTableColumn.columnType.asc()
+            )
 
         return paginate(query=q, page=filter.get('page', 1), page_size=filter.get('pageSize', 10)).to_dict()
@@ -1,8 +1,8 @@
 import logging
 
-from sqlalchemy import and_, or_
+from sqlalchemy import and_
 
-from dataall.base.db import paginate, exceptions
+from dataall.base.db import paginate, exceptions, term_filter
 from dataall.modules.s3_datasets.db.dataset_models import DatasetStorageLocation, S3Dataset
 
 logger = logging.getLogger(__name__)
@@ -52,7 +52,7 @@ class DatasetLocationRepository:
         )
         if data.get('term'):
             term = data.get('term')
-            query = query.filter(DatasetStorageLocation.label.ilike('%' + term + '%'))
+            query = query.filter(term_filter(term, DatasetStorageLocation.label))
         return paginate(query, page=data.get('page', 1), page_size=data.get('pageSize', 10)).to_dict()
 
     @staticmethod
@@ -106,12 +106,7 @@ class DatasetLocationRepository:
         query = session.query(DatasetStorageLocation).filter(DatasetStorageLocation.datasetUri == uri)
         if data and data.get('term'):
             query = query.filter(
-                or_(
-                    *[
-                        DatasetStorageLocation.name.ilike('%' + data.get('term') + '%'),
-                        DatasetStorageLocation.S3Prefix.ilike('%' + data.get('term') + '%'),
-                    ]
-                )
+                term_filter(data.get('term'), DatasetStorageLocation.name, DatasetStorageLocation.S3Prefix)
             )
         return paginate(
             query=query.order_by(DatasetStorageLocation.label),
@@ -1,8 +1,9 @@
-from sqlalchemy import Boolean, Column, String, Text, ForeignKey
+from sqlalchemy import Boolean, Column, String, Text, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import JSON, ARRAY
 from sqlalchemy.orm import query_expression
 from dataall.base.db import Base, Resource, utils
 from dataall.modules.datasets_base.db.dataset_models import DatasetBase
+from dataall.modules.datasets_base.db.shareable_item_repositories import ShareableItemRepository
 from dataall.modules.datasets_base.services.datasets_enums import DatasetTypes
 
 
@@ -78,6 +79,8 @@ class DatasetTable(Resource, Base):
     topics = Column(ARRAY(String), nullable=True)
     confidentiality = Column(String, nullable=False, default='C1')
 
+    __table_args__ = (Index('ix_dataset_table_datasetUri', 'datasetUri'),)
+
     @classmethod
     def uri(cls):
         return cls.tableUri
@@ -136,3 +139,9 @@ class DatasetBucket(Resource, Base):
     @classmethod
     def uri(cls):
         return cls.bucketUri
+
+
+# Tracked here and not by the sharing modules, so that the tasks syncing them keep the projection up to date
+ShareableItemRepository.track('DatasetTable', DatasetTable, DatasetTable.tableUri)
+ShareableItemRepository.track('DatasetStorageLocation', DatasetStorageLocation, DatasetStorageLocation.locationUri)
+ShareableItemRepository.track('S3Bucket', DatasetBucket, DatasetBucket.bucketUri)
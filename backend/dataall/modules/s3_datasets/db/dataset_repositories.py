@@ -5,7 +5,7 @@ from sqlalchemy.orm import Query
 from dataall.core.activity.db.activity_models import Activity
 from dataall.core.environment.db.environment_models import Environment
 from dataall.core.organizations.db.organization_repositories import OrganizationRepository
-from dataall.base.db import paginate
+from dataall.base.db import paginate, term_filter
 from dataall.base.db.exceptions import ObjectNotFound
 from dataall.modules.datasets_base.services.datasets_enums import ConfidentialityClassification, Language
 from dataall.core.environment.services.environment_resource_manager import EnvironmentResource
@@ -151,14 +151,7 @@ class DatasetRepository(EnvironmentResource):
             .order_by(DatasetTable.created.desc())
         )
         if data and data.get('term'):
-            query = query.filter(
-                or_(
-                    *[
-                        DatasetTable.name.ilike('%' + data.get('term') + '%'),
-                        DatasetTable.GlueTableName.ilike('%' + data.get('term') + '%'),
-                    ]
-                )
-            )
+            query = query.filter(term_filter(data.get('term'), DatasetTable.name, DatasetTable.GlueTableName))
         return paginate(query=query, page_size=data.get('pageSize', 10), page=data.get('page', 1)).to_dict()
 
     @staticmethod
@@ -196,6 +189,14 @@ class DatasetRepository(EnvironmentResource):
     def list_all_active_datasets(session) -> [S3Dataset]:
         return session.query(S3Dataset).filter(S3Dataset.deleted.is_(None)).all()
 
+    @staticmethod
+    def list_organization_datasets(session, organization_uri) -> [S3Dataset]:
+        return (
+            session.query(S3Dataset)
+            .filter(S3Dataset.organizationUri == organization_uri, S3Dataset.deleted.is_(None))
+            .all()
+        )
+
     @staticmethod
     def get_dataset_by_bucket_name(session, bucket) -> [S3Dataset]:
         return session.query(S3Dataset).filter(S3Dataset.S3BucketName == bucket).first()
@@ -217,10 +218,8 @@ class DatasetRepository(EnvironmentResource):
             term = filter['term']
             query = query.filter(
                 or_(
-                    S3Dataset.label.ilike('%' + term + '%'),
-                    S3Dataset.description.ilike('%' + term + '%'),
+                    term_filter(term, S3Dataset.label, S3Dataset.description, S3Dataset.region),
                     S3Dataset.tags.contains(f'{{{term}}}'),
-                    S3Dataset.region.ilike('%' + term + '%'),
                 )
             )
         return query.order_by(S3Dataset.label)
@@ -234,10 +233,8 @@ class DatasetRepository(EnvironmentResource):
             term = filter['term']
             query = query.filter(
                 or_(
-                    S3Dataset.label.ilike('%' + term + '%'),
-                    S3Dataset.description.ilike('%' + term + '%'),
+                    term_filter(term, S3Dataset.label, S3Dataset.description, S3Dataset.region),
                     S3Dataset.tags.contains(f'{{{term}}}'),
-                    S3Dataset.region.ilike('%' + term + '%'),
                 )
             )
         return query
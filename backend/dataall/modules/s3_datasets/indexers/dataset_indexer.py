@@ -31,6 +31,9 @@ class DatasetIndexer(BaseIndexer):
                     'owner': dataset.owner,
                     'label': dataset.label,
                     'admins': dataset.SamlAdminGroupName,
+                    'allowedGroups': BaseIndexer._get_allowed_groups(
+                        session, org.organizationUri, dataset.SamlAdminGroupName, dataset.stewards
+                    ),
                     'database': dataset.GlueDatabaseName,
                     'source': dataset.S3BucketName,
                     'resourceKind': 'dataset',
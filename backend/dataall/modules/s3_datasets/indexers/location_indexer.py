@@ -11,13 +11,17 @@ from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
 
 class DatasetLocationIndexer(BaseIndexer):
     @classmethod
-    def upsert(cls, session, folder_uri: str, dataset=None, env=None, org=None):
+    def upsert(cls, session, folder_uri: str, dataset=None, env=None, org=None, allowed_groups=None):
         folder = DatasetLocationRepository.get_location_by_uri(session, folder_uri)
 
         if folder:
             dataset = DatasetRepository.get_dataset_by_uri(session, folder.datasetUri) if not dataset else dataset
             env = EnvironmentService.get_environment_by_uri(session, dataset.environmentUri) if not env else env
             org = OrganizationRepository.get_organization_by_uri(session, dataset.organizationUri) if not org else org
+            if allowed_groups is None:
+                allowed_groups = BaseIndexer._get_allowed_groups(
+                    session, org.organizationUri, dataset.SamlAdminGroupName, dataset.stewards
+                )
             glossary = BaseIndexer._get_target_glossary_terms(session, folder_uri)
 
             BaseIndexer._index(
@@ -25,6 +29,7 @@ class DatasetLocationIndexer(BaseIndexer):
                 doc={
                     'name': folder.name,
                     'admins': dataset.SamlAdminGroupName,
+                    'allowedGroups': allowed_groups,
                     'owner': folder.owner,
                     'label': folder.label,
                     'resourceKind': 'folder',
@@ -53,8 +58,23 @@ class DatasetLocationIndexer(BaseIndexer):
         dataset = DatasetRepository.get_dataset_by_uri(session, dataset_uri)
         env = EnvironmentService.get_environment_by_uri(session, dataset.environmentUri)
         org = OrganizationRepository.get_organization_by_uri(session, dataset.organizationUri)
+        allowed_groups = BaseIndexer._get_allowed_groups(
+            session, org.organizationUri, dataset.SamlAdminGroupName, dataset.stewards
+        )
         for folder in folders:
             DatasetLocationIndexer.upsert(
-                session=session, folder_uri=folder.locationUri, dataset=dataset, env=env, org=org
+                session=session,
+                folder_uri=folder.locationUri,
+                dataset=dataset,
+                env=env,
+                org=org,
+                allowed_groups=allowed_groups,
             )
         return folders
+
+    @classmethod
+    def queue_upsert_all(cls, session, dataset_uri: str):
+        folders = DatasetLocationRepository.get_dataset_folders(session, dataset_uri)
+        for folder in folders:
+            cls.queue_upsert(session, folder.locationUri)
+        return folders
@@ -0,0 +1,16 @@
+from dataall.core.organizations.services.organization_resource_manager import OrganizationResource
+from dataall.modules.s3_datasets.db.dataset_repositories import DatasetRepository
+from dataall.modules.s3_datasets.indexers.dataset_indexer import DatasetIndexer
+from dataall.modules.s3_datasets.indexers.location_indexer import DatasetLocationIndexer
+from dataall.modules.s3_datasets.indexers.table_indexer import DatasetTableIndexer
+
+
+class DatasetOrganizationResource(OrganizationResource):
+    """Reindexes the datasets, tables and folders of the organization, their documents hold the organization teams"""
+
+    @staticmethod
+    def update_org_groups(session, organization):
+        for dataset in DatasetRepository.list_organization_datasets(session, organization.organizationUri):
+            DatasetIndexer.queue_upsert(session, dataset.datasetUri)
+            DatasetTableIndexer.queue_upsert_all(session, dataset.datasetUri)
+            DatasetLocationIndexer.queue_upsert_all(session, dataset.datasetUri)
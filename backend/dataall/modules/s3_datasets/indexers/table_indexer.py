@@ -12,13 +12,17 @@ from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
 
 class DatasetTableIndexer(BaseIndexer):
     @classmethod
-    def upsert(cls, session, table_uri: str, dataset=None, env=None, org=None):
+    def upsert(cls, session, table_uri: str, dataset=None, env=None, org=None, allowed_groups=None):
         table = DatasetTableRepository.get_dataset_table_by_uri(session, table_uri)
 
         if table:
             dataset = DatasetRepository.get_dataset_by_uri(session, table.datasetUri) if not dataset else dataset
             env = EnvironmentService.get_environment_by_uri(session, dataset.environmentUri) if not env else env
             org = OrganizationRepository.get_organization_by_uri(session, dataset.organizationUri) if not org else org
+            if allowed_groups is None:
+                allowed_groups = BaseIndexer._get_allowed_groups(
+                    session, org.organizationUri, dataset.SamlAdminGroupName, dataset.stewards
+                )
             glossary = BaseIndexer._get_target_glossary_terms(session, table_uri)
 
             tags = table.tags if table.tags else []
@@ -27,6 +31,7 @@ class DatasetTableIndexer(BaseIndexer):
                 doc={
                     'name': table.name,
                     'admins': dataset.SamlAdminGroupName,
+                    'allowedGroups': allowed_groups,
                     'owner': table.owner,
                     'label': table.label,
                     'resourceKind': 'table',
@@ -56,8 +61,25 @@ class DatasetTableIndexer(BaseIndexer):
         dataset = DatasetRepository.get_dataset_by_uri(session, dataset_uri)
         env = EnvironmentService.get_environment_by_uri(session, dataset.environmentUri)
         org = OrganizationRepository.get_organization_by_uri(session, dataset.organizationUri)
+        allowed_groups = BaseIndexer._get_allowed_groups(
+            session, org.organizationUri, dataset.SamlAdminGroupName, dataset.stewards
+        )
         for table in tables:
-            DatasetTableIndexer.upsert(session=session, table_uri=table.tableUri, dataset=dataset, env=env, org=org)
+            DatasetTableIndexer.upsert(
+                session=session,
+                table_uri=table.tableUri,
+                dataset=dataset,
+                env=env,
+                org=org,
+                allowed_groups=allowed_groups,
+            )
+        return tables
+
+    @classmethod
+    def queue_upsert_all(cls, session, dataset_uri: str):
+        tables = DatasetTableRepository.find_all_active_tables(session, dataset_uri)
+        for table in tables:
+            cls.queue_upsert(session, table.tableUri)
         return tables
 
     @classmethod
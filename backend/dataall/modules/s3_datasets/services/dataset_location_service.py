@@ -48,8 +48,8 @@ class DatasetLocationService:
 
             S3LocationClient(location, dataset).create_bucket_prefix()
 
-        DatasetLocationIndexer.upsert(session=session, folder_uri=location.locationUri)
-        DatasetIndexer.upsert(session, dataset.datasetUri)
+            DatasetLocationIndexer.queue_upsert(session, location.locationUri)
+            DatasetIndexer.queue_upsert(session, dataset.datasetUri)
         return location
 
     @staticmethod
@@ -78,8 +78,8 @@ class DatasetLocationService:
             if 'terms' in data.keys():
                 DatasetLocationService._create_glossary_links(session, location, data['terms'])
 
-            DatasetLocationIndexer.upsert(session, folder_uri=location.locationUri)
-            DatasetIndexer.upsert(session, location.datasetUri)
+            DatasetLocationIndexer.queue_upsert(session, location.locationUri)
+            DatasetIndexer.queue_upsert(session, location.datasetUri)
 
             return location
 
@@ -3,7 +3,7 @@ import json
 import logging
 from typing import List
 from dataall.core.resource_lock.db.resource_lock_repositories import ResourceLockRepository
-from dataall.base.aws.quicksight import QuicksightClient
+from dataall.core.quicksight.services.quicksight_metadata_service import QuicksightMetadataService
 from dataall.base.db import exceptions
 from dataall.base.utils.naming_convention import NamingConventionPattern
 from dataall.core.permissions.services.resource_policy_service import ResourcePolicyService
@@ -94,14 +94,14 @@ class DatasetService:
     def check_dataset_account(session, environment):
         dashboards_enabled = EnvironmentService.get_boolean_env_param(session, environment, 'dashboardsEnabled')
         if dashboards_enabled:
-            quicksight_subscription = QuicksightClient.check_quicksight_enterprise_subscription(
-                AwsAccountId=environment.AwsAccountId, region=environment.region
+            quicksight_subscription = QuicksightMetadataService.check_enterprise_subscription(
+                session, environment.AwsAccountId, environment.region
             )
             if quicksight_subscription:
-                group = QuicksightClient.create_quicksight_group(
-                    AwsAccountId=environment.AwsAccountId, region=environment.region
+                group_arn = QuicksightMetadataService.get_default_group_arn(
+                    session, environment.AwsAccountId, environment.region
                 )
-                return True if group else False
+                return True if group_arn else False
         return True
 
     @staticmethod
@@ -194,7 +194,7 @@ class DatasetService:
 
             DatasetService._create_dataset_stack(session, dataset)
 
-            DatasetIndexer.upsert(session=session, dataset_uri=dataset.datasetUri)
+            DatasetIndexer.queue_upsert(session, dataset.datasetUri)
 
         DatasetService._deploy_dataset_stack(dataset)
 
@@ -285,7 +285,7 @@ class DatasetService:
                     GlossaryRepository.set_glossary_terms_links(session, username, uri, 'Dataset', data.get('terms'))
                 DatasetBaseRepository.update_dataset_activity(session, dataset, username)
 
-            DatasetIndexer.upsert(session, dataset_uri=uri)
+            DatasetIndexer.queue_upsert(session, uri)
 
         DatasetService._deploy_dataset_stack(dataset)
 
@@ -58,8 +58,8 @@ class DatasetTableService:
                     session, get_context().username, table.tableUri, 'DatasetTable', table_data['terms']
                 )
 
-        DatasetTableIndexer.upsert(session, table_uri=table.tableUri)
-        DatasetIndexer.upsert(session=session, dataset_uri=table.datasetUri)
+            DatasetTableIndexer.queue_upsert(session, table.tableUri)
+            DatasetIndexer.queue_upsert(session, table.datasetUri)
         return table
 
     @staticmethod
@@ -115,9 +115,9 @@ class DatasetTableService:
             S3Prefix = dataset.S3BucketName
             tables = DatasetCrawler(dataset).list_glue_database_tables(S3Prefix)
             cls.sync_existing_tables(session, uri=dataset.datasetUri, glue_tables=tables)
-            DatasetTableIndexer.upsert_all(session=session, dataset_uri=dataset.datasetUri)
+            DatasetTableIndexer.queue_upsert_all(session=session, dataset_uri=dataset.datasetUri)
             DatasetTableIndexer.remove_all_deleted(session=session, dataset_uri=dataset.datasetUri)
-            DatasetIndexer.upsert(session=session, dataset_uri=dataset.datasetUri)
+            DatasetIndexer.queue_upsert(session, dataset.datasetUri)
             return DatasetRepository.paginated_dataset_tables(
                 session=session,
                 uri=uri,
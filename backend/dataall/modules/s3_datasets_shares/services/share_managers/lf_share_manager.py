@@ -5,7 +5,7 @@ from warnings import warn
 from dataall.core.environment.services.environment_service import EnvironmentService
 from dataall.modules.s3_datasets_shares.aws.glue_client import GlueClient
 from dataall.modules.s3_datasets_shares.aws.lakeformation_client import LakeFormationClient
-from dataall.base.aws.quicksight import QuicksightClient
+from dataall.core.quicksight.services.quicksight_metadata_service import QuicksightMetadataService
 from dataall.base.aws.iam import IAM
 from dataall.base.aws.sts import SessionHelper
 from dataall.base.db import exceptions
@@ -14,7 +14,6 @@ from dataall.modules.shares_base.db.share_object_state_machines import ShareItem
 from dataall.modules.shares_base.db.share_state_machines_repositories import ShareStatusRepository
 from dataall.modules.shares_base.services.shares_enums import (
     ShareItemStatus,
-    ShareObjectActions,
     ShareItemActions,
     ShareItemHealthStatus,
 )
@@ -94,13 +93,11 @@ class LFShareManager:
         )
 
         if dashboard_enabled:
-            group = QuicksightClient.create_quicksight_group(
-                AwsAccountId=self.target_environment.AwsAccountId, region=self.target_environment.region
+            group_arn = QuicksightMetadataService.get_default_group_arn(
+                self.session, self.target_environment.AwsAccountId, self.target_environment.region
             )
-            if group and group.get('Group'):
-                group_arn = group.get('Group').get('Arn')
-                if group_arn:
-                    principals.append(group_arn)
+            if group_arn:
+                principals.append(group_arn)
 
         return principals
 
@@ -600,19 +597,26 @@ class LFShareManager:
         :param share_item_status : Status of approved/ revoked share
         returns : Returns True is handling is successful
         """
-        for table in tables:
-            share_item = ShareObjectRepository.find_sharable_item(self.session, self.share.shareUri, table.tableUri)
-            if not reapply:
-                share_item_sm = ShareItemSM(share_item_status)
-                new_state = share_item_sm.run_transition(ShareObjectActions.Start.value)
-                share_item_sm.update_state_single_item(self.session, share_item, new_state)
-                new_state = share_item_sm.run_transition(ShareItemActions.Failure.value)
-                share_item_sm.update_state_single_item(self.session, share_item, new_state)
-            else:
-                ShareStatusRepository.update_share_item_health_status(
-                    self.session, share_item, ShareItemHealthStatus.Unhealthy.value, str(error), datetime.now()
-                )
+        share_items = ShareObjectRepository.find_sharable_items(
+            self.session, self.share.shareUri, [table.tableUri for table in tables]
+        )
+        item_uris = [item.shareItemUri for item in share_items.values()]
+        if not reapply:
+            # Failure moves the approved items straight to failed, like Start followed by Failure
+            ShareItemSM.update_items_state(
+                self.session,
+                self.share.shareUri,
+                ShareItemActions.Failure.value,
+                prev_states=[share_item_status],
+                item_uris=item_uris,
+            )
+        else:
+            ShareStatusRepository.update_share_items_health_status(
+                self.session, item_uris, ShareItemHealthStatus.Unhealthy.value, str(error), datetime.now()
+            )
+        self.session.commit()
 
+        for table in tables:
             if share_item_status == ShareItemStatus.Share_Approved.value:
                 self.handle_share_failure(table=table, error=error)
             if share_item_status == ShareItemStatus.Revoke_Approved.value:
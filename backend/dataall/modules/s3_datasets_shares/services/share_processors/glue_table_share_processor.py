@@ -3,7 +3,7 @@ from typing import List
 from warnings import warn
 from datetime import datetime
 from dataall.core.environment.services.environment_service import EnvironmentService
-from dataall.base.aws.quicksight import QuicksightClient
+from dataall.core.quicksight.services.quicksight_metadata_service import QuicksightMetadataService
 from dataall.modules.shares_base.services.shares_enums import (
     ShareItemHealthStatus,
     ShareItemStatus,
@@ -28,6 +28,9 @@ from dataall.modules.shares_base.services.share_processor_manager import SharesP
 
 log = logging.getLogger(__name__)
 
+# Number of processed tables whose final state is buffered before being written to the database
+ITEMS_STATE_FLUSH_SIZE = 20
+
 
 class ProcessLakeFormationShare(SharesProcessorInterface):
     def __init__(self, session, share_data, shareable_items, reapply=False):
@@ -39,6 +42,49 @@ class ProcessLakeFormationShare(SharesProcessorInterface):
     def _initialize_share_manager(self, tables):
         return LFShareManager(session=self.session, share_data=self.share_data, tables=tables)
 
+    def _find_share_items(self):
+        return ShareObjectRepository.find_sharable_items(
+            self.session, self.share_data.share.shareUri, [table.tableUri for table in self.tables]
+        )
+
+    def _update_items_state(self, action, prev_state, share_items):
+        """Runs the transition for all the processed share items at once, instead of one commit per item"""
+        ShareItemSM.update_items_state(
+            self.session,
+            self.share_data.share.shareUri,
+            action.value,
+            prev_states=[prev_state.value],
+            item_uris=[item.shareItemUri for item in share_items if item],
+        )
+        self.session.commit()
+
+    def _flush_shared_items(self, succeeded, failed):
+        """Writes the final state of the tables processed so far, so that a later failure cannot mark them as failed"""
+        if not self.reapply:
+            self._update_items_state(ShareItemActions.Success, ShareItemStatus.Share_In_Progress, succeeded)
+            self._update_items_state(ShareItemActions.Failure, ShareItemStatus.Share_In_Progress, failed)
+        ShareStatusRepository.update_share_items_health_status(
+            self.session,
+            [item.shareItemUri for item in succeeded],
+            ShareItemHealthStatus.Healthy.value,
+            None,
+            datetime.now(),
+        )
+        self.session.commit()
+        succeeded.clear()
+        failed.clear()
+
+    def _flush_revoked_items(self, succeeded, failed):
+        """Writes the final state of the tables revoked so far, so that a later failure cannot mark them as failed"""
+        self._update_items_state(ShareItemActions.Success, ShareItemStatus.Revoke_In_Progress, succeeded)
+        self._update_items_state(ShareItemActions.Failure, ShareItemStatus.Revoke_In_Progress, failed)
+        ShareStatusRepository.update_share_items_health_status(
+            self.session, [item.shareItemUri for item in succeeded], None, None
+        )
+        self.session.commit()
+        succeeded.clear()
+        failed.clear()
+
     def process_approved_shares(self) -> bool:
         """
         0) Check if source account details are properly initialized and initialize the Glue and LF clients
@@ -85,9 +131,7 @@ class ProcessLakeFormationShare(SharesProcessorInterface):
                     )
                 env = EnvironmentService.get_environment_by_uri(self.session, self.share_data.share.environmentUri)
                 if EnvironmentService.get_boolean_env_param(self.session, env, 'dashboardsEnabled'):
-                    QuicksightClient.check_quicksight_enterprise_subscription(
-                        AwsAccountId=env.AwsAccountId, region=env.region
-                    )
+                    QuicksightMetadataService.check_enterprise_subscription(self.session, env.AwsAccountId, env.region)
                 manager.initialize_clients()
                 manager.grant_pivot_role_all_database_permissions_to_source_database()
                 manager.check_if_exists_and_create_shared_database_in_target()
@@ -103,45 +147,38 @@ class ProcessLakeFormationShare(SharesProcessorInterface):
                 )
                 return False
 
-            for table in self.tables:
-                log.info(f'Sharing table {table.tableUri}/{table.GlueTableName}...')
-
-                share_item = ShareObjectRepository.find_sharable_item(
-                    self.session, self.share_data.share.shareUri, table.tableUri
+            share_items = self._find_share_items()
+            if not self.reapply:
+                self._update_items_state(
+                    ShareObjectActions.Start, ShareItemStatus.Share_Approved, list(share_items.values())
                 )
+            succeeded, failed = [], []
+            try:
+                for table in self.tables:
+                    if len(succeeded) + len(failed) >= ITEMS_STATE_FLUSH_SIZE:
+                        self._flush_shared_items(succeeded, failed)
+                    log.info(f'Sharing table {table.tableUri}/{table.GlueTableName}...')
 
-                if not share_item:
-                    log.info(
-                        f'Share Item not found for {self.share_data.share.shareUri} '
-                        f'and Dataset Table {table.GlueTableName} continuing loop...'
-                    )
-                    continue
-                if not self.reapply:
-                    shared_item_SM = ShareItemSM(ShareItemStatus.Share_Approved.value)
-                    new_state = shared_item_SM.run_transition(ShareObjectActions.Start.value)
-                    shared_item_SM.update_state_single_item(self.session, share_item, new_state)
-
-                try:
-                    manager.check_table_exists_in_source_database(share_item, table)
+                    share_item = share_items.get(table.tableUri)
 
-                    if manager.cross_account:
-                        log.info(f'Processing cross-account permissions for table {table.GlueTableName}...')
-                        manager.revoke_iam_allowed_principals_from_table(table)
-                        manager.grant_target_account_permissions_to_source_table(table)
-                        (
-                            retry_share_table,
-                            failed_invitations,
-                        ) = RamClient.accept_ram_invitation(
-                            source_account_id=manager.source_account_id,
-                            source_region=manager.source_account_region,
-                            source_database=manager.source_database_name,
-                            source_table_name=table.GlueTableName,
-                            target_account_id=self.share_data.target_environment.AwsAccountId,
-                            target_region=self.share_data.target_environment.region,
+                    if not share_item:
+                        log.info(
+                            f'Share Item not found for {self.share_data.share.shareUri} '
+                            f'and Dataset Table {table.GlueTableName} continuing loop...'
                         )
-                        if retry_share_table:
+                        continue
+
+                    try:
+                        manager.check_table_exists_in_source_database(share_item, table)
+
+                        if manager.cross_account:
+                            log.info(f'Processing cross-account permissions for table {table.GlueTableName}...')
+                            manager.revoke_iam_allowed_principals_from_table(table)
                             manager.grant_target_account_permissions_to_source_table(table)
-                            RamClient.accept_ram_invitation(
+                            (
+                                retry_share_table,
+                                failed_invitations,
+                            ) = RamClient.accept_ram_invitation(
                                 source_account_id=manager.source_account_id,
                                 source_region=manager.source_account_region,
                                 source_database=manager.source_database_name,
@@ -149,35 +186,42 @@ class ProcessLakeFormationShare(SharesProcessorInterface):
                                 target_account_id=self.share_data.target_environment.AwsAccountId,
                                 target_region=self.share_data.target_environment.region,
                             )
-                    manager.check_if_exists_and_create_resource_link_table_in_shared_database(table)
-                    manager.grant_principals_permissions_to_table_in_target(table)
-                    manager.grant_principals_permissions_to_resource_link_table(table)
-
-                    log.info('Attaching TABLE READ permissions...')
-                    S3ShareService.attach_dataset_table_read_permission(
-                        self.session, self.share_data.share, table.tableUri
-                    )
+                            if retry_share_table:
+                                manager.grant_target_account_permissions_to_source_table(table)
+                                RamClient.accept_ram_invitation(
+                                    source_account_id=manager.source_account_id,
+                                    source_region=manager.source_account_region,
+                                    source_database=manager.source_database_name,
+                                    source_table_name=table.GlueTableName,
+                                    target_account_id=self.share_data.target_environment.AwsAccountId,
+                                    target_region=self.share_data.target_environment.region,
+                                )
+                        manager.check_if_exists_and_create_resource_link_table_in_shared_database(table)
+                        manager.grant_principals_permissions_to_table_in_target(table)
+                        manager.grant_principals_permissions_to_resource_link_table(table)
 
-                    if not self.reapply:
-                        new_state = shared_item_SM.run_transition(ShareItemActions.Success.value)
-                        shared_item_SM.update_state_single_item(self.session, share_item, new_state)
-                    ShareStatusRepository.update_share_item_health_status(
-                        self.session, share_item, ShareItemHealthStatus.Healthy.value, None, datetime.now()
-                    )
-                except Exception as e:
-                    if not self.reapply:
-                        new_state = shared_item_SM.run_transition(ShareItemActions.Failure.value)
-                        shared_item_SM.update_state_single_item(self.session, share_item, new_state)
-                    else:
-                        ShareStatusRepository.update_share_item_health_status(
-                            self.session,
-                            share_item,
-                            ShareItemHealthStatus.Unhealthy.value,
-                            str(e),
-                            datetime.now(),
+                        log.info('Attaching TABLE READ permissions...')
+                        S3ShareService.attach_dataset_table_read_permission(
+                            self.session, self.share_data.share, table.tableUri
                         )
-                    success = False
-                    manager.handle_share_failure(table=table, error=e)
+
+                        succeeded.append(share_item)
+                    except Exception as e:
+                        if not self.reapply:
+                            failed.append(share_item)
+                        else:
+                            ShareStatusRepository.update_share_item_health_status(
+                                self.session,
+                                share_item,
+                                ShareItemHealthStatus.Unhealthy.value,
+                                str(e),
+                                datetime.now(),
+                            )
+                        success = False
+                        manager.handle_share_failure(table=table, error=e)
+            finally:
+                self._flush_shared_items(succeeded, failed)
+
         return success
 
     def process_revoked_shares(self) -> bool:
@@ -226,73 +270,71 @@ class ProcessLakeFormationShare(SharesProcessorInterface):
                 )
                 return False
 
-            for table in self.tables:
-                log.info(f'Revoking access to table {table.tableUri}/{table.GlueTableName}...')
-                share_item = ShareObjectRepository.find_sharable_item(
-                    self.session, self.share_data.share.shareUri, table.tableUri
-                )
-
-                revoked_item_SM = ShareItemSM(ShareItemStatus.Revoke_Approved.value)
-                new_state = revoked_item_SM.run_transition(ShareObjectActions.Start.value)
-                revoked_item_SM.update_state_single_item(self.session, share_item, new_state)
-
-                try:
-                    log.info(f'Revoking access to table: {table.GlueTableName} ')
-                    manager.check_table_exists_in_source_database(share_item, table)
-
-                    log.info('Check resource link table exists')
-                    resource_link_table_exists = manager.check_resource_link_table_exists_in_target_database(table)
-                    other_table_shares_in_env = (
-                        True
-                        if S3ShareObjectRepository.check_other_approved_share_item_table_exists(
-                            self.session,
-                            self.share_data.target_environment.environmentUri,
-                            share_item.itemUri,
-                            share_item.shareItemUri,
+            share_items = self._find_share_items()
+            self._update_items_state(
+                ShareObjectActions.Start, ShareItemStatus.Revoke_Approved, list(share_items.values())
+            )
+            succeeded, failed = [], []
+            try:
+                for table in self.tables:
+                    if len(succeeded) + len(failed) >= ITEMS_STATE_FLUSH_SIZE:
+                        self._flush_revoked_items(succeeded, failed)
+                    log.info(f'Revoking access to table {table.tableUri}/{table.GlueTableName}...')
+                    share_item = share_items.get(table.tableUri)
+
+                    try:
+                        log.info(f'Revoking access to table: {table.GlueTableName} ')
+                        manager.check_table_exists_in_source_database(share_item, table)
+
+                        log.info('Check resource link table exists')
+                        resource_link_table_exists = manager.check_resource_link_table_exists_in_target_database(table)
+                        other_table_shares_in_env = (
+                            True
+                            if S3ShareObjectRepository.check_other_approved_share_item_table_exists(
+                                self.session,
+                                self.share_data.target_environment.environmentUri,
+                                share_item.itemUri,
+                                share_item.shareItemUri,
+                            )
+                            else False
                         )
-                        else False
-                    )
 
-                    if resource_link_table_exists:
-                        log.info('Revoking principal permissions from resource link table')
-                        manager.revoke_principals_permissions_to_resource_link_table(table)
-                        log.info('Revoking principal permissions from table in target')
-                        manager.revoke_principals_permissions_to_table_in_target(table, other_table_shares_in_env)
+                        if resource_link_table_exists:
+                            log.info('Revoking principal permissions from resource link table')
+                            manager.revoke_principals_permissions_to_resource_link_table(table)
+                            log.info('Revoking principal permissions from table in target')
+                            manager.revoke_principals_permissions_to_table_in_target(table, other_table_shares_in_env)
+
+                            if (manager.is_new_share and not other_table_shares_in_env) or not manager.is_new_share:
+                                warn(
+                                    'share_manager.is_new_share will be deprecated in v2.6.0',
+                                    DeprecationWarning,
+                                    stacklevel=2,
+                                )
+                                manager.grant_pivot_role_drop_permissions_to_resource_link_table(table)
+                                manager.delete_resource_link_table_in_shared_database(table)
 
-                        if (manager.is_new_share and not other_table_shares_in_env) or not manager.is_new_share:
-                            warn(
-                                'share_manager.is_new_share will be deprecated in v2.6.0',
-                                DeprecationWarning,
-                                stacklevel=2,
-                            )
-                            manager.grant_pivot_role_drop_permissions_to_resource_link_table(table)
-                            manager.delete_resource_link_table_in_shared_database(table)
-
-                    if not other_table_shares_in_env:
-                        manager.revoke_external_account_access_on_source_account(table)
-
-                    if (
-                        self.share_data.share.groupUri != self.share_data.dataset.SamlAdminGroupName
-                        and self.share_data.share.groupUri != self.share_data.dataset.stewards
-                    ):
-                        log.info('Deleting TABLE READ permissions...')
-                        S3ShareService.delete_dataset_table_read_permission(
-                            self.session, self.share_data.share, table.tableUri
-                        )
+                        if not other_table_shares_in_env:
+                            manager.revoke_external_account_access_on_source_account(table)
 
-                    new_state = revoked_item_SM.run_transition(ShareItemActions.Success.value)
-                    revoked_item_SM.update_state_single_item(self.session, share_item, new_state)
+                        if (
+                            self.share_data.share.groupUri != self.share_data.dataset.SamlAdminGroupName
+                            and self.share_data.share.groupUri != self.share_data.dataset.stewards
+                        ):
+                            log.info('Deleting TABLE READ permissions...')
+                            S3ShareService.delete_dataset_table_read_permission(
+                                self.session, self.share_data.share, table.tableUri
+                            )
 
-                    ShareStatusRepository.update_share_item_health_status(
-                        self.session, share_item, None, None, share_item.lastVerificationTime
-                    )
+                        succeeded.append(share_item)
 
-                except Exception as e:
-                    new_state = revoked_item_SM.run_transition(ShareItemActions.Failure.value)
-                    revoked_item_SM.update_state_single_item(self.session, share_item, new_state)
-                    success = False
+                    except Exception as e:
+                        failed.append(share_item)
+                        success = False
 
-                    manager.handle_revoke_failure(table=table, error=e)
+                        manager.handle_revoke_failure(table=table, error=e)
+            finally:
+                self._flush_revoked_items(succeeded, failed)
 
             try:
                 if self.tables:
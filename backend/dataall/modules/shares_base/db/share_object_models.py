@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta
 from uuid import uuid4
 
-from sqlalchemy import Boolean, Column, String, DateTime
+from sqlalchemy import Boolean, Column, String, DateTime, Index
 from sqlalchemy.orm import query_expression
 
 from dataall.base.db import Base, utils
@@ -39,6 +39,12 @@ class ShareObject(Base):
     userRoleForShareObject = query_expression()
     existingSharedItems = query_expression()
 
+    __table_args__ = (
+        Index('ix_share_object_datasetUri_status', 'datasetUri', 'status'),
+        Index('ix_share_object_environmentUri_groupUri', 'environmentUri', 'groupUri'),
+        Index('ix_share_object_groupUri', 'groupUri'),
+    )
+
 
 class ShareObjectItem(Base):
     __tablename__ = 'share_object_item'
@@ -57,3 +63,9 @@ class ShareObjectItem(Base):
     healthStatus = Column(String, nullable=True)
     healthMessage = Column(String, nullable=True)
     lastVerificationTime = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index('ix_share_object_item_shareUri_status', 'shareUri', 'status'),
+        Index('ix_share_object_item_shareUri_healthStatus', 'shareUri', 'healthStatus'),
+        Index('ix_share_object_item_itemUri', 'itemUri'),
+    )
@@ -1,13 +1,12 @@
 import logging
-from sqlalchemy import and_, or_, func, case
-from sqlalchemy.orm import Query
+from sqlalchemy import and_, or_, case
 from typing import List
 
-from dataall.base.db import exceptions, paginate
+from dataall.base.db import exceptions, paginate, term_filter
 from dataall.base.db.paginator import Page
 from dataall.core.organizations.db.organization_models import Organization
 from dataall.core.environment.db.environment_models import Environment, EnvironmentGroup
-from dataall.modules.datasets_base.db.dataset_models import DatasetBase
+from dataall.modules.datasets_base.db.dataset_models import DatasetBase, ShareableItem
 from dataall.modules.datasets_base.db.dataset_repositories import DatasetBaseRepository
 from dataall.modules.notifications.db.notification_models import Notification
 from dataall.modules.shares_base.db.share_object_models import ShareObjectItem, ShareObject
@@ -54,6 +53,17 @@ class ShareObjectRepository:
             .first()
         )
 
+    @staticmethod
+    def find_sharable_items(session, share_uri, item_uris) -> dict:
+        """Returns the share items of the share for the item uris keyed by itemUri"""
+        items = session.query(ShareObjectItem).filter(
+            and_(
+                ShareObjectItem.itemUri.in_(item_uris),
+                ShareObjectItem.shareUri == share_uri,
+            )
+        )
+        return {item.itemUri: item for item in items}
+
     @staticmethod
     def get_share_by_uri(session, uri):
         share = session.query(ShareObject).get(uri)
@@ -316,20 +326,25 @@ class ShareObjectRepository:
 
         if data.get('term'):
             term = data.get('term')
-            q = q.filter(ShareObjectItem.itemName.ilike('%' + term + '%'))
+            q = q.filter(term_filter(term, ShareObjectItem.itemName))
 
         return paginate(query=q, page=data.get('page', 1), page_size=data.get('pageSize', 10)).to_dict()
 
     @staticmethod
-    def list_shareable_items_of_type(session, share, type, share_type_model, share_type_uri, status=None):
-        logger.info(f'Getting all shareable items {status=}, for {share_type_model=}')
+    def paginated_list_shareable_items(session, share, item_types: List[str], status=None, data: dict = None):
+        """
+        Lists the items of the dataset of the share from the shareable_item projection,
+        with the state of the items already added to the share
+        """
+        if len(item_types) == 0:
+            return Page([], 1, 1, 0)  # empty page. All modules are turned off
         query = (
             session.query(
-                share_type_uri.label('itemUri'),
-                share_type_model.datasetUri.label('datasetUri'),
-                func.coalesce(type.value).label('itemType'),
-                share_type_model.description.label('description'),
-                share_type_model.name.label('itemName'),
+                ShareableItem.itemUri.label('itemUri'),
+                ShareableItem.datasetUri.label('datasetUri'),
+                ShareableItem.itemType.label('itemType'),
+                ShareableItem.description.label('description'),
+                ShareableItem.itemName.label('itemName'),
                 ShareObjectItem.shareItemUri.label('shareItemUri'),
                 ShareObjectItem.status.label('status'),
                 ShareObjectItem.healthStatus.label('healthStatus'),
@@ -342,45 +357,30 @@ class ShareObjectRepository:
             )
             .outerjoin(
                 ShareObjectItem,
-                (ShareObjectItem.itemUri == share_type_uri) & (ShareObjectItem.shareUri == share.shareUri),
+                and_(ShareObjectItem.itemUri == ShareableItem.itemUri, ShareObjectItem.shareUri == share.shareUri),
             )
-            .filter(and_(share_type_model.datasetUri == share.datasetUri))
+            .filter(and_(ShareableItem.datasetUri == share.datasetUri, ShareableItem.itemType.in_(item_types)))
         )
         if status:
             query = query.filter(ShareObjectItem.status.in_(status))
-        return query
-
-    @staticmethod
-    def paginated_list_shareable_items(session, subqueries: List[Query], data: dict = None):
-        if len(subqueries) == 0:
-            return Page([], 1, 1, 0)  # empty page. All modules are turned off
-        elif len(subqueries) == 1:
-            shareable_objects = subqueries[0].subquery('shareable_objects')
-        else:
-            shareable_objects = subqueries[0].union(*subqueries[1:]).subquery('shareable_objects')
-        query = session.query(shareable_objects)
-        if data:
-            if data.get('term'):
-                term = data.get('term')
-                query = query.filter(
-                    or_(
-                        shareable_objects.c.itemName.ilike(term + '%'),
-                        shareable_objects.c.description.ilike(term + '%'),
-                    )
-                )
-            if 'isShared' in data:
-                is_shared = data.get('isShared')
-                query = query.filter(shareable_objects.c.isShared == is_shared)
-
-            if 'isHealthy' in data:
-                query = (
-                    query.filter(shareable_objects.c.healthStatus == ShareItemHealthStatus.Healthy.value)
-                    if data.get('isHealthy')
-                    else query.filter(shareable_objects.c.healthStatus != ShareItemHealthStatus.Healthy.value)
-                )
+        data = data or {}
+        if data.get('term'):
+            query = query.filter(term_filter(data.get('term'), ShareableItem.itemName, ShareableItem.description))
+        if 'isShared' in data:
+            query = query.filter(
+                ShareObjectItem.shareItemUri.isnot(None)
+                if data.get('isShared')
+                else ShareObjectItem.shareItemUri.is_(None)
+            )
+        if 'isHealthy' in data:
+            query = (
+                query.filter(ShareObjectItem.healthStatus == ShareItemHealthStatus.Healthy.value)
+                if data.get('isHealthy')
+                else query.filter(ShareObjectItem.healthStatus != ShareItemHealthStatus.Healthy.value)
+            )
 
         return paginate(
-            query.order_by(shareable_objects.c.itemName).distinct(), data.get('page', 1), data.get('pageSize', 10)
+            query.order_by(ShareableItem.itemName, ShareableItem.itemUri), data.get('page', 1), data.get('pageSize', 10)
         ).to_dict()
 
     @staticmethod
@@ -403,11 +403,35 @@ class ShareObjectRepository:
             .join(
                 Notification,
                 and_(
-                    ShareObject.shareUri == func.split_part(Notification.target_uri, '|', 1),
-                    ShareObject.datasetUri == func.split_part(Notification.target_uri, '|', 2),
+                    ShareObject.shareUri == Notification.share_uri,
+                    ShareObject.datasetUri == Notification.dataset_uri,
                 ),
             )
             .filter(and_(Notification.type == 'SHARE_OBJECT_SUBMITTED', ShareObject.status == 'Submitted'))
             .all()
         )
         return pending_shares
+
+    @staticmethod
+    def fetch_submitted_shares_with_datasets(session):
+        """
+        Same shares as fetch_submitted_shares_with_notifications() returned as (share, dataset) pairs of one query
+        """
+        submitted_notification = (
+            session.query(Notification.notificationUri)
+            .filter(
+                and_(
+                    Notification.type == 'SHARE_OBJECT_SUBMITTED',
+                    Notification.share_uri == ShareObject.shareUri,
+                    Notification.dataset_uri == ShareObject.datasetUri,
+                )
+            )
+            .exists()
+        )
+        return (
+            session.query(ShareObject, DatasetBase)
+            .join(DatasetBase, DatasetBase.datasetUri == ShareObject.datasetUri)
+            .filter(and_(ShareObject.status == 'Submitted', submitted_notification))
+            .order_by(ShareObject.created)
+            .all()
+        )
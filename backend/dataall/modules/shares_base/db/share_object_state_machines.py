@@ -42,6 +42,15 @@ class Transition:
         else:
             return prev_state
 
+    def get_transition_targets(self, prev_states=None):
+        """
+        Validates the transition of each of the states in memory and returns the {prev_state: target_state} mapping
+        of the states that change. All the source states of the transition are used if no states are given
+        """
+        prev_states = self._all_source_states if prev_states is None else set(prev_states)
+        targets = {prev_state: self.get_transition_target(prev_state) for prev_state in prev_states}
+        return {prev_state: target for prev_state, target in targets.items() if target != prev_state}
+
 
 class ShareObjectSM:
     def __init__(self, state):
@@ -247,21 +256,38 @@ class ShareItemSM:
 
     def update_state(self, session, share_uri, new_state):
         if share_uri and (new_state != self._state):
-            if new_state == ShareItemStatus.Deleted.value:
-                logger.info(f'Deleting share items in DB in {self._state} state')
-                ShareStatusRepository.delete_share_item_status_batch(
-                    session=session, share_uri=share_uri, status=self._state
-                )
-            else:
-                logger.info(f'Updating share items in DB from {self._state} to state {new_state}')
-                ShareStatusRepository.update_share_item_status_batch(
-                    session=session, share_uri=share_uri, old_status=self._state, new_status=new_state
-                )
+            logger.info(f'Updating share items in DB from {self._state} to state {new_state}')
+            ShareItemSM._apply_targets(session, share_uri, {self._state: new_state})
             self._state = new_state
         else:
             logger.info(f'Share Items in DB already in target state {new_state} or no update is required')
             return True
 
+    @classmethod
+    def update_items_state(cls, session, share_uri, transition, prev_states=None, item_uris=None, item_type=None):
+        """
+        Runs the transition for a set of share items with one statement instead of updating the items one by one.
+        The transition is validated in memory for the prev_states (all the source states of the transition by default),
+        the items of the share in other states are left unchanged.
+        Returns the {shareItemUri: status} of the updated items
+        """
+        targets = cls(None).transitionTable[transition].get_transition_targets(prev_states)
+        logger.info(f'Running transition {transition} for the share items of {share_uri}: {targets}')
+        return cls._apply_targets(session, share_uri, targets, item_uris, item_type)
+
+    @staticmethod
+    def _apply_targets(session, share_uri, targets, item_uris=None, item_type=None):
+        deleted_states = [state for state, target in targets.items() if target == ShareItemStatus.Deleted.value]
+        if deleted_states:
+            ShareStatusRepository.delete_share_items_in_states(session, share_uri, deleted_states, item_uris, item_type)
+        return ShareStatusRepository.update_share_items_status(
+            session,
+            share_uri,
+            {state: target for state, target in targets.items() if target != ShareItemStatus.Deleted.value},
+            item_uris,
+            item_type,
+        )
+
     def update_state_single_item(self, session, share_item, new_state):
         logger.info(f'Updating share item in DB {share_item.shareItemUri} status to {new_state}')
         ShareStatusRepository.update_share_item_status(session=session, uri=share_item.shareItemUri, status=new_state)
@@ -1,6 +1,9 @@
 import logging
 from datetime import datetime
-from sqlalchemy import and_
+from typing import Dict, List
+
+from sqlalchemy import and_, case
+from sqlalchemy.orm.attributes import set_committed_value
 
 from dataall.modules.shares_base.db.share_object_models import ShareObjectItem, ShareObject
 from dataall.modules.shares_base.db.share_object_repositories import ShareObjectRepository
@@ -78,36 +81,80 @@ class ShareStatusRepository:
         return share_item
 
     @staticmethod
-    def update_share_item_status_batch(
+    def _share_items_conditions(share_uri, states, item_uris=None, item_type=None):
+        conditions = [ShareObjectItem.shareUri == share_uri, ShareObjectItem.status.in_(states)]
+        if item_uris is not None:
+            conditions.append(ShareObjectItem.shareItemUri.in_(item_uris))
+        if item_type:
+            conditions.append(ShareObjectItem.itemType == getattr(item_type, 'value', item_type))
+        return conditions
+
+    @staticmethod
+    def update_share_items_status(
         session,
         share_uri: str,
-        old_status: str,
-        new_status: str,
-        share_item_type: ShareableType = None,
-    ) -> bool:
-        query = session.query(ShareObjectItem).filter(
-            and_(ShareObjectItem.shareUri == share_uri, ShareObjectItem.status == old_status)
+        new_status_by_status: Dict[str, str],
+        item_uris: List[str] = None,
+        item_type=None,
+    ) -> Dict[str, str]:
+        """Moves the share items from each status to its new status in one UPDATE and returns the updated items"""
+        if not new_status_by_status or item_uris == []:
+            return {}
+        table = ShareObjectItem.__table__
+        statement = (
+            table.update()
+            .where(
+                and_(
+                    *ShareStatusRepository._share_items_conditions(
+                        share_uri, list(new_status_by_status), item_uris, item_type
+                    )
+                )
+            )
+            .values(status=case(new_status_by_status, value=table.c.status, else_=table.c.status))
+            .returning(table.c.shareItemUri, table.c.status)
         )
-        if share_item_type:
-            query = query.filter(ShareObjectItem.itemType == share_item_type.value)
+        updated = dict(session.execute(statement).fetchall())
 
-        query.update(
-            {
-                ShareObjectItem.status: new_status,
-            }
-        )
-        return True
+        # keeps the items already loaded in the session in sync with the database
+        for item in list(session.identity_map.values()):
+            if isinstance(item, ShareObjectItem) and item.shareItemUri in updated:
+                set_committed_value(item, 'status', updated[item.shareItemUri])
+        return updated
 
     @staticmethod
-    def delete_share_item_status_batch(
+    def delete_share_items_in_states(
         session,
         share_uri: str,
-        status: str,
+        states: List[str],
+        item_uris: List[str] = None,
+        item_type=None,
+    ):
+        if item_uris == []:
+            return
+        (
+            session.query(ShareObjectItem)
+            .filter(and_(*ShareStatusRepository._share_items_conditions(share_uri, states, item_uris, item_type)))
+            .delete(synchronize_session='fetch')
+        )
+
+    @staticmethod
+    def update_share_items_health_status(
+        session,
+        item_uris: List[str],
+        healthStatus: str = None,
+        healthMessage: str = None,
+        timestamp: datetime = None,
     ):
+        """Sets the health of the share items in one UPDATE, the last verification time is kept if no timestamp is given"""
+        if not item_uris:
+            return
+        values = {ShareObjectItem.healthStatus: healthStatus, ShareObjectItem.healthMessage: healthMessage}
+        if timestamp:
+            values[ShareObjectItem.lastVerificationTime] = timestamp
         (
             session.query(ShareObjectItem)
-            .filter(and_(ShareObjectItem.shareUri == share_uri, ShareObjectItem.status == status))
-            .delete()
+            .filter(ShareObjectItem.shareItemUri.in_(item_uris))
+            .update(values, synchronize_session='fetch')
         )
 
     @staticmethod
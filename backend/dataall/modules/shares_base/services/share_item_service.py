@@ -183,20 +183,12 @@ class ShareItemService:
             status = ShareStatusRepository.get_share_item_revokable_states()
 
         with get_context().db_engine.scoped_session() as session:
-            subqueries = []
-            for type, processor in ShareProcessorManager.SHARING_PROCESSORS.items():
-                subqueries.append(
-                    ShareObjectRepository.list_shareable_items_of_type(
-                        session=session,
-                        share=share,
-                        type=type,
-                        share_type_model=processor.shareable_type,
-                        share_type_uri=processor.shareable_uri,
-                        status=status,
-                    )
-                )
             return ShareObjectRepository.paginated_list_shareable_items(
-                session=session, subqueries=subqueries, data=filter
+                session=session,
+                share=share,
+                item_types=[type.value for type in ShareProcessorManager.SHARING_PROCESSORS],
+                status=status,
+                data=filter,
             )
 
     @staticmethod
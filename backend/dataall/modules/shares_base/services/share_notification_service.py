@@ -1,6 +1,7 @@
 import logging
 import enum
 import os
+from collections import defaultdict
 
 from dataall.base.config import config
 from dataall.core.tasks.db.task_models import Task
@@ -57,34 +58,85 @@ class ShareNotificationService:
         self._create_notification_task(subject=subject, msg=email_notification_msg)
         return notifications
 
-    def notify_persistent_email_reminder(self, email_id: str):
-        share_link_text = ''
-        if os.environ.get('frontend_domain_url'):
-            share_link_text = (
-                f'<br><br>Please visit data.all <a href="{os.environ.get("frontend_domain_url")}'
-                f'/console/shares/{self.share.shareUri}">share link</a> '
-                f'to review and take appropriate action or view more details.'
+    @staticmethod
+    def notify_persistent_email_reminders(session, pending_shares):
+        """
+        Reminds the approvers of the pending (share, dataset) pairs.
+        Every dataset.SamlAdminGroupName and dataset.stewards group gets one email listing all its pending shares
+        """
+        reminders = defaultdict(list)
+        for share, dataset in pending_shares:
+            ShareNotificationService(session=session, dataset=dataset, share=share).register_notifications(
+                notification_type=DataSharingNotificationType.SHARE_OBJECT_SUBMITTED.value,
+                msg=ShareNotificationService._persistent_reminder_message(dataset, share),
             )
+            for group in dict.fromkeys([dataset.SamlAdminGroupName, dataset.stewards]):
+                reminders[group].append((share, dataset))
 
-        msg_intro = f"""Dear User,
-        This is a reminder that a share request for the dataset "{self.dataset.label}" submitted by {email_id} 
-        on behalf of principal "{self.share.principalId}" is still pending and has not been addressed.
-        """
+        if not ShareNotificationService._is_email_notification_active():
+            session.commit()
+            return
 
-        msg_end = """Your prompt attention to this matter is greatly appreciated.
-        Best regards,
-        The Data.all Team
-        """
+        emails = [
+            (group, *ShareNotificationService._persistent_reminder_email(group_shares))
+            for group, group_shares in reminders.items()
+        ]
+        session.add_all(
+            [
+                Task(
+                    action='notification.service',
+                    targetUri=group,
+                    payload={
+                        'notificationType': 'email',
+                        'subject': subject,
+                        'message': msg,
+                        'recipientGroupsList': [group],
+                        'recipientEmailList': [],
+                    },
+                )
+                for group, subject, msg in emails
+            ]
+        )
+        session.commit()
 
-        subject = f'URGENT REMINDER: Data.all | Action Required on Pending Share Request for {self.dataset.label}'
-        email_notification_msg = msg_intro + share_link_text + msg_end
+        for group, subject, msg in emails:
+            log.info(f'Sending email reminder for {len(reminders[group])} pending shares to {group}')
+            SESEmailNotificationService.send_email_task(subject, msg, [group], [])
 
-        notifications = self.register_notifications(
-            notification_type=DataSharingNotificationType.SHARE_OBJECT_SUBMITTED.value, msg=msg_intro
+    @staticmethod
+    def _persistent_reminder_message(dataset: DatasetBase, share: ShareObject):
+        return (
+            f'This is a reminder that a share request for the dataset "{dataset.label}" submitted by {share.owner} '
+            f'on behalf of principal "{share.principalId}" is still pending and has not been addressed.'
         )
 
-        self._create_persistent_reminder_notification_task(subject=subject, msg=email_notification_msg)
-        return notifications
+    @staticmethod
+    def _persistent_reminder_email(group_shares):
+        if len(group_shares) == 1:
+            subject = (
+                f'URGENT REMINDER: Data.all | Action Required on Pending Share Request for {group_shares[0][1].label}'
+            )
+        else:
+            subject = f'URGENT REMINDER: Data.all | Action Required on {len(group_shares)} Pending Share Requests'
+
+        frontend_domain_url = os.environ.get('frontend_domain_url')
+        items = []
+        for share, dataset in group_shares:
+            item = f'Share request for the dataset "{dataset.label}" submitted by {share.owner} on behalf of principal "{share.principalId}"'
+            if frontend_domain_url:
+                item += f' - <a href="{frontend_domain_url}/console/shares/{share.shareUri}">share link</a>'
+            items.append(f'<li>{item}</li>')
+
+        msg = (
+            'Dear User,<br><br>'
+            'This is a reminder that the following share requests are still pending and have not been addressed:'
+            f'<ul>{"".join(items)}</ul>'
+            'Please visit data.all to review and take appropriate action or view more details.<br><br>'
+            'Your prompt attention to this matter is greatly appreciated.<br>'
+            'Best regards,<br>'
+            'The Data.all Team'
+        )
+        return subject, msg
 
     def notify_share_object_approval(self, email_id: str):
         share_link_text = ''
@@ -149,15 +201,17 @@ class ShareNotificationService:
         for recipient in self.notification_target_users:
             log.info(f'Creating notification for {recipient}, msg {msg}')
             notifications.append(
-                NotificationRepository.create_notification(
+                NotificationRepository.add_notification(
                     session=self.session,
                     recipient=recipient,
                     notification_type=notification_type,
                     target_uri=f'{self.share.shareUri}|{self.dataset.datasetUri}',
                     message=msg,
+                    target_type='ShareObject',
+                    share_uri=self.share.shareUri,
+                    dataset_uri=self.dataset.datasetUri,
                 )
             )
-        self.session.add_all(notifications)
         return notifications
 
     def _create_notification_task(self, subject, msg):
@@ -205,41 +259,12 @@ class ShareNotificationService:
         else:
             log.info('Notifications are not active')
 
-    def _create_persistent_reminder_notification_task(self, subject, msg):
-        """
-        At the moment just for notification_config_type = email, but designed for additional notification types
-        Emails sent to:
-            - dataset.SamlAdminGroupName
-            - dataset.stewards
-        """
+    @staticmethod
+    def _is_email_notification_active():
         share_notification_config = config.get_property(
             'modules.datasets_base.features.share_notifications', default=None
         )
-        if share_notification_config:
-            for share_notification_config_type in share_notification_config.keys():
-                n_config = share_notification_config[share_notification_config_type]
-                if n_config.get('active', False) == True:
-                    notification_recipient_groups_list = [self.dataset.SamlAdminGroupName, self.dataset.stewards]
-
-                    if share_notification_config_type == 'email':
-                        notification_task: Task = Task(
-                            action='notification.service',
-                            targetUri=self.share.shareUri,
-                            payload={
-                                'notificationType': share_notification_config_type,
-                                'subject': subject,
-                                'message': msg,
-                                'recipientGroupsList': notification_recipient_groups_list,
-                                'recipientEmailList': [],
-                            },
-                        )
-                        self.session.add(notification_task)
-                        self.session.commit()
-
-                        SESEmailNotificationService.send_email_task(
-                            subject, msg, notification_recipient_groups_list, []
-                        )
-                else:
-                    log.info(f'Notification type : {share_notification_config_type} is not active')
-        else:
-            log.info('Notifications are not active')
+        if not share_notification_config or not share_notification_config.get('email', {}).get('active', False):
+            log.info('Email notifications are not active')
+            return False
+        return True
@@ -411,10 +411,7 @@ class ShareObjectService:
         share_sm = ShareObjectSM(share.status)
         new_share_state = share_sm.run_transition(action.value)
 
-        for item_state in share_items_states:
-            item_sm = ShareItemSM(item_state)
-            new_state = item_sm.run_transition(action.value)
-            item_sm.update_state(session, share.shareUri, new_state)
+        ShareItemSM.update_items_state(session, share.shareUri, action.value, prev_states=share_items_states)
 
         share_sm.update_state(session, share, new_share_state)
         return new_share_state
@@ -2,6 +2,7 @@ import logging
 from typing import Any, Dict
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
+from dataall.modules.datasets_base.db.shareable_item_repositories import ShareableItemRepository
 from dataall.modules.shares_base.services.shares_enums import ShareableType
 
 log = logging.getLogger(__name__)
@@ -38,6 +39,7 @@ class ShareProcessorManager:
     @classmethod
     def register_processor(cls, processor: ShareProcessorDefinition) -> None:
         cls.SHARING_PROCESSORS[processor.type] = processor
+        ShareableItemRepository.track(processor.type.value, processor.shareable_type, processor.shareable_uri)
 
     @classmethod
     def get_processor_by_item_type(cls, item_type: str) -> ShareProcessorDefinition:
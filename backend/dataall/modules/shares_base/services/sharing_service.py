@@ -113,19 +113,15 @@ class SharingService:
                                 share_successful = False
                         except Exception as e:
                             log.exception(f'Error occurred during sharing of {type.value}')
-                            ShareStatusRepository.update_share_item_status_batch(
+                            ShareItemSM.update_items_state(
                                 session,
                                 share_uri,
-                                old_status=ShareItemStatus.Share_Approved.value,
-                                new_status=ShareItemStatus.Share_Failed.value,
-                                share_item_type=processor.type,
-                            )
-                            ShareStatusRepository.update_share_item_status_batch(
-                                session,
-                                share_uri,
-                                old_status=ShareItemStatus.Share_In_Progress.value,
-                                new_status=ShareItemStatus.Share_Failed.value,
-                                share_item_type=processor.type,
+                                ShareItemActions.Failure.value,
+                                prev_states=[
+                                    ShareItemStatus.Share_Approved.value,
+                                    ShareItemStatus.Share_In_Progress.value,
+                                ],
+                                item_type=processor.type,
                             )
                             share_successful = False
                 return share_successful
@@ -211,19 +207,15 @@ class SharingService:
                                 revoke_successful = False
                         except Exception as e:
                             log.error(f'Error occurred during share revoking of {type.value}: {e}')
-                            ShareStatusRepository.update_share_item_status_batch(
-                                session,
-                                share_uri,
-                                old_status=ShareItemStatus.Revoke_Approved.value,
-                                new_status=ShareItemStatus.Revoke_Failed.value,
-                                share_item_type=processor.type.value,
-                            )
-                            ShareStatusRepository.update_share_item_status_batch(
+                            ShareItemSM.update_items_state(
                                 session,
                                 share_uri,
-                                old_status=ShareItemStatus.Revoke_In_Progress.value,
-                                new_status=ShareItemStatus.Revoke_Failed.value,
-                                share_item_type=processor.type.value,
+                                ShareItemActions.Failure.value,
+                                prev_states=[
+                                    ShareItemStatus.Revoke_Approved.value,
+                                    ShareItemStatus.Revoke_In_Progress.value,
+                                ],
+                                item_type=processor.type,
                             )
                             revoke_successful = False
 
@@ -2,11 +2,9 @@ import logging
 import os
 import sys
 from dataall.base.loader import load_modules, ImportMode
-from dataall.modules.shares_base.db.share_object_models import ShareObject
 from dataall.base.db import get_engine
 from dataall.modules.shares_base.db.share_object_repositories import ShareObjectRepository
 from dataall.modules.shares_base.services.share_notification_service import ShareNotificationService
-from dataall.modules.datasets_base.db.dataset_repositories import DatasetBaseRepository
 
 
 root = logging.getLogger()
@@ -23,17 +21,9 @@ def persistent_email_reminders(engine):
     """
     with engine.scoped_session() as session:
         log.info('Running Persistent Email Reminders Task')
-        pending_shares = ShareObjectRepository.fetch_submitted_shares_with_notifications(session=session)
+        pending_shares = ShareObjectRepository.fetch_submitted_shares_with_datasets(session=session)
         log.info(f'Found {len(pending_shares)} pending shares')
-        pending_share: ShareObject
-        for pending_share in pending_shares:
-            log.info(f'Sending Email Reminder for Share: {pending_share.shareUri}')
-            share = ShareObjectRepository.get_share_by_uri(session, pending_share.shareUri)
-            dataset = DatasetBaseRepository.get_dataset_by_uri(session, share.datasetUri)
-            ShareNotificationService(session=session, dataset=dataset, share=share).notify_persistent_email_reminder(
-                email_id=share.owner
-            )
-            log.info(f'Email reminder sent for share {share.shareUri}')
+        ShareNotificationService.notify_persistent_email_reminders(session=session, pending_shares=pending_shares)
         log.info('Completed Persistent Email Reminders Task')
 
 
@@ -28,7 +28,7 @@ class VoteService:
     def upvote(targetUri: str, targetType: str, upvote: bool):
         with _session() as session:
             vote = VoteRepository.upvote(session=session, targetUri=targetUri, targetType=targetType, upvote=upvote)
-            _VOTE_TYPES[vote.targetType].upsert(session, vote.targetUri)
+            _VOTE_TYPES[vote.targetType].queue_upsert(session, vote.targetUri)
             return vote
 
     @staticmethod
@@ -1,5 +1,10 @@
 from dataall.base.api import gql
-from dataall.modules.worksheets.api.resolvers import create_worksheet, delete_worksheet, update_worksheet
+from dataall.modules.worksheets.api.resolvers import (
+    create_worksheet,
+    delete_worksheet,
+    update_worksheet,
+    start_sql_query,
+)
 
 
 createWorksheet = gql.MutationField(
@@ -27,3 +32,14 @@ deleteWorksheet = gql.MutationField(
     ],
     type=gql.Boolean,
 )
+
+startWorksheetQuery = gql.MutationField(
+    name='startWorksheetQuery',
+    resolver=start_sql_query,
+    args=[
+        gql.Argument(name='environmentUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='worksheetUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='sqlQuery', type=gql.NonNullableType(gql.String)),
+    ],
+    type=gql.Ref('AthenaQueryResult'),
+)
@@ -1,5 +1,11 @@
 from dataall.base.api import gql
-from dataall.modules.worksheets.api.resolvers import get_worksheet, list_worksheets, run_sql_query
+from dataall.modules.worksheets.api.resolvers import (
+    get_worksheet,
+    list_worksheets,
+    run_sql_query,
+    get_sql_query_status,
+    get_sql_query_results,
+)
 
 
 getWorksheet = gql.QueryField(
@@ -28,3 +34,29 @@ runAthenaSqlQuery = gql.QueryField(
     ],
     resolver=run_sql_query,
 )
+
+
+getWorksheetQueryStatus = gql.QueryField(
+    name='getWorksheetQueryStatus',
+    type=gql.Ref('AthenaQueryResult'),
+    args=[
+        gql.Argument(name='environmentUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='worksheetUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='queryId', type=gql.NonNullableType(gql.String)),
+    ],
+    resolver=get_sql_query_status,
+)
+
+
+getWorksheetQueryResults = gql.QueryField(
+    name='getWorksheetQueryResults',
+    type=gql.Ref('AthenaQueryResultPage'),
+    args=[
+        gql.Argument(name='environmentUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='worksheetUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='queryId', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='nextToken', type=gql.String),
+        gql.Argument(name='pageSize', type=gql.Integer),
+    ],
+    resolver=get_sql_query_results,
+)
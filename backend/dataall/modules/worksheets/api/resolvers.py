@@ -66,6 +66,48 @@ def run_sql_query(context: Context, source, environmentUri: str = None, workshee
         )
 
 
+def start_sql_query(
+    context: Context, source, environmentUri: str = None, worksheetUri: str = None, sqlQuery: str = None
+):
+    with context.engine.scoped_session() as session:
+        return WorksheetService.start_sql_query(
+            session=session, uri=environmentUri, worksheetUri=worksheetUri, sqlQuery=sqlQuery
+        )
+
+
+def get_sql_query_status(
+    context: Context, source, environmentUri: str = None, worksheetUri: str = None, queryId: str = None
+):
+    if not queryId:
+        raise exceptions.RequiredParameter('queryId')
+    with context.engine.scoped_session() as session:
+        return WorksheetService.get_sql_query_status(
+            session=session, uri=environmentUri, worksheetUri=worksheetUri, queryId=queryId
+        )
+
+
+def get_sql_query_results(
+    context: Context,
+    source,
+    environmentUri: str = None,
+    worksheetUri: str = None,
+    queryId: str = None,
+    nextToken: str = None,
+    pageSize: int = None,
+):
+    if not queryId:
+        raise exceptions.RequiredParameter('queryId')
+    with context.engine.scoped_session() as session:
+        return WorksheetService.get_sql_query_results(
+            session=session,
+            uri=environmentUri,
+            worksheetUri=worksheetUri,
+            queryId=queryId,
+            nextToken=nextToken,
+            pageSize=pageSize,
+        )
+
+
 def delete_worksheet(context, source, worksheetUri: str = None):
     with context.engine.scoped_session() as session:
         return WorksheetService.delete_worksheet(session=session, uri=worksheetUri)
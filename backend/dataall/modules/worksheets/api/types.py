@@ -34,7 +34,7 @@ AthenaQueryResult = gql.ObjectType(
         gql.Field(name='AwsAccountId', type=gql.String),
         gql.Field(name='region', type=gql.String),
         gql.Field(name='ElapsedTimeInMs', type=gql.Integer),
-        gql.Field(name='DataScannedInBytes', type=gql.Integer),
+        gql.Field(name='DataScannedInBytes', type=gql.String),
         gql.Field(name='Status', type=gql.String),
         gql.Field(name='columns', type=gql.ArrayType(gql.Ref('AthenaResultColumnDescriptor'))),
         gql.Field(name='rows', type=gql.ArrayType(gql.Ref('AthenaResultRecord'))),
@@ -42,6 +42,21 @@ AthenaQueryResult = gql.ObjectType(
 )
 
 
+AthenaQueryResultPage = gql.ObjectType(
+    name='AthenaQueryResultPage',
+    fields=[
+        gql.Field(name='AthenaQueryId', type=gql.String),
+        gql.Field(name='Status', type=gql.String),
+        gql.Field(name='Error', type=gql.String),
+        gql.Field(name='ElapsedTimeInMs', type=gql.Integer),
+        gql.Field(name='DataScannedInBytes', type=gql.String),
+        gql.Field(name='columns', type=gql.ArrayType(gql.Ref('AthenaResultColumnDescriptor'))),
+        gql.Field(name='rows', type=gql.ArrayType(gql.ArrayType(gql.String))),
+        gql.Field(name='nextToken', type=gql.String),
+    ],
+)
+
+
 Worksheet = gql.ObjectType(
     name='Worksheet',
     fields=[
@@ -56,6 +71,7 @@ Worksheet = gql.ObjectType(
         gql.Field(name='updated', type=gql.String),
         gql.Field(name='owner', type=gql.NonNullableType(gql.String)),
         gql.Field(name='SamlAdminGroupName', type=gql.String),
+        gql.Field(name='lastSavedAthenaQueryIdForQuery', type=gql.String),
         gql.Field(
             name='lastSavedQueryResult',
             type=gql.Ref('AthenaQueryResult'),
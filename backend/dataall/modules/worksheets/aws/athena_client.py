@@ -1,14 +1,37 @@
 from pyathena import connect
 from dataall.base.aws.sts import SessionHelper
+from dataall.base.utils.ttl_cache import TTLCache
+
+# assumed role credentials are valid for 1 hour, keep them well below that
+_env_group_sessions = TTLCache(ttl_seconds=30 * 60)
 
 
 class AthenaClient:
     """Makes requests to AWS Athena"""
 
+    # GetQueryResults returns up to 1000 rows, the first page of a SELECT also holds the header row
+    MAX_RESULTS_PAGE_SIZE = 999
+
+    def __init__(self, aws_account_id, env_group, region):
+        session = AthenaClient._get_env_group_session(aws_account_id, env_group, region)
+        self._client = session.client('athena', region_name=region)
+        self._work_group = env_group.environmentAthenaWorkGroup
+
+    @staticmethod
+    def _get_env_group_session(aws_account_id, env_group, region):
+        """Pivot role -> environment group role chain, reused while the warm container keeps the credentials"""
+
+        def assume_env_group_role():
+            base_session = SessionHelper.remote_session(accountid=aws_account_id, region=region)
+            return SessionHelper.get_session(base_session=base_session, role_arn=env_group.environmentIAMRoleArn)
+
+        return _env_group_sessions.get_or_set(
+            (aws_account_id, region, env_group.environmentIAMRoleArn), assume_env_group_role
+        )
+
     @staticmethod
     def run_athena_query(aws_account_id, env_group, s3_staging_dir, region, sql=None):
-        base_session = SessionHelper.remote_session(accountid=aws_account_id, region=region)
-        boto3_session = SessionHelper.get_session(base_session=base_session, role_arn=env_group.environmentIAMRoleArn)
+        boto3_session = AthenaClient._get_env_group_session(aws_account_id, env_group, region)
         creds = boto3_session.get_credentials()
         connection = connect(
             aws_access_key_id=creds.access_key,
@@ -46,3 +69,68 @@ class AthenaClient:
             'rows': rows,
             'columns': columns,
         }
+
+    def start_query_execution(self, sql, s3_staging_dir, result_reuse_max_age_minutes=0) -> str:
+        """
+        Submits the query to Athena and returns its QueryExecutionId without waiting for the results.
+        With result_reuse_max_age_minutes Athena serves identical queries from the results of a previous run
+        in the workgroup instead of scanning the data again
+        """
+        params = {
+            'QueryString': sql,
+            'WorkGroup': self._work_group,
+            'ResultConfiguration': {'OutputLocation': s3_staging_dir},
+        }
+        if result_reuse_max_age_minutes:
+            params['ResultReuseConfiguration'] = {
+                'ResultReuseByAgeConfiguration': {'Enabled': True, 'MaxAgeInMinutes': result_reuse_max_age_minutes}
+            }
+        response = self._client.start_query_execution(**params)
+        return response['QueryExecutionId']
+
+    def get_query_execution(self, query_id) -> dict:
+        execution = self._client.get_query_execution(QueryExecutionId=query_id)['QueryExecution']
+        status = execution.get('Status', {})
+        statistics = execution.get('Statistics', {})
+        return {
+            'AthenaQueryId': query_id,
+            'Status': status.get('State'),
+            'Error': status.get('StateChangeReason') if status.get('State') == 'FAILED' else None,
+            'OutputLocation': execution.get('ResultConfiguration', {}).get('OutputLocation'),
+            'ElapsedTimeInMs': statistics.get('EngineExecutionTimeInMillis'),
+            'DataScannedInBytes': statistics.get('DataScannedInBytes'),
+        }
+
+    def _get_statement_type(self, query_id) -> str:
+        return self._client.get_query_execution(QueryExecutionId=query_id)['QueryExecution'].get('StatementType')
+
+    def get_query_results_page(self, query_id, page_size, next_token=None) -> dict:
+        """
+        Reads one page of results of a finished query.
+        The column header is returned once per page and every row is a plain list of values,
+        so the payload grows with the number of values and not with the number of cells times the column metadata
+        """
+        # the first page of a SELECT starts with the header row, fetch one more row to fill the page
+        has_header_row = next_token is None and self._get_statement_type(query_id) == 'DML'
+        params = {
+            'QueryExecutionId': query_id,
+            'MaxResults': page_size + 1 if has_header_row else page_size,
+        }
+        if next_token:
+            params['NextToken'] = next_token
+        response = self._client.get_query_results(**params)
+
+        result_set = response['ResultSet']
+        columns = [
+            {'columnName': column['Name'], 'typeName': column['Type']}
+            for column in result_set.get('ResultSetMetadata', {}).get('ColumnInfo', [])
+        ]
+        rows = [[cell.get('VarCharValue') for cell in row.get('Data', [])] for row in result_set.get('Rows', [])]
+        if has_header_row:
+            rows = rows[1:]
+
+        return {
+            'columns': columns,
+            'rows': rows,
+            'nextToken': response.get('NextToken'),
+        }
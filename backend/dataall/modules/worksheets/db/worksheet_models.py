@@ -1,7 +1,7 @@
 import datetime
 import enum
 
-from sqlalchemy import Column, DateTime, Integer, Enum, String
+from sqlalchemy import BigInteger, Column, DateTime, Integer, Enum, String, Index
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import query_expression
 
@@ -27,6 +27,7 @@ class Worksheet(Resource, Base):
 
 class WorksheetQueryResult(Base):
     __tablename__ = 'worksheet_query_result'
+    __table_args__ = (Index('ix_worksheet_query_result_workgroup_queryHash', 'workgroup', 'queryHash'),)
     worksheetUri = Column(String, nullable=False)
     AthenaQueryId = Column(String, primary_key=True)
     status = Column(String, nullable=False)
@@ -37,5 +38,7 @@ class WorksheetQueryResult(Base):
     OutputLocation = Column(String, nullable=False)
     error = Column(String, nullable=True)
     ElapsedTimeInMs = Column(Integer, nullable=True)
-    DataScannedInBytes = Column(Integer, nullable=True)
+    DataScannedInBytes = Column(BigInteger, nullable=True)
     created = Column(DateTime, default=datetime.datetime.now)
+    workgroup = Column(String, nullable=True)
+    queryHash = Column(String, nullable=True)
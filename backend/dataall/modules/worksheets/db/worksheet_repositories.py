@@ -2,11 +2,11 @@
 DAO layer that encapsulates the logic and interaction with the database for worksheets
 """
 
-from sqlalchemy import or_
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Query
 
 from dataall.core.environment.services.environment_resource_manager import EnvironmentResource
-from dataall.base.db import paginate
+from dataall.base.db import paginate, term_filter
 from dataall.modules.worksheets.db.worksheet_models import Worksheet, WorksheetQueryResult
 
 
@@ -28,6 +28,26 @@ class WorksheetRepository(EnvironmentResource):
     def find_worksheet_by_uri(session, uri) -> Worksheet:
         return session.query(Worksheet).get(uri)
 
+    @staticmethod
+    def find_query_result_by_query_id(session, query_id) -> WorksheetQueryResult:
+        return session.query(WorksheetQueryResult).get(query_id)
+
+    @staticmethod
+    def find_reusable_query_result(session, workgroup, query_hash, created_after, statuses) -> WorksheetQueryResult:
+        return (
+            session.query(WorksheetQueryResult)
+            .filter(
+                and_(
+                    WorksheetQueryResult.workgroup == workgroup,
+                    WorksheetQueryResult.queryHash == query_hash,
+                    WorksheetQueryResult.created >= created_after,
+                    WorksheetQueryResult.status.in_(statuses),
+                )
+            )
+            .order_by(WorksheetQueryResult.created.desc())
+            .first()
+        )
+
     @staticmethod
     def query_user_worksheets(session, username, groups, filter) -> Query:
         query = session.query(Worksheet).filter(
@@ -39,8 +59,7 @@ class WorksheetRepository(EnvironmentResource):
         if filter and filter.get('term'):
             query = query.filter(
                 or_(
-                    Worksheet.label.ilike('%' + filter.get('term') + '%'),
-                    Worksheet.description.ilike('%' + filter.get('term') + '%'),
+                    term_filter(filter.get('term'), Worksheet.label, Worksheet.description),
                     Worksheet.tags.contains(f"{{{filter.get('term')}}}"),
                 )
             )
@@ -1,12 +1,16 @@
+import hashlib
 import logging
+import re
+from datetime import datetime, timedelta
 
+from dataall.base.config import config
 from dataall.core.activity.db.activity_models import Activity
 from dataall.core.environment.services.environment_service import EnvironmentService
 from dataall.base.db import exceptions
 from dataall.core.permissions.services.resource_policy_service import ResourcePolicyService
 from dataall.core.permissions.services.tenant_policy_service import TenantPolicyService
 from dataall.modules.worksheets.aws.athena_client import AthenaClient
-from dataall.modules.worksheets.db.worksheet_models import Worksheet
+from dataall.modules.worksheets.db.worksheet_models import Worksheet, WorksheetQueryResult, QueryType
 from dataall.modules.worksheets.db.worksheet_repositories import WorksheetRepository
 from dataall.modules.worksheets.services.worksheet_permissions import (
     MANAGE_WORKSHEETS,
@@ -22,6 +26,12 @@ logger = logging.getLogger(__name__)
 
 
 class WorksheetService:
+    _DEFAULT_RESULTS_PAGE_SIZE = 100
+    _FINISHED_QUERY_STATES = ['SUCCEEDED', 'FAILED', 'CANCELLED']
+    _REUSABLE_QUERY_STATES = ['QUEUED', 'RUNNING', 'SUCCEEDED']
+    _LEADING_COMMENTS = re.compile(r'^(?:\s+|--[^\n]*(?:\n|$)|/\*.*?\*/|\()*', re.DOTALL)
+    _READ_ONLY_STATEMENT = re.compile(r'^(?:SELECT|WITH|VALUES|SHOW|DESCRIBE)\b', re.IGNORECASE)
+
     @staticmethod
     def get_worksheet_by_uri(session, uri: str) -> Worksheet:
         if not uri:
@@ -116,9 +126,146 @@ class WorksheetService:
         cursor = AthenaClient.run_athena_query(
             aws_account_id=environment.AwsAccountId,
             env_group=env_group,
-            s3_staging_dir=f's3://{environment.EnvironmentDefaultBucketName}/athenaqueries/{env_group.environmentAthenaWorkGroup}/',
+            s3_staging_dir=WorksheetService._get_s3_staging_dir(environment, env_group),
             region=environment.region,
             sql=sqlQuery,
         )
 
         return AthenaClient.convert_query_output(cursor)
+
+    @staticmethod
+    @ResourcePolicyService.has_resource_permission(RUN_ATHENA_QUERY)
+    def start_sql_query(session, uri, worksheetUri, sqlQuery):
+        environment = EnvironmentService.get_environment_by_uri(session, uri)
+        worksheet = WorksheetService.get_worksheet_by_uri(session, worksheetUri)
+
+        env_group = EnvironmentService.get_environment_group(
+            session, worksheet.SamlAdminGroupName, environment.environmentUri
+        )
+        max_age_minutes = (
+            WorksheetService._get_result_reuse_max_age_minutes() if WorksheetService._is_read_only(sqlQuery) else 0
+        )
+        query_hash = WorksheetService._hash_sql(sqlQuery)
+
+        query_result = None
+        if max_age_minutes:
+            query_result = WorksheetRepository.find_reusable_query_result(
+                session,
+                workgroup=env_group.environmentAthenaWorkGroup,
+                query_hash=query_hash,
+                created_after=datetime.now() - timedelta(minutes=max_age_minutes),
+                statuses=WorksheetService._REUSABLE_QUERY_STATES,
+            )
+        if query_result:
+            logger.info(f'Reusing Athena query {query_result.AthenaQueryId} for worksheet {worksheetUri}')
+        else:
+            output_location = WorksheetService._get_s3_staging_dir(environment, env_group)
+            query_id = AthenaClient(
+                aws_account_id=environment.AwsAccountId, env_group=env_group, region=environment.region
+            ).start_query_execution(
+                sql=sqlQuery, s3_staging_dir=output_location, result_reuse_max_age_minutes=max_age_minutes
+            )
+            query_result = WorksheetQueryResult(
+                worksheetUri=worksheet.worksheetUri,
+                AthenaQueryId=query_id,
+                status='QUEUED',
+                queryType=QueryType.data,
+                sqlBody=sqlQuery,
+                AwsAccountId=environment.AwsAccountId,
+                region=environment.region,
+                OutputLocation=output_location,
+                workgroup=env_group.environmentAthenaWorkGroup,
+                queryHash=query_hash,
+            )
+            session.add(query_result)
+
+        worksheet.lastSavedAthenaQueryIdForQuery = query_result.AthenaQueryId
+        return WorksheetService._to_query_execution(query_result)
+
+    @staticmethod
+    @ResourcePolicyService.has_resource_permission(RUN_ATHENA_QUERY)
+    def get_sql_query_status(session, uri, worksheetUri, queryId):
+        query_result, _ = WorksheetService._get_refreshed_query_result(session, uri, worksheetUri, queryId)
+        return WorksheetService._to_query_execution(query_result)
+
+    @staticmethod
+    @ResourcePolicyService.has_resource_permission(RUN_ATHENA_QUERY)
+    def get_sql_query_results(session, uri, worksheetUri, queryId, nextToken=None, pageSize=None):
+        page_size = pageSize or WorksheetService._DEFAULT_RESULTS_PAGE_SIZE
+        if page_size < 1 or page_size > AthenaClient.MAX_RESULTS_PAGE_SIZE:
+            raise exceptions.InvalidInput(
+                param_name='pageSize',
+                param_value=page_size,
+                constraint=f'between 1 and {AthenaClient.MAX_RESULTS_PAGE_SIZE}',
+            )
+
+        query_result, client = WorksheetService._get_refreshed_query_result(session, uri, worksheetUri, queryId)
+
+        response = WorksheetService._to_query_execution(query_result)
+        if query_result.status == 'SUCCEEDED':
+            response.update(client.get_query_results_page(query_id=queryId, page_size=page_size, next_token=nextToken))
+        else:
+            response.update({'columns': [], 'rows': [], 'nextToken': None})
+        return response
+
+    @staticmethod
+    def _get_refreshed_query_result(session, uri, worksheetUri, queryId):
+        """Finds the query started from the worksheet's workgroup and refreshes its status until it is final"""
+        environment = EnvironmentService.get_environment_by_uri(session, uri)
+        worksheet = WorksheetService.get_worksheet_by_uri(session, worksheetUri)
+        env_group = EnvironmentService.get_environment_group(
+            session, worksheet.SamlAdminGroupName, environment.environmentUri
+        )
+        query_result = WorksheetRepository.find_query_result_by_query_id(session, queryId)
+        if (
+            not query_result
+            or query_result.AwsAccountId != environment.AwsAccountId
+            or (
+                query_result.worksheetUri != worksheet.worksheetUri
+                and query_result.workgroup != env_group.environmentAthenaWorkGroup
+            )
+        ):
+            raise exceptions.ObjectNotFound('WorksheetQueryResult', queryId)
+
+        client = AthenaClient(aws_account_id=environment.AwsAccountId, env_group=env_group, region=environment.region)
+        if query_result.status not in WorksheetService._FINISHED_QUERY_STATES:
+            execution = client.get_query_execution(query_id=queryId)
+            query_result.status = execution['Status']
+            query_result.error = execution['Error']
+            query_result.ElapsedTimeInMs = execution['ElapsedTimeInMs']
+            query_result.DataScannedInBytes = execution['DataScannedInBytes']
+        return query_result, client
+
+    @staticmethod
+    def _get_s3_staging_dir(environment, env_group):
+        return f's3://{environment.EnvironmentDefaultBucketName}/athenaqueries/{env_group.environmentAthenaWorkGroup}/'
+
+    @staticmethod
+    def _get_result_reuse_max_age_minutes() -> int:
+        return config.get_property('modules.worksheets.features.query_result_reuse_max_age_minutes', 0)
+
+    @staticmethod
+    def _is_read_only(sql: str) -> bool:
+        """Only the results of read-only statements can be reused, the other statements must run every time"""
+        statement = WorksheetService._LEADING_COMMENTS.sub('', sql, count=1)
+        return bool(WorksheetService._READ_ONLY_STATEMENT.match(statement))
+
+    @staticmethod
+    def _hash_sql(sql: str) -> str:
+        """Hash of the statement with whitespace and trailing semicolons normalized outside of string literals"""
+        parts = re.split(r"('(?:[^']|'')*')", sql.strip().rstrip(';').strip())
+        normalized = ''.join(part if part.startswith("'") else re.sub(r'\s+', ' ', part) for part in parts)
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _to_query_execution(query_result: WorksheetQueryResult) -> dict:
+        return {
+            'AthenaQueryId': query_result.AthenaQueryId,
+            'Status': query_result.status,
+            'Error': query_result.error,
+            'OutputLocation': query_result.OutputLocation,
+            'AwsAccountId': query_result.AwsAccountId,
+            'region': query_result.region,
+            'ElapsedTimeInMs': query_result.ElapsedTimeInMs,
+            'DataScannedInBytes': query_result.DataScannedInBytes,
+        }
@@ -13,6 +13,7 @@ from dataall.core.permissions.services.tenant_permissions import TENANT_ALL
 from dataall.core.permissions.services.tenant_policy_service import TenantPolicyService
 
 from dataall.base.db import get_engine, Base
+from dataall.base.db.instrumentation import SqlInstrumentation
 from dataall.base.searchproxy import connect, run_query
 from dataall.base.loader import load_modules, ImportMode
 from dataall.base.config import config
@@ -148,12 +149,15 @@ def graphql_server():
 
     # Note: Passing the request to the context is optional.
     # In Flask, the current request is always accessible as flask.request
-    success, result = graphql_sync(
-        schema,
-        data,
-        context_value=context,
-        debug=app.debug,
-    )
+    with SqlInstrumentation.record_operation(data.get('operationName')) as recorded_statements:
+        success, result = graphql_sync(
+            schema,
+            data,
+            context_value=context,
+            debug=app.debug,
+        )
+    if extensions := SqlInstrumentation.graphql_extensions(recorded_statements):
+        result['extensions'] = extensions
 
     dispose_context()
     status_code = 200 if success else 400
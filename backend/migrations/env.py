@@ -10,6 +10,7 @@ import re
 
 # disable ruff-format, because this unused imports are important
 # fmt: off
+from dataall.modules.catalog.db.catalog_index_outbox_models import CatalogIndexOutbox
 from dataall.modules.catalog.db.glossary_models import GlossaryNode, TermLink
 from dataall.modules.dashboards.db.dashboard_models import DashboardShare, Dashboard
 from dataall.modules.datapipelines.db.datapipelines_models import DataPipeline, DataPipelineEnvironment
@@ -50,6 +51,9 @@ exclude_tables = config.get_section('alembic:exclude').get('tables', '').split('
 
 
 def include_object(object, name, type_, *args, **kwargs):
+    # trigram search indexes are created by migrations only, see b7c2e9a4f1d3_add_trigram_search_indexes
+    if type_ == 'index' and name.endswith('_trgm'):
+        return False
     return not (type_ == 'table' and name in exclude_tables)
 
 
@@ -0,0 +1,24 @@
+"""add_stack_target_uri_index
+
+Revision ID: 3d8f0a6b2c51
+Revises: b7c2e9a4f1d3
+Create Date: 2024-08-12 09:27:13.480126
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '3d8f0a6b2c51'
+down_revision = 'b7c2e9a4f1d3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_stack_targetUri', 'stack', ['targetUri'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_stack_targetUri', table_name='stack')
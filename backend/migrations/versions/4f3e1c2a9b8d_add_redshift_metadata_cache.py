@@ -0,0 +1,63 @@
+"""add_redshift_metadata_cache
+
+Revision ID: 4f3e1c2a9b8d
+Revises: c9df73287d75
+Create Date: 2024-08-06 09:41:17.520318
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4f3e1c2a9b8d'
+down_revision = 'c9df73287d75'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'redshift_metadata_table',
+        sa.Column('connectionUri', sa.String(), nullable=False),
+        sa.Column('schema', sa.String(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('type', sa.String(), nullable=False),
+        sa.Column('lastSynced', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['connectionUri'], ['redshift_connection.connectionUri'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('connectionUri', 'schema', 'name'),
+    )
+    op.create_table(
+        'redshift_metadata_column',
+        sa.Column('connectionUri', sa.String(), nullable=False),
+        sa.Column('schema', sa.String(), nullable=False),
+        sa.Column('tableName', sa.String(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+        sa.Column('typeName', sa.String(), nullable=True),
+        sa.Column('nullable', sa.Boolean(), nullable=True),
+        sa.Column('length', sa.Integer(), nullable=True),
+        sa.Column('precision', sa.Integer(), nullable=True),
+        sa.Column('scale', sa.Integer(), nullable=True),
+        sa.Column('columnDefault', sa.String(), nullable=True),
+        sa.Column('isCaseSensitive', sa.Boolean(), nullable=True),
+        sa.Column('isCurrency', sa.Boolean(), nullable=True),
+        sa.Column('isSigned', sa.Boolean(), nullable=True),
+        sa.Column('label', sa.String(), nullable=True),
+        sa.Column('lastSynced', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['connectionUri'], ['redshift_connection.connectionUri'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('connectionUri', 'schema', 'tableName', 'name'),
+    )
+    op.create_index(
+        'ix_redshift_metadata_column_position',
+        'redshift_metadata_column',
+        ['connectionUri', 'schema', 'tableName', 'position'],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index('ix_redshift_metadata_column_position', table_name='redshift_metadata_column')
+    op.drop_table('redshift_metadata_column')
+    op.drop_table('redshift_metadata_table')
@@ -0,0 +1,62 @@
+"""glossary_path_index_and_counters
+
+Revision ID: 8a1d5e7c3f20
+Revises: 4f3e1c2a9b8d
+Create Date: 2024-08-07 11:23:05.114962
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8a1d5e7c3f20'
+down_revision = '4f3e1c2a9b8d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_glossary_node_path',
+        'glossary_node',
+        ['path'],
+        unique=False,
+        postgresql_ops={'path': 'text_pattern_ops'},
+    )
+    op.create_index('ix_glossary_node_parentUri', 'glossary_node', ['parentUri'], unique=False)
+    op.create_index('ix_term_link_nodeUri', 'term_link', ['nodeUri'], unique=False)
+
+    op.add_column('glossary_node', sa.Column('categoriesCount', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('glossary_node', sa.Column('termsCount', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('glossary_node', sa.Column('associationsCount', sa.Integer(), nullable=False, server_default='0'))
+
+    op.execute(
+        """
+        UPDATE glossary_node AS node SET
+            "categoriesCount" = (
+                SELECT count(*) FROM glossary_node AS child
+                WHERE left(child.path, length(node.path)) = node.path AND child."nodeType" = 'C' AND child.deleted IS NULL
+            ),
+            "termsCount" = (
+                SELECT count(*) FROM glossary_node AS child
+                WHERE left(child.path, length(node.path)) = node.path AND child."nodeType" = 'T' AND child.deleted IS NULL
+            ),
+            "associationsCount" = (
+                SELECT count(*) FROM term_link
+                JOIN glossary_node AS term ON term."nodeUri" = term_link."nodeUri"
+                WHERE left(term.path, length(node.path)) = node.path AND term.deleted IS NULL
+            )
+        WHERE node.deleted IS NULL
+        """
+    )
+
+
+def downgrade():
+    op.drop_column('glossary_node', 'associationsCount')
+    op.drop_column('glossary_node', 'termsCount')
+    op.drop_column('glossary_node', 'categoriesCount')
+    op.drop_index('ix_term_link_nodeUri', table_name='term_link')
+    op.drop_index('ix_glossary_node_parentUri', table_name='glossary_node')
+    op.drop_index('ix_glossary_node_path', table_name='glossary_node')
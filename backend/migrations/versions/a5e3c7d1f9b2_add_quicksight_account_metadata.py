@@ -0,0 +1,34 @@
+"""add_quicksight_account_metadata
+
+Revision ID: a5e3c7d1f9b2
+Revises: 3d8f0a6b2c51
+Create Date: 2024-08-13 15:04:38.215947
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a5e3c7d1f9b2'
+down_revision = '3d8f0a6b2c51'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'quicksight_account_metadata',
+        sa.Column('AwsAccountId', sa.String(), nullable=False),
+        sa.Column('identityRegion', sa.String(), nullable=False),
+        sa.Column('edition', sa.String(), nullable=True),
+        sa.Column('subscriptionStatus', sa.String(), nullable=True),
+        sa.Column('defaultGroupArn', sa.String(), nullable=True),
+        sa.Column('lastSynced', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('AwsAccountId'),
+    )
+
+
+def downgrade():
+    op.drop_table('quicksight_account_metadata')
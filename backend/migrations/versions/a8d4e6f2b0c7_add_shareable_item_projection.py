@@ -0,0 +1,59 @@
+"""add_shareable_item_projection
+
+Revision ID: a8d4e6f2b0c7
+Revises: f3b8d2a6c9e4
+Create Date: 2024-08-19 09:48:13.402967
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8d4e6f2b0c7'
+down_revision = 'f3b8d2a6c9e4'
+branch_labels = None
+depends_on = None
+
+# (item type, table, uri column) of the shareable types registered by the share modules
+SHAREABLE_TYPES = [
+    ('DatasetTable', 'dataset_table', 'tableUri'),
+    ('DatasetStorageLocation', 'dataset_storage_location', 'locationUri'),
+    ('S3Bucket', 'dataset_bucket', 'bucketUri'),
+]
+
+
+def upgrade():
+    op.create_table(
+        'shareable_item',
+        sa.Column('itemUri', sa.String(), nullable=False),
+        sa.Column('itemType', sa.String(), nullable=False),
+        sa.Column('datasetUri', sa.String(), nullable=False),
+        sa.Column('itemName', sa.String(), nullable=True),
+        sa.Column('description', sa.String(), nullable=True),
+        sa.PrimaryKeyConstraint('itemUri'),
+    )
+    op.create_index('ix_shareable_item_datasetUri_itemName', 'shareable_item', ['datasetUri', 'itemName'], unique=False)
+    for column in ['itemName', 'description']:
+        op.create_index(
+            f'ix_shareable_item_{column}_trgm',
+            'shareable_item',
+            [column],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+    for item_type, table, uri_column in SHAREABLE_TYPES:
+        op.execute(
+            f"""
+            INSERT INTO shareable_item ("itemUri", "itemType", "datasetUri", "itemName", description)
+            SELECT "{uri_column}", '{item_type}', "datasetUri", name, description FROM {table}
+            ON CONFLICT DO NOTHING
+            """
+        )
+
+
+def downgrade():
+    op.drop_table('shareable_item')
@@ -0,0 +1,60 @@
+"""add_trigram_search_indexes
+
+Revision ID: b7c2e9a4f1d3
+Revises: e1b9c6f4d2a7
+Create Date: 2024-08-09 10:15:42.618205
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7c2e9a4f1d3'
+down_revision = 'e1b9c6f4d2a7'
+branch_labels = None
+depends_on = None
+
+# GIN trigram indexes serving the '%term%' filters of dataall.base.db.term_filter.
+# They are not declared in the models (pg_trgm is not always available), env.py skips them in autogenerate
+SEARCHED_COLUMNS = [
+    ('organization', ['label', 'description']),
+    ('environment', ['label', 'description']),
+    ('environment_group_permission', ['groupUri']),
+    ('consumptionrole', ['consumptionRoleName']),
+    ('dataset', ['label', 'description']),
+    ('dataset_table', ['name']),
+    ('dataset_storage_location', ['name']),
+    ('dataset_table_column', ['label']),
+    ('share_object_item', ['itemName']),
+    ('glossary_node', ['label']),
+    ('dashboard', ['label']),
+    ('datapipeline', ['label']),
+    ('sagemaker_notebook', ['label']),
+    ('worksheet', ['label']),
+    ('redshift_connection', ['label']),
+]
+
+
+def _index_name(table, column):
+    return f'ix_{table}_{column}_trgm'
+
+
+def upgrade():
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table, columns in SEARCHED_COLUMNS:
+        for column in columns:
+            op.create_index(
+                _index_name(table, column),
+                table,
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+            )
+
+
+def downgrade():
+    for table, columns in reversed(SEARCHED_COLUMNS):
+        for column in columns:
+            op.drop_index(_index_name(table, column), table_name=table)
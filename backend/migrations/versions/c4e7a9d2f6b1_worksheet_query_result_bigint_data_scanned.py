@@ -0,0 +1,38 @@
+"""worksheet_query_result_bigint_data_scanned
+
+Revision ID: c4e7a9d2f6b1
+Revises: a8d4e6f2b0c7
+Create Date: 2024-08-20 08:21:37.129845
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4e7a9d2f6b1'
+down_revision = 'a8d4e6f2b0c7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Athena reports the scanned bytes of queries scanning more than 2 GB, they do not fit a 32 bits integer
+    op.alter_column(
+        'worksheet_query_result',
+        'DataScannedInBytes',
+        existing_type=sa.Integer(),
+        type_=sa.BigInteger(),
+        existing_nullable=True,
+    )
+
+
+def downgrade():
+    op.alter_column(
+        'worksheet_query_result',
+        'DataScannedInBytes',
+        existing_type=sa.BigInteger(),
+        type_=sa.Integer(),
+        existing_nullable=True,
+    )
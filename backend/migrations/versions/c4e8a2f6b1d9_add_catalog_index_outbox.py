@@ -0,0 +1,33 @@
+"""add_catalog_index_outbox
+
+Revision ID: c4e8a2f6b1d9
+Revises: a5e3c7d1f9b2
+Create Date: 2024-08-14 10:37:42.618205
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4e8a2f6b1d9'
+down_revision = 'a5e3c7d1f9b2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'catalog_index_outbox',
+        sa.Column('indexer', sa.String(), nullable=False),
+        sa.Column('targetUri', sa.String(), nullable=False),
+        sa.Column('queued', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('indexer', 'targetUri'),
+    )
+    op.create_index('ix_catalog_index_outbox_queued', 'catalog_index_outbox', ['queued'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_catalog_index_outbox_queued', table_name='catalog_index_outbox')
+    op.drop_table('catalog_index_outbox')
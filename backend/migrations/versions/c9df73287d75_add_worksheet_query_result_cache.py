@@ -0,0 +1,34 @@
+"""add_worksheet_query_result_cache
+
+Revision ID: c9df73287d75
+Revises: b2ca24b72ca4
+Create Date: 2024-08-05 10:12:41.381204
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c9df73287d75'
+down_revision = 'b2ca24b72ca4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('worksheet_query_result', sa.Column('workgroup', sa.String(), nullable=True))
+    op.add_column('worksheet_query_result', sa.Column('queryHash', sa.String(), nullable=True))
+    op.create_index(
+        'ix_worksheet_query_result_workgroup_queryHash',
+        'worksheet_query_result',
+        ['workgroup', 'queryHash'],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index('ix_worksheet_query_result_workgroup_queryHash', table_name='worksheet_query_result')
+    op.drop_column('worksheet_query_result', 'queryHash')
+    op.drop_column('worksheet_query_result', 'workgroup')
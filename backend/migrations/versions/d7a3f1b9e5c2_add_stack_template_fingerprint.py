@@ -0,0 +1,25 @@
+"""add_stack_template_fingerprint
+
+Revision ID: d7a3f1b9e5c2
+Revises: c4e8a2f6b1d9
+Create Date: 2024-08-15 16:12:08.270531
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7a3f1b9e5c2'
+down_revision = 'c4e8a2f6b1d9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('stack', sa.Column('templateFingerprint', sa.String(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('stack', 'templateFingerprint')
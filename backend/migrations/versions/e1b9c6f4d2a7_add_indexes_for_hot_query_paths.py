@@ -0,0 +1,42 @@
+"""add_indexes_for_hot_query_paths
+
+Revision ID: e1b9c6f4d2a7
+Revises: 8a1d5e7c3f20
+Create Date: 2024-08-08 14:02:51.903417
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e1b9c6f4d2a7'
+down_revision = '8a1d5e7c3f20'
+branch_labels = None
+depends_on = None
+
+# resource_lock (resourceUri, resourceType) and environment_group_permission (groupUri, environmentUri)
+# are already served by their primary keys
+INDEXES = [
+    ('ix_share_object_item_shareUri_status', 'share_object_item', ['shareUri', 'status']),
+    ('ix_share_object_item_shareUri_healthStatus', 'share_object_item', ['shareUri', 'healthStatus']),
+    ('ix_share_object_item_itemUri', 'share_object_item', ['itemUri']),
+    ('ix_share_object_datasetUri_status', 'share_object', ['datasetUri', 'status']),
+    ('ix_share_object_environmentUri_groupUri', 'share_object', ['environmentUri', 'groupUri']),
+    ('ix_share_object_groupUri', 'share_object', ['groupUri']),
+    ('ix_environment_group_permission_environmentUri', 'environment_group_permission', ['environmentUri']),
+    ('ix_term_link_targetUri_targetType', 'term_link', ['targetUri', 'targetType']),
+    ('ix_notification_recipient', 'notification', ['recipient']),
+    ('ix_task_status_action', 'task', ['status', 'action']),
+    ('ix_dataset_table_datasetUri', 'dataset_table', ['datasetUri']),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
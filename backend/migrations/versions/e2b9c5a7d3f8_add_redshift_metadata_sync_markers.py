@@ -0,0 +1,67 @@
+"""add_redshift_metadata_sync_markers
+
+Revision ID: e2b9c5a7d3f8
+Revises: c4e7a9d2f6b1
+Create Date: 2024-08-20 10:05:52.817346
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2b9c5a7d3f8'
+down_revision = 'c4e7a9d2f6b1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'redshift_metadata_sync',
+        sa.Column('connectionUri', sa.String(), nullable=False),
+        sa.Column('schema', sa.String(), nullable=False),
+        sa.Column('tableName', sa.String(), nullable=False),
+        sa.Column('lastSynced', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['connectionUri'], ['redshift_connection.connectionUri'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('connectionUri', 'schema', 'tableName'),
+    )
+    op.execute(
+        """
+        INSERT INTO redshift_metadata_sync ("connectionUri", "schema", "tableName", "lastSynced")
+        SELECT "connectionUri", "schema", '', min("lastSynced")
+        FROM redshift_metadata_table
+        GROUP BY "connectionUri", "schema"
+        UNION ALL
+        SELECT "connectionUri", "schema", "tableName", min("lastSynced")
+        FROM redshift_metadata_column
+        GROUP BY "connectionUri", "schema", "tableName"
+        """
+    )
+    op.drop_column('redshift_metadata_table', 'lastSynced')
+    op.drop_column('redshift_metadata_column', 'lastSynced')
+
+
+def downgrade():
+    op.add_column('redshift_metadata_column', sa.Column('lastSynced', sa.DateTime(), nullable=True))
+    op.add_column('redshift_metadata_table', sa.Column('lastSynced', sa.DateTime(), nullable=True))
+    op.execute(
+        """
+        UPDATE redshift_metadata_table t SET "lastSynced" = s."lastSynced"
+        FROM redshift_metadata_sync s
+        WHERE s."connectionUri" = t."connectionUri" AND s."schema" = t."schema" AND s."tableName" = ''
+        """
+    )
+    op.execute(
+        """
+        UPDATE redshift_metadata_column c SET "lastSynced" = s."lastSynced"
+        FROM redshift_metadata_sync s
+        WHERE s."connectionUri" = c."connectionUri" AND s."schema" = c."schema" AND s."tableName" = c."tableName"
+        """
+    )
+    op.execute('UPDATE redshift_metadata_table SET "lastSynced" = now() WHERE "lastSynced" IS NULL')
+    op.execute('UPDATE redshift_metadata_column SET "lastSynced" = now() WHERE "lastSynced" IS NULL')
+    op.alter_column('redshift_metadata_column', 'lastSynced', nullable=False)
+    op.alter_column('redshift_metadata_table', 'lastSynced', nullable=False)
+    op.drop_table('redshift_metadata_sync')
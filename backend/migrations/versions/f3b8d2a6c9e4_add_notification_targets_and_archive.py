@@ -0,0 +1,78 @@
+"""add_notification_targets_and_archive
+
+Revision ID: f3b8d2a6c9e4
+Revises: d7a3f1b9e5c2
+Create Date: 2024-08-16 11:24:37.581946
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b8d2a6c9e4'
+down_revision = 'd7a3f1b9e5c2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('notification', sa.Column('target_type', sa.String(), nullable=True))
+    op.add_column('notification', sa.Column('share_uri', sa.String(), nullable=True))
+    op.add_column('notification', sa.Column('dataset_uri', sa.String(), nullable=True))
+
+    # share notifications are the only ones with a target, it is stored as 'shareUri|datasetUri'
+    op.execute(
+        """
+        UPDATE notification
+        SET target_type = 'ShareObject',
+            share_uri = split_part(target_uri, '|', 1),
+            dataset_uri = split_part(target_uri, '|', 2)
+        WHERE target_uri LIKE '%|%'
+        """
+    )
+
+    op.drop_index('ix_notification_recipient', table_name='notification')
+    op.create_index('ix_notification_recipient_created', 'notification', ['recipient', 'created'], unique=False)
+    op.create_index('ix_notification_share_uri_type', 'notification', ['share_uri', 'type'], unique=False)
+    op.create_index('ix_notification_dataset_uri', 'notification', ['dataset_uri'], unique=False)
+
+    op.create_table(
+        'notification_archive',
+        sa.Column('notificationUri', sa.String(), nullable=False),
+        sa.Column('type', sa.String(), nullable=True),
+        sa.Column('message', sa.String(), nullable=False),
+        sa.Column('recipient', sa.String(), nullable=False),
+        sa.Column('is_read', sa.Boolean(), nullable=False),
+        sa.Column('target_uri', sa.String(), nullable=True),
+        sa.Column('target_type', sa.String(), nullable=True),
+        sa.Column('share_uri', sa.String(), nullable=True),
+        sa.Column('dataset_uri', sa.String(), nullable=True),
+        sa.Column('created', sa.DateTime(), nullable=True),
+        sa.Column('updated', sa.DateTime(), nullable=True),
+        sa.Column('deleted', sa.DateTime(), nullable=True),
+        sa.Column('archived', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('notificationUri'),
+    )
+
+
+def downgrade():
+    op.execute(
+        """
+        INSERT INTO notification
+            ("notificationUri", type, message, recipient, is_read, target_uri, created, updated, deleted)
+        SELECT "notificationUri", type, message, recipient, is_read, target_uri, created, updated, deleted
+        FROM notification_archive
+        """
+    )
+    op.drop_table('notification_archive')
+
+    op.drop_index('ix_notification_dataset_uri', table_name='notification')
+    op.drop_index('ix_notification_share_uri_type', table_name='notification')
+    op.drop_index('ix_notification_recipient_created', table_name='notification')
+    op.create_index('ix_notification_recipient', 'notification', ['recipient'], unique=False)
+
+    op.drop_column('notification', 'dataset_uri')
+    op.drop_column('notification', 'share_uri')
+    op.drop_column('notification', 'target_type')
@@ -0,0 +1,64 @@
+"""add_missing_trigram_search_indexes
+
+Revision ID: f9a3d6c1e8b2
+Revises: e2b9c5a7d3f8
+Create Date: 2024-08-20 11:32:08.264917
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f9a3d6c1e8b2'
+down_revision = 'e2b9c5a7d3f8'
+branch_labels = None
+depends_on = None
+
+# Postgres combines the indexes of an OR of term filters only when every column of the OR is indexed,
+# these are the columns searched next to the ones indexed by b7c2e9a4f1d3_add_trigram_search_indexes
+SEARCHED_COLUMNS = [
+    ('organization_group', ['groupUri']),
+    ('environment', ['region']),
+    ('tenant_policy', ['principalId']),
+    ('vpc', ['label', 'VpcId']),
+    ('dataset', ['region']),
+    ('dataset_table', ['GlueTableName']),
+    ('dataset_storage_location', ['label', 'S3Prefix']),
+    ('dataset_table_column', ['description']),
+    ('glossary_node', ['readme']),
+    ('dashboard', ['description']),
+    ('dashboardshare', ['SamlGroupName']),
+    ('datapipeline', ['description']),
+    ('sagemaker_notebook', ['description']),
+    ('sagemaker_studio_user_profile', ['label', 'description']),
+    ('worksheet', ['description']),
+    ('redshift_connection', ['description']),
+    ('redshift_table', ['name', 'label']),
+    ('omics_workflow', ['id', 'name']),
+    ('omics_run', ['label', 'description']),
+    ('feed_message', ['content', 'creator']),
+]
+
+
+def _index_name(table, column):
+    return f'ix_{table}_{column}_trgm'
+
+
+def upgrade():
+    for table, columns in SEARCHED_COLUMNS:
+        for column in columns:
+            op.create_index(
+                _index_name(table, column),
+                table,
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+            )
+
+
+def downgrade():
+    for table, columns in reversed(SEARCHED_COLUMNS):
+        for column in columns:
+            op.drop_index(_index_name(table, column), table_name=table)
@@ -1,10 +1,12 @@
 import json
 import os
 
+from dataall.base.config import config
 from dataall.base.context import RequestContext, set_context
 from dataall.base.db import get_engine
 from dataall.base.searchproxy import connect, run_query
 from dataall.base.utils.api_handler_utils import validate_and_block_if_maintenance_window, extract_groups
+from dataall.core.permissions.services.tenant_policy_service import TenantPolicyValidationService
 from dataall.modules.maintenance.api.enums import MaintenanceModes
 
 
@@ -13,6 +15,15 @@ es = connect(envname=ENVNAME)
 ENGINE = get_engine(envname=ENVNAME)
 
 
+def search_groups(groups):
+    """Groups the catalog search of the user is restricted to, None if the user can find every document"""
+    if not config.get_property('core.features.restrict_catalog_search_to_organization_teams', False):
+        return None
+    if TenantPolicyValidationService.is_tenant_admin(groups):
+        return None
+    return groups
+
+
 def handler(event, context):
     print('Received event')
     print(event)
@@ -57,7 +68,7 @@ def handler(event, context):
             print(body)
             success = True
             try:
-                response = run_query(es, 'dataall-index', body)
+                response = run_query(es, 'dataall-index', body, groups=search_groups(groups))
             except Exception:
                 success = False
                 response = {}
@@ -195,6 +195,7 @@ class BackendStack(Stack):
             email_notification_sender_email_id=email_sender,
             email_custom_domain=ses_stack.ses_identity.email_identity_name if ses_stack is not None else None,
             ses_configuration_set=ses_stack.configuration_set.configuration_set_name if ses_stack is not None else None,
+            ses_email_template=ses_stack.email_template_name if ses_stack is not None else None,
             custom_domain=custom_domain,
             custom_auth=custom_auth,
             custom_waf_rules=custom_waf_rules,
@@ -221,6 +222,7 @@ class BackendStack(Stack):
             ],
             email_custom_domain=ses_stack.ses_identity.email_identity_name if ses_stack is not None else None,
             ses_configuration_set=ses_stack.configuration_set.configuration_set_name if ses_stack is not None else None,
+            ses_email_template=ses_stack.email_template_name if ses_stack is not None else None,
             custom_domain=custom_domain,
             **kwargs,
         )
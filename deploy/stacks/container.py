@@ -33,6 +33,7 @@ class ContainerStack(pyNestedClass):
         lambdas=None,
         email_custom_domain=None,
         ses_configuration_set=None,
+        ses_email_template=None,
         custom_domain=None,
         **kwargs,
     ):
@@ -65,6 +66,8 @@ class ContainerStack(pyNestedClass):
                 + custom_domain.get('hosted_zone_name')
             )
             self.env_vars.update({'email_sender_id': email_sender})
+        if ses_email_template:
+            self.env_vars.update({'email_template_name': ses_email_template})
 
         cluster = ecs.Cluster(
             self,
@@ -75,7 +78,7 @@ class ContainerStack(pyNestedClass):
         )
 
         self.task_role = self.create_task_role(
-            envname, resource_prefix, pivot_role_name, email_custom_domain, ses_configuration_set
+            envname, resource_prefix, pivot_role_name, email_custom_domain, ses_configuration_set, ses_email_template
         )
 
         self.cicd_stacks_updater_role = self.create_cicd_stacks_updater_role(
@@ -192,12 +195,14 @@ class ContainerStack(pyNestedClass):
 
         self.add_catalog_indexer_task()
         self.add_sync_dataset_table_task()
+        self.add_redshift_metadata_sync_task()
         self.add_subscription_task()
         self.add_share_management_task()
         self.add_share_verifier_task()
         self.add_share_reapplier_task()
         self.add_omics_fetch_workflows_task()
         self.add_persistent_email_reminders_task()
+        self.add_notifications_archiver_task()
 
     @run_if(['modules.s3_datasets.active', 'modules.dashboards.active'])
     def add_catalog_indexer_task(self):
@@ -362,6 +367,31 @@ class ContainerStack(pyNestedClass):
         )
         self.ecs_task_definitions_families.append(persistent_email_reminders_task.task_definition.family)
 
+    def add_notifications_archiver_task(self):
+        notifications_archiver_task, notifications_archiver_task_def = self.set_scheduled_task(
+            cluster=self.ecs_cluster,
+            command=[
+                'python3.9',
+                '-m',
+                'dataall.modules.notifications.tasks.notifications_archiver_task',
+            ],
+            container_id='container',
+            ecr_repository=self._ecr_repository,
+            environment=self.env_vars,
+            image_tag=self._cdkproxy_image_tag,
+            log_group=self.create_log_group(
+                self._envname, self._resource_prefix, log_group_name='notifications-archiver'
+            ),
+            schedule_expression=Schedule.expression('cron(0 3 * * ? *)'),  # Run at 3:00 AM UTC every day
+            scheduled_task_id=f'{self._resource_prefix}-{self._envname}-notifications-archiver-schedule',
+            task_id=f'{self._resource_prefix}-{self._envname}-notifications-archiver',
+            task_role=self.task_role,
+            vpc=self._vpc,
+            security_group=self.scheduled_tasks_sg,
+            prod_sizing=self._prod_sizing,
+        )
+        self.ecs_task_definitions_families.append(notifications_archiver_task.task_definition.family)
+
     @run_if(['modules.s3_datasets.active'])
     def add_subscription_task(self):
         subscriptions_task, subscription_task_def = self.set_scheduled_task(
@@ -406,6 +436,28 @@ class ContainerStack(pyNestedClass):
         )
         self.ecs_task_definitions_families.append(sync_tables_task.task_definition.family)
 
+    @run_if(['modules.redshift_datasets.active'])
+    def add_redshift_metadata_sync_task(self):
+        redshift_metadata_sync_task, redshift_metadata_sync_task_def = self.set_scheduled_task(
+            cluster=self.ecs_cluster,
+            command=['python3.9', '-m', 'dataall.modules.redshift_datasets.tasks.redshift_metadata_syncer'],
+            container_id='container',
+            ecr_repository=self._ecr_repository,
+            environment=self._create_env('INFO'),
+            image_tag=self._cdkproxy_image_tag,
+            log_group=self.create_log_group(
+                self._envname, self._resource_prefix, log_group_name='redshift-metadata-syncer'
+            ),
+            schedule_expression=Schedule.expression('rate(1 hour)'),
+            scheduled_task_id=f'{self._resource_prefix}-{self._envname}-redshift-metadata-syncer-schedule',
+            task_id=f'{self._resource_prefix}-{self._envname}-redshift-metadata-syncer',
+            task_role=self.task_role,
+            vpc=self._vpc,
+            security_group=self.scheduled_tasks_sg,
+            prod_sizing=self._prod_sizing,
+        )
+        self.ecs_task_definitions_families.append(redshift_metadata_sync_task.task_definition.family)
+
     @run_if(['modules.omics.active'])
     def add_omics_fetch_workflows_task(self):
         fetch_omics_workflows_task, fetch_omics_workflows_task_def = self.set_scheduled_task(
@@ -530,7 +582,13 @@ class ContainerStack(pyNestedClass):
         return cicd_stacks_updater_role
 
     def create_task_role(
-        self, envname, resource_prefix, pivot_role_name, email_custom_domain=None, ses_configuration_set=None
+        self,
+        envname,
+        resource_prefix,
+        pivot_role_name,
+        email_custom_domain=None,
+        ses_configuration_set=None,
+        ses_email_template=None,
     ):
         role_inline_policy = iam.Policy(
             self,
@@ -631,6 +689,18 @@ class ContainerStack(pyNestedClass):
                     ],
                 )
             )
+        if email_custom_domain and ses_configuration_set and ses_email_template:
+            role_inline_policy.document.add_statements(
+                iam.PolicyStatement(
+                    actions=['ses:SendBulkEmail'],
+                    resources=[
+                        f'arn:aws:ses:{self.region}:{self.account}:identity/{email_custom_domain}',
+                        f'arn:aws:ses:{self.region}:{self.account}:configuration-set/{ses_configuration_set}',
+                        f'arn:aws:ses:{self.region}:{self.account}:template/{ses_email_template}',
+                    ],
+                ),
+                iam.PolicyStatement(actions=['ses:GetAccount'], resources=['*']),
+            )
 
         task_role = iam.Role(
             self,
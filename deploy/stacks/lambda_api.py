@@ -19,6 +19,7 @@ from aws_cdk import (
     Fn,
     RemovalPolicy,
     BundlingOptions,
+    Size,
 )
 from aws_cdk.aws_ec2 import (
     InterfaceVpcEndpoint,
@@ -55,6 +56,7 @@ class LambdaApiStack(pyNestedClass):
         email_notification_sender_email_id=None,
         email_custom_domain=None,
         ses_configuration_set=None,
+        ses_email_template=None,
         custom_domain=None,
         custom_auth=None,
         **kwargs,
@@ -162,6 +164,8 @@ class LambdaApiStack(pyNestedClass):
             'LOG_LEVEL': 'INFO',
             'email_sender_id': email_notification_sender_email_id,
         }
+        if ses_email_template:
+            awshandler_env['email_template_name'] = ses_email_template
         self.aws_handler = _lambda.DockerImageFunction(
             self,
             'AWSWorker',
@@ -203,6 +207,18 @@ class LambdaApiStack(pyNestedClass):
                     ],
                 )
             )
+        if email_custom_domain is not None and ses_email_template is not None:
+            self.aws_handler.add_to_role_policy(
+                iam.PolicyStatement(
+                    actions=['ses:SendBulkEmail'],
+                    resources=[
+                        f'arn:aws:ses:{self.region}:{self.account}:identity/{email_custom_domain}',
+                        f'arn:aws:ses:{self.region}:{self.account}:configuration-set/{ses_configuration_set}',
+                        f'arn:aws:ses:{self.region}:{self.account}:template/{ses_email_template}',
+                    ],
+                )
+            )
+            self.aws_handler.add_to_role_policy(iam.PolicyStatement(actions=['ses:GetAccount'], resources=['*']))
 
         if custom_auth is not None:
             # Create the custom authorizer lambda
@@ -638,6 +654,8 @@ class LambdaApiStack(pyNestedClass):
                 backend_api_name,
                 rest_api_name=backend_api_name,
                 deploy_options=api_deploy_options,
+                # responses of the GraphQL API and of the search proxy are gzipped for clients accepting it
+                min_compression_size=Size.kibibytes(1),
                 endpoint_configuration=apigw.EndpointConfiguration(
                     types=[apigw.EndpointType.PRIVATE], vpc_endpoints=[api_vpc_endpoint]
                 ),
@@ -649,6 +667,7 @@ class LambdaApiStack(pyNestedClass):
                 backend_api_name,
                 rest_api_name=backend_api_name,
                 deploy_options=api_deploy_options,
+                min_compression_size=Size.kibibytes(1),
             )
         api_url = gw.url
         integration = apigw.LambdaIntegration(api_handler)
@@ -90,3 +90,16 @@ class SesStack(pyNestedClass):
         )
 
         self.ses_identity.apply_removal_policy(RemovalPolicy.DESTROY)
+
+        # Template of the notification emails sent in bulk, the backend renders the subject and the html body
+        self.email_template_name = f'{resource_prefix}-{envname}-notification-template'
+        email_template = ses.CfnTemplate(
+            self,
+            f'{resource_prefix}-{envname}-SES-Notification-Template',
+            template=ses.CfnTemplate.TemplateProperty(
+                template_name=self.email_template_name,
+                subject_part='{{{subject}}}',
+                html_part='{{{message}}}',
+            ),
+        )
+        email_template.apply_removal_policy(RemovalPolicy.DESTROY)
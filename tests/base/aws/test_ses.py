@@ -0,0 +1,54 @@
+from unittest.mock import MagicMock
+
+from dataall.base.aws.ses import NOT_SENT_RESULT, Ses
+
+
+def _ses_client(mocker):
+    client = MagicMock()
+    client.get_account.return_value = {'SendQuota': {'MaxSendRate': 1000.0}}
+    client.send_bulk_email.side_effect = lambda BulkEmailEntries, **kwargs: {
+        'BulkEmailEntryResults': [
+            {'Status': 'SUCCESS', 'MessageId': entry['Destination']['ToAddresses'][0]} for entry in BulkEmailEntries
+        ]
+    }
+    mocker.patch('dataall.base.aws.ses.boto3.client', return_value=client)
+    return client
+
+
+def test_send_bulk_email_in_batches(mocker):
+    client = _ses_client(mocker)
+    emails = [f'user-{i}@email.com' for i in range(120)]
+
+    results = Ses('noreply@email.com', 'template').send_bulk_email(emails, 'message', 'subject')
+
+    assert client.send_bulk_email.call_count == 3
+    batch_sizes = sorted(len(call.kwargs['BulkEmailEntries']) for call in client.send_bulk_email.call_args_list)
+    assert batch_sizes == [20, 50, 50]
+    assert [email for email, _ in results] == emails
+    assert all(result['MessageId'] == email for email, result in results)
+    template = client.send_bulk_email.call_args.kwargs['DefaultContent']['Template']
+    assert template['TemplateName'] == 'template'
+    assert template['TemplateData'] == '{"subject": "subject", "message": "message"}'
+
+
+def test_send_bulk_email_without_recipients(mocker):
+    client = _ses_client(mocker)
+
+    assert Ses('noreply@email.com', 'template').send_bulk_email([], 'message', 'subject') == []
+    client.send_bulk_email.assert_not_called()
+
+
+def test_send_bulk_email_does_not_wait_past_the_time_budget(mocker):
+    client = _ses_client(mocker)
+    client.get_account.return_value = {'SendQuota': {'MaxSendRate': 1.0}}
+    sleep = mocker.patch('dataall.base.aws.ses.time.sleep')
+    emails = [f'user-{i}@email.com' for i in range(120)]
+
+    results = Ses('noreply@email.com', 'template').send_bulk_email(emails, 'message', 'subject', max_wait_seconds=10)
+
+    # At 1 email per second the second batch could only be sent after 50 seconds
+    assert client.send_bulk_email.call_count == 1
+    sleep.assert_not_called()
+    not_sent = [email for email, result in results if result is NOT_SENT_RESULT]
+    assert len(not_sent) == 70
+    assert sorted(email for email, _ in results) == sorted(emails)
@@ -0,0 +1,29 @@
+import pytest
+from sqlalchemy import literal, select
+
+from dataall.base.db import term_filter
+
+
+@pytest.mark.parametrize(
+    'value,term,matches',
+    [
+        ('Sales Dataset', 'dataset', True),
+        ('Sales Dataset', 'les da', True),
+        ('Sales Dataset', 'marketing', False),
+        ('100% sure', '0%', True),
+        ('100 sure', '0%', False),
+        ('my_table', 'y_t', True),
+        ('mystable', 'y_t', False),
+        ('C:\\data', ':\\d', True),
+    ],
+)
+def test_term_filter_matches_term_literally(db, value, term, matches):
+    with db.scoped_session() as session:
+        result = session.execute(select([term_filter(term, literal(value))])).scalar()
+    assert result is matches
+
+
+def test_term_filter_matches_any_column(db):
+    with db.scoped_session() as session:
+        result = session.execute(select([term_filter('team', literal('Sales'), literal('Owned by team A'))])).scalar()
+    assert result is True
@@ -0,0 +1,86 @@
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import event
+
+from dataall.base.api import resolver_adapter
+from dataall.base.db.instrumentation import SqlInstrumentation
+from dataall.core.permissions.db.tenant.tenant_repositories import TenantRepository
+
+
+@pytest.fixture
+def instrumentation(db, mocker, monkeypatch):
+    monkeypatch.setenv('envname', 'local')
+    settings = {
+        'enabled': True,
+        'statements_budget': 50,
+        'db_time_budget_ms': 1000,
+        'slowest_statements': 1,
+        'graphql_extensions': True,
+    }
+    mocker.patch.object(SqlInstrumentation, 'settings', return_value=settings)
+    SqlInstrumentation.instrument(db.engine)
+    yield settings
+    event.remove(db.engine, 'before_cursor_execute', SqlInstrumentation._before_execute)
+    event.remove(db.engine, 'after_cursor_execute', SqlInstrumentation._after_execute)
+
+
+def _resolve(db, field_name, resolver):
+    info = MagicMock(context={'engine': db, 'username': 'alice', 'groups': [], 'schema': None}, field_name=field_name)
+    info.parent_type.name = 'Query'
+    return resolver_adapter(resolver)(None, info)
+
+
+def _find_tenant(context, source):
+    with context.engine.scoped_session() as session:
+        TenantRepository.find_tenant_by_name(session, 'dataall')
+        TenantRepository.find_tenant_by_name(session, 'dataall')
+
+
+def test_statements_are_recorded_per_resolver(db, instrumentation):
+    with SqlInstrumentation.record_operation('GetTenant') as recorded:
+        _resolve(db, 'getTenant', _find_tenant)
+
+    assert recorded.statements == 2
+    assert recorded.resolvers['Query.getTenant'].statements == 2
+    extensions = SqlInstrumentation.graphql_extensions(recorded)['sqlStatements']
+    assert extensions['operation'] == 'GetTenant'
+    assert len(extensions['slowest']) == 1
+    assert (
+        extensions['slowest'][0]['caller']
+        == 'dataall.core.permissions.db.tenant.tenant_repositories.find_tenant_by_name'
+    )
+    assert extensions['slowest'][0]['statement'].startswith('SELECT')
+
+
+def test_statements_are_not_recorded_outside_operations(db, instrumentation):
+    _resolve(db, 'getTenant', _find_tenant)
+    assert SqlInstrumentation.current() is None
+
+
+def test_budget_exceeded_is_logged(db, instrumentation, caplog):
+    instrumentation['statements_budget'] = 1
+    with caplog.at_level(logging.WARNING):
+        with SqlInstrumentation.record_operation('GetTenant'):
+            _resolve(db, 'getTenant', _find_tenant)
+
+    assert 'Operation GetTenant exceeded its SQL budget of 1 statements' in caplog.text
+
+
+def test_graphql_extensions_are_not_returned_in_deployed_envs(db, instrumentation, monkeypatch):
+    monkeypatch.setenv('envname', 'prod')
+    with SqlInstrumentation.record_operation('GetTenant') as recorded:
+        _resolve(db, 'getTenant', _find_tenant)
+
+    assert recorded.statements == 2
+    assert SqlInstrumentation.graphql_extensions(recorded) is None
+
+
+def test_disabled_instrumentation_records_nothing(db, mocker):
+    mocker.patch.object(SqlInstrumentation, 'settings', return_value={'enabled': False})
+    with SqlInstrumentation.record_operation('GetTenant') as recorded:
+        _resolve(db, 'getTenant', _find_tenant)
+
+    assert recorded is None
+    assert SqlInstrumentation.graphql_extensions(recorded) is None
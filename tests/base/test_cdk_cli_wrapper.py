@@ -0,0 +1,62 @@
+import json
+
+from dataall.base.cdkproxy import cdk_cli_wrapper
+from dataall.base.cdkproxy.cdk_cli_wrapper import cloud_assembly_fingerprint, describe_unchanged_stack
+from dataall.base.cdkproxy.stacks import stack as register_stack
+from dataall.base.cdkproxy.synth_worker import CdkSynthWorker
+from dataall.core.stacks.db.stack_models import Stack
+
+
+def _write_assembly(path, template):
+    (path / 'manifest.json').write_text(json.dumps({'version': '36.0.0', 'artifacts': {}}))
+    (path / 'stack.template.json').write_text(json.dumps(template, indent=1))
+    (path / 'stack.assets.json').write_text(json.dumps({'files': {'abc123': {}}}))
+    (path / 'tree.json').write_text(json.dumps({'id': str(path)}))
+
+
+def test_cloud_assembly_fingerprint(tmp_path):
+    first, second, changed = tmp_path / 'first', tmp_path / 'second', tmp_path / 'changed'
+    for path in (first, second, changed):
+        path.mkdir()
+    _write_assembly(first, {'Resources': {'Bucket': {'Type': 'AWS::S3::Bucket'}}, 'Outputs': {}})
+    _write_assembly(second, {'Outputs': {}, 'Resources': {'Bucket': {'Type': 'AWS::S3::Bucket'}}})
+    _write_assembly(changed, {'Resources': {'Queue': {'Type': 'AWS::SQS::Queue'}}, 'Outputs': {}})
+
+    assert cloud_assembly_fingerprint(first) == cloud_assembly_fingerprint(second)
+    assert cloud_assembly_fingerprint(first) != cloud_assembly_fingerprint(changed)
+
+
+def test_describe_unchanged_stack(mocker):
+    stack = Stack(name='stack', templateFingerprint='fingerprint')
+    describe = mocker.patch.object(
+        cdk_cli_wrapper, 'describe_stack', return_value={'StackId': 'id', 'StackStatus': 'UPDATE_COMPLETE'}
+    )
+    assert describe_unchanged_stack(stack, 'fingerprint') == {'StackId': 'id', 'StackStatus': 'UPDATE_COMPLETE'}
+    assert describe_unchanged_stack(stack, 'other') is None
+
+    describe.return_value = {'StackId': 'id', 'StackStatus': 'UPDATE_ROLLBACK_COMPLETE'}
+    assert describe_unchanged_stack(stack, 'fingerprint') is None
+
+    describe.side_effect = Exception('Stack does not exist')
+    assert describe_unchanged_stack(stack, 'fingerprint') is None
+
+
+def test_synth_worker(tmp_path, mocker):
+    from aws_cdk import Stack as CdkStack, aws_sqs as sqs
+
+    @register_stack(stack='synthworkertest')
+    class SynthWorkerTestStack(CdkStack):
+        def __init__(self, scope, id, target_uri=None, **kwargs):
+            super().__init__(scope, id, **kwargs)
+            sqs.Queue(self, 'Queue', queue_name=target_uri)
+
+    mocker.patch.object(CdkSynthWorker, '_feature_flags', {})
+    stack = Stack(name='synth-worker-test', accountid='111111111111', region='eu-west-1', targetUri='queue')
+
+    stack.stack = 'synthworkertest'
+    assert CdkSynthWorker.synth(stack, str(tmp_path))
+    template = json.loads((tmp_path / 'synth-worker-test.template.json').read_text())
+    assert template['Resources']['Queue4A7E3555']['Properties']['QueueName'] == 'queue'
+
+    stack.stack = 'unknown'
+    assert not CdkSynthWorker.synth(stack, str(tmp_path / 'unknown'))
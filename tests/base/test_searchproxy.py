@@ -0,0 +1,78 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from dataall.base.searchproxy import run_query
+from dataall.base.searchproxy.search import RESULT_SOURCE_FIELDS
+
+
+def _ndjson(*searches):
+    return (
+        '\n'.join(line for search in searches for line in [json.dumps({'preference': 'x'}), json.dumps(search)]) + '\n'
+    )
+
+
+def test_single_search_is_filtered():
+    es = MagicMock()
+
+    run_query(
+        es, 'dataall-index', _ndjson({'query': {'match_all': {}}, '_source': {'includes': ['*'], 'excludes': []}})
+    )
+
+    es.msearch.assert_not_called()
+    kwargs = es.search.call_args.kwargs
+    assert kwargs['index'] == 'dataall-index'
+    assert kwargs['body']['_source'] == {'includes': RESULT_SOURCE_FIELDS, 'excludes': []}
+    assert 'hits.hits._source' in kwargs['filter_path']
+
+
+def test_explicit_source_is_kept():
+    es = MagicMock()
+
+    run_query(es, 'dataall-index', _ndjson({'size': 0, '_source': {'includes': ['label']}}))
+
+    assert es.search.call_args.kwargs['body']['_source'] == {'includes': ['label']}
+
+
+def test_multi_search_is_passed_through():
+    es = MagicMock()
+
+    run_query(es, 'dataall-index', _ndjson({'query': {'match_all': {}}}, {'size': 0, 'aggs': {}}))
+
+    es.search.assert_not_called()
+    kwargs = es.msearch.call_args.kwargs
+    assert kwargs['body'][0::2] == [{'index': 'dataall-index'}, {'index': 'dataall-index'}]
+    assert [search.get('size') for search in kwargs['body'][1::2]] == [None, 0]
+    assert 'responses.hits.hits._source' in kwargs['filter_path']
+
+
+def test_search_is_restricted_to_groups():
+    es = MagicMock()
+
+    run_query(es, 'dataall-index', _ndjson({'query': {'match': {'label': 'sales'}}}), groups=['Engineers'])
+
+    query = es.search.call_args.kwargs['body']['query']['bool']
+    assert query['must'] == [{'match': {'label': 'sales'}}]
+    assert {'terms': {'allowedGroups': ['Engineers']}} in query['filter'][0]['bool']['should']
+
+
+@pytest.mark.parametrize(
+    'aggs',
+    [
+        {'x': {'global': {}, 'aggs': {'docs': {'top_hits': {'size': 100}}}}},
+        {
+            'types': {
+                'terms': {'field': 'resourceKind'},
+                'aggregations': {'all': {'global': {}, 'aggs': {'docs': {'top_hits': {'size': 100}}}}},
+            }
+        },
+    ],
+)
+def test_global_aggregations_are_refused_when_restricted_to_groups(aggs):
+    es = MagicMock()
+
+    with pytest.raises(ValueError):
+        run_query(es, 'dataall-index', _ndjson({'query': {'match_all': {}}, 'aggs': aggs}), groups=['Engineers'])
+
+    es.search.assert_not_called()
@@ -0,0 +1,51 @@
+from dataall.base.utils.ttl_cache import TTLCache
+
+
+def test_cached_value_is_returned_until_expiry(mocker):
+    clock = mocker.patch('dataall.base.utils.ttl_cache.time.monotonic', return_value=100)
+    cache = TTLCache(ttl_seconds=10)
+    cache.set('key', 'value')
+
+    clock.return_value = 109
+    assert cache.get('key') == 'value'
+
+    clock.return_value = 110
+    assert cache.get('key') is None
+
+
+def test_get_or_set_calls_factory_once():
+    cache = TTLCache(ttl_seconds=60)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return None
+
+    # None is a valid cached value as well
+    assert cache.get_or_set('key', compute) is None
+    assert cache.get_or_set('key', compute) is None
+    assert len(calls) == 1
+
+
+def test_invalidate():
+    cache = TTLCache(ttl_seconds=60)
+    cache.set('a', 1)
+    cache.set('b', 2)
+
+    cache.invalidate('a')
+    assert cache.get('a') is None
+    assert cache.get('b') == 2
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_oldest_entry_is_evicted_when_full():
+    cache = TTLCache(ttl_seconds=60, max_size=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.set('c', 3)
+
+    assert cache.get('a') is None
+    assert cache.get('b') == 2
+    assert cache.get('c') == 3
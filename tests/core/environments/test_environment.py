@@ -1,10 +1,12 @@
 from dataall.core.environment.api.enums import EnvironmentPermission
-from dataall.core.environment.db.environment_models import Environment
+from dataall.core.environment.db.environment_models import Environment, EnvironmentGroup
 from dataall.core.environment.services.environment_service import EnvironmentService
 from dataall.core.permissions.services.environment_permissions import (
     REMOVE_ENVIRONMENT_CONSUMPTION_ROLE,
 )
 from dataall.core.permissions.services.resource_policy_service import ResourcePolicyService
+from dataall.core.stacks.api.enums import StackStatus
+from dataall.core.stacks.db.stack_repositories import StackRepository
 
 
 def get_env(client, env_fixture, group):
@@ -342,6 +344,72 @@ def test_list_environment_role_filter_as_admin(db, client, org_fixture, env_fixt
     assert response.data.listEnvironments.count == 1
 
 
+def _list_environment_roles(client, username, groups):
+    response = client.query(
+        """
+        query ListEnvironments($filter:EnvironmentFilter){
+            listEnvironments(filter:$filter){
+                nodes{
+                    environmentUri
+                    userRoleInEnvironment
+                }
+            }
+        }
+        """,
+        username=username,
+        groups=groups,
+    )
+    return {node.environmentUri: node.userRoleInEnvironment for node in response.data.listEnvironments.nodes}
+
+
+def test_list_environments_user_role(db, client, org_fixture, env_fixture, group, group2):
+    env_uri = env_fixture.environmentUri
+    assert _list_environment_roles(client, 'alice', [group.name])[env_uri] == EnvironmentPermission.Owner.name
+    assert _list_environment_roles(client, 'bob', [group.name])[env_uri] == EnvironmentPermission.Admin.name
+    assert env_uri not in _list_environment_roles(client, 'bob', [group2.name])
+
+    with db.scoped_session() as session:
+        session.add(EnvironmentGroup(environmentUri=env_uri, groupUri=group2.name))
+    try:
+        assert _list_environment_roles(client, 'bob', [group2.name])[env_uri] == EnvironmentPermission.Invited.name
+    finally:
+        with db.scoped_session() as session:
+            session.query(EnvironmentGroup).filter(
+                EnvironmentGroup.environmentUri == env_uri, EnvironmentGroup.groupUri == group2.name
+            ).delete()
+
+
+def test_list_valid_environments(db, client, org_fixture, env_fixture, group):
+    query = """
+        query ListValidEnvironments($filter:EnvironmentFilter){
+            listValidEnvironments(filter:$filter){
+                count
+                nodes{
+                    environmentUri
+                }
+            }
+        }
+    """
+    with db.scoped_session() as session:
+        stack = StackRepository.find_stack_by_target_uri(session, env_fixture.environmentUri)
+        previous_status = stack.status
+        stack.status = StackStatus.CREATE_COMPLETE.value
+    try:
+        response = client.query(query, username='alice', groups=[group.name])
+        assert response.data.listValidEnvironments.count == 1
+        assert response.data.listValidEnvironments.nodes[0].environmentUri == env_fixture.environmentUri
+
+        with db.scoped_session() as session:
+            StackRepository.find_stack_by_target_uri(
+                session, env_fixture.environmentUri
+            ).status = StackStatus.CREATE_FAILED.value
+        response = client.query(query, username='alice', groups=[group.name])
+        assert response.data.listValidEnvironments.count == 0
+    finally:
+        with db.scoped_session() as session:
+            StackRepository.find_stack_by_target_uri(session, env_fixture.environmentUri).status = previous_status
+
+
 def test_paging(db, client, org_fixture, env_fixture, user, group):
     for i in range(1, 30):
         with db.scoped_session() as session:
@@ -1,6 +1,7 @@
 import pytest
 
 from dataall.core.permissions.db.permission.permission_models import PermissionType
+from dataall.core.permissions.db.tenant.tenant_policy_repositories import TenantPolicyRepository
 from dataall.core.permissions.services.permission_service import PermissionService
 from dataall.base.db import exceptions
 from dataall.core.permissions.services.environment_permissions import ENVIRONMENT_ALL
@@ -62,3 +63,31 @@ def test_unauthorized_tenant_policy(db, group):
                 permission_name='UNKNOW_PERMISSION',
                 tenant_name='dataall',
             )
+
+
+def test_tenant_permissions_are_cached_until_changed(db, group, mocker):
+    check = dict(
+        username='alice',
+        groups=[group.name],
+        permission_name=MANAGE_GROUPS,
+        tenant_name=TenantPolicyService.TENANT_NAME,
+    )
+    with db.scoped_session() as session:
+        TenantPolicyService.attach_group_tenant_policy(
+            session=session,
+            group=group.name,
+            permissions=[MANAGE_GROUPS],
+            tenant_name=TenantPolicyService.TENANT_NAME,
+        )
+    with db.scoped_session() as session:
+        assert TenantPolicyService.check_user_tenant_permission(session=session, **check)
+        load = mocker.spy(TenantPolicyRepository, 'list_groups_tenant_permission_names')
+        assert TenantPolicyService.check_user_tenant_permission(session=session, **check)
+        load.assert_not_called()
+
+        TenantPolicyService.delete_tenant_policy(
+            session=session, group=group.name, tenant_name=TenantPolicyService.TENANT_NAME
+        )
+        with pytest.raises(exceptions.TenantUnauthorized):
+            TenantPolicyService.check_user_tenant_permission(session=session, **check)
+        load.assert_called_once()
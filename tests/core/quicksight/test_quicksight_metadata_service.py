@@ -0,0 +1,119 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from dataall.base.aws.quicksight import QuicksightClient
+from dataall.core.quicksight.db.quicksight_models import QuicksightAccountMetadata
+from dataall.core.quicksight.db.quicksight_repositories import QuicksightAccountMetadataRepository
+from dataall.core.quicksight.services.quicksight_metadata_service import QuicksightMetadataService
+
+ACCOUNT_ID = '123456789012'
+REGION = 'eu-west-1'
+GROUP_ARN = f'arn:aws:quicksight:us-east-1:{ACCOUNT_ID}:group/default/dataall'
+
+
+@pytest.fixture(autouse=True)
+def clear_metadata(db):
+    QuicksightClient._identity_regions.invalidate()
+    QuicksightClient._groups.invalidate()
+    yield
+    with db.scoped_session() as session:
+        session.query(QuicksightAccountMetadata).delete()
+
+
+@pytest.fixture
+def quicksight(mocker):
+    discover = mocker.patch.object(QuicksightClient, '_discover_identity_region', return_value='us-east-1')
+    subscription = mocker.patch.object(
+        QuicksightClient,
+        'get_account_subscription',
+        return_value={'Edition': 'ENTERPRISE', 'AccountSubscriptionStatus': 'ACCOUNT_CREATED'},
+    )
+    create_group = mocker.patch.object(
+        QuicksightClient, 'create_quicksight_group', return_value={'Group': {'Arn': GROUP_ARN}}
+    )
+    yield discover, subscription, create_group
+
+
+def test_metadata_is_discovered_once_and_persisted(db, quicksight):
+    discover, subscription, create_group = quicksight
+    for _ in range(2):
+        with db.scoped_session() as session:
+            assert QuicksightMetadataService.get_identity_region(session, ACCOUNT_ID, REGION) == 'us-east-1'
+            assert QuicksightMetadataService.check_enterprise_subscription(session, ACCOUNT_ID, REGION)
+            assert QuicksightMetadataService.get_default_group_arn(session, ACCOUNT_ID, REGION) == GROUP_ARN
+
+    discover.assert_called_once()
+    subscription.assert_called_once()
+    create_group.assert_called_once()
+
+    # a new container reads the persisted metadata and primes the in-process cache
+    QuicksightClient._identity_regions.invalidate()
+    with db.scoped_session() as session:
+        assert QuicksightMetadataService.get_identity_region(session, ACCOUNT_ID, REGION) == 'us-east-1'
+    assert QuicksightClient.get_identity_region(ACCOUNT_ID, REGION) == 'us-east-1'
+    discover.assert_called_once()
+
+
+def test_stale_metadata_is_rediscovered(db, quicksight):
+    discover, subscription, create_group = quicksight
+    with db.scoped_session() as session:
+        session.add(
+            QuicksightAccountMetadata(
+                AwsAccountId=ACCOUNT_ID,
+                identityRegion='eu-central-1',
+                edition='ENTERPRISE',
+                subscriptionStatus='ACCOUNT_CREATED',
+                defaultGroupArn='old-arn',
+                lastSynced=datetime.now() - timedelta(days=30),
+            )
+        )
+
+    with db.scoped_session() as session:
+        assert QuicksightMetadataService.get_identity_region(session, ACCOUNT_ID, REGION) == 'us-east-1'
+        assert QuicksightMetadataService.get_default_group_arn(session, ACCOUNT_ID, REGION) == GROUP_ARN
+    discover.assert_called_once()
+    create_group.assert_called_once()
+
+
+def test_inactive_subscription_is_checked_again(db, quicksight):
+    discover, subscription, create_group = quicksight
+    subscription.return_value = {'Edition': 'STANDARD', 'AccountSubscriptionStatus': 'ACCOUNT_CREATED'}
+    with db.scoped_session() as session:
+        with pytest.raises(Exception, match='incorrect type'):
+            QuicksightMetadataService.check_enterprise_subscription(session, ACCOUNT_ID, REGION)
+
+    subscription.return_value = {'Edition': 'ENTERPRISE', 'AccountSubscriptionStatus': 'ACCOUNT_CREATED'}
+    with db.scoped_session() as session:
+        assert QuicksightMetadataService.check_enterprise_subscription(session, ACCOUNT_ID, REGION)
+    assert subscription.call_count == 2
+
+
+def _metadata(identity_region):
+    return {
+        'AwsAccountId': ACCOUNT_ID,
+        'identityRegion': identity_region,
+        'edition': None,
+        'subscriptionStatus': None,
+        'defaultGroupArn': None,
+        'lastSynced': datetime.now(),
+    }
+
+
+def test_concurrent_saves_of_a_new_account_do_not_conflict(db):
+    Session = sessionmaker(bind=db.engine)
+    first, second = Session(), Session()
+    try:
+        QuicksightAccountMetadataRepository.save_account_metadata(first, _metadata('us-east-1'))
+        # the second save waits for the uncommitted row of the first one
+        waiting = ThreadPoolExecutor(max_workers=1).submit(
+            QuicksightAccountMetadataRepository.save_account_metadata, second, _metadata('eu-west-1')
+        )
+        first.commit()
+        assert waiting.result(timeout=10).identityRegion == 'eu-west-1'
+        second.commit()
+    finally:
+        first.close()
+        second.close()
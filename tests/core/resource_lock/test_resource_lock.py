@@ -0,0 +1,97 @@
+import threading
+import time
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from dataall.base.db.exceptions import ResourceLockTimeout
+from dataall.core.resource_lock.db.resource_lock_models import ResourceLock
+from dataall.core.resource_lock.db.resource_lock_repositories import ResourceLockRepository
+
+RESOURCES = [('dataset-1', 'dataset'), ('env-group-1', 'environment_group')]
+
+
+@pytest.fixture
+def new_session(db):
+    sessions = []
+
+    def factory():
+        session = sessionmaker(bind=db.engine, expire_on_commit=False)()
+        sessions.append(session)
+        return session
+
+    yield factory
+    for session in sessions:
+        session.close()
+
+
+def _hold_lock(session, acquired, release, share_uri='share-1'):
+    with ResourceLockRepository.acquire_lock_with_retry(RESOURCES, session, share_uri, 'share_object'):
+        acquired.set()
+        release.wait(10)
+
+
+def test_lock_is_handed_over_on_release(db, new_session):
+    acquired, release = threading.Event(), threading.Event()
+    holder = threading.Thread(target=_hold_lock, args=(new_session(), acquired, release))
+    holder.start()
+    assert acquired.wait(10)
+
+    session = new_session()
+    with pytest.raises(ResourceLockTimeout):
+        with ResourceLockRepository.acquire_lock_with_retry(RESOURCES[:1], session, 'share-2', 'share_object', 0.2):
+            pass
+
+    threading.Timer(0.5, release.set).start()
+    started = time.monotonic()
+    with ResourceLockRepository.acquire_lock_with_retry(RESOURCES, session, 'share-2', 'share_object', 10):
+        assert time.monotonic() - started < 5
+        assert {lock.acquiredByUri for lock in session.query(ResourceLock)} == {'share-2'}
+    holder.join()
+
+    assert session.query(ResourceLock).count() == 0
+
+
+def test_stale_lock_is_replaced(db, new_session):
+    session = new_session()
+    session.add(ResourceLock('dataset-1', 'dataset', 'crashed-share', 'share_object'))
+    session.commit()
+
+    with ResourceLockRepository.acquire_lock_with_retry(RESOURCES, session, 'share-1', 'share_object', 1):
+        assert session.query(ResourceLock).filter(ResourceLock.acquiredByUri == 'crashed-share').count() == 0
+    assert session.query(ResourceLock).count() == 0
+
+
+class _FailingUnlockConnection:
+    """Connection on which releasing a single advisory lock fails"""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.statements = []
+
+    def execute(self, statement, **params):
+        self.statements.append(str(statement))
+        if 'pg_advisory_unlock(' in str(statement):
+            raise RuntimeError('connection lost')
+        return self.connection.execute(statement, **params)
+
+    def invalidate(self):
+        self.connection.invalidate()
+
+
+def test_connection_is_discarded_when_unlock_fails(db):
+    connection = db.engine.connect()
+    failing = _FailingUnlockConnection(connection)
+    keys = ResourceLockRepository._acquire_advisory_locks(connection, RESOURCES, timeout=5)
+
+    ResourceLockRepository._release_advisory_locks(failing, keys)
+
+    assert 'SELECT pg_advisory_unlock_all()' in failing.statements
+    assert connection.invalidated
+    connection.close()
+    other = db.engine.connect()
+    try:
+        assert ResourceLockRepository._acquire_advisory_locks(other, RESOURCES, timeout=1) == keys
+        ResourceLockRepository._release_advisory_locks(other, keys)
+    finally:
+        other.close()
@@ -0,0 +1,38 @@
+from dataall.core.stacks.aws.ecs import EcsTaskTracker
+
+
+def _mock_ecs(mocker, started_by):
+    client = mocker.MagicMock()
+    task_arns = [f'arn:task/{i}' for i in range(len(started_by))]
+    client.get_paginator.return_value.paginate.return_value = [{'taskArns': task_arns}]
+    client.describe_tasks.return_value = {
+        'tasks': [{'taskArn': arn, 'startedBy': value} for arn, value in zip(task_arns, started_by)]
+    }
+    mocker.patch('dataall.core.stacks.aws.ecs.boto3.client', return_value=client)
+    return client
+
+
+def test_task_tracker_answers_from_one_snapshot(mocker):
+    client = _mock_ecs(mocker, ['awsworker-stack-1', 'awsworker-stack-2'])
+    tracker = EcsTaskTracker('cluster')
+
+    assert tracker.is_running()
+    assert tracker.is_running('awsworker-stack-1')
+    assert tracker.is_running('awsworker-stack-2')
+    assert not tracker.is_running('awsworker-stack-3')
+
+    tracker.add('awsworker-stack-3')
+    assert tracker.is_running('awsworker-stack-3')
+    assert client.get_paginator.return_value.paginate.call_count == 1
+    assert client.describe_tasks.call_count == 1
+
+
+def test_task_tracker_refreshes_the_snapshot(mocker):
+    client = _mock_ecs(mocker, ['awsworker-stack-1'])
+    tracker = EcsTaskTracker('cluster', max_age=0)
+    assert tracker.is_running('awsworker-stack-1')
+
+    client.get_paginator.return_value.paginate.return_value = [{'taskArns': []}]
+    assert not tracker.is_running('awsworker-stack-1')
+    assert not tracker.is_running()
+    client.describe_tasks.assert_called_once()
@@ -0,0 +1,120 @@
+"""
+Pytest plugin that reports the queries of the unit tests which can not be served by an index.
+
+Every SELECT/UPDATE/DELETE is explained once per calling repository function with sequential scans disabled,
+so a "Seq Scan" with a filter left in the plan means that no index matches the filter.
+Statements are tagged with the calling function, which makes them recognisable in pg_stat_statements too.
+
+Usage: make index-advisor
+To get the pg_stat_statements summary, start Postgres with -c shared_preload_libraries=pg_stat_statements
+"""
+
+import os
+import sys
+from collections import defaultdict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_EXPLAINED_STATEMENTS = ('SELECT', 'UPDATE', 'DELETE')
+_TOP_STATEMENTS = 20
+
+_explained = set()
+_seq_scans = defaultdict(set)
+
+
+def _caller():
+    """The first data.all function in the stack, the repositories usually"""
+    frame = sys._getframe(2)
+    fallback = None
+    while frame:
+        module = frame.f_globals.get('__name__', '')
+        if module.startswith('dataall.') and not module.startswith('dataall.base.db'):
+            name = f"{module}.{getattr(frame.f_code, 'co_qualname', frame.f_code.co_name)}"
+            if '.db.' in module:
+                return name
+            fallback = fallback or name
+        frame = frame.f_back
+    return fallback or 'unknown'
+
+
+def _seq_scans_with_filter(plan):
+    if plan.get('Node Type') == 'Seq Scan' and 'Filter' in plan:
+        yield plan['Relation Name'], plan['Filter']
+    for child in plan.get('Plans', []):
+        yield from _seq_scans_with_filter(child)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    caller = _caller()
+    if context is not None:
+        context._index_advisor_caller = caller
+    return f'{statement} /* caller: {caller} */', parameters
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if executemany or not statement.lstrip().upper().startswith(_EXPLAINED_STATEMENTS):
+        return
+    caller = getattr(context, '_index_advisor_caller', 'unknown')
+    sql = statement.rsplit(' /* caller: ', 1)[0]
+    if (caller, sql) in _explained:
+        return
+    _explained.add((caller, sql))
+
+    explain_cursor = conn.connection.cursor()
+    try:
+        explain_cursor.execute('SAVEPOINT index_advisor')
+        explain_cursor.execute('SET LOCAL enable_seqscan = off')
+        explain_cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', parameters)
+        plan = explain_cursor.fetchone()[0][0]['Plan']
+        explain_cursor.execute('ROLLBACK TO SAVEPOINT index_advisor')
+        for table, condition in _seq_scans_with_filter(plan):
+            _seq_scans[caller].add((table, condition))
+    except Exception:
+        explain_cursor.execute('ROLLBACK TO SAVEPOINT index_advisor')
+    finally:
+        explain_cursor.close()
+
+
+def _pg_stat_statements(query):
+    from dataall.base.db import get_engine
+
+    engine = get_engine(envname=os.environ.get('envname', 'pytest')).engine
+    try:
+        with engine.connect() as connection:
+            return connection.execute(query).fetchall()
+    except Exception:
+        return None
+    finally:
+        engine.dispose()
+
+
+def pytest_configure(config):
+    event.listen(Engine, 'before_cursor_execute', _before_cursor_execute, retval=True)
+    event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+
+
+def pytest_sessionstart(session):
+    _pg_stat_statements('CREATE EXTENSION IF NOT EXISTS pg_stat_statements; SELECT pg_stat_statements_reset()')
+
+
+def pytest_terminal_summary(terminalreporter):
+    write = terminalreporter.write_line
+    terminalreporter.section('index advisor: sequential scans per function')
+    if not _seq_scans:
+        write('No filtered sequential scans found')
+    for caller in sorted(_seq_scans):
+        write(caller)
+        for table, condition in sorted(_seq_scans[caller]):
+            write(f'    {table}: {condition}')
+
+    terminalreporter.section('index advisor: pg_stat_statements')
+    rows = _pg_stat_statements(
+        'SELECT calls, round(total_exec_time::numeric, 2) AS total_ms, query FROM pg_stat_statements '
+        f"WHERE query LIKE '%%/* caller: %%' ORDER BY total_exec_time DESC LIMIT {_TOP_STATEMENTS}"
+    )
+    if rows is None:
+        write('pg_stat_statements is not available, add it to shared_preload_libraries of the test database')
+        return
+    for calls, total_ms, query in rows:
+        write(f'{total_ms:>10} ms {calls:>6} calls  {" ".join(query.split())[:300]}')
@@ -0,0 +1,85 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from dataall.core.tasks.db.task_models import Task
+from dataall.modules.catalog.db.catalog_index_outbox_models import CatalogIndexOutbox
+from dataall.modules.catalog.indexers.base_indexer import BaseIndexer, OUTBOX_TASK_ACTION
+from dataall.modules.catalog.indexers.catalog_indexer import CatalogIndexer
+from dataall.modules.catalog.tasks.catalog_indexer_task import CatalogIndexerTask
+
+
+class RecordingIndexer(BaseIndexer):
+    upserted = []
+
+    @classmethod
+    def upsert(cls, session, target_uri):
+        cls.upserted.append(target_uri)
+
+
+@pytest.fixture(autouse=True)
+def empty_outbox(db):
+    with db.scoped_session() as session:
+        session.query(CatalogIndexOutbox).delete()
+    RecordingIndexer.upserted = []
+
+
+def _queued(db):
+    with db.scoped_session() as session:
+        return sorted(entry.targetUri for entry in session.query(CatalogIndexOutbox))
+
+
+def test_queue_upsert_deduplicates(db):
+    with db.scoped_session() as session:
+        drain_tasks = session.query(Task).filter(Task.action == OUTBOX_TASK_ACTION).count()
+        RecordingIndexer.queue_upsert(session, 'uri-1')
+        RecordingIndexer.queue_upsert(session, 'uri-1')
+        RecordingIndexer.queue_upsert(session, 'uri-2')
+
+    assert _queued(db) == ['uri-1', 'uri-2']
+    with db.scoped_session() as session:
+        # one drain is queued per transaction
+        assert session.query(Task).filter(Task.action == OUTBOX_TASK_ACTION).count() == drain_tasks + 1
+
+
+def test_drain_outbox_keeps_documents_that_failed(db, mocker):
+    with db.scoped_session() as session:
+        RecordingIndexer.queue_upsert(session, 'uri-1')
+        RecordingIndexer.queue_upsert(session, 'uri-2')
+    mocker.patch.object(BaseIndexer, '_bulk_index', return_value={'uri-2'})
+
+    assert BaseIndexer.drain_outbox(db) == 1
+    assert sorted(RecordingIndexer.upserted) == ['uri-1', 'uri-2']
+    assert _queued(db) == ['uri-2']
+
+    mocker.patch.object(BaseIndexer, '_bulk_index', return_value=set())
+    assert BaseIndexer.drain_outbox(db) == 1
+    assert _queued(db) == []
+
+
+class FailingSqlIndexer(BaseIndexer):
+    @classmethod
+    def upsert(cls, session, target_uri):
+        if target_uri == 'broken':
+            session.execute('SELECT * FROM missing_table')
+        RecordingIndexer.upserted.append(target_uri)
+
+
+def test_drain_outbox_continues_after_sql_error(db, mocker):
+    with db.scoped_session() as session:
+        FailingSqlIndexer.queue_upsert(session, 'broken')
+        FailingSqlIndexer.queue_upsert(session, 'uri-1')
+    mocker.patch.object(BaseIndexer, '_bulk_index', return_value=set())
+
+    assert BaseIndexer.drain_outbox(db) == 2
+    assert RecordingIndexer.upserted == ['uri-1']
+    assert _queued(db) == []
+
+
+def test_full_reindex_runs_when_drain_fails(db, mocker):
+    mocker.patch.object(BaseIndexer, 'drain_outbox', side_effect=Exception('OpenSearch unavailable'))
+    mocker.patch.object(CatalogIndexer, 'all', return_value=[MagicMock(**{'index.return_value': ['uri-1']})])
+    alarm = mocker.patch('dataall.modules.catalog.tasks.catalog_indexer_task.AlarmService')
+
+    assert CatalogIndexerTask.index_objects(engine=db) == 1
+    alarm.assert_not_called()
@@ -1,6 +1,7 @@
 from datetime import datetime
 
 from dataall.modules.catalog.db.glossary_models import GlossaryNode
+from dataall.modules.catalog.db.glossary_repositories import GlossaryRepository
 import pytest
 
 
@@ -138,6 +139,65 @@ def test_list_glossaries(client):
     assert response.data.listGlossaries.nodes[0].stats.categories == 2
 
 
+def _glossary_stats(client):
+    response = client.query(
+        """
+        query ListGlossaries{
+            listGlossaries{
+                nodes{
+                    stats{
+                        categories
+                        terms
+                        associations
+                    }
+                }
+            }
+        }
+        """
+    )
+    return response.data.listGlossaries.nodes[0].stats
+
+
+def test_glossary_stats_count_term_links(client, db, t1):
+    with db.scoped_session() as session:
+        GlossaryRepository.set_glossary_terms_links(session, 'alice', 'target-uri', 'Dataset', [t1.nodeUri])
+    assert _glossary_stats(client).associations == 1
+
+    with db.scoped_session() as session:
+        GlossaryRepository.set_glossary_terms_links(session, 'alice', 'target-uri', 'Dataset', [t1.nodeUri])
+    assert _glossary_stats(client).associations == 1
+
+    with db.scoped_session() as session:
+        GlossaryRepository.delete_glossary_terms_links(session, 'target-uri', 'Dataset')
+    assert _glossary_stats(client).associations == 0
+
+
+def test_glossary_tree_page(client, g1):
+    response = client.query(
+        """
+        query GetGlossary($nodeUri:String!, $filter:GlossaryNodeSearchFilter){
+            getGlossary(nodeUri:$nodeUri){
+                tree(filter:$filter){
+                    count
+                    pages
+                    hasNext
+                    nodes{
+                        __typename
+                    }
+                }
+            }
+        }
+        """,
+        nodeUri=g1.nodeUri,
+        filter={'page': 2, 'pageSize': 3},
+    )
+    tree = response.data.getGlossary.tree
+    assert tree.count == 4
+    assert tree.pages == 2
+    assert not tree.hasNext
+    assert len(tree.nodes) == 1
+
+
 def test_search_glossary(client):
     response = client.query(
         """
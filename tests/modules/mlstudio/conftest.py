@@ -9,6 +9,10 @@ def patch_aws_sagemaker_client(module_mocker):
         'dataall.modules.mlstudio.services.mlstudio_service.get_sagemaker_studio_domain',
         return_value={'DomainId': 'test'},
     )
+    module_mocker.patch(
+        'dataall.modules.mlstudio.services.mlstudio_service.list_sagemaker_studio_user_statuses',
+        return_value={},
+    )
 
 
 @pytest.fixture(scope='module', autouse=True)
@@ -20,6 +20,10 @@ def patch_aws(module_mocker):
         'dataall.modules.notebooks.services.notebook_service.client',
         return_value=MockSagemakerClient(),
     )
+    module_mocker.patch(
+        'dataall.modules.notebooks.services.notebook_service.list_notebook_instance_statuses',
+        return_value={},
+    )
 
 
 @pytest.fixture(scope='module', autouse=True)
@@ -1,5 +1,8 @@
 import pytest
 
+from dataall.modules.notebooks.db.notebook_models import SagemakerNotebook
+from dataall.modules.notebooks.services.notebook_service import NotebookService
+
 
 def test_sgm_notebook(sgm_notebook, group):
     assert sgm_notebook.notebookUri
@@ -48,6 +51,32 @@ def test_list_notebooks(client, user, group, sgm_notebook):
     assert len(response.data.listSagemakerNotebooks['nodes']) == 1
 
 
+def test_list_notebooks_status_from_snapshot(client, db, mocker, user, group, sgm_notebook):
+    with db.scoped_session() as session:
+        notebook = session.query(SagemakerNotebook).get(sgm_notebook.notebookUri)
+        instance_name = notebook.NotebookInstanceName
+    list_statuses = mocker.patch(
+        'dataall.modules.notebooks.services.notebook_service.list_notebook_instance_statuses',
+        return_value={instance_name: 'Stopped'},
+    )
+    NotebookService._status_snapshots.invalidate()
+    query = """
+        query ListSagemakerNotebooks($filter:SagemakerNotebookFilter){
+            listSagemakerNotebooks(filter:$filter){
+                nodes{
+                    NotebookInstanceStatus
+                }
+            }
+        }
+        """
+    for _ in range(2):
+        response = client.query(query, filter=None, username=user.username, groups=[group.name])
+        assert response.data.listSagemakerNotebooks['nodes'][0]['NotebookInstanceStatus'] == 'Stopped'
+
+    list_statuses.assert_called_once()
+    NotebookService._status_snapshots.invalidate()
+
+
 def test_nopermissions_list_notebooks(client, user2, group2, sgm_notebook):
     response = client.query(
         """
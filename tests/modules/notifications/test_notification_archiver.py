@@ -0,0 +1,39 @@
+from datetime import datetime, timedelta
+
+from dataall.modules.notifications.db.notification_models import Notification, NotificationArchive
+from dataall.modules.notifications.db.notification_repositories import NotificationRepository
+from dataall.modules.notifications.tasks.notifications_archiver_task import archive_read_notifications
+
+
+def _notification(session, recipient, is_read, age_days):
+    notification = NotificationRepository.create_notification(
+        session=session,
+        recipient=recipient,
+        notification_type='SHARE_OBJECT_SUBMITTED',
+        target_uri='shareUri|datasetUri',
+        message='message',
+        target_type='ShareObject',
+        share_uri='shareUri',
+        dataset_uri='datasetUri',
+    )
+    notification.is_read = is_read
+    notification.created = datetime.now() - timedelta(days=age_days)
+    session.commit()
+    return notification.notificationUri
+
+
+def test_archive_read_notifications(db):
+    with db.scoped_session() as session:
+        old_read = _notification(session, 'archiver', is_read=True, age_days=100)
+        old_unread = _notification(session, 'archiver', is_read=False, age_days=100)
+        recent_read = _notification(session, 'archiver', is_read=True, age_days=1)
+
+    assert archive_read_notifications(db, older_than_days=90) == 1
+
+    with db.scoped_session() as session:
+        remaining = session.query(Notification.notificationUri).filter(Notification.recipient == 'archiver').all()
+        assert {uri for (uri,) in remaining} == {old_unread, recent_read}
+        archived = session.query(NotificationArchive).get(old_read)
+        assert archived.share_uri == 'shareUri'
+        assert archived.archived is not None
+        assert NotificationRepository.count_read_notifications(session, 'archiver', []) == 1
@@ -4,10 +4,22 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from dataall.modules.notifications.handlers.notifications_handler import NotificationHandler
+from dataall.base.aws.ses import NOT_SENT_RESULT
+from dataall.modules.notifications.handlers.notifications_handler import (
+    EMAIL_SEND_MAX_WAIT_SECONDS,
+    NotificationHandler,
+)
+from dataall.modules.notifications.services.ses_email_notification_service import SESEmailNotificationService
 from dataall.core.tasks.db.task_models import Task
 
 
+@pytest.fixture(autouse=True)
+def clear_group_email_ids():
+    SESEmailNotificationService._group_email_ids.invalidate()
+    yield
+    SESEmailNotificationService._group_email_ids.invalidate()
+
+
 def mock_cognito_client(mocker):
     mock_client = MagicMock()
     mocker.patch('dataall.modules.notifications.services.ses_email_notification_service.Cognito', mock_client)
@@ -64,9 +76,89 @@ def test_notification_service_email(mocker, db):
         and 'datasetStewardsGroup' in group_name_list_used_for_share
         and 'requesterGroupName' in group_name_list_used_for_share
     )
-    mock_ses_client().send_email.assert_called()
-    # Check if the email send method is called three times for ["bob@email.com", "bob-1@email.com", "email@email.com"]
+    # Check if the emails are sent in one bulk request to ["bob-1@email.com", "bob@email.com", "email@email.com"]
+    mock_ses_client().send_bulk_email.assert_called_once_with(
+        ['bob-1@email.com', 'bob@email.com', 'email@email.com'], 'message', 'subject', EMAIL_SEND_MAX_WAIT_SECONDS
+    )
+    assert mock_ses_client().send_email.call_count == 0
+
+
+def _email_task(session):
+    notification_task: Task = Task(
+        action='notification.service',
+        targetUri='some_share_uri',
+        payload={
+            'notificationType': 'email',
+            'subject': 'subject',
+            'message': 'message',
+            'recipientGroupsList': ['requesterGroupName', 'datasetOwnerGroup'],
+            'recipientEmailList': ['email@email.com'],
+        },
+    )
+    session.add(notification_task)
+    session.commit()
+    return notification_task
+
+
+# Test that the emails are sent one by one when no email template is deployed
+def test_notification_service_email_without_template(mocker, db):
+    mock_ses_client = mock_ses_client_(mocker)
+    mock_ses_client().templateName = None
+    cognito_client = mock_cognito_client(mocker)
+    cognito_client().get_user_emailids_from_group.return_value = ['bob@email.com', 'bob-1@email.com']
+    mocker.patch(
+        'dataall.modules.notifications.services.ses_email_notification_service.ServiceProviderFactory.get_service_provider_instance',
+        return_value=cognito_client(),
+    )
+
+    with db.scoped_session() as session:
+        NotificationHandler.notification_service(db, _email_task(session))
+
     assert mock_ses_client().send_email.call_count == 3
+    mock_ses_client().send_bulk_email.assert_not_called()
+
+
+# Test that the members of the groups are resolved once for several notifications
+def test_notification_service_caches_group_email_ids(mocker, db):
+    mock_ses_client_(mocker)
+    cognito_client = mock_cognito_client(mocker)
+    cognito_client().get_user_emailids_from_group.return_value = ['bob@email.com']
+    mocker.patch(
+        'dataall.modules.notifications.services.ses_email_notification_service.ServiceProviderFactory.get_service_provider_instance',
+        return_value=cognito_client(),
+    )
+
+    with db.scoped_session() as session:
+        NotificationHandler.notification_service(db, _email_task(session))
+        NotificationHandler.notification_service(db, _email_task(session))
+
+    assert cognito_client().get_user_emailids_from_group.call_count == 2
+
+
+def test_notification_service_queues_the_emails_not_sent_in_time(mocker, db):
+    mock_ses_client = mock_ses_client_(mocker)
+    mock_ses_client().send_bulk_email.return_value = [
+        ('bob@email.com', {'Status': 'SUCCESS', 'MessageId': '1'}),
+        ('carol@email.com', NOT_SENT_RESULT),
+        ('dave@email.com', NOT_SENT_RESULT),
+    ]
+    cognito_client = mock_cognito_client(mocker)
+    cognito_client().get_user_emailids_from_group.return_value = ['bob@email.com', 'carol@email.com']
+    mocker.patch(
+        'dataall.modules.notifications.services.ses_email_notification_service.ServiceProviderFactory.get_service_provider_instance',
+        return_value=cognito_client(),
+    )
+    queue = mocker.patch('dataall.modules.notifications.handlers.notifications_handler.Worker.queue')
+
+    with db.scoped_session() as session:
+        task = _email_task(session)
+        NotificationHandler.notification_service(db, task)
+
+        remaining_task = session.query(Task).get(queue.call_args.kwargs['task_ids'][0])
+        assert remaining_task.taskUri != task.taskUri
+        assert remaining_task.payload['recipientGroupsList'] == []
+        assert remaining_task.payload['recipientEmailList'] == ['carol@email.com', 'dave@email.com']
+        assert remaining_task.payload['subject'] == task.payload['subject']
 
 
 # Test to check when unknown notification type is used
@@ -133,6 +225,7 @@ def test_notification_service_with_no_email_ids_in_group(mocker, db):
 
     # Check that the send email was not called
     assert mock_ses_client().send_email.call_count == 0
+    mock_ses_client().send_bulk_email.assert_not_called()
 
 
 # Test to check when sender email id is None. This can happen when the custom_domain is present/absent and the config for email is set to true in config.json
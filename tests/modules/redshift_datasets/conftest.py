@@ -4,6 +4,7 @@ import boto3
 import pytest
 
 from dataall.base.context import set_context, dispose_context, RequestContext
+from dataall.base.utils.ttl_cache import TTLCache
 from dataall.modules.redshift_datasets.services.redshift_connection_service import RedshiftConnectionService
 from dataall.modules.redshift_datasets.services.redshift_dataset_service import RedshiftDatasetService
 
@@ -32,6 +33,7 @@ def mock_redshift(mocker):
 
 @pytest.fixture(scope='function')
 def mock_redshift_data(mocker):
+    mocker.patch('dataall.modules.redshift_datasets.aws.redshift_data._redshift_data_clients', TTLCache(ttl_seconds=60))
     redshiftDataClient = mocker.patch(
         'dataall.modules.redshift_datasets.aws.redshift_data.RedshiftDataClient', autospec=True
     )
@@ -0,0 +1,58 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from dataall.base.utils.ttl_cache import TTLCache
+from dataall.modules.redshift_datasets.aws.redshift_data import RedshiftDataClient, redshift_data_client
+from dataall.modules.redshift_datasets.db.redshift_models import RedshiftConnection
+
+
+@pytest.fixture(scope='function')
+def connection():
+    yield RedshiftConnection(database='database_1', workgroup='workgroup_name_1', secretArn='secret-1')
+
+
+@pytest.fixture(scope='function')
+def data_api(mocker):
+    mocker.patch('dataall.modules.redshift_datasets.aws.redshift_data._redshift_data_clients', TTLCache(ttl_seconds=60))
+    session_helper = mocker.patch('dataall.modules.redshift_datasets.aws.redshift_data.SessionHelper')
+    client = MagicMock()
+    session_helper.remote_session.return_value.client.return_value = client
+    yield client
+
+
+@pytest.fixture(scope='function')
+def sleep(mocker):
+    yield mocker.patch('dataall.modules.redshift_datasets.aws.redshift_data.time.sleep')
+
+
+def test_execute_statement_polls_with_backoff(data_api, connection, sleep):
+    data_api.execute_statement.return_value = {'Id': 'statement-1'}
+    data_api.describe_statement.side_effect = [{'Status': 'SUBMITTED'}] * 10 + [
+        {'Status': 'FINISHED', 'Id': 'statement-1'}
+    ]
+
+    client = RedshiftDataClient(account_id='111111111111', region='eu-west-1', connection=connection)
+    assert client._execute_statement('GRANT USAGE ON SCHEMA "public" TO ROLE "role1"') == 'statement-1'
+
+    delays = [call.args[0] for call in sleep.call_args_list]
+    assert delays[:3] == [0.1, 0.2, 0.4]
+    assert max(delays) == RedshiftDataClient.POLL_MAX_DELAY_SECONDS
+    assert 'Sql' not in client.execute_connection_params
+
+
+def test_execute_statement_failed(data_api, connection, sleep):
+    data_api.execute_statement.return_value = {'Id': 'statement-1'}
+    data_api.describe_statement.return_value = {'Status': 'FAILED', 'Error': 'permission denied'}
+
+    client = RedshiftDataClient(account_id='111111111111', region='eu-west-1', connection=connection)
+    with pytest.raises(Exception, match='permission denied'):
+        client._execute_statement('GRANT USAGE ON SCHEMA "public" TO ROLE "role1"')
+    sleep.assert_not_called()
+
+
+def test_redshift_data_client_is_reused(data_api, connection):
+    client = redshift_data_client(account_id='111111111111', region='eu-west-1', connection=connection)
+
+    assert redshift_data_client(account_id='111111111111', region='eu-west-1', connection=connection) is client
+    assert redshift_data_client(account_id='111111111111', region='us-east-1', connection=connection) is not client
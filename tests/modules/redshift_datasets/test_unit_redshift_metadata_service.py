@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+
+from assertpy import assert_that
+
+from dataall.modules.redshift_datasets.db.redshift_models import (
+    RedshiftMetadataColumn,
+    RedshiftMetadataSync,
+    RedshiftMetadataTable,
+)
+from dataall.modules.redshift_datasets.services.redshift_dataset_service import RedshiftDatasetService
+from dataall.modules.redshift_datasets.tasks.redshift_metadata_syncer import sync_redshift_metadata
+
+
+def test_list_redshift_dataset_table_columns_reads_cache(imported_dataset_2_table_1, mock_redshift_data, api_context_1):
+    # When
+    first_page = RedshiftDatasetService.list_redshift_dataset_table_columns(
+        uri=imported_dataset_2_table_1.rsTableUri, filter={'page': 1, 'pageSize': 3}
+    )
+    second_page = RedshiftDatasetService.list_redshift_dataset_table_columns(
+        uri=imported_dataset_2_table_1.rsTableUri, filter={'page': 2, 'pageSize': 3}
+    )
+    # Then
+    assert_that([column.name for column in first_page['nodes']]).is_equal_to(['column1', 'column2', 'column3'])
+    assert_that([column.name for column in second_page['nodes']]).is_equal_to(['column4'])
+    assert_that(second_page).contains_entry(count=4, pages=2)
+    mock_redshift_data.return_value.list_redshift_table_columns.assert_called_once_with('public', 'table1')
+
+
+def test_list_redshift_dataset_table_columns_refreshes_stale_cache(
+    db, imported_dataset_2_table_1, mock_redshift_data, api_context_1
+):
+    # Given
+    RedshiftDatasetService.list_redshift_dataset_table_columns(uri=imported_dataset_2_table_1.rsTableUri, filter={})
+    with db.scoped_session() as session:
+        session.query(RedshiftMetadataSync).update({'lastSynced': datetime.now() - timedelta(days=1)})
+        session.commit()
+    # When
+    RedshiftDatasetService.list_redshift_dataset_table_columns(uri=imported_dataset_2_table_1.rsTableUri, filter={})
+    # Then
+    assert_that(mock_redshift_data.return_value.list_redshift_table_columns.call_count).is_equal_to(2)
+
+
+def test_list_redshift_schema_dataset_tables_reads_cache(
+    imported_redshift_dataset_2_with_tables, mock_redshift_data, api_context_1
+):
+    # When
+    for _ in range(2):
+        tables = RedshiftDatasetService.list_redshift_schema_dataset_tables(
+            uri=imported_redshift_dataset_2_with_tables.datasetUri
+        )
+    # Then
+    assert_that([table['alreadyAdded'] for table in tables]).is_equal_to([True, True, False, False])
+    mock_redshift_data.return_value.list_redshift_tables.assert_called_once_with('public')
+
+
+def test_list_redshift_table_columns_caches_empty_table(imported_dataset_2_table_1, mock_redshift_data, api_context_1):
+    # Given
+    mock_redshift_data.return_value.list_redshift_table_columns.return_value = []
+    # When
+    for _ in range(2):
+        columns = RedshiftDatasetService.list_redshift_dataset_table_columns(
+            uri=imported_dataset_2_table_1.rsTableUri, filter={}
+        )
+    # Then
+    assert_that(columns['count']).is_equal_to(0)
+    mock_redshift_data.return_value.list_redshift_table_columns.assert_called_once_with('public', 'table1')
+
+
+def test_sync_redshift_metadata(db, imported_redshift_dataset_2_with_tables, mock_redshift_data, mocker):
+    # Given
+    upsert = mocker.patch('dataall.modules.redshift_datasets.tasks.redshift_metadata_syncer.DatasetTableIndexer.upsert')
+    # When
+    synced = sync_redshift_metadata(engine=db)
+    # Then
+    assert_that(synced).is_equal_to([(imported_redshift_dataset_2_with_tables.connectionUri, 'public')])
+    assert_that(upsert.call_count).is_equal_to(2)
+    with db.scoped_session() as session:
+        assert_that(session.query(RedshiftMetadataTable).count()).is_equal_to(4)
+        assert_that(session.query(RedshiftMetadataColumn).count()).is_equal_to(8)
@@ -1,7 +1,9 @@
 import pytest
 
+from dataall.core.organizations.db.organization_models import OrganizationGroup
 from dataall.modules.catalog.tasks.catalog_indexer_task import CatalogIndexerTask
 from dataall.modules.s3_datasets.db.dataset_models import DatasetTable, S3Dataset
+from dataall.modules.s3_datasets.indexers.dataset_indexer import DatasetIndexer
 
 
 @pytest.fixture(scope='module', autouse=True)
@@ -81,3 +83,13 @@ def test_catalog_indexer_with_deletes(db, org, env, sync_dataset, table, mocker)
 
     # Count should be One Dataset = 1
     assert indexed_objects_counter == 1
+
+
+def test_dataset_indexer_allowed_groups(db, org_fixture, sync_dataset, mocker):
+    index = mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer._index', return_value=True)
+    with db.scoped_session() as session:
+        session.add(OrganizationGroup(organizationUri=org_fixture.organizationUri, groupUri='orgteam'))
+        session.commit()
+        DatasetIndexer.upsert(session, sync_dataset.datasetUri)
+
+    assert index.call_args.kwargs['doc']['allowedGroups'] == ['foo', 'orgteam']
@@ -1,3 +1,6 @@
+from dataall.core.organizations.db.organization_models import Organization
+from dataall.core.permissions.services.organization_permissions import ORGANIZATION_ALL
+from dataall.core.permissions.services.resource_policy_service import ResourcePolicyService
 from dataall.modules.s3_datasets.indexers.location_indexer import DatasetLocationIndexer
 from dataall.modules.s3_datasets.indexers.table_indexer import DatasetTableIndexer
 from dataall.modules.s3_datasets.indexers.dataset_indexer import DatasetIndexer
@@ -39,3 +42,50 @@ def test_upsert_tables(db, dataset_fixture, folder_fixture):
     with db.scoped_session() as session:
         tables = DatasetTableIndexer.upsert_all(session, dataset_uri=dataset_fixture.datasetUri)
         assert len(tables) == 1
+
+
+def test_organization_team_changes_reindex_datasets(
+    db, client, mocker, org_fixture, dataset_fixture, table_fixture, folder_fixture, group, group2
+):
+    with db.scoped_session() as session:
+        ResourcePolicyService.attach_resource_policy(
+            session=session,
+            group=group.name,
+            permissions=ORGANIZATION_ALL,
+            resource_uri=org_fixture.organizationUri,
+            resource_type=Organization.__name__,
+        )
+    queued = mocker.patch('dataall.modules.catalog.indexers.base_indexer.CatalogIndexOutboxRepository.add')
+    expected = {dataset_fixture.datasetUri, table_fixture.tableUri, folder_fixture.locationUri}
+
+    response = client.query(
+        """
+        mutation inviteGroupToOrganization($input:InviteGroupToOrganizationInput!){
+            inviteGroupToOrganization(input:$input){
+                organizationUri
+            }
+        }
+        """,
+        username='alice',
+        input=dict(organizationUri=org_fixture.organizationUri, groupUri=group2.name, permissions=[]),
+        groups=[group.name],
+    )
+    assert not response.errors
+    assert expected <= {call.args[2] for call in queued.call_args_list}
+
+    queued.reset_mock()
+    response = client.query(
+        """
+        mutation removeGroupFromOrganization($organizationUri: String!, $groupUri: String!){
+            removeGroupFromOrganization(organizationUri: $organizationUri, groupUri: $groupUri){
+                organizationUri
+            }
+        }
+        """,
+        username='alice',
+        organizationUri=org_fixture.organizationUri,
+        groupUri=group2.name,
+        groups=[group.name],
+    )
+    assert not response.errors
+    assert expected <= {call.args[2] for call in queued.call_args_list}
@@ -14,10 +14,11 @@ from typing import Callable
 from dataall.core.groups.db.group_models import Group
 from dataall.core.organizations.db.organization_models import Organization
 from dataall.core.environment.db.environment_models import Environment, EnvironmentGroup
-from dataall.modules.shares_base.services.shares_enums import ShareItemStatus
+from dataall.modules.shares_base.services.shares_enums import ShareItemHealthStatus, ShareItemStatus, ShareableType
 from dataall.modules.shares_base.db.share_object_models import ShareObject, ShareObjectItem
 from dataall.modules.s3_datasets.db.dataset_models import DatasetTable, S3Dataset
 from dataall.modules.s3_datasets_shares.services.s3_share_alarm_service import S3ShareAlarmService
+from dataall.modules.s3_datasets_shares.services.s3_share_service import S3ShareService
 from dataall.modules.s3_datasets_shares.services.share_processors.glue_table_share_processor import (
     ProcessLakeFormationShare,
 )
@@ -896,3 +897,51 @@ def test_handle_revoke_failure(
 
     # Then
     alarm_service_mock.assert_called_once()
+
+
+def test_processed_tables_state_is_written_when_the_loop_fails(
+    db, share, share_data, table1: DatasetTable, table2: DatasetTable, mocker
+):
+    # Given
+    with db.scoped_session() as session:
+        items = [
+            ShareObjectItem(
+                shareUri=share.shareUri,
+                owner='alice',
+                itemUri=table.tableUri,
+                itemType=ShareableType.Table.value,
+                itemName=table.name,
+                status=ShareItemStatus.Share_Approved.value,
+            )
+            for table in [table1, table2]
+        ]
+        session.add_all(items)
+        session.commit()
+        item_uris = [item.shareItemUri for item in items]
+
+    manager = MagicMock()
+    manager.cross_account = False
+    manager.check_table_exists_in_source_database.side_effect = [None, Exception('table2 not found')]
+    manager.handle_share_failure.side_effect = RuntimeError('alarm failed')
+    mocker.patch.object(ProcessLakeFormationShare, '_initialize_share_manager', return_value=manager)
+    mocker.patch.object(S3ShareService, 'attach_dataset_table_read_permission')
+    mocker.patch(
+        'dataall.modules.s3_datasets_shares.services.share_processors.glue_table_share_processor.ShareObjectService.verify_principal_role',
+        return_value=True,
+    )
+
+    # When
+    with db.scoped_session() as session:
+        processor = ProcessLakeFormationShare(session, share_data, [table1, table2])
+        with pytest.raises(RuntimeError):
+            processor.process_approved_shares()
+
+    # Then
+    with db.scoped_session() as session:
+        succeeded, failed = [session.query(ShareObjectItem).get(uri) for uri in item_uris]
+        assert succeeded.status == ShareItemStatus.Share_Succeeded.value
+        assert succeeded.healthStatus == ShareItemHealthStatus.Healthy.value
+        assert failed.status == ShareItemStatus.Share_Failed.value
+        for item in [succeeded, failed]:
+            session.delete(item)
+        session.commit()
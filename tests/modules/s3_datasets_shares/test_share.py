@@ -1,11 +1,16 @@
+import os
 import random
+import subprocess
+import sys
 import typing
 from unittest.mock import MagicMock
 
 import boto3
 import pytest
 
+from dataall.base.db.exceptions import UnauthorizedOperation
 from dataall.core.environment.db.environment_models import Environment, EnvironmentGroup
+from dataall.core.tasks.db.task_models import Task
 from dataall.core.organizations.db.organization_models import Organization
 from dataall.modules.shares_base.services.shares_enums import ShareableType, PrincipalType
 from dataall.modules.shares_base.services.shares_enums import (
@@ -15,10 +20,13 @@ from dataall.modules.shares_base.services.shares_enums import (
     ShareItemStatus,
     ShareItemHealthStatus,
 )
+from dataall.modules.notifications.db.notification_repositories import NotificationRepository
 from dataall.modules.shares_base.db.share_object_models import ShareObject, ShareObjectItem
+from dataall.modules.datasets_base.db.dataset_models import ShareableItem
 from dataall.modules.shares_base.db.share_object_repositories import ShareObjectRepository
 from dataall.modules.shares_base.db.share_state_machines_repositories import ShareStatusRepository
 from dataall.modules.shares_base.db.share_object_state_machines import ShareItemSM, ShareObjectSM
+from dataall.modules.shares_base.tasks.persistent_email_reminders_task import persistent_email_reminders
 from dataall.modules.s3_datasets.db.dataset_models import DatasetTable, S3Dataset
 
 
@@ -1742,3 +1750,153 @@ def _successfull_processing_for_share_object(db, share):
             Item_SM.update_state(session, share.shareUri, new_state)
 
         Share_SM.update_state(session, share, new_share_state)
+
+
+def test_update_items_state_in_bulk(db, share1_draft, share_item, table1, table1_1):
+    # Given share items approved and in progress
+    approved = share_item(share=share1_draft, table=table1, status=ShareItemStatus.Share_Approved.value)
+    in_progress = share_item(share=share1_draft, table=table1_1, status=ShareItemStatus.Share_In_Progress.value)
+
+    with db.scoped_session() as session:
+        # When a failure is applied to the items of both states
+        new_states = ShareItemSM.update_items_state(
+            session,
+            share1_draft.shareUri,
+            ShareItemActions.Failure.value,
+            prev_states=[ShareItemStatus.Share_Approved.value, ShareItemStatus.Share_In_Progress.value],
+        )
+
+        # Then all of them fail in one go
+        assert new_states == {
+            approved.shareItemUri: ShareItemStatus.Share_Failed.value,
+            in_progress.shareItemUri: ShareItemStatus.Share_Failed.value,
+        }
+        assert ShareStatusRepository.get_share_items_states(session, share1_draft.shareUri) == [
+            ShareItemStatus.Share_Failed.value
+        ]
+
+        # And a transition from a state it does not apply to is refused
+        with pytest.raises(UnauthorizedOperation):
+            ShareItemSM.update_items_state(
+                session,
+                share1_draft.shareUri,
+                ShareItemActions.Success.value,
+                prev_states=[ShareItemStatus.Share_Failed.value],
+            )
+
+
+def test_shareable_item_projection(db, dataset1):
+    # Given a new table of the dataset
+    with db.scoped_session() as session:
+        table = DatasetTable(
+            name='projected_table',
+            label='projected_table',
+            owner='alice',
+            datasetUri=dataset1.datasetUri,
+            GlueDatabaseName=dataset1.GlueDatabaseName,
+            GlueTableName='projected_table',
+            region=dataset1.region,
+            AWSAccountId=dataset1.AwsAccountId,
+            S3BucketName=dataset1.S3BucketName,
+            S3Prefix='projected_table',
+        )
+        session.add(table)
+        session.commit()
+        table_uri = table.tableUri
+
+        # Then it is projected as a shareable item when it is flushed
+        item = session.query(ShareableItem).get(table_uri)
+        assert (item.itemType, item.datasetUri, item.itemName) == (
+            ShareableType.Table.value,
+            dataset1.datasetUri,
+            'projected_table',
+        )
+
+        # When the table is updated and deleted, the projection follows
+        table.description = 'updated'
+        session.commit()
+        session.expire_all()
+        assert session.query(ShareableItem).get(table_uri).description == 'updated'
+
+        session.delete(table)
+        session.commit()
+        session.expire_all()
+        assert session.query(ShareableItem).get(table_uri) is None
+
+
+def test_tables_synced_outside_api_mode_are_shareable(db, share2_submitted, dataset1):
+    # Given a process that loads no module, like the scheduled tables syncer
+    glue_tables = [{'Name': 'synced_table', 'StorageDescriptor': {'Location': 's3://bucket/synced_table'}}]
+    script = '\n'.join(
+        [
+            'import os',
+            'from dataall.base.db import get_engine',
+            'from dataall.modules.s3_datasets.services.dataset_table_service import DatasetTableService',
+            "with get_engine(envname=os.environ.get('envname', 'pytest')).scoped_session() as session:",
+            f"    DatasetTableService.sync_existing_tables(session, '{dataset1.datasetUri}', {glue_tables!r})",
+        ]
+    )
+    backend = os.path.dirname(os.path.dirname(sys.modules['dataall'].__file__))
+
+    # When it syncs a new Glue table of the dataset
+    subprocess.run(
+        [sys.executable, '-c', script],
+        env={**os.environ, 'PYTHONPATH': os.pathsep.join([backend, os.environ.get('PYTHONPATH', '')])},
+        check=True,
+    )
+
+    # Then the table can be added to the shares of the dataset
+    with db.scoped_session() as session:
+        share = ShareObjectRepository.get_share_by_uri(session, share2_submitted.shareUri)
+        items = ShareObjectRepository.paginated_list_shareable_items(
+            session, share, [ShareableType.Table.value], data={'term': 'synced_table'}
+        )
+        assert [item.itemName for item in items['nodes']] == ['synced_table']
+
+        table = session.query(DatasetTable).get(items['nodes'][0].itemUri)
+        session.delete(table)
+        session.commit()
+
+
+def test_persistent_email_reminders(db, mocker, share2_submitted, dataset1):
+    with db.scoped_session() as session:
+        NotificationRepository.create_notification(
+            session=session,
+            recipient=dataset1.SamlAdminGroupName,
+            notification_type='SHARE_OBJECT_SUBMITTED',
+            target_uri=f'{share2_submitted.shareUri}|{dataset1.datasetUri}',
+            message='submitted',
+            target_type='ShareObject',
+            share_uri=share2_submitted.shareUri,
+            dataset_uri=dataset1.datasetUri,
+        )
+        pending_shares = ShareObjectRepository.fetch_submitted_shares_with_datasets(session)
+        assert share2_submitted.shareUri in [share.shareUri for share, _ in pending_shares]
+        groups = {dataset.SamlAdminGroupName for _, dataset in pending_shares} | {
+            dataset.stewards for _, dataset in pending_shares
+        }
+
+    mocker.patch(
+        'dataall.modules.shares_base.services.share_notification_service.ShareNotificationService._is_email_notification_active',
+        return_value=True,
+    )
+    send_email_task = mocker.patch(
+        'dataall.modules.shares_base.services.share_notification_service.SESEmailNotificationService.send_email_task'
+    )
+    commit = mocker.spy(db.session(), 'commit')
+
+    persistent_email_reminders(db)
+
+    # the notifications and the email tasks are committed together, the scoped session commits on exit
+    assert commit.call_count == 2
+
+    # One email per approver group listing all its pending shares
+    assert sorted(call.args[2][0] for call in send_email_task.call_args_list) == sorted(groups)
+    admin_group_email = next(
+        call.args for call in send_email_task.call_args_list if call.args[2] == [dataset1.SamlAdminGroupName]
+    )
+    assert f'"{dataset1.label}" submitted by {share2_submitted.owner}' in admin_group_email[1]
+    with db.scoped_session() as session:
+        tasks = session.query(Task).filter(Task.targetUri.in_(groups)).all()
+        assert len(tasks) == len(groups)
+        assert {task.payload['subject'] for task in tasks} == {call.args[0] for call in send_email_task.call_args_list}
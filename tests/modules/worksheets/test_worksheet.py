@@ -1,6 +1,10 @@
+from unittest.mock import MagicMock
+
 import pytest
 
+from dataall.base.utils.ttl_cache import TTLCache
 from dataall.modules.worksheets.api.resolvers import WorksheetRole
+from dataall.modules.worksheets.services.worksheet_service import WorksheetService
 
 
 @pytest.fixture(scope='module', autouse=True)
@@ -145,3 +149,269 @@ def test_update_worksheet(client, worksheet, group):
     )
 
     assert response.data.updateWorksheet.label == 'change label'
+
+
+@pytest.fixture(scope='function')
+def mock_athena_client(mocker):
+    athena_client = MagicMock()
+    session_helper = MagicMock()
+    mocker.patch('dataall.modules.worksheets.aws.athena_client.SessionHelper', session_helper)
+    mocker.patch('dataall.modules.worksheets.aws.athena_client._env_group_sessions', TTLCache(ttl_seconds=60))
+    session_helper.get_session.return_value.client.return_value = athena_client
+    yield athena_client
+
+
+def _start_worksheet_query(client, worksheet, env_fixture, group, sql):
+    return client.query(
+        """
+        mutation StartWorksheetQuery($environmentUri:String!, $worksheetUri:String!, $sqlQuery:String!){
+            startWorksheetQuery(environmentUri:$environmentUri, worksheetUri:$worksheetUri, sqlQuery:$sqlQuery){
+                AthenaQueryId
+                Status
+            }
+        }
+        """,
+        environmentUri=env_fixture.environmentUri,
+        worksheetUri=worksheet.worksheetUri,
+        sqlQuery=sql,
+        username='alice',
+        groups=[group.name],
+    )
+
+
+def _get_worksheet_query_results(client, worksheet, env_fixture, group, query_id, next_token=None):
+    return client.query(
+        """
+        query GetWorksheetQueryResults(
+            $environmentUri:String!, $worksheetUri:String!, $queryId:String!, $nextToken:String, $pageSize:Int
+        ){
+            getWorksheetQueryResults(
+                environmentUri:$environmentUri,
+                worksheetUri:$worksheetUri,
+                queryId:$queryId,
+                nextToken:$nextToken,
+                pageSize:$pageSize
+            ){
+                AthenaQueryId
+                Status
+                DataScannedInBytes
+                columns{
+                    columnName
+                    typeName
+                }
+                rows
+                nextToken
+            }
+        }
+        """,
+        environmentUri=env_fixture.environmentUri,
+        worksheetUri=worksheet.worksheetUri,
+        queryId=query_id,
+        nextToken=next_token,
+        pageSize=2,
+        username='alice',
+        groups=[group.name],
+    )
+
+
+def test_start_worksheet_query(client, worksheet, env_fixture, group, mock_athena_client):
+    mock_athena_client.start_query_execution.return_value = {'QueryExecutionId': 'query-1'}
+
+    response = _start_worksheet_query(client, worksheet, env_fixture, group, 'SELECT * FROM db.table1')
+
+    assert response.data.startWorksheetQuery.AthenaQueryId == 'query-1'
+    assert response.data.startWorksheetQuery.Status == 'QUEUED'
+    mock_athena_client.get_query_results.assert_not_called()
+
+
+def test_get_worksheet_query_results_pages(client, worksheet, env_fixture, group, mock_athena_client):
+    mock_athena_client.start_query_execution.return_value = {'QueryExecutionId': 'query-2'}
+    _start_worksheet_query(client, worksheet, env_fixture, group, 'SELECT * FROM db.table2')
+
+    mock_athena_client.get_query_execution.return_value = {
+        'QueryExecution': {
+            'StatementType': 'DML',
+            'Status': {'State': 'SUCCEEDED'},
+            'Statistics': {'EngineExecutionTimeInMillis': 10, 'DataScannedInBytes': 5 * 1024**3},
+        }
+    }
+    mock_athena_client.get_query_results.return_value = {
+        'ResultSet': {
+            'ResultSetMetadata': {
+                'ColumnInfo': [{'Name': 'id', 'Type': 'integer'}, {'Name': 'name', 'Type': 'varchar'}]
+            },
+            'Rows': [
+                {'Data': [{'VarCharValue': 'id'}, {'VarCharValue': 'name'}]},
+                {'Data': [{'VarCharValue': '1'}, {'VarCharValue': 'a'}]},
+                {'Data': [{'VarCharValue': '2'}, {}]},
+            ],
+        },
+        'NextToken': 'token-1',
+    }
+
+    response = _get_worksheet_query_results(client, worksheet, env_fixture, group, 'query-2')
+
+    page = response.data.getWorksheetQueryResults
+    assert page.Status == 'SUCCEEDED'
+    assert page.DataScannedInBytes == str(5 * 1024**3)
+    assert [column.columnName for column in page.columns] == ['id', 'name']
+    assert page.rows == [['1', 'a'], ['2', None]]
+    assert page.nextToken == 'token-1'
+    mock_athena_client.get_query_results.assert_called_with(QueryExecutionId='query-2', MaxResults=3)
+
+    mock_athena_client.get_query_execution.reset_mock()
+    mock_athena_client.get_query_results.return_value = {
+        'ResultSet': {'ResultSetMetadata': {'ColumnInfo': []}, 'Rows': [{'Data': [{'VarCharValue': '3'}]}]},
+    }
+
+    response = _get_worksheet_query_results(client, worksheet, env_fixture, group, 'query-2', next_token='token-1')
+
+    assert response.data.getWorksheetQueryResults.rows == [['3']]
+    assert response.data.getWorksheetQueryResults.nextToken is None
+    mock_athena_client.get_query_execution.assert_not_called()
+    mock_athena_client.get_query_results.assert_called_with(
+        QueryExecutionId='query-2', MaxResults=2, NextToken='token-1'
+    )
+
+
+@pytest.mark.parametrize(
+    'statement_type,max_results,rows',
+    [
+        # the header row of a SELECT is dropped, a data row equal to the column names is kept
+        ('DML', 3, [['id', 'name'], ['2', 'b']]),
+        ('UTILITY', 2, [['id', 'name'], ['id', 'name']]),
+    ],
+)
+def test_get_worksheet_query_results_header_row(
+    client, worksheet, env_fixture, group, mock_athena_client, statement_type, max_results, rows
+):
+    mock_athena_client.start_query_execution.return_value = {'QueryExecutionId': f'query-{statement_type}'}
+    _start_worksheet_query(client, worksheet, env_fixture, group, f'SELECT * FROM db.{statement_type}')
+    mock_athena_client.get_query_execution.return_value = {
+        'QueryExecution': {'StatementType': statement_type, 'Status': {'State': 'SUCCEEDED'}}
+    }
+    mock_athena_client.get_query_results.return_value = {
+        'ResultSet': {
+            'ResultSetMetadata': {
+                'ColumnInfo': [{'Name': 'id', 'Type': 'varchar'}, {'Name': 'name', 'Type': 'varchar'}]
+            },
+            'Rows': [
+                {'Data': [{'VarCharValue': 'id'}, {'VarCharValue': 'name'}]},
+                {'Data': [{'VarCharValue': 'id'}, {'VarCharValue': 'name'}]},
+                {'Data': [{'VarCharValue': '2'}, {'VarCharValue': 'b'}]},
+            ][:max_results],
+        },
+    }
+
+    response = _get_worksheet_query_results(client, worksheet, env_fixture, group, f'query-{statement_type}')
+
+    assert response.data.getWorksheetQueryResults.rows == rows
+    mock_athena_client.get_query_results.assert_called_with(
+        QueryExecutionId=f'query-{statement_type}', MaxResults=max_results
+    )
+
+
+def test_get_worksheet_query_results_running(client, worksheet, env_fixture, group, mock_athena_client):
+    mock_athena_client.start_query_execution.return_value = {'QueryExecutionId': 'query-3'}
+    _start_worksheet_query(client, worksheet, env_fixture, group, 'SELECT * FROM db.table3')
+    mock_athena_client.get_query_execution.return_value = {'QueryExecution': {'Status': {'State': 'RUNNING'}}}
+
+    response = _get_worksheet_query_results(client, worksheet, env_fixture, group, 'query-3')
+
+    assert response.data.getWorksheetQueryResults.Status == 'RUNNING'
+    assert response.data.getWorksheetQueryResults.rows == []
+    mock_athena_client.get_query_results.assert_not_called()
+
+
+def test_get_worksheet_query_results_unknown_query(client, worksheet, env_fixture, group, mock_athena_client):
+    response = _get_worksheet_query_results(client, worksheet, env_fixture, group, 'unknown')
+
+    assert 'ResourceNotFound' in response.errors[0].message
+
+
+def test_start_worksheet_query_reuses_recent_query(client, worksheet, env_fixture, group, mock_athena_client):
+    mock_athena_client.start_query_execution.return_value = {'QueryExecutionId': 'query-4'}
+    _start_worksheet_query(client, worksheet, env_fixture, group, "SELECT name FROM db.table  WHERE x = 'a  b';")
+
+    response = _start_worksheet_query(
+        client, worksheet, env_fixture, group, "SELECT name\nFROM db.table WHERE x = 'a  b'"
+    )
+
+    assert response.data.startWorksheetQuery.AthenaQueryId == 'query-4'
+    mock_athena_client.start_query_execution.assert_called_once()
+    assert mock_athena_client.start_query_execution.call_args.kwargs['ResultReuseConfiguration'] == {
+        'ResultReuseByAgeConfiguration': {'Enabled': True, 'MaxAgeInMinutes': 60}
+    }
+
+    mock_athena_client.start_query_execution.return_value = {'QueryExecutionId': 'query-5'}
+    response = _start_worksheet_query(
+        client, worksheet, env_fixture, group, "SELECT name FROM db.table WHERE x = 'a b'"
+    )
+
+    assert response.data.startWorksheetQuery.AthenaQueryId == 'query-5'
+
+
+def test_start_worksheet_query_runs_repeated_statements(client, worksheet, env_fixture, group, mock_athena_client):
+    sql = 'INSERT INTO db.table7 SELECT * FROM db.table1'
+    mock_athena_client.start_query_execution.return_value = {'QueryExecutionId': 'query-7'}
+    _start_worksheet_query(client, worksheet, env_fixture, group, sql)
+    assert 'ResultReuseConfiguration' not in mock_athena_client.start_query_execution.call_args.kwargs
+
+    mock_athena_client.start_query_execution.return_value = {'QueryExecutionId': 'query-8'}
+    response = _start_worksheet_query(client, worksheet, env_fixture, group, sql)
+
+    assert response.data.startWorksheetQuery.AthenaQueryId == 'query-8'
+    assert mock_athena_client.start_query_execution.call_count == 2
+
+
+def test_read_only_statements_are_detected():
+    assert WorksheetService._is_read_only('-- report\n/* daily */ ( select 1)')
+    assert WorksheetService._is_read_only('WITH t AS (SELECT 1) SELECT * FROM t')
+    assert WorksheetService._is_read_only('show tables')
+    assert not WorksheetService._is_read_only('/* select */ DROP TABLE db.t')
+    assert not WorksheetService._is_read_only('MSCK REPAIR TABLE db.t')
+    assert not WorksheetService._is_read_only('CREATE TABLE db.t AS SELECT 1')
+
+
+def test_get_worksheet_query_status(client, worksheet, env_fixture, group, mock_athena_client):
+    mock_athena_client.start_query_execution.return_value = {'QueryExecutionId': 'query-6'}
+    _start_worksheet_query(client, worksheet, env_fixture, group, 'SELECT * FROM db.table6')
+    mock_athena_client.get_query_execution.return_value = {
+        'QueryExecution': {'Status': {'State': 'FAILED', 'StateChangeReason': 'TABLE_NOT_FOUND'}}
+    }
+
+    response = client.query(
+        """
+        query GetWorksheetQueryStatus($environmentUri:String!, $worksheetUri:String!, $queryId:String!){
+            getWorksheetQueryStatus(environmentUri:$environmentUri, worksheetUri:$worksheetUri, queryId:$queryId){
+                AthenaQueryId
+                Status
+                Error
+            }
+        }
+        """,
+        environmentUri=env_fixture.environmentUri,
+        worksheetUri=worksheet.worksheetUri,
+        queryId='query-6',
+        username='alice',
+        groups=[group.name],
+    )
+
+    assert response.data.getWorksheetQueryStatus.Status == 'FAILED'
+    assert response.data.getWorksheetQueryStatus.Error == 'TABLE_NOT_FOUND'
+    mock_athena_client.get_query_results.assert_not_called()
+
+    response = client.query(
+        """
+        query GetWorksheet($worksheetUri:String!){
+            getWorksheet(worksheetUri:$worksheetUri){
+                lastSavedAthenaQueryIdForQuery
+            }
+        }
+        """,
+        worksheetUri=worksheet.worksheetUri,
+        username='alice',
+        groups=[group.name],
+    )
+
+    assert response.data.getWorksheet.lastSavedAthenaQueryIdForQuery == 'query-6'
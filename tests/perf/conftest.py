@@ -0,0 +1,42 @@
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from dataall.base.context import set_context, dispose_context, RequestContext
+from dataall.base.db.instrumentation import SqlInstrumentation
+from tests.perf.seed import Volumes, seed
+
+
+def pytest_runtest_setup(item):
+    # skipped before the fixtures are set up, seeding the database takes minutes
+    if not os.environ.get('BENCHMARKS'):
+        pytest.skip('the benchmarks run with make benchmarks')
+
+
+@pytest.fixture(scope='module', autouse=True)
+def patch_aws(module_mocker):
+    module_mocker.patch('dataall.base.searchproxy.connect', return_value={})
+    module_mocker.patch('dataall.base.searchproxy.search', return_value={})
+    module_mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer._index', return_value={})
+    session_helper = MagicMock()
+    module_mocker.patch('dataall.base.aws.sts.SessionHelper', session_helper)
+    module_mocker.patch('dataall.modules.s3_datasets.aws.s3_dataset_client.SessionHelper', session_helper)
+    yield session_helper
+
+
+@pytest.fixture(scope='module')
+def seeded(db, group, user):
+    set_context(RequestContext(db, user.username, [group.name], user.username))
+    with db.scoped_session() as session:
+        seeded_data = seed(session, Volumes.from_env(), group.name, user.username)
+    dispose_context()
+    yield seeded_data
+
+
+@pytest.fixture(scope='module')
+def instrumentation(db, module_mocker):
+    settings = {**SqlInstrumentation.settings(), 'enabled': True}
+    module_mocker.patch.object(SqlInstrumentation, 'settings', return_value=settings)
+    SqlInstrumentation.instrument(db.engine)
+    yield settings
@@ -0,0 +1,332 @@
+"""
+Seeds the benchmark database with realistic volumes.
+
+The bulk of the rows is written with bulk_save_objects, only the resources queried by uri in the benchmarks
+get resource policies and are created like the unit tests fixtures do.
+"""
+
+import os
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta
+
+from dataall.core.environment.db.environment_models import Environment, EnvironmentGroup
+from dataall.core.organizations.db.organization_models import Organization
+from dataall.core.permissions.services.environment_permissions import ENVIRONMENT_ALL
+from dataall.core.permissions.services.resource_policy_service import ResourcePolicyService
+from dataall.modules.catalog.db.glossary_models import TermLink
+from dataall.modules.catalog.db.glossary_repositories import GlossaryRepository
+from dataall.modules.notifications.db.notification_models import Notification
+from dataall.modules.s3_datasets.db.dataset_models import S3Dataset, DatasetTable, DatasetStorageLocation
+from dataall.modules.s3_datasets.services.dataset_permissions import DATASET_ALL
+from dataall.modules.shares_base.db.share_object_models import ShareObject, ShareObjectItem
+from dataall.modules.datasets_base.db.dataset_models import ShareableItem
+from dataall.modules.shares_base.services.share_permissions import SHARE_OBJECT_APPROVER, SHARE_OBJECT_REQUESTER
+from dataall.modules.shares_base.services.shares_enums import (
+    PrincipalType,
+    ShareableType,
+    ShareItemStatus,
+    ShareObjectStatus,
+)
+
+
+@dataclass
+class Volumes:
+    organizations: int = 10
+    environments: int = 1000
+    datasets: int = 2000
+    tables_per_dataset: int = 10
+    locations_per_dataset: int = 2
+    shares: int = 2000
+    items_per_share: int = 5
+    focus_dataset_tables: int = 2000
+    glossary_categories: int = 20
+    terms_per_category: int = 100
+    notifications: int = 20000
+
+    @classmethod
+    def from_env(cls):
+        """Volumes multiplied by BENCHMARK_SCALE, 1 by default"""
+        scale = float(os.environ.get('BENCHMARK_SCALE', 1))
+        return cls(**{f.name: max(int(getattr(cls, f.name) * scale), 1) for f in fields(cls)})
+
+
+@dataclass
+class SeededData:
+    environment_uri: str
+    dataset_uri: str
+    share_uri: str
+    glossary_uri: str
+
+
+def _environment(index, organization_uri, group):
+    account = f'{index:012d}'
+    return Environment(
+        environmentUri=f'perfenv{index}',
+        organizationUri=organization_uri,
+        AwsAccountId=account,
+        region='eu-west-1',
+        label=f'environment {index}',
+        name=f'environment{index}',
+        owner='alice',
+        tags=[],
+        description=f'Benchmark environment {index}',
+        SamlGroupName=group,
+        EnvironmentDefaultIAMRoleName='role',
+        EnvironmentDefaultIAMRoleArn=f'arn:aws:iam::{account}:role/role',
+        EnvironmentDefaultBucketName=f'bucket{index}',
+        CDKRoleArn=f'arn:aws::{account}:role/EnvRole',
+        EnvironmentDefaultAthenaWorkGroup='DefaultWorkGroup',
+    )
+
+
+def _dataset(index, environment: Environment, group):
+    return S3Dataset(
+        datasetUri=f'perfdataset{index}',
+        organizationUri=environment.organizationUri,
+        environmentUri=environment.environmentUri,
+        AwsAccountId=environment.AwsAccountId,
+        region=environment.region,
+        label=f'dataset {index}',
+        name=f'dataset{index}',
+        owner='alice',
+        description=f'Benchmark dataset {index} of sales and marketing data',
+        SamlAdminGroupName=group,
+        stewards=group,
+        tags=[],
+        topics=[],
+        S3BucketName=f'dataset{index}bucket',
+        GlueDatabaseName=f'dataset{index}db',
+        IAMDatasetAdminRoleArn=f'arn:aws:iam::{environment.AwsAccountId}:role/dataset{index}',
+        IAMDatasetAdminUserArn=f'arn:aws:iam::{environment.AwsAccountId}:user/dataset{index}',
+        KmsAlias='kms',
+    )
+
+
+def _table(index, dataset: S3Dataset):
+    return DatasetTable(
+        tableUri=f'{dataset.datasetUri}table{index}',
+        datasetUri=dataset.datasetUri,
+        label=f'table {index}',
+        name=f'table{index}',
+        owner='alice',
+        description=f'Table {index} of {dataset.label}',
+        AWSAccountId=dataset.AwsAccountId,
+        region=dataset.region,
+        S3BucketName=dataset.S3BucketName,
+        S3Prefix=f'table{index}',
+        GlueDatabaseName=dataset.GlueDatabaseName,
+        GlueTableName=f'table{index}',
+    )
+
+
+def _location(index, dataset: S3Dataset):
+    return DatasetStorageLocation(
+        locationUri=f'{dataset.datasetUri}location{index}',
+        datasetUri=dataset.datasetUri,
+        label=f'folder {index}',
+        name=f'folder{index}',
+        owner='alice',
+        description=f'Folder {index} of {dataset.label}',
+        AWSAccountId=dataset.AwsAccountId,
+        region=dataset.region,
+        S3BucketName=dataset.S3BucketName,
+        S3Prefix=f'folder{index}',
+    )
+
+
+def _shareable_item(item_uri, item, item_type: ShareableType):
+    # bulk_save_objects does not flush, the shareable_item projection is written like the migration backfills it
+    return ShareableItem(
+        itemUri=item_uri,
+        itemType=item_type.value,
+        datasetUri=item.datasetUri,
+        itemName=item.name,
+        description=item.description,
+    )
+
+
+def _share(index, dataset: S3Dataset, environment: Environment, group, status=ShareObjectStatus.Processed.value):
+    return ShareObject(
+        shareUri=f'perfshare{index}',
+        datasetUri=dataset.datasetUri,
+        environmentUri=environment.environmentUri,
+        owner='bob',
+        groupUri=group,
+        principalId=group,
+        principalType=PrincipalType.Group.value,
+        principalIAMRoleName='role',
+        status=status,
+    )
+
+
+def _share_item(share: ShareObject, table: DatasetTable, status=ShareItemStatus.Share_Succeeded.value):
+    return ShareObjectItem(
+        shareUri=share.shareUri,
+        owner='bob',
+        itemUri=table.tableUri,
+        itemType=ShareableType.Table.value,
+        itemName=table.name,
+        status=status,
+        healthStatus='Healthy',
+    )
+
+
+def _glossary(session, volumes: Volumes, group):
+    # the nodes are created by the repository that maintains the counters of the tree
+    glossary = GlossaryRepository.create_glossary(
+        session, {'label': 'Benchmark glossary', 'readme': 'Benchmark glossary', 'admin': group}
+    )
+    terms = []
+    for category_index in range(volumes.glossary_categories):
+        category = GlossaryRepository.create_category(
+            session, glossary.nodeUri, {'label': f'Category {category_index}', 'readme': 'category'}
+        )
+        for term_index in range(volumes.terms_per_category):
+            terms.append(
+                GlossaryRepository.create_term(
+                    session,
+                    category.nodeUri,
+                    {'label': f'Term {category_index}.{term_index}', 'readme': 'term'},
+                )
+            )
+    session.commit()
+    return glossary, terms
+
+
+def _notifications(volumes: Volumes, group, username, shares):
+    now = datetime.now()
+    recipients = [group, username, 'otherteam']
+    return [
+        Notification(
+            notificationUri=f'perfnotification{index}',
+            type='SHARE_OBJECT_SUBMITTED',
+            message=f'Share request {index} submitted',
+            recipient=recipients[index % len(recipients)],
+            is_read=index % 2 == 0,
+            target_uri=f'{shares[index % len(shares)].shareUri}|{shares[index % len(shares)].datasetUri}',
+            target_type='ShareObject',
+            share_uri=shares[index % len(shares)].shareUri,
+            dataset_uri=shares[index % len(shares)].datasetUri,
+            created=now - timedelta(minutes=index),
+        )
+        for index in range(volumes.notifications)
+    ]
+
+
+def seed(session, volumes: Volumes, group: str, username: str) -> SeededData:
+    organizations = [
+        Organization(
+            organizationUri=f'perforg{index}',
+            label=f'organization {index}',
+            name=f'organization{index}',
+            description=f'Benchmark organization {index}',
+            owner=username,
+            SamlGroupName=group,
+        )
+        for index in range(volumes.organizations)
+    ]
+    session.bulk_save_objects(organizations)
+
+    # half of the environments and datasets belong to the team running the benchmarks
+    teams = [group, 'otherteam']
+    environments = [
+        _environment(index, organizations[index % len(organizations)].organizationUri, teams[index % 2])
+        for index in range(volumes.environments)
+    ]
+    session.bulk_save_objects(environments)
+    session.bulk_save_objects(
+        [
+            EnvironmentGroup(
+                environmentUri=environment.environmentUri,
+                groupUri=environment.SamlGroupName,
+                environmentIAMRoleArn=environment.EnvironmentDefaultIAMRoleArn,
+                environmentIAMRoleName=environment.EnvironmentDefaultIAMRoleName,
+                environmentAthenaWorkGroup='workgroup',
+            )
+            for environment in environments
+        ]
+    )
+
+    datasets = [
+        _dataset(index, environments[index % len(environments)], teams[index % 2]) for index in range(volumes.datasets)
+    ]
+    session.bulk_save_objects(datasets)
+
+    focus_dataset = datasets[0]
+    tables = {
+        dataset.datasetUri: [
+            _table(index, dataset)
+            for index in range(volumes.focus_dataset_tables if dataset is focus_dataset else volumes.tables_per_dataset)
+        ]
+        for dataset in datasets
+    }
+    locations = [_location(index, dataset) for dataset in datasets for index in range(volumes.locations_per_dataset)]
+    all_tables = [table for dataset_tables in tables.values() for table in dataset_tables]
+    session.bulk_save_objects(all_tables)
+    session.bulk_save_objects(locations)
+    session.bulk_save_objects(
+        [_shareable_item(table.tableUri, table, ShareableType.Table) for table in all_tables]
+        + [_shareable_item(location.locationUri, location, ShareableType.StorageLocation) for location in locations]
+    )
+
+    # the shares of the other datasets are shared with the environment of the team running the benchmarks
+    focus_environment = environments[0]
+    shares = [
+        _share(index, datasets[index % len(datasets)], focus_environment if index % 2 else environments[1], group)
+        for index in range(1, volumes.shares + 1)
+    ]
+    focus_share = _share(0, focus_dataset, environments[1], 'otherteam', status=ShareObjectStatus.Submitted.value)
+    session.bulk_save_objects(shares + [focus_share])
+    session.bulk_save_objects(
+        [_share_item(share, table) for share in shares for table in tables[share.datasetUri][: volumes.items_per_share]]
+        + [
+            _share_item(focus_share, table, ShareItemStatus.PendingApproval.value)
+            for table in tables[focus_dataset.datasetUri][:: max(len(tables[focus_dataset.datasetUri]) // 100, 1)]
+        ]
+    )
+    session.bulk_save_objects(_notifications(volumes, group, username, shares + [focus_share]))
+    session.commit()
+
+    glossary, terms = _glossary(session, volumes, group)
+    session.bulk_save_objects(
+        [
+            TermLink(
+                nodeUri=term.nodeUri,
+                targetUri=focus_dataset.datasetUri,
+                targetType='Dataset',
+                owner=username,
+                approvedBySteward=True,
+            )
+            for term in terms[:20]
+        ]
+    )
+
+    ResourcePolicyService.attach_resource_policy(
+        session=session,
+        group=group,
+        permissions=ENVIRONMENT_ALL,
+        resource_uri=focus_environment.environmentUri,
+        resource_type=Environment.__name__,
+    )
+    ResourcePolicyService.attach_resource_policy(
+        session=session,
+        group=group,
+        permissions=DATASET_ALL,
+        resource_uri=focus_dataset.datasetUri,
+        resource_type=S3Dataset.__name__,
+    )
+    for share_group, permissions in [('otherteam', SHARE_OBJECT_REQUESTER), (group, SHARE_OBJECT_APPROVER)]:
+        ResourcePolicyService.attach_resource_policy(
+            session=session,
+            group=share_group,
+            permissions=permissions,
+            resource_uri=focus_share.shareUri,
+            resource_type=ShareObject.__name__,
+        )
+    session.commit()
+    return SeededData(
+        environment_uri=focus_environment.environmentUri,
+        dataset_uri=focus_dataset.datasetUri,
+        share_uri=focus_share.shareUri,
+        glossary_uri=glossary.nodeUri,
+    )
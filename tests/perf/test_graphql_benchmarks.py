@@ -0,0 +1,212 @@
+"""
+Benchmarks of the hot GraphQL operations against a database seeded with realistic volumes.
+
+Every operation is executed with graphql_sync and the executable schema, its latency percentiles and the number
+of SQL statements it executes are compared to baseline.json. A benchmark fails when it executes more statements
+than its baseline or when its median latency exceeds the baseline by more than BENCHMARK_TOLERANCE (0.5 by default).
+The p95 latency is recorded too, it is too noisy on shared machines to fail the benchmarks.
+
+Usage: make benchmarks
+    BENCHMARK_SCALE=0.1      multiplies the seeded volumes, the baseline is recorded with the default scale
+    BENCHMARK_RUNS=20        number of measured executions of each operation
+    BENCHMARK_UPDATE_BASELINE=true  records the results as the new baseline
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+from ariadne import graphql_sync
+
+from dataall.base.api import get_executable_schema
+from dataall.base.context import set_context, dispose_context, RequestContext
+from dataall.base.db.instrumentation import SqlInstrumentation
+
+BASELINE_PATH = Path(__file__).parent / 'baseline.json'
+RUNS = int(os.environ.get('BENCHMARK_RUNS', 20))
+WARMUP_RUNS = 3
+TOLERANCE = float(os.environ.get('BENCHMARK_TOLERANCE', 0.5))
+UPDATE_BASELINE = os.environ.get('BENCHMARK_UPDATE_BASELINE', '').lower() == 'true'
+
+# the documents of the frontend views
+LIST_DATASETS = """
+query ListDatasets($filter: DatasetFilter) {
+  listDatasets(filter: $filter) {
+    count page pages hasNext hasPrevious
+    nodes {
+      datasetUri owner description region label created SamlAdminGroupName userRoleForDataset
+      userRoleInEnvironment tags topics AwsAccountId datasetType
+      organization { organizationUri label }
+      environment { label AwsAccountId region }
+      stack { status }
+    }
+  }
+}
+"""
+
+SEARCH_ENVIRONMENT_DATA_ITEMS = """
+query SearchEnvironmentDataItems($filter: EnvironmentDataItemFilter, $environmentUri: String!) {
+  searchEnvironmentDataItems(environmentUri: $environmentUri, filter: $filter) {
+    count page pages hasNext hasPrevious
+    nodes {
+      shareUri environmentName environmentUri organizationName organizationUri datasetUri datasetName
+      itemType itemName created principalId
+    }
+  }
+}
+"""
+
+GET_SHARE_OBJECT = """
+query getShareObject($shareUri: String!, $filter: ShareableObjectFilter) {
+  getShareObject(shareUri: $shareUri) {
+    shareUri created owner status requestPurpose rejectPurpose userRoleForShareObject canViewLogs
+    principal {
+      principalId principalType principalName principalIAMRoleName SamlGroupName environmentUri environmentName
+      AwsAccountId region organizationUri organizationName
+    }
+    items(filter: $filter) {
+      count page pages hasNext hasPrevious
+      nodes {
+        itemUri shareItemUri itemType itemName status action healthStatus healthMessage lastVerificationTime
+      }
+    }
+    dataset {
+      datasetUri datasetName SamlAdminGroupName environmentName AwsAccountId region exists description datasetType
+    }
+  }
+}
+"""
+
+GET_DATASET = """
+query GetDataset($datasetUri: String!) {
+  getDataset(datasetUri: $datasetUri) {
+    datasetUri owner description label name region created imported userRoleForDataset SamlAdminGroupName
+    AwsAccountId KmsAlias S3BucketName GlueDatabaseName tags businessOwnerEmail stewards IAMDatasetAdminRoleArn
+    businessOwnerDelegationEmails topics language confidentiality autoApprovalEnabled
+    organization { organizationUri label }
+    terms { count nodes { __typename ... on Term { nodeUri path label } } }
+    environment {
+      environmentUri label region subscriptionsEnabled subscriptionsProducersTopicImported
+      subscriptionsConsumersTopicImported subscriptionsConsumersTopicName subscriptionsProducersTopicName
+      organization { organizationUri label }
+    }
+    statistics { tables locations upvotes }
+  }
+}
+"""
+
+LIST_NOTIFICATIONS = """
+query listNotifications($filter: NotificationFilter) {
+  listNotifications(filter: $filter) {
+    count page pages hasNext hasPrevious
+    nodes { notificationUri message type is_read target_uri }
+  }
+}
+"""
+
+GET_GLOSSARY_TREE = """
+query GetGlossaryTree($nodeUri: String!, $filter: GlossaryNodeSearchFilter) {
+  getGlossary(nodeUri: $nodeUri) {
+    nodeUri label readme created owner status path admin deleted
+    categories {
+      count page pages hasNext hasPrevious
+      nodes { nodeUri parentUri label readme status created stats { categories terms } }
+    }
+    tree(filter: $filter) {
+      count hasNext hasPrevious page pages
+      nodes {
+        __typename
+        ... on Glossary { nodeUri label readme created owner path }
+        ... on Category { nodeUri label parentUri readme created owner path }
+        ... on Term { nodeUri parentUri label readme created owner path }
+      }
+    }
+  }
+}
+"""
+
+# operation name -> (document, variables of the seeded data)
+OPERATIONS = {
+    'ListDatasets': (LIST_DATASETS, lambda seeded: {'filter': {'page': 1, 'pageSize': 10}}),
+    'SearchEnvironmentDataItems': (
+        SEARCH_ENVIRONMENT_DATA_ITEMS,
+        lambda seeded: {'environmentUri': seeded.environment_uri, 'filter': {'page': 1, 'pageSize': 10}},
+    ),
+    'getShareObject': (
+        GET_SHARE_OBJECT,
+        lambda seeded: {'shareUri': seeded.share_uri, 'filter': {'page': 1, 'pageSize': 10}},
+    ),
+    'GetDataset': (GET_DATASET, lambda seeded: {'datasetUri': seeded.dataset_uri}),
+    'listNotifications': (LIST_NOTIFICATIONS, lambda seeded: {'filter': {'unread': True, 'page': 1, 'pageSize': 10}}),
+    'GetGlossaryTree': (
+        GET_GLOSSARY_TREE,
+        lambda seeded: {'nodeUri': seeded.glossary_uri, 'filter': {'page': 1, 'pageSize': 50}},
+    ),
+}
+
+_results = {}
+
+
+@pytest.fixture(scope='module')
+def schema():
+    yield get_executable_schema()
+
+
+@pytest.fixture(scope='module', autouse=True)
+def baseline():
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    yield baseline
+    if UPDATE_BASELINE and _results:
+        BASELINE_PATH.write_text(json.dumps({**baseline, **_results}, indent=4, sort_keys=True) + '\n')
+
+
+def _percentile(durations, percentile):
+    ordered = sorted(durations)
+    return ordered[min(int(len(ordered) * percentile / 100), len(ordered) - 1)]
+
+
+def _execute(db, schema, username, groups, operation, variables):
+    document, _ = OPERATIONS[operation]
+    set_context(RequestContext(db, username, groups, username))
+    try:
+        started = time.perf_counter()
+        with SqlInstrumentation.record_operation(operation) as recorded:
+            success, result = graphql_sync(
+                schema,
+                {'query': document, 'variables': variables, 'operationName': operation},
+                context_value={'schema': None, 'engine': db, 'username': username, 'groups': groups},
+            )
+        duration = time.perf_counter() - started
+    finally:
+        dispose_context()
+    assert success and not result.get('errors'), result.get('errors')
+    return duration, recorded.statements
+
+
+@pytest.mark.parametrize('operation', OPERATIONS)
+def test_graphql_operation_benchmark(db, schema, seeded, instrumentation, baseline, user, group, operation):
+    variables = OPERATIONS[operation][1](seeded)
+    for _ in range(WARMUP_RUNS):
+        _execute(db, schema, user.username, [group.name], operation, variables)
+    runs = [_execute(db, schema, user.username, [group.name], operation, variables) for _ in range(RUNS)]
+    durations = [duration * 1000 for duration, _ in runs]
+
+    result = {
+        'p50_ms': round(_percentile(durations, 50), 3),
+        'p95_ms': round(_percentile(durations, 95), 3),
+        'statements': max(statements for _, statements in runs),
+    }
+    _results[operation] = result
+    print(f'{operation}: {result}')
+
+    expected = baseline.get(operation)
+    if UPDATE_BASELINE or expected is None:
+        return
+    assert result['statements'] <= expected['statements'], (
+        f'{operation} executes {result["statements"]} SQL statements, {expected["statements"]} in the baseline'
+    )
+    assert result['p50_ms'] <= expected['p50_ms'] * (1 + TOLERANCE), (
+        f'{operation} median latency is {result["p50_ms"]} ms, {expected["p50_ms"]} ms in the baseline'
+    )